@@ -33,9 +33,7 @@ def patch(body, id):
     employee = models.Employee.query.filter_by(id=id).first()
     if employee is None:
         return ("Employee not found.", 404)
-    employee.name = body["name"]
-    employee.division = body["division"]
-    employee.salary = body["salary"]
+    employee.apply_patch(body)
     database.db.session.commit()
     return 200
 
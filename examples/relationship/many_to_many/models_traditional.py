@@ -7,8 +7,11 @@ Base = declarative_base()
 employee_project = sa.Table(
     "employee_project",
     Base.metadata,
-    sa.Column("project_id", sa.Integer, sa.ForeignKey("project.id")),
-    sa.Column("employee_id", sa.Integer, sa.ForeignKey("employee.id")),
+    sa.Column("project_id", sa.Integer, sa.ForeignKey("project.id"), primary_key=True),
+    sa.Column(
+        "employee_id", sa.Integer, sa.ForeignKey("employee.id"), primary_key=True
+    ),
+    sa.Index("ix_employee_project_employee_id", "employee_id", "project_id"),
 )
 
 
@@ -1,5 +1,6 @@
 """Map an OpenAPI schema to SQLAlchemy models."""
 
+import copy
 import functools
 import sys
 import types as py_types
@@ -10,9 +11,12 @@ from sqlalchemy.ext import declarative
 from open_alchemy import types as oa_types
 
 from . import exceptions
+from . import facades as _facades
 from . import helpers as _helpers
+from . import hot_reload as _hot_reload
 from . import model_factory as _model_factory
 from . import models_file as _models_file
+from .load_tracking import track_loads
 
 models = py_types.ModuleType("models")  # pylint: disable=invalid-name
 sys.modules["open_alchemy.models"] = models
@@ -25,6 +29,7 @@ def init_model_factory(
     define_all: bool = False,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    index_foreign_keys: bool = False,
 ) -> oa_types.ModelFactory:
     """
     Create factory that generates SQLAlchemy models based on OpenAPI specification.
@@ -36,6 +41,9 @@ def init_model_factory(
         models_filename: The name of the file to write the models typing information to.
         spec_path: The path the the OpenAPI specification. Mainly used to support remote
             references.
+        index_foreign_keys: Whether to add an index to foreign key columns that are
+            not already indexed. Can be overridden for a model using
+            x-index-foreign-keys.
 
     Returns:
         A factory that returns SQLAlchemy models derived from the base based on the
@@ -47,20 +55,17 @@ def init_model_factory(
         _helpers.ref.set_context(path=spec_path)
 
     # Retrieving the schema from the specification
-    if "components" not in spec:
-        raise exceptions.MalformedSpecificationError(
-            '"components" is a required key in the specification.'
-        )
-    components = spec.get("components", {})
-    if "schemas" not in components:
-        raise exceptions.MalformedSpecificationError(
-            '"schemas" is a required key in the components of the specification.'
-        )
-    schemas = components.get("schemas", {})
+    schemas = _hot_reload.get_schemas(spec=spec)
+
+    # Discard backrefs recorded for the models of any previous specification
+    _facades.models.reset_backrefs()
 
     # Binding the base and schemas
     bound_model_factories = functools.partial(
-        _model_factory.model_factory, schemas=schemas, get_base=_get_base
+        _model_factory.model_factory,
+        schemas=schemas,
+        get_base=_get_base,
+        index_foreign_keys=index_foreign_keys,
     )
     # Caching calls
     cached_model_factories = functools.lru_cache(maxsize=None)(bound_model_factories)
@@ -72,7 +77,7 @@ def init_model_factory(
     def _register_model(*, name: str) -> typing.Type:
         """Intercept calls to model factory and register model on models."""
         model = cached_model_factories(name=name)
-        setattr(models, name, model)
+        _facades.models.set_model(name=name, model=model)
         return model
 
     if define_all:
@@ -80,17 +85,25 @@ def init_model_factory(
         if models_filename is not None:
             models_file = _models_file.ModelsFile()
 
-            # Intercept factory calls to record the schema
+            model_names: typing.List[str] = []
+
+            # Intercept factory calls to record the name of the model
             def _record_schema(*, name: str) -> typing.Type:
-                """Intercept calls to model factory and record schema."""
+                """Intercept calls to model factory and record the name of the model."""
                 model = _register_model(name=name)
-                models_file.add_model(
-                    schema=model._schema, name=name  # pylint: disable=protected-access
-                )
+                model_names.append(name)
                 return model
 
             _helpers.define_all(model_factory=_record_schema, schemas=schemas)
 
+            # Record the schemas once all backrefs have been added to them
+            for model_name in model_names:
+                model = getattr(models, model_name)
+                models_file.add_model(
+                    schema=model._schema,  # pylint: disable=protected-access
+                    name=model_name,
+                )
+
             with open(models_filename, "w") as out_file:
                 out_file.write(models_file.generate_models())
 
@@ -111,6 +124,7 @@ def _init_optional_base(
     define_all: bool,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    index_foreign_keys: bool = False,
 ) -> BaseAndModelFactory:
     """Wrap init_model_factory with optional base."""
     if base is None:
@@ -123,25 +137,106 @@ def _init_optional_base(
             define_all=define_all,
             models_filename=models_filename,
             spec_path=spec_path,
+            index_foreign_keys=index_foreign_keys,
         ),
     )
 
 
+def _init_file(
+    *,
+    spec_filename: str,
+    load_spec: _hot_reload.TLoadSpec,
+    base: typing.Optional[typing.Type],
+    define_all: bool,
+    models_filename: typing.Optional[str],
+    index_foreign_keys: bool,
+    watch: bool,
+) -> BaseAndModelFactory:
+    """Wrap _init_optional_base with reading the file and reloading on changes."""
+    if watch and not define_all:
+        raise exceptions.InvalidArgumentError(
+            "define_all must be set to reload the models when the specification "
+            "changes."
+        )
+    spec = load_spec(spec_filename)
+    # Constructing the models adds to the schemas, the watcher compares the originals
+    schemas = copy.deepcopy(_hot_reload.get_schemas(spec=spec)) if watch else {}
+    base, model_factory = _init_optional_base(
+        base=base,
+        spec=spec,
+        define_all=define_all,
+        models_filename=models_filename,
+        spec_path=spec_filename,
+        index_foreign_keys=index_foreign_keys,
+    )
+    if not watch:
+        _hot_reload.set_watcher(None)
+        return base, model_factory
+
+    watcher = _hot_reload.Watcher(
+        spec_filename=spec_filename,
+        load_spec=load_spec,
+        base=base,
+        schemas=schemas,
+        get_base=_get_base,
+        index_foreign_keys=index_foreign_keys,
+    )
+    _hot_reload.set_watcher(watcher)
+    watcher.start()
+    return base, watcher.model_factory
+
+
+def _load_json(spec_filename: str) -> oa_types.Schema:
+    """Read an OpenAPI specification from a JSON file."""
+    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
+    # need it:
+    import json  # pylint: disable=import-outside-toplevel
+
+    with open(spec_filename) as spec_file:
+        return json.load(spec_file)
+
+
+def _load_yaml(spec_filename: str) -> oa_types.Schema:
+    """
+    Read an OpenAPI specification from a YAML file.
+
+    Raise ImportError if pyyaml has not been installed.
+
+    """
+    try:
+        import yaml  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError(
+            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
+        )
+
+    with open(spec_filename) as spec_file:
+        return yaml.load(spec_file, Loader=yaml.SafeLoader)
+
+
 def init_json(
     spec_filename: str,
     *,
     base: typing.Optional[typing.Type] = None,
     define_all: bool = True,
     models_filename: typing.Optional[str] = None,
+    index_foreign_keys: bool = False,
+    watch: bool = False,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a JSON file.
 
+    Raise InvalidArgumentError if watch is set and define_all is not.
+
     Args:
         spec_filename: filename of an OpenAPI spec in JSON format
         base: The declarative base for the models.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        index_foreign_keys: (optional) Whether to add an index to foreign key columns
+            that are not already indexed.
+        watch: (optional) Whether to reload the models in a background thread when
+            the file changes. Requires define_all.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -152,19 +247,14 @@ def init_json(
         define_all: (optional) Whether to define all the models during initialization.
 
     """
-    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
-    # need it:
-    import json  # pylint: disable=import-outside-toplevel
-
-    with open(spec_filename) as spec_file:
-        spec = json.load(spec_file)
-
-    return _init_optional_base(
+    return _init_file(
+        spec_filename=spec_filename,
+        load_spec=_load_json,
         base=base,
-        spec=spec,
         define_all=define_all,
         models_filename=models_filename,
-        spec_path=spec_filename,
+        index_foreign_keys=index_foreign_keys,
+        watch=watch,
     )
 
 
@@ -174,11 +264,14 @@ def init_yaml(
     base: typing.Optional[typing.Type] = None,
     define_all: bool = True,
     models_filename: typing.Optional[str] = None,
+    index_foreign_keys: bool = False,
+    watch: bool = False,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a YAML file.
 
     Raise ImportError if pyyaml has not been installed.
+    Raise InvalidArgumentError if watch is set and define_all is not.
 
     Args:
         spec_filename: filename of an OpenAPI spec in YAML format
@@ -187,6 +280,10 @@ def init_yaml(
         define_all: (optional) Whether to define all the models during initialization.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        index_foreign_keys: (optional) Whether to add an index to foreign key columns
+            that are not already indexed.
+        watch: (optional) Whether to reload the models in a background thread when
+            the file changes. Requires define_all.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -197,22 +294,14 @@ def init_yaml(
         define_all: Whether to define all the models during initialization.
 
     """
-    try:
-        import yaml  # pylint: disable=import-outside-toplevel
-    except ImportError:
-        raise ImportError(
-            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
-        )
-
-    with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
-
-    return _init_optional_base(
+    return _init_file(
+        spec_filename=spec_filename,
+        load_spec=_load_yaml,
         base=base,
-        spec=spec,
         define_all=define_all,
         models_filename=models_filename,
-        spec_path=spec_filename,
+        index_foreign_keys=index_foreign_keys,
+        watch=watch,
     )
 
 
@@ -243,14 +332,14 @@ def _get_base(*, name: str, schemas: oa_types.Schemas) -> typing.Type:
 
     if _helpers.schema.inherits(schema=schema, schemas=schemas):
         parent = _helpers.inheritance.retrieve_parent(schema=schema, schemas=schemas)
-        try:
-            return getattr(models, parent)
-        except AttributeError:
+        parent_model = _facades.models.get_model(name=parent)
+        if parent_model is None:
             raise exceptions.InheritanceError(
                 "Any parents of a schema must be constructed before the schema can be "
                 "constructed."
             )
-    return getattr(models, "Base")
+        return parent_model
+    return _facades.models.get_base()
 
 
-__all__ = ["init_model_factory", "init_json", "init_yaml"]
+__all__ = ["init_model_factory", "init_json", "init_yaml", "track_loads"]
@@ -0,0 +1,7 @@
+"""Run the command line interface using python -m open_alchemy."""
+
+import sys
+
+from open_alchemy import cli
+
+sys.exit(cli.main())
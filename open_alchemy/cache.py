@@ -0,0 +1,242 @@
+"""Read-through caches for instances of models read by primary key."""
+
+import collections
+import dataclasses
+import functools
+import threading
+import time
+import typing
+
+from . import facades
+from . import types
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_SIZE = 1000
+
+TKey = typing.Tuple[typing.Any, ...]
+
+
+class Backend(types.Protocol):
+    """Defines interface for a cache backend."""
+
+    def get(self, key: TKey) -> typing.Optional[typing.Any]:
+        """Get the value for a key or None if it is not cached or has expired."""
+        ...
+
+    def set(self, key: TKey, value: typing.Any) -> None:
+        """Cache the value for a key."""
+        ...
+
+    def delete(self, key: TKey) -> None:
+        """Remove the value for a key if it is cached."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all values."""
+        ...
+
+
+class LruBackend:
+    """In-process cache that evicts the least recently used values."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Construct.
+
+        Args:
+            ttl: The number of seconds a value is cached for.
+            max_size: The maximum number of values that are cached.
+            clock: Returns the current time in seconds.
+
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._values: "collections.OrderedDict[TKey, typing.Any]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: TKey) -> typing.Optional[typing.Any]:
+        """Get the value for a key or None if it is not cached or has expired."""
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= self._clock():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: TKey, value: typing.Any) -> None:
+        """Cache the value for a key, evicting the least recently used value."""
+        with self._lock:
+            self._values[key] = (self._clock() + self._ttl, value)
+            self._values.move_to_end(key)
+            while len(self._values) > self._max_size:
+                self._values.popitem(last=False)
+
+    def delete(self, key: TKey) -> None:
+        """Remove the value for a key if it is cached."""
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached values, including any that have expired."""
+        return len(self._values)
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """
+    The number of reads of a cache.
+
+    Attrs:
+        hits: The number of reads that were served from the cache.
+        misses: The number of reads that were served from the database.
+
+    """
+
+    hits: int
+    misses: int
+
+
+class ModelCache:
+    """Cache for the instances of a model that counts hits and misses."""
+
+    def __init__(self, *, backend: Backend) -> None:
+        """
+        Construct.
+
+        Args:
+            backend: Stores the cached values.
+
+        """
+        self.backend = backend
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: TKey) -> typing.Optional[typing.Any]:
+        """
+        Get the value for a key and record whether it was a hit or a miss.
+
+        Args:
+            key: The primary key.
+
+        Returns:
+            The cached value or None if it is not cached.
+
+        """
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: TKey, value: typing.Any) -> None:
+        """Cache the value for a primary key."""
+        self.backend.set(key, value)
+
+    def invalidate(self, key: TKey) -> None:
+        """Remove the value for a primary key."""
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self.backend.clear()
+
+    def stats(self) -> CacheStats:
+        """Get the number of hits and misses."""
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
+
+
+def calculate(
+    value: typing.Union[bool, typing.Dict[str, typing.Any]],
+) -> typing.Optional[ModelCache]:
+    """
+    Construct the cache of a model based on the value of x-cache.
+
+    Args:
+        value: The value of x-cache.
+
+    Returns:
+        The cache or None if caching is not enabled.
+
+    """
+    if value is False:
+        return None
+    options = value if isinstance(value, dict) else {}
+    return ModelCache(
+        backend=LruBackend(
+            ttl=options.get("ttl", DEFAULT_TTL),
+            max_size=options.get("max-size", DEFAULT_MAX_SIZE),
+        )
+    )
+
+
+def _clear_model(model: typing.Type) -> None:
+    """Clear the caches of a model and the models it inherits from or inherit it."""
+    classes = list(model.__mro__)
+    subclasses = model.__subclasses__()
+    while subclasses:
+        subclass = subclasses.pop()
+        classes.append(subclass)
+        subclasses.extend(subclass.__subclasses__())
+    for class_ in classes:
+        model_cache = vars(class_).get("_cache")
+        if isinstance(model_cache, ModelCache):
+            model_cache.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _listen_bulk_changes() -> None:
+    """Clear the caches of models changed by query updates and deletes, once."""
+    facades.sqlalchemy.cache.listen_bulk_changes(callback=_clear_model)
+
+
+def register(*, model: typing.Type, model_cache: ModelCache) -> None:
+    """
+    Invalidate the cache of a model when instances are updated or deleted.
+
+    Args:
+        model: The model.
+        model_cache: The cache of the model.
+
+    """
+    _listen_bulk_changes()
+    facades.sqlalchemy.cache.listen_changes(
+        model=model, callback=model_cache.invalidate
+    )
+
+
+def clear_written(*, model: typing.Type, bind: typing.Any) -> None:
+    """
+    Clear the caches of a model after its table is written using Core statements.
+
+    Core statements do not emit the events used to invalidate cached instances. For a
+    session the caches are cleared when its transaction is committed or rolled back,
+    otherwise they are cleared straight away.
+
+    Args:
+        model: The model whose table was written.
+        bind: The session, connection or engine the statements were executed with.
+
+    """
+    facades.sqlalchemy.cache.defer(bind=bind, callback=_clear_model, argument=model)
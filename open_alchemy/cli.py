@@ -0,0 +1,178 @@
+"""Command line interface for OpenAlchemy."""
+
+import argparse
+import os
+import sys
+import typing
+
+import open_alchemy
+
+from . import exceptions
+from . import facades
+from . import loader
+from . import migration_plan
+from . import types
+
+
+def _init(spec_filename: str) -> None:
+    """Construct the models for an OpenAPI specification in a YAML or JSON file."""
+    if spec_filename.lower().endswith(".json"):
+        open_alchemy.init_json(spec_filename)
+    else:
+        open_alchemy.init_yaml(spec_filename)
+
+
+def _load(spec_filename: str) -> types.Schema:
+    """Read an OpenAPI specification from a YAML or JSON file."""
+    # pylint: disable=protected-access
+    if spec_filename.lower().endswith(".json"):
+        return open_alchemy._load_json(spec_filename)
+    return open_alchemy._load_yaml(spec_filename)
+
+
+def _report(progress: loader.Progress) -> None:
+    """Print the progress of a load."""
+    print(
+        f"{progress.rows_skipped + progress.rows_written} rows committed "
+        f"({progress.rows_written} this run, "
+        f"{progress.rows_per_second:.0f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+def load(args: argparse.Namespace) -> int:
+    """Execute the load command."""
+    _init(args.spec)
+    model = facades.models.get_model(name=args.model)
+    if model is None:
+        print(f"The model {args.model} was not found.", file=sys.stderr)
+        return 1
+
+    engine = facades.sqlalchemy.create_engine(args.url)
+    if args.create_table:
+        model.__table__.create(bind=engine, checkfirst=True)
+    progress = loader.load(
+        model=model,
+        filename=args.filename,
+        bind=engine,
+        format_=args.format,
+        batch_size=args.batch_size,
+        commit_interval=args.commit_interval,
+        processes=args.processes if args.processes > 1 else None,
+        checkpoint_filename=args.checkpoint,
+        progress=_report,
+    )
+    print(
+        f"Loaded {progress.rows_written} rows in {progress.elapsed:.1f}s "
+        f"({progress.rows_per_second:.0f} rows/s).",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def diff(args: argparse.Namespace) -> int:
+    """Execute the diff command."""
+    try:
+        operations = migration_plan.plan(
+            old=migration_plan.build_metadata(spec=_load(args.old), spec_path=args.old),
+            new=migration_plan.build_metadata(spec=_load(args.new), spec_path=args.new),
+            dialect=args.dialect,
+        )
+    except exceptions.BaseError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(migration_plan.format_plan(operations=operations), end="")
+    if args.check and any(operation.warning is not None for operation in operations):
+        return 2
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Construct the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="open_alchemy", description="Tools for OpenAlchemy models."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    load_parser = subparsers.add_parser(
+        "load", help="Stream an NDJSON or CSV file into the table of a model."
+    )
+    load_parser.add_argument("spec", help="The OpenAPI specification (YAML or JSON).")
+    load_parser.add_argument("model", help="The name of the model to load into.")
+    load_parser.add_argument("filename", help="The NDJSON or CSV file to load.")
+    load_parser.add_argument("--url", required=True, help="The database URL.")
+    load_parser.add_argument(
+        "--format",
+        choices=loader.reader.FORMATS,
+        default=None,
+        help="The format of the file, determined from the extension by default.",
+    )
+    load_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=loader.DEFAULT_BATCH_SIZE,
+        help="The number of rows validated and inserted together.",
+    )
+    load_parser.add_argument(
+        "--commit-interval",
+        type=int,
+        default=loader.DEFAULT_COMMIT_INTERVAL,
+        help="The number of rows between commits.",
+    )
+    load_parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of processes used to validate rows.",
+    )
+    load_parser.add_argument(
+        "--checkpoint", default=None, help="The file used to resume a failed load."
+    )
+    load_parser.add_argument(
+        "--create-table",
+        action="store_true",
+        help="Create the table of the model if it does not exist.",
+    )
+    load_parser.set_defaults(handler=load)
+
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="Print the DDL that migrates the database from one specification to "
+        "another.",
+    )
+    diff_parser.add_argument(
+        "old", help="The OpenAPI specification the database has (YAML or JSON)."
+    )
+    diff_parser.add_argument(
+        "new", help="The OpenAPI specification the database should have."
+    )
+    diff_parser.add_argument(
+        "--dialect",
+        choices=facades.sqlalchemy.ddl.DIALECTS,
+        default=migration_plan.DEFAULT_DIALECT,
+        help="The database the statements are written for.",
+    )
+    diff_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with 2 if any step rewrites, scans or drops existing data.",
+    )
+    diff_parser.set_defaults(handler=diff)
+
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Args:
+        argv: The arguments, defaults to the arguments of the process.
+
+    Returns:
+        The exit code.
+
+    """
+    args = _parser().parse_args(argv)
+    return args.handler(args)
@@ -59,7 +59,14 @@ def column_factory(
         column_value, column_schema = column.handle_column(
             schema=schema, schemas=schemas, required=required
         )
-        return ([(logical_name, column_value)], column_schema)
+        deferred = column_schema.get("x-deferred")
+        if not deferred:
+            return ([(logical_name, column_value)], column_schema)
+        group = deferred if isinstance(deferred, str) else None
+        deferred_value = facades.sqlalchemy.column.deferred(
+            column=column_value, group=group
+        )
+        return ([(logical_name, deferred_value)], column_schema)
 
     # Check readOnly
     if helpers.peek.read_only(schema=schema, schemas=schemas):
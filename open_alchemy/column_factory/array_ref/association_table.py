@@ -131,7 +131,7 @@ def _gather_column_artifacts(
 
 
 def _construct_column(
-    *, artifacts: _ColumnArtifacts
+    *, artifacts: _ColumnArtifacts, primary_key: typing.Optional[bool] = None
 ) -> facades.sqlalchemy.column.Column:
     """
     Construct many to many column.
@@ -141,6 +141,7 @@ def _construct_column(
 
     Args:
         artifacts: The artifacts based on which to construct the column
+        primary_key: Whether the column is part of the primary key of the table.
 
     Returns:
         The column.
@@ -154,7 +155,8 @@ def _construct_column(
             max_length=artifacts.max_length,
         ),
         extension=types.ExtensionColumnArtifacts(
-            foreign_key=f"{artifacts.tablename}.{artifacts.column_name}"
+            primary_key=primary_key,
+            foreign_key=f"{artifacts.tablename}.{artifacts.column_name}",
         ),
     )
 
@@ -166,12 +168,49 @@ def _construct_column(
     return return_column
 
 
+def _construct_payload_columns(
+    *,
+    properties: types.Schema,
+    schemas: types.Schemas,
+    reserved: typing.Set[str],
+) -> typing.List[facades.sqlalchemy.column.Column]:
+    """
+    Construct the additional columns of an association table.
+
+    Raise MalformedSchemaError if a column has the same name as one of the foreign key
+    columns.
+
+    Args:
+        properties: The schemas of the additional columns by column name.
+        schemas: Used to resolve any $ref.
+        reserved: The names of the foreign key columns.
+
+    Returns:
+        The columns.
+
+    """
+    columns = []
+    for name, property_schema in properties.items():
+        if name in reserved:
+            raise exceptions.MalformedSchemaError(
+                f"The association table column {name} clashes with a foreign key "
+                "column."
+            )
+        payload_column, _ = column.handle_column(
+            schema=property_schema, schemas=schemas
+        )
+        payload_column.name = name
+        columns.append(payload_column)
+    return columns
+
+
 def construct(
     *,
     parent_schema: types.Schema,
     child_schema: types.Schema,
     schemas: types.Schemas,
     tablename: str,
+    table_schema: typing.Optional[types.Schema] = None,
 ) -> facades.sqlalchemy.Table:
     """
     Construct many to many association table.
@@ -179,16 +218,28 @@ def construct(
     Gather artifacts for both models, construct foreign key column for models and
     combine into a table.
 
+    By default, the foreign key columns form a composite primary key in the order
+    (parent, child) which prevents duplicate links and supports lookups from the
+    parent. An index is added in the reverse order (child, parent) to support lookups
+    from the child. The value of x-secondary-table can disable either, name the index,
+    add columns and pass keyword arguments to the table.
+
     Args:
         parent_schema: The schema for the many to many parent.
         child_schema: The schema for the many to many child.
         schemas: Used to resolve any $ref.
         tablename: The name of the association table.
+        table_schema: The value of x-secondary-table.
 
     Returns:
         The association table.
 
     """
+    if table_schema is None:
+        table_schema = {}
+    primary_key: bool = table_schema.get("primary-key", True)
+    index: typing.Union[bool, str] = table_schema.get("index", True)
+
     # Gather artifacts for parent and child model
     parent_artifacts = _gather_column_artifacts(
         model_schema=parent_schema, schemas=schemas
@@ -198,11 +249,34 @@ def construct(
     )
 
     # Construct columns for parent and child models
-    parent_column = _construct_column(artifacts=parent_artifacts)
-    child_column = _construct_column(artifacts=child_artifacts)
+    parent_column = _construct_column(
+        artifacts=parent_artifacts, primary_key=primary_key or None
+    )
+    child_column = _construct_column(
+        artifacts=child_artifacts, primary_key=primary_key or None
+    )
+
+    # Construct any additional columns
+    payload_columns = _construct_payload_columns(
+        properties=table_schema.get("properties", {}),
+        schemas=schemas,
+        reserved={parent_column.name, child_column.name},
+    )
+
+    # Construct the reverse index
+    args: typing.Tuple[typing.Any, ...] = ()
+    if index is not False:
+        index_name = index if isinstance(index, str) else None
+        if index_name is None:
+            index_name = f"ix_{tablename}_{child_column.name}"
+        args = (facades.sqlalchemy.Index(index_name, child_column, parent_column),)
 
     # Construct table
     base = facades.models.get_base()
     return facades.sqlalchemy.table(
-        tablename=tablename, base=base, columns=(parent_column, child_column)
+        tablename=tablename,
+        base=base,
+        columns=(parent_column, child_column, *payload_columns),
+        args=args,
+        kwargs=table_schema.get("kwargs"),
     )
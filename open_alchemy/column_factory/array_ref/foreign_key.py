@@ -27,8 +27,10 @@ def set_(
     then somehow added to the referenced model. At the time of processing, the
     referenced model may already have been constructed. This requires a check on
     open_alchemy.models for the referenced model. If it is there, it is modified by
-    adding a new column to it. Otherwise, the schema of the referenced model is altered
-    to include the column so that it is constructed when that model is processed.
+    adding a new column to it which is indexed, or warned about, in the same way as
+    the foreign key columns of a model that is being constructed. Otherwise, the
+    schema of the referenced model is altered to include the column so that it is
+    constructed when that model is processed.
 
     Raise MalformedRelationshipError of the referenced model is not found in the
     schemas.
@@ -77,6 +79,7 @@ def set_(
     if ref_model is not None:
         column_inst = column.construct_column(artifacts=fk_artifacts)
         setattr(ref_model, fk_logical_name, column_inst)
+        helpers.index_foreign_keys(model=ref_model, column_names={column_inst.name})
         return
 
     # Handle model not constructed by adding the foreign key schema to the model schema
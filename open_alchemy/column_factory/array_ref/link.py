@@ -39,6 +39,7 @@ def construct(
             child_schema=artifacts.spec,
             schemas=schemas,
             tablename=artifacts.relationship.secondary,
+            table_schema=artifacts.relationship.secondary_table,
         )
         facades.models.set_association(
             table=table, name=artifacts.relationship.secondary
@@ -46,6 +46,7 @@ def check_schema(
     Raise TypeMissingError of the type is not in the schema or is not a string.
     Raise MalformedSchemaError if format, maxLength or nullable are not of the correct
     type.
+    Raise MalformedSchemaError if a computed column sets readOnly to false.
     Raise MalformedExtensionPropertyError if an extension property is of the wrong
     type.
 
@@ -74,9 +75,32 @@ def check_schema(
     artifacts.extension.autoincrement = helpers.ext_prop.get(
         source=schema, name="x-autoincrement"
     )
-    artifacts.extension.index = helpers.ext_prop.get(source=schema, name="x-index")
+    index = helpers.ext_prop.get(source=schema, name="x-index")
+    # Indexes with options are constructed with the table args
+    if not isinstance(index, dict):
+        artifacts.extension.index = index
     artifacts.extension.unique = helpers.ext_prop.get(source=schema, name="x-unique")
     artifacts.extension.json = helpers.ext_prop.get(source=schema, name="x-json")
+    artifacts.extension.deferred = helpers.ext_prop.get(
+        source=schema, name="x-deferred"
+    )
+    artifacts.extension.server_default = helpers.ext_prop.get(
+        source=schema, name="x-server-default"
+    )
+    computed_value = helpers.ext_prop.get(source=schema, name="x-computed")
+    computed: typing.Optional[types.Computed] = (
+        {"expression": computed_value}
+        if isinstance(computed_value, str)
+        else computed_value
+    )
+    artifacts.extension.computed = computed
+    # Computed columns are always generated by the database
+    if computed is not None:
+        if artifacts.open_api.read_only is False:
+            raise exceptions.MalformedSchemaError(
+                "Computed columns cannot set readOnly to false."
+            )
+        artifacts.open_api.read_only = True
     artifacts.extension.foreign_key = helpers.ext_prop.get(
         source=schema, name="x-foreign-key"
     )
@@ -105,7 +129,10 @@ def check_schema(
     # Update nullable to consider autoincrement, required and default
     artifacts.open_api.nullable = helpers.calculate_nullable(
         nullable=nullable,
-        generated=artifacts.extension.autoincrement is True,
+        generated=(
+            artifacts.extension.autoincrement is True
+            or artifacts.extension.server_default is not None
+        ),
         required=required,
         defaulted=artifacts.open_api.default is not None,
     )
@@ -138,13 +165,17 @@ def calculate_schema(
         schema["description"] = artifacts.open_api.description
     if artifacts.extension.json is not None:
         schema["x-json"] = artifacts.extension.json
+    if artifacts.extension.deferred is not None:
+        schema["x-deferred"] = artifacts.extension.deferred
     if artifacts.open_api.default is not None:
         schema["default"] = artifacts.open_api.default
     if artifacts.open_api.read_only is not None:
         schema["readOnly"] = artifacts.open_api.read_only
     if artifacts.open_api.write_only is not None:
         schema["writeOnly"] = artifacts.open_api.write_only
-    if artifacts.extension.autoincrement is not None:
+    if artifacts.extension.server_default is not None:
+        schema["x-generated"] = True
+    elif artifacts.extension.autoincrement is not None:
         schema["x-generated"] = artifacts.extension.autoincrement
     if dict_ignore is not None:
         schema["x-dict-ignore"] = dict_ignore
@@ -227,6 +258,13 @@ def _check_artifacts(*, artifacts: types.ColumnArtifacts) -> None:
         3. format with
             a. boolean
         4. default with JSON
+        5. deferred primary key
+        6. computed with
+            a. default
+            b. server default
+            c. autoincrement
+            d. primary key
+        7. server default with server_default in kwargs
 
     Args:
         artifacts: The artifacts to check.
@@ -253,6 +291,29 @@ def _check_artifacts(*, artifacts: types.ColumnArtifacts) -> None:
     # Check whether format was used with boolean
     if artifacts.open_api.type == "boolean" and artifacts.open_api.format is not None:
         raise exceptions.MalformedSchemaError("format is not supported for boolean")
+    # Check whether a primary key was deferred
+    if artifacts.extension.primary_key and artifacts.extension.deferred:
+        raise exceptions.MalformedSchemaError("primary key columns cannot be deferred")
+    # Check whether computed was combined with another way of generating the value
+    if artifacts.extension.computed is not None and (
+        artifacts.open_api.default is not None
+        or artifacts.extension.server_default is not None
+        or artifacts.extension.autoincrement
+        or artifacts.extension.primary_key
+    ):
+        raise exceptions.MalformedSchemaError(
+            "computed columns cannot have a default, server default, autoincrement or "
+            "be a primary key"
+        )
+    # Check whether the server default was also defined in kwargs
+    if (
+        artifacts.extension.server_default is not None
+        and artifacts.extension.kwargs is not None
+        and "server_default" in artifacts.extension.kwargs
+    ):
+        raise exceptions.MalformedSchemaError(
+            "x-server-default cannot be combined with server_default in x-kwargs"
+        )
     # Check whether default was used with JSON column
     if artifacts.extension.json and artifacts.open_api.default is not None:
         raise exceptions.FeatureNotImplementedError(
@@ -53,6 +53,11 @@ def handle_object(
         raise exceptions.MalformedRelationshipError(
             "Many to one and one to one relationships do not support x-secondary."
         )
+    # Check for dynamic loading
+    if obj_artifacts.relationship.lazy == "dynamic":
+        raise exceptions.MalformedRelationshipError(
+            "Many to one and one to one relationships do not support dynamic loading."
+        )
 
     # Record any backref
     helpers.backref.record(
@@ -18,9 +18,14 @@ def gather(
     key column name from a raw object specification.
 
     Raise MalformedRelationshipError if neither $ref nor $allOf is found.
-    Raise MalformedRelationshipError if uselist is defined but backref is not.
+    Raise MalformedRelationshipError if uselist or backref lazy is defined but backref
+    is not.
+    Raise MalformedRelationshipError if lazy is defined using both x-lazy and x-kwargs.
+    Raise MalformedRelationshipError if x-secondary-table is defined but x-secondary is
+    not.
     Raise MalformedRelationshipError if multiple $ref, x-backref, x-secondary,
-    x-foreign-key-column or x-uselist are found.
+    x-secondary-table, x-foreign-key-column, x-uselist, x-lazy or x-backref-lazy are
+    found.
 
     Args:
         schema: The schema for the column.
@@ -44,6 +49,32 @@ def gather(
         raise exceptions.MalformedRelationshipError(
             "Relationships with x-uselist defined must also define x-backref."
         )
+    # Check if backref lazy is defined and backref is not
+    if (
+        intermediary_obj_artifacts.backref_lazy is not None
+        and intermediary_obj_artifacts.backref is None
+    ):
+        raise exceptions.MalformedRelationshipError(
+            "Relationships with x-backref-lazy defined must also define x-backref."
+        )
+    # Check if lazy is defined twice
+    if (
+        intermediary_obj_artifacts.lazy is not None
+        and intermediary_obj_artifacts.kwargs is not None
+        and "lazy" in intermediary_obj_artifacts.kwargs
+    ):
+        raise exceptions.MalformedRelationshipError(
+            "Relationships may not define lazy using both x-lazy and x-kwargs."
+        )
+    # Check if secondary table is defined and secondary is not
+    if (
+        intermediary_obj_artifacts.secondary_table is not None
+        and intermediary_obj_artifacts.secondary is None
+    ):
+        raise exceptions.MalformedRelationshipError(
+            "Relationships with x-secondary-table defined must also define "
+            "x-secondary."
+        )
 
     # Construct back reference
     back_reference = None
@@ -51,6 +82,7 @@ def gather(
         back_reference = types.BackReferenceArtifacts(
             property_name=intermediary_obj_artifacts.backref,
             uselist=intermediary_obj_artifacts.uselist,
+            lazy=intermediary_obj_artifacts.backref_lazy,
         )
 
     return types.ObjectArtifacts(
@@ -62,6 +94,8 @@ def gather(
             back_reference=back_reference,
             secondary=intermediary_obj_artifacts.secondary,
             kwargs=intermediary_obj_artifacts.kwargs,
+            secondary_table=intermediary_obj_artifacts.secondary_table,
+            lazy=intermediary_obj_artifacts.lazy,
         ),
         nullable=intermediary_obj_artifacts.nullable,
         description=intermediary_obj_artifacts.description,
@@ -85,6 +119,12 @@ class _IntermediaryObjectArtifacts:
     uselist: typing.Optional[bool] = None
     # The name of the secondary table to use for the relationship
     secondary: typing.Optional[str] = None
+    # Customization of the secondary table
+    secondary_table: typing.Optional[types.Schema] = None
+    # The loading strategy of the relationship
+    lazy: typing.Optional[str] = None
+    # The loading strategy of the back reference
+    backref_lazy: typing.Optional[str] = None
     # Whether the foreign key is nullable
     nullable: typing.Optional[bool] = None
     # The description for the reference
@@ -166,6 +206,9 @@ def _handle_ref(
     backref = helpers.ext_prop.get(source=ref_schema, name="x-backref")
     uselist = helpers.ext_prop.get(source=ref_schema, name="x-uselist")
     secondary = helpers.ext_prop.get(source=ref_schema, name="x-secondary")
+    secondary_table = helpers.ext_prop.get(source=ref_schema, name="x-secondary-table")
+    lazy = helpers.ext_prop.get(source=ref_schema, name="x-lazy")
+    backref_lazy = helpers.ext_prop.get(source=ref_schema, name="x-backref-lazy")
     fk_column_name = helpers.ext_prop.get(
         source=ref_schema, name="x-foreign-key-column"
     )
@@ -181,6 +224,9 @@ def _handle_ref(
         backref=backref,
         uselist=uselist,
         secondary=secondary,
+        secondary_table=secondary_table,
+        lazy=lazy,
+        backref_lazy=backref_lazy,
         nullable=nullable,
         write_only=write_only,
     )
@@ -209,6 +255,9 @@ def _handle_all_of(
     # Initial values
     obj_artifacts: typing.Optional[_IntermediaryObjectArtifacts] = None
     secondary: typing.Optional[str] = None
+    secondary_table: typing.Optional[types.Schema] = None
+    lazy: typing.Optional[str] = None
+    backref_lazy: typing.Optional[str] = None
     backref: typing.Optional[str] = None
     uselist: typing.Optional[bool] = None
     fk_column_name: typing.Optional[str] = None
@@ -255,6 +304,31 @@ def _handle_all_of(
             default=secondary,
             exception_message="Relationships may have at most 1 x-secondary defined.",
         )
+        # Handle secondary table
+        secondary_table = _handle_key_single(
+            key="x-secondary-table",
+            schema=sub_schema,
+            default=secondary_table,
+            exception_message=(
+                "Relationships may have at most 1 x-secondary-table defined."
+            ),
+        )
+        # Handle lazy
+        lazy = _handle_key_single(
+            key="x-lazy",
+            schema=sub_schema,
+            default=lazy,
+            exception_message="Relationships may have at most 1 x-lazy defined.",
+        )
+        # Handle backref lazy
+        backref_lazy = _handle_key_single(
+            key="x-backref-lazy",
+            schema=sub_schema,
+            default=backref_lazy,
+            exception_message=(
+                "Relationships may have at most 1 x-backref-lazy defined."
+            ),
+        )
         # Handle fk_column_name
         fk_column_name = _handle_key_single(
             key="x-foreign-key-column",
@@ -302,6 +376,12 @@ def _handle_all_of(
         obj_artifacts.uselist = uselist
     if secondary is not None:
         obj_artifacts.secondary = secondary
+    if secondary_table is not None:
+        obj_artifacts.secondary_table = secondary_table
+    if lazy is not None:
+        obj_artifacts.lazy = lazy
+    if backref_lazy is not None:
+        obj_artifacts.backref_lazy = backref_lazy
     if fk_column_name is not None:
         obj_artifacts.fk_column_name = fk_column_name
     if nullable is not None:
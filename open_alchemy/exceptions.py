@@ -66,3 +66,43 @@ class MalformedModelDictionaryError(BaseError, ValueError):
 
 class InheritanceError(BaseError):
     """Raised when an error related to inheritance occurs."""
+
+
+class InvalidArgumentError(BaseError, ValueError):
+    """Raised when an argument does not have a valid value."""
+
+
+class InvalidConflictTargetError(BaseError, ValueError):
+    """Raised when an upsert conflict target is not backed by a unique constraint."""
+
+
+class UnindexedFilterError(BaseError, ValueError):
+    """Raised when a filter is on a property that is not indexed."""
+
+
+class CacheNotEnabledError(BaseError, ValueError):
+    """Raised when the cache of a model is used without x-cache on its schema."""
+
+
+class MalformedBinaryError(BaseError, ValueError):
+    """Raised when a binary payload is malformed or was encoded for another schema."""
+
+
+class TooManyQueriesError(BaseError):
+    """Raised when more queries than the threshold are tracked by track_loads."""
+
+
+class UnindexedForeignKeyWarning(UserWarning):
+    """Warned when a foreign key column is not the leading column of any index."""
+
+
+class UnindexedFilterWarning(UserWarning):
+    """Warned when a filter is on a property that is not indexed."""
+
+
+class TooManyQueriesWarning(UserWarning):
+    """Warned when more queries than the threshold are tracked by track_loads."""
+
+
+class ReloadFailedWarning(UserWarning):
+    """Warned when the models could not be reloaded after the specification changed."""
@@ -11,6 +11,27 @@ ValidationError = jsonschema.ValidationError
 validate = jsonschema.validate  # pylint: disable=invalid-name
 
 
+def validator(
+    *,
+    schema: typing.Dict[str, typing.Any],
+    resolver: typing.Optional[jsonschema.RefResolver] = None,
+) -> typing.Any:
+    """
+    Construct a validator for a schema that can be re-used for many instances.
+
+    Args:
+        schema: The schema to validate against.
+        resolver: Used to resolve any $ref in the schema.
+
+    Returns:
+        The validator, call validate on it with the instance.
+
+    """
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema, resolver=resolver)
+
+
 def _filename_to_dict(filename: str) -> typing.Dict:
     """
     Map filename for a JSON file to the de-serialized dictionary.
@@ -1,5 +1,8 @@
 """Functions for interacting with the OpenAlchemy models."""
 
+import contextlib
+import contextvars
+import types as py_types
 import typing
 
 import open_alchemy
@@ -8,9 +11,87 @@ from open_alchemy import helpers
 from open_alchemy import types
 
 from ..utility_base import TOptUtilityBase
-from ..utility_base import TUtilityBase
 from . import sqlalchemy
 
+# The staged models that replace models in the current context while models are
+# reloaded
+_STAGED: "contextvars.ContextVar[typing.Optional[py_types.ModuleType]]" = (
+    contextvars.ContextVar("staged", default=None)
+)
+
+
+def _models() -> typing.Any:
+    """Get the staged models in the current context or models otherwise."""
+    staged_models = _STAGED.get()
+    if staged_models is not None:
+        return staged_models
+    return open_alchemy.models
+
+
+def _public(*, namespace: typing.Any) -> typing.Dict[str, typing.Any]:
+    """Get the models, association tables and Base of a namespace."""
+    return {
+        key: value for key, value in vars(namespace).items() if not key.startswith("__")
+    }
+
+
+@contextlib.contextmanager
+def staged(
+    *, base: typing.Any, exclude: typing.Optional[typing.Iterable[str]] = None
+) -> typing.Iterator[py_types.ModuleType]:
+    """
+    Replace models in the current context with a copy that models are constructed on.
+
+    Other threads and contexts continue to use models until the copy is swapped in
+    using swap.
+
+    Args:
+        base: The declarative base of the copy.
+        exclude: The names of the models that are left out of the copy. If it is
+            None, the copy starts without any models.
+
+    Returns:
+        The copy of models.
+
+    """
+    staged_models = py_types.ModuleType("models")
+    if exclude is not None:
+        excluded = set(exclude)
+        vars(staged_models).update(
+            {
+                key: value
+                for key, value in _public(namespace=open_alchemy.models).items()
+                if key not in excluded
+            }
+        )
+    setattr(staged_models, "Base", base)
+    token = _STAGED.set(staged_models)
+    try:
+        yield staged_models
+    finally:
+        _STAGED.reset(token)
+
+
+def swap(*, staged_models: py_types.ModuleType) -> None:
+    """
+    Replace the contents of models with the staged models.
+
+    The models are added and replaced in a single update after which any models that
+    are not staged are removed.
+
+    Args:
+        staged_models: The staged models.
+
+    """
+    values = _public(namespace=staged_models)
+    removed = [
+        key for key in _public(namespace=open_alchemy.models) if key not in values
+    ]
+    current = vars(open_alchemy.models)
+    current.update(values)
+    for key in removed:
+        current.pop(key, None)
+
 
 def get_base() -> typing.Any:
     """
@@ -20,8 +101,7 @@ def get_base() -> typing.Any:
         The models.Base.
 
     """
-    # pylint: disable=no-member
-    return open_alchemy.models.Base  # type: ignore
+    return _models().Base
 
 
 def set_association(*, table: sqlalchemy.Table, name: str) -> None:
@@ -33,7 +113,7 @@ def set_association(*, table: sqlalchemy.Table, name: str) -> None:
         name: The attribute name to use.
 
     """
-    setattr(open_alchemy.models, name, table)
+    setattr(_models(), name, table)
 
 
 def get_model(*, name: str) -> TOptUtilityBase:
@@ -47,7 +127,7 @@ def get_model(*, name: str) -> TOptUtilityBase:
         The model with the name.
 
     """
-    return getattr(open_alchemy.models, name, None)
+    return getattr(_models(), name, None)
 
 
 def get_model_schema(*, name: str) -> typing.Optional[types.Schema]:
@@ -67,7 +147,7 @@ def get_model_schema(*, name: str) -> typing.Optional[types.Schema]:
     return model._schema  # pylint: disable=protected-access
 
 
-def set_model(*, name: str, model: TUtilityBase) -> None:
+def set_model(*, name: str, model: typing.Type) -> None:
     """
     Set model by name on models.
 
@@ -76,46 +156,73 @@ def set_model(*, name: str, model: TUtilityBase) -> None:
         name: The name of the model.
 
     """
-    setattr(open_alchemy.models, name, model)
+    setattr(_models(), name, model)
 
 
 def _add_backref_to_model(
     *, schema: types.Schema, backref: types.Schema, property_name: str
-) -> None:
+) -> types.Schema:
     """
-    Add backref schema for a model that exists to its schema using the x-backrefs key.
+    Calculate the schema of a model that exists with a backref schema added to it.
 
-    Retrieve and check the existing backrefs format. If backrefs already exists, then
-    add backref schema to it, otherwise start a new backrefs under the x-backrefs key.
+    Retrieve and check the existing backrefs format. The schema of the model is frozen
+    and shares fragments with other models, so a new frozen schema is returned with the
+    backref schema added under the x-backrefs key.
 
     Args:
         schema: The schema to add the backref schema to.
         backref: The backref schema to add.
         property_name: The name under which to add the schema.
 
+    Returns:
+        The frozen schema with the backref schema.
+
     """
     # Check format of x-backrefs
     backrefs = helpers.ext_prop.get(source=schema, name="x-backrefs")
-
-    # Check whether key exists
     if backrefs is None:
-        schema["x-backrefs"] = {property_name: backref}
-        return
+        backrefs = {}
+
+    return helpers.frozen.freeze(
+        {**schema, "x-backrefs": {**backrefs, property_name: backref}}
+    )
+
+
+class _BackrefStore:
+    """Store backrefs of models that have not been constructed yet by model name."""
+
+    _backrefs: typing.Dict[str, types.Schema]
+
+    def __init__(self) -> None:
+        """Construct."""
+        self._backrefs = {}
+
+    def reset(self) -> None:
+        """Reset the state of the backref store."""
+        self._backrefs = {}
+
+    def add(self, *, name: str, backref: types.Schema, property_name: str) -> None:
+        """Record a backref schema for a model under a property name."""
+        self._backrefs.setdefault(name, {})[property_name] = backref
+
+    def pop(self, *, name: str) -> types.Schema:
+        """Remove and return the backref schemas recorded for a model."""
+        return self._backrefs.pop(name, {})
+
 
-    # Add backref to existing
-    schema["x-backrefs"][property_name] = backref
+_backref_store = _BackrefStore()  # pylint: disable=invalid-name
 
 
 def _add_backref_to_schemas(
     *, name: str, schemas: types.Schemas, backref: types.Schema, property_name: str
 ) -> None:
     """
-    Add backref schema for a model that does not exist to its schema.
+    Add backref schema for a model that does not exist to the backref store.
 
     Raise SchemaNotFoundError if the schema does not exist.
 
-    Look for model in schemas. If it already has allOf, append backref, otherwise wrap
-    the schema in an allOf with x-backrefs key.
+    The schemas are not modified. The backrefs are merged into the schema of the model
+    once when it is constructed.
 
     Args:
         name: The name of the model of the backref.
@@ -124,29 +231,38 @@ def _add_backref_to_schemas(
         property_name: The name under which to add the schema.
 
     """
-    # Retrieve schema for model
-    schema = schemas.get(name)
-    if schema is None:
+    if name not in schemas:
         raise exceptions.SchemaNotFoundError(
             f"The schema {name} was not found in schemas."
         )
 
-    # Calculate the schema addition
-    backref_schema = {"type": "object", "x-backrefs": {property_name: backref}}
+    _backref_store.add(name=name, backref=backref, property_name=property_name)
 
-    # Add backref to allOf
-    all_of = schema.get("allOf")
-    if all_of is None:
-        schemas[name] = {"allOf": [schemas[name], backref_schema]}
-        return
-    all_of.append(backref_schema)
+
+def pop_backrefs(*, name: str) -> types.Schema:
+    """
+    Remove and return the backrefs recorded for a model before it was constructed.
+
+    Args:
+        name: The name of the model.
+
+    Returns:
+        The backref schemas by property name.
+
+    """
+    return _backref_store.pop(name=name)
+
+
+def reset_backrefs() -> None:
+    """Discard the backrefs recorded for models that have not been constructed."""
+    _backref_store.reset()
 
 
 def add_backref(
     *, name: str, schemas: types.Schemas, backref: types.Schema, property_name: str
 ) -> None:
     """
-    Add backref to model if it exists or to schemas otherwise.
+    Add backref to model if it exists or to the backref store otherwise.
 
     Args:
         name: The name of the model to add the backref to.
@@ -165,7 +281,7 @@ def add_backref(
         return
 
     # Handle model defined
-    _add_backref_to_model(
+    model._schema = _add_backref_to_model(  # pylint: disable=protected-access
         schema=model._schema,  # pylint: disable=protected-access
         backref=backref,
         property_name=property_name,
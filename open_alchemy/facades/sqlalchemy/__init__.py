@@ -5,14 +5,27 @@ import typing
 
 import sqlalchemy
 from sqlalchemy import orm
+from sqlalchemy.ext import declarative
 
+from open_alchemy import loading
 from open_alchemy import types
 
+from . import bulk as bulk
+from . import cache as cache
 from . import column as column
+from . import ddl as ddl
+from . import index as index
+from . import query as query
+from . import rebuild as rebuild
+from . import tracking as tracking
 
 # Mapping from SQLAlchemy
 Table = sqlalchemy.Table
+Index = sqlalchemy.Index
+UniqueConstraint = sqlalchemy.UniqueConstraint
 Relationship = orm.RelationshipProperty
+create_engine = sqlalchemy.create_engine  # pylint: disable=invalid-name
+declarative_base = declarative.declarative_base  # pylint: disable=invalid-name
 
 
 def relationship(*, artifacts: types.RelationshipArtifacts) -> orm.RelationshipProperty:
@@ -29,15 +42,25 @@ def relationship(*, artifacts: types.RelationshipArtifacts) -> orm.RelationshipP
     # Construct back reference
     backref = None
     if artifacts.back_reference is not None:
+        backref_kwargs: typing.Dict[str, typing.Any] = {}
+        backref_lazy = loading.calculate_lazy(artifacts.back_reference.lazy)
+        if backref_lazy is not None:
+            backref_kwargs["lazy"] = backref_lazy
         backref = orm.backref(
             artifacts.back_reference.property_name,
             uselist=artifacts.back_reference.uselist,
+            **backref_kwargs,
         )
 
     # Construct kwargs
     kwargs: typing.Dict[str, typing.Any] = {}
     if artifacts.kwargs is not None:
-        kwargs = artifacts.kwargs
+        kwargs = {**artifacts.kwargs}
+    lazy = loading.calculate_lazy(
+        artifacts.lazy if artifacts.lazy is not None else kwargs.get("lazy")
+    )
+    if lazy is not None:
+        kwargs["lazy"] = lazy
 
     # Construct relationship
     return orm.relationship(
@@ -45,8 +68,78 @@ def relationship(*, artifacts: types.RelationshipArtifacts) -> orm.RelationshipP
     )
 
 
+def unloaded(*, instance: typing.Any) -> typing.Set[str]:
+    """
+    Calculate the names of the attributes of an instance that have not been loaded.
+
+    Args:
+        instance: The model instance.
+
+    Returns:
+        The names of the attributes that have not been loaded.
+
+    """
+    return sqlalchemy.inspect(instance).unloaded
+
+
+def unindexed_foreign_keys(*, table: Table) -> typing.List[column.Column]:
+    """
+    Find the foreign key columns of a table that do not lead any index or constraint.
+
+    A column leads an index or constraint if it is the first column of an index, a
+    unique constraint or the primary key. Columns that explicitly disable index are not
+    included.
+
+    Args:
+        table: The table to check.
+
+    Returns:
+        The foreign key columns without a supporting index.
+
+    """
+    leading: typing.Set[str] = set()
+    for table_index in table.indexes:
+        index_columns = list(table_index.columns)
+        if index_columns:
+            leading.add(index_columns[0].name)
+    for constraint in table.constraints:
+        if isinstance(
+            constraint, (sqlalchemy.UniqueConstraint, sqlalchemy.PrimaryKeyConstraint)
+        ):
+            constraint_columns = list(constraint.columns)
+            if constraint_columns:
+                leading.add(constraint_columns[0].name)
+
+    return [
+        table_column
+        for table_column in table.columns
+        if table_column.foreign_keys
+        and table_column.name not in leading
+        and table_column.index is not False
+    ]
+
+
+def add_index(*, column_: column.Column) -> Index:
+    """
+    Add an index to a column of a table named using the naming convention.
+
+    Args:
+        column_: The column to index.
+
+    Returns:
+        The index.
+
+    """
+    return Index(None, column_)
+
+
 def table(
-    *, tablename: str, base: typing.Any, columns: typing.Tuple[column.Column, ...]
+    *,
+    tablename: str,
+    base: typing.Any,
+    columns: typing.Tuple[column.Column, ...],
+    args: typing.Tuple[typing.Any, ...] = (),
+    kwargs: types.TOptKwargs = None,
 ) -> Table:
     """
     Construct table.
@@ -55,9 +148,13 @@ def table(
         tablename: The name of the table to construct.
         base: The base class for the table containing metadata.
         columns: The columns of the table.
+        args: Any other positional arguments for the table such as indexes.
+        kwargs: Keyword arguments for the table.
 
     Returns:
         The SQLAlchemy table.
 
     """
-    return Table(tablename, base.metadata, *columns)
+    if kwargs is None:
+        kwargs = {}
+    return Table(tablename, base.metadata, *columns, *args, **kwargs)
@@ -0,0 +1,238 @@
+"""Batched Core INSERT and upsert statements against the table of a model."""
+
+import contextlib
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext import compiler
+from sqlalchemy.sql import expression
+
+from ... import exceptions
+
+Insert = expression.Insert
+TRow = typing.Dict[str, typing.Any]
+TColumnKeys = typing.Tuple[str, ...]
+
+
+class _Upsert(Insert):
+    """INSERT with ON CONFLICT DO UPDATE/NOTHING for dialects without a construct."""
+
+    inherit_cache = False
+
+    def __init__(
+        self,
+        table: sqlalchemy.Table,
+        *,
+        index_elements: typing.Sequence[str],
+        update: typing.Sequence[str],
+    ) -> None:
+        """Construct."""
+        super().__init__(table)
+        self.index_elements = tuple(index_elements)
+        self.update = tuple(update)
+
+
+@compiler.compiles(_Upsert)
+def _compile_upsert(element: _Upsert, sql_compiler, **kwargs) -> str:
+    """Append the ON CONFLICT clause to the compiled INSERT statement."""
+    insert = sql_compiler.visit_insert(element, **kwargs)
+    quote = sql_compiler.preparer.quote
+    table = typing.cast(sqlalchemy.Table, element.table)
+    target = ", ".join(quote(table.columns[key].name) for key in element.index_elements)
+    if not element.update:
+        return f"{insert} ON CONFLICT ({target}) DO NOTHING"
+    assignments = ", ".join(
+        f"{quote(name)} = excluded.{quote(name)}"
+        for name in (table.columns[key].name for key in element.update)
+    )
+    return f"{insert} ON CONFLICT ({target}) DO UPDATE SET {assignments}"
+
+
+def column_keys(*, model: typing.Type) -> typing.Dict[str, str]:
+    """
+    Map the property names of a model to the keys of the columns of its table.
+
+    Relationships are not included. A property backed by more than one column, such as
+    the primary key of a model with joined table inheritance, uses the column of the
+    table of the model.
+
+    Args:
+        model: The model to calculate the keys for.
+
+    Returns:
+        The column key for each property that maps to a column.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    return {prop.key: prop.columns[0].key for prop in mapper.column_attrs}
+
+
+def conflict_targets(*, table: sqlalchemy.Table) -> typing.List[TColumnKeys]:
+    """
+    Calculate the sets of columns that can be used as the target of an upsert.
+
+    These are the primary key and any unique constraints and unique indexes defined on
+    the table, including single column ones.
+
+    Args:
+        table: The table to calculate the targets for.
+
+    Returns:
+        The column keys of every unique set of columns of the table.
+
+    """
+    targets: typing.List[TColumnKeys] = []
+    if table.primary_key.columns:
+        targets.append(tuple(column.key for column in table.primary_key.columns))
+    for constraint in table.constraints:
+        if isinstance(constraint, sqlalchemy.UniqueConstraint):
+            targets.append(tuple(column.key for column in constraint.columns))
+    for index in table.indexes:
+        index_columns = [
+            expr for expr in index.expressions if isinstance(expr, sqlalchemy.Column)
+        ]
+        if index.unique and len(index_columns) == len(index.expressions):
+            targets.append(tuple(column.key for column in index_columns))
+    for column in table.columns:
+        if column.unique:
+            targets.append((column.key,))
+    return targets
+
+
+def dialect_name(*, bind: typing.Any, table: sqlalchemy.Table) -> str:
+    """
+    Retrieve the name of the dialect of a session, connection or engine.
+
+    Args:
+        bind: The session, connection or engine.
+        table: The table the statements are issued against.
+
+    Returns:
+        The name of the dialect.
+
+    """
+    if isinstance(bind, orm.Session):
+        bind = bind.get_bind(clause=table)
+    return bind.dialect.name
+
+
+def insert(*, table: sqlalchemy.Table) -> Insert:
+    """
+    Construct an INSERT statement for a table.
+
+    Args:
+        table: The table to insert into.
+
+    Returns:
+        The INSERT statement.
+
+    """
+    return table.insert()
+
+
+def upsert(
+    *,
+    table: sqlalchemy.Table,
+    dialect: str,
+    index_elements: typing.Sequence[str],
+    update: typing.Sequence[str],
+) -> Insert:
+    """
+    Construct an INSERT ... ON CONFLICT statement for a table.
+
+    Raise FeatureNotImplementedError if the dialect does not support ON CONFLICT.
+
+    Args:
+        table: The table to insert into.
+        dialect: The name of the dialect the statement is executed on.
+        index_elements: The keys of the columns that identify a conflict.
+        update: The keys of the columns to update when there is a conflict.
+
+    Returns:
+        The upsert statement.
+
+    """
+    if dialect == "postgresql":
+        statement = postgresql.insert(table)
+        target = [table.columns[key] for key in index_elements]
+        if not update:
+            return statement.on_conflict_do_nothing(index_elements=target)
+        return statement.on_conflict_do_update(
+            index_elements=target,
+            set_={table.columns[key].name: statement.excluded[key] for key in update},
+        )
+    if dialect == "sqlite":
+        return _Upsert(table, index_elements=index_elements, update=update)
+    raise exceptions.FeatureNotImplementedError(
+        f"Upserts are not supported for the {dialect} dialect."
+    )
+
+
+def update(
+    *,
+    bind: typing.Any,
+    table: sqlalchemy.Table,
+    criteria: typing.Sequence[typing.Any],
+    row: TRow,
+) -> int:
+    """
+    Execute a single UPDATE of the rows of a table that match criteria.
+
+    Args:
+        bind: The session, connection or engine to execute the statement with.
+        table: The table to update.
+        criteria: The expressions that the rows to update must all match.
+        row: The values to set keyed by column key.
+
+    Returns:
+        The number of rows that matched the criteria.
+
+    """
+    statement = table.update().where(sqlalchemy.and_(*criteria)).values(row)
+    return bind.execute(statement).rowcount
+
+
+def execute(*, bind: typing.Any, statement: Insert, rows: typing.List[TRow]) -> None:
+    """
+    Execute a statement for a batch of rows using executemany.
+
+    Args:
+        bind: The session, connection or engine to execute the statement with.
+        statement: The statement to execute.
+        rows: The parameters for each row, all rows must have the same keys.
+
+    """
+    bind.execute(statement, rows)
+
+
+@contextlib.contextmanager
+def transaction(*, bind: typing.Any) -> typing.Iterator[typing.Any]:
+    """
+    Run statements in a transaction that is committed when the context exits.
+
+    For a session, the session is committed or rolled back. For an engine, a connection
+    with a transaction is opened. For a connection, a transaction is started on it.
+
+    Args:
+        bind: The session, engine or connection.
+
+    Returns:
+        The session or connection to execute statements with.
+
+    """
+    if isinstance(bind, orm.Session):
+        try:
+            yield bind
+            bind.commit()
+        except BaseException:
+            bind.rollback()
+            raise
+        return
+    if isinstance(bind, sqlalchemy.engine.Engine):
+        with bind.begin() as connection:
+            yield connection
+        return
+    with bind.begin():
+        yield bind
@@ -0,0 +1,230 @@
+"""Read and reconstruct instances by primary key and listen for changes to them."""
+
+import functools
+import typing
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy import orm
+
+TIdentity = typing.Tuple[typing.Any, ...]
+
+
+def identity(*, instance: typing.Any) -> TIdentity:
+    """
+    Calculate the primary key of an instance.
+
+    Args:
+        instance: The instance of a model.
+
+    Returns:
+        The values of the primary key columns.
+
+    """
+    mapper = sqlalchemy.inspect(instance).mapper
+    return tuple(mapper.primary_key_from_instance(instance))
+
+
+def get(*, query: orm.Query, identity_: TIdentity) -> typing.Any:
+    """
+    Read an instance by its primary key, using the identity map of the session.
+
+    Args:
+        query: A query for the model.
+        identity_: The values of the primary key columns.
+
+    Returns:
+        The instance or None if it does not exist.
+
+    """
+    return query.get(identity_)
+
+
+def column_values(*, instance: typing.Any) -> typing.Dict[str, typing.Any]:
+    """
+    Collect the values of the properties of an instance that map to a column.
+
+    Args:
+        instance: The instance of a model.
+
+    Returns:
+        The value of each property that maps to a column.
+
+    """
+    mapper = sqlalchemy.inspect(instance).mapper
+    return {prop.key: getattr(instance, prop.key) for prop in mapper.column_attrs}
+
+
+def detached(*, model: typing.Type, values: typing.Dict[str, typing.Any]) -> typing.Any:
+    """
+    Construct a detached instance from the values of its columns.
+
+    The constructor of the model is not called. The instance can be attached to a
+    session using merge with load=False.
+
+    Args:
+        model: The model of the instance.
+        values: The value of each property that maps to a column.
+
+    Returns:
+        The detached instance.
+
+    """
+    instance = sqlalchemy.inspect(model).class_manager.new_instance()
+    for key, value in values.items():
+        setattr(instance, key, value)
+    orm.make_transient_to_detached(instance)
+    return instance
+
+
+_PENDING_KEY = "open_alchemy.cache.pending"
+TPending = typing.Set[typing.Tuple[typing.Callable[[typing.Any], None], typing.Any]]
+
+
+def _run_pending(session: typing.Any, *_args: typing.Any) -> None:
+    """Call the functions recorded for a session during its transaction."""
+    pending: TPending = session.info.pop(_PENDING_KEY, set())
+    for callback, argument in pending:
+        callback(argument)
+
+
+@functools.lru_cache(maxsize=None)
+def _listen_transactions() -> None:
+    """Call the recorded functions when a transaction ends, once."""
+    event.listen(orm.Session, "after_commit", _run_pending)
+    event.listen(orm.Session, "after_soft_rollback", _run_pending)
+
+
+def _defer(
+    *,
+    session: typing.Any,
+    callback: typing.Callable[[typing.Any], None],
+    argument: typing.Any,
+) -> None:
+    """
+    Call a function when the transaction of a session is committed or rolled back.
+
+    The function is called straight away if there is no session.
+
+    """
+    if session is None:
+        callback(argument)
+        return
+    _listen_transactions()
+    session.info.setdefault(_PENDING_KEY, set()).add((callback, argument))
+
+
+def defer(
+    *,
+    bind: typing.Any,
+    callback: typing.Callable[[typing.Any], None],
+    argument: typing.Any,
+) -> None:
+    """
+    Call a function after statements are executed outside of the unit of work.
+
+    For a session the function is called when its transaction is committed or rolled
+    back. For a connection or an engine the function is called straight away.
+
+    Args:
+        bind: The session, connection or engine the statements were executed with.
+        callback: The function to call.
+        argument: The argument to call the function with.
+
+    """
+    session = bind if isinstance(bind, orm.Session) else None
+    _defer(session=session, callback=callback, argument=argument)
+
+
+def listen_changes(
+    *, model: typing.Type, callback: typing.Callable[[TIdentity], None]
+) -> None:
+    """
+    Call a function with the primary key of any instance that is updated or deleted.
+
+    The function is called when the transaction of the session that flushed the
+    change is committed or rolled back so that values read while the transaction is
+    in progress do not outlive it. Also called for instances of models that inherit
+    from the model. The previous primary key is also passed if it was changed.
+
+    Args:
+        model: The model to listen to.
+        callback: The function to call with the primary key.
+
+    """
+
+    def handle(
+        _mapper: typing.Any, _connection: typing.Any, target: typing.Any
+    ) -> None:
+        """Record the current and the previous primary key for the callback."""
+        state = sqlalchemy.inspect(target)
+        current = identity(instance=target)
+        _defer(session=state.session, callback=callback, argument=current)
+        previous = state.identity
+        if previous is not None and tuple(previous) != current:
+            _defer(session=state.session, callback=callback, argument=tuple(previous))
+
+    event.listen(model, "after_update", handle, propagate=True)
+    event.listen(model, "after_delete", handle, propagate=True)
+
+
+def listen_bulk_changes(*, callback: typing.Callable[[typing.Type], None]) -> None:
+    """
+    Call a function with the model of any query update or delete of any session.
+
+    Query updates and deletes do not emit the events of the instances that are
+    changed. The function is called when the transaction of the session is committed
+    or rolled back.
+
+    Args:
+        callback: The function to call with the model.
+
+    """
+
+    def handle(context: typing.Any) -> None:
+        """Record the model of the query for the callback."""
+        _defer(
+            session=context.session, callback=callback, argument=context.mapper.class_
+        )
+
+    event.listen(orm.Session, "after_bulk_update", handle)
+    event.listen(orm.Session, "after_bulk_delete", handle)
+
+
+def listen_instance_changes(
+    *, model: typing.Type, callback: typing.Callable[[typing.Any], None]
+) -> None:
+    """
+    Call a function with any instance of a model whose values may have changed.
+
+    The function is called when a property is set, when an item is appended to or
+    removed from a relationship, when an instance is inserted, expired or refreshed and
+    when deferred properties are loaded. Only instances of the model itself, not of
+    models that inherit from it, are passed.
+
+    Args:
+        model: The model to listen to.
+        callback: The function to call with the instance.
+
+    """
+
+    def handle(target: typing.Any, *_args: typing.Any, **_kwargs: typing.Any) -> None:
+        """Pass the instance to the callback unless it has been garbage collected."""
+        if target is not None:
+            callback(target)
+
+    def handle_mapper(
+        _mapper: typing.Any, _connection: typing.Any, target: typing.Any
+    ) -> None:
+        """Pass the instance of a mapper event to the callback."""
+        callback(target)
+
+    for prop in sqlalchemy.inspect(model).attrs:
+        attribute = getattr(model, prop.key)
+        event.listen(attribute, "set", handle)
+        if isinstance(prop, orm.RelationshipProperty) and prop.uselist:
+            event.listen(attribute, "append", handle)
+            event.listen(attribute, "remove", handle)
+    for identifier in ("expire", "refresh", "refresh_flush"):
+        event.listen(model, identifier, handle)
+    event.listen(model, "after_insert", handle_mapper)
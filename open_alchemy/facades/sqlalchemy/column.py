@@ -3,6 +3,7 @@
 import typing
 
 import sqlalchemy
+from sqlalchemy import orm
 
 from ... import exceptions
 from ... import helpers
@@ -21,6 +22,7 @@ Date = sqlalchemy.Date
 DateTime = sqlalchemy.DateTime
 Boolean = sqlalchemy.Boolean
 JSON = sqlalchemy.JSON
+ColumnProperty = orm.ColumnProperty
 
 
 class _TOptColumnArgs(types.TypedDict, total=False):
@@ -30,6 +32,7 @@ class _TOptColumnArgs(types.TypedDict, total=False):
     autoincrement: bool
     index: bool
     unique: bool
+    server_default: sqlalchemy.sql.elements.TextClause
 
 
 def construct(*, artifacts: types.ColumnArtifacts) -> Column:
@@ -44,12 +47,14 @@ def construct(*, artifacts: types.ColumnArtifacts) -> Column:
 
     """
     type_ = _determine_type(artifacts=artifacts)
-    foreign_key: typing.Optional[ForeignKey] = None
+    args: typing.List[typing.Any] = []
     if artifacts.extension.foreign_key is not None:
         foreign_key_kwargs: types.TKwargs = {}
         if artifacts.extension.foreign_key_kwargs is not None:
             foreign_key_kwargs = artifacts.extension.foreign_key_kwargs
-        foreign_key = ForeignKey(artifacts.extension.foreign_key, **foreign_key_kwargs)
+        args.append(ForeignKey(artifacts.extension.foreign_key, **foreign_key_kwargs))
+    if artifacts.extension.computed is not None:
+        args.append(_computed(computed=artifacts.extension.computed))
     # Map default value
     default = None
     if artifacts.open_api.default is not None:
@@ -69,13 +74,17 @@ def construct(*, artifacts: types.ColumnArtifacts) -> Column:
         opt_kwargs["index"] = artifacts.extension.index
     if artifacts.extension.unique is not None:
         opt_kwargs["unique"] = artifacts.extension.unique
+    if artifacts.extension.server_default is not None:
+        opt_kwargs["server_default"] = sqlalchemy.text(
+            artifacts.extension.server_default
+        )
     # Generate kwargs
     kwargs: types.TKwargs = {}
     if artifacts.extension.kwargs is not None:
         kwargs = artifacts.extension.kwargs
     return Column(
         type_,
-        foreign_key,
+        *args,
         nullable=artifacts.open_api.nullable,
         default=default,
         **opt_kwargs,
@@ -83,6 +92,66 @@ def construct(*, artifacts: types.ColumnArtifacts) -> Column:
     )
 
 
+def _computed(*, computed: types.Computed) -> typing.Any:
+    """
+    Construct the computed construct of a column.
+
+    Raise FeatureNotImplementedError if the installed SQLAlchemy does not support
+    computed columns.
+
+    Args:
+        computed: The value of x-computed.
+
+    Returns:
+        The computed construct.
+
+    """
+    # Computed was added in SQLAlchemy 1.3.11
+    computed_class = getattr(sqlalchemy, "Computed", None)
+    if computed_class is None:
+        raise exceptions.FeatureNotImplementedError(
+            "x-computed requires SQLAlchemy 1.3.11 or later."
+        )
+    return computed_class(computed["expression"], persisted=computed.get("persisted"))
+
+
+def deferred(*, column: Column, group: typing.Optional[str] = None) -> ColumnProperty:
+    """
+    Defer loading a column until it is accessed.
+
+    Args:
+        column: The column to defer.
+        group: The name of the group of columns that are loaded together.
+
+    Returns:
+        The deferred column property.
+
+    """
+    return orm.deferred(column, group=group)
+
+
+def server_generated(*, value: typing.Any) -> bool:
+    """
+    Check whether the value of a column is generated by the database.
+
+    Args:
+        value: The column or column property to check.
+
+    Returns:
+        Whether the column has a server default or is computed.
+
+    """
+    columns = getattr(value, "columns", [value])
+    return any(
+        isinstance(column, Column)
+        and (
+            column.server_default is not None
+            or getattr(column, "computed", None) is not None
+        )
+        for column in columns
+    )
+
+
 def _determine_type(*, artifacts: types.ColumnArtifacts) -> Type:
     """
     Determine the type for a specification.
@@ -0,0 +1,238 @@
+"""Compile DDL statements for a dialect without connecting to a database."""
+
+import typing
+
+import sqlalchemy
+from sqlalchemy import schema
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+
+from open_alchemy import exceptions
+
+_DIALECTS = {"postgresql": postgresql.dialect, "mysql": mysql.dialect}
+DIALECTS = tuple(_DIALECTS)
+
+
+def dialect(*, name: str) -> typing.Any:
+    """
+    Construct a dialect by name.
+
+    Args:
+        name: The name of the dialect, one of DIALECTS.
+
+    Returns:
+        The dialect.
+
+    """
+    return _DIALECTS[name]()
+
+
+def _compile(element: typing.Any, dialect_: typing.Any) -> str:
+    """
+    Compile a DDL element or type.
+
+    Raise FeatureNotImplementedError if the dialect does not support the element.
+
+    """
+    try:
+        return str(element.compile(dialect=dialect_)).strip()
+    except sqlalchemy.exc.CompileError as exc:
+        raise exceptions.FeatureNotImplementedError(
+            f"{dialect_.name} does not support {element}: {exc}"
+        ) from exc
+
+
+def _table(table: sqlalchemy.Table, dialect_: typing.Any) -> str:
+    """Quote the name of a table."""
+    return dialect_.identifier_preparer.format_table(table)
+
+
+def _name(name: str, dialect_: typing.Any) -> str:
+    """Quote a name."""
+    return dialect_.identifier_preparer.quote(name)
+
+
+def column_type(*, column: sqlalchemy.Column, dialect_: typing.Any) -> str:
+    """
+    Compile the type of a column.
+
+    Raise FeatureNotImplementedError if the dialect does not support the type.
+
+    Args:
+        column: The column.
+        dialect_: The dialect.
+
+    Returns:
+        The type as it is written in DDL.
+
+    """
+    return _compile(column.type, dialect_)
+
+
+def widens(*, old: sqlalchemy.Column, new: sqlalchemy.Column) -> bool:
+    """
+    Check whether the type of a column only becomes a longer string type.
+
+    Args:
+        old: The previous column.
+        new: The current column.
+
+    Returns:
+        Whether the type is a string type that is at least as long as before.
+
+    """
+    old_type: typing.Any = old.type
+    new_type: typing.Any = new.type
+    if not isinstance(old_type, sqlalchemy.String) or type(old_type) is not type(
+        new_type
+    ):
+        return False
+    if new_type.length is None:
+        return True
+    return old_type.length is not None and new_type.length >= old_type.length
+
+
+def create_table(*, table: sqlalchemy.Table, dialect_: typing.Any) -> str:
+    """Compile CREATE TABLE without the indexes of the table."""
+    return _compile(schema.CreateTable(table), dialect_)
+
+
+def drop_table(*, table: sqlalchemy.Table, dialect_: typing.Any) -> str:
+    """Compile DROP TABLE."""
+    return _compile(schema.DropTable(table), dialect_)  # type: ignore
+
+
+def add_column(*, column: sqlalchemy.Column, dialect_: typing.Any) -> str:
+    """Compile ALTER TABLE ADD COLUMN."""
+    return (
+        f"ALTER TABLE {_table(column.table, dialect_)} "
+        f"ADD COLUMN {_compile(schema.CreateColumn(column), dialect_)}"
+    )
+
+
+def drop_column(*, column: sqlalchemy.Column, dialect_: typing.Any) -> str:
+    """Compile ALTER TABLE DROP COLUMN."""
+    return (
+        f"ALTER TABLE {_table(column.table, dialect_)} "
+        f"DROP COLUMN {dialect_.identifier_preparer.format_column(column)}"
+    )
+
+
+def alter_column(
+    *, column: sqlalchemy.Column, dialect_: typing.Any, type_: bool, nullable: bool
+) -> typing.List[str]:
+    """
+    Compile the statements that change the type or nullability of a column.
+
+    Args:
+        column: The column with the new type and nullability.
+        dialect_: The dialect.
+        type_: Whether the type changed.
+        nullable: Whether the nullability changed.
+
+    Returns:
+        The statements.
+
+    """
+    table = _table(column.table, dialect_)
+    if dialect_.name == "mysql":
+        return [
+            f"ALTER TABLE {table} "
+            f"MODIFY {_compile(schema.CreateColumn(column), dialect_)}"
+        ]
+
+    name = dialect_.identifier_preparer.format_column(column)
+    statements = []
+    if type_:
+        statements.append(
+            f"ALTER TABLE {table} ALTER COLUMN {name} "
+            f"TYPE {column_type(column=column, dialect_=dialect_)}"
+        )
+    if nullable:
+        action = "DROP NOT NULL" if column.nullable else "SET NOT NULL"
+        statements.append(f"ALTER TABLE {table} ALTER COLUMN {name} {action}")
+    return statements
+
+
+def _concurrently(
+    *, index: sqlalchemy.Index, dialect_: typing.Any, concurrently: bool
+) -> None:
+    """Set whether the index is created and dropped concurrently on PostgreSQL."""
+    if dialect_.name == "postgresql":
+        index.dialect_options["postgresql"]["concurrently"] = concurrently
+
+
+def create_index(
+    *, index: sqlalchemy.Index, dialect_: typing.Any, concurrently: bool
+) -> str:
+    """Compile CREATE INDEX, concurrently on PostgreSQL if requested."""
+    _concurrently(index=index, dialect_=dialect_, concurrently=concurrently)
+    return _compile(schema.CreateIndex(index), dialect_)  # type: ignore
+
+
+def drop_index(
+    *, index: sqlalchemy.Index, dialect_: typing.Any, concurrently: bool
+) -> str:
+    """Compile DROP INDEX, concurrently on PostgreSQL if requested."""
+    _concurrently(index=index, dialect_=dialect_, concurrently=concurrently)
+    if dialect_.name == "mysql":
+        return (
+            f"DROP INDEX {_name(index.name, dialect_)} "
+            f"ON {_table(index.table, dialect_)}"  # type: ignore
+        )
+    return _compile(schema.DropIndex(index), dialect_)  # type: ignore
+
+
+def add_unique_constraint(
+    *, constraint: sqlalchemy.UniqueConstraint, name: str, dialect_: typing.Any
+) -> typing.List[str]:
+    """
+    Compile the statements that add a unique constraint to an existing table.
+
+    On PostgreSQL the unique index is created concurrently first and the constraint
+    uses the index so that writes are not blocked while the index is built.
+
+    Args:
+        constraint: The unique constraint.
+        name: The name of the constraint.
+        dialect_: The dialect.
+
+    Returns:
+        The statements.
+
+    """
+    table = _table(constraint.table, dialect_)
+    columns = ", ".join(
+        dialect_.identifier_preparer.format_column(column)
+        for column in constraint.columns
+    )
+    quoted_name = _name(name, dialect_)
+    if dialect_.name != "postgresql":
+        return [f"ALTER TABLE {table} ADD CONSTRAINT {quoted_name} UNIQUE ({columns})"]
+    return [
+        f"CREATE UNIQUE INDEX CONCURRENTLY {quoted_name} ON {table} ({columns})",
+        f"ALTER TABLE {table} ADD CONSTRAINT {quoted_name} "
+        f"UNIQUE USING INDEX {quoted_name}",
+    ]
+
+
+def add_foreign_key(
+    *, constraint: sqlalchemy.ForeignKeyConstraint, dialect_: typing.Any
+) -> str:
+    """Compile ALTER TABLE ADD FOREIGN KEY."""
+    return _compile(schema.AddConstraint(constraint), dialect_)  # type: ignore
+
+
+def drop_constraint(
+    *, constraint: sqlalchemy.Constraint, name: str, dialect_: typing.Any
+) -> str:
+    """Compile ALTER TABLE DROP CONSTRAINT for a constraint with a name."""
+    table = _table(constraint.table, dialect_)
+    if dialect_.name == "mysql":
+        kind = (
+            "FOREIGN KEY"
+            if isinstance(constraint, sqlalchemy.ForeignKeyConstraint)
+            else "INDEX"
+        )
+        return f"ALTER TABLE {table} DROP {kind} {_name(name, dialect_)}"
+    return f"ALTER TABLE {table} DROP CONSTRAINT {_name(name, dialect_)}"
@@ -0,0 +1,90 @@
+"""Support index options that older versions of SQLAlchemy do not implement."""
+
+import functools
+import typing
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext import compiler as sa_compiler
+from sqlalchemy.sql import ddl
+
+
+def include_supported() -> bool:
+    """Check whether SQLAlchemy supports INCLUDE for PostgreSQL indexes."""
+    arguments = dict(postgresql.dialect.construct_arguments or [])
+    return "include" in arguments.get(sqlalchemy.Index, {})
+
+
+def _column_list_end(statement: str) -> int:
+    """
+    Find the end of the column list of a CREATE INDEX statement.
+
+    Args:
+        statement: The CREATE INDEX statement.
+
+    Returns:
+        The index just after the closing bracket of the column list.
+
+    """
+    start = statement.index("(", statement.index(" ON "))
+    depth = 0
+    for position in range(start, len(statement)):
+        if statement[position] == "(":
+            depth += 1
+        elif statement[position] == ")":
+            depth -= 1
+            if depth == 0:
+                return position + 1
+    return len(statement)
+
+
+def _compile_create_index(
+    previous: typing.Optional[typing.Callable[..., str]],
+    create: ddl.CreateIndex,
+    compiler: typing.Any,
+    **kwargs: typing.Any,
+) -> str:
+    """
+    Add the INCLUDE clause to the CREATE INDEX statement for PostgreSQL.
+
+    Statements for indexes without include are compiled unchanged by any previously
+    registered compilation function or by the compiler.
+
+    """
+    compile_ = (
+        functools.partial(previous, create, compiler)
+        if previous is not None
+        else functools.partial(compiler.visit_create_index, create)
+    )
+    index: typing.Any = create.element
+    include = index.dialect_options["postgresql"]["include"]
+    if not include:
+        return compile_(**kwargs)
+
+    statement: str = compile_(**kwargs)
+    columns = ", ".join(
+        compiler.preparer.quote(column if isinstance(column, str) else column.name)
+        for column in include
+    )
+    end = _column_list_end(statement)
+    return f"{statement[:end]} INCLUDE ({columns}){statement[end:]}"
+
+
+@functools.lru_cache(maxsize=None)
+def register_include() -> None:
+    """
+    Register the postgresql_include argument of Index if it is not supported, once.
+
+    Only called when an index with include is constructed so that the compilation of
+    CREATE INDEX is left alone otherwise.
+
+    """
+    if include_supported():
+        return
+    sqlalchemy.Index.argument_for("postgresql", "include", None)
+    # pylint: disable=protected-access
+    dispatcher = vars(ddl.CreateIndex).get("_compiler_dispatcher")
+    previous = dispatcher.specs.get("postgresql") if dispatcher is not None else None
+    sa_compiler.compiles(ddl.CreateIndex, "postgresql")(
+        functools.partial(_compile_create_index, previous)
+    )
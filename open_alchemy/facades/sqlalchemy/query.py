@@ -0,0 +1,287 @@
+"""Read model instances and column metadata for exports and pagination."""
+
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.orm import exc as orm_exc
+
+
+def column_nullable(*, model: typing.Type) -> typing.Dict[str, bool]:
+    """
+    Map the property names of a model that are backed by a column to its nullability.
+
+    A property backed by more than one column, such as the primary key of a model
+    with joined table inheritance, uses the column of the table of the model.
+
+    Args:
+        model: The model to calculate the nullability for.
+
+    Returns:
+        Whether the column is nullable for each property that maps to a column.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    return {prop.key: bool(prop.columns[0].nullable) for prop in mapper.column_attrs}
+
+
+def iterate(
+    *, rows: typing.Iterable[typing.Any], chunk_size: int
+) -> typing.Iterable[typing.Any]:
+    """
+    Iterate over a query or any other iterable of instances.
+
+    A query is executed with yield_per so that rows are fetched from the database in
+    chunks instead of being loaded all at once.
+
+    Args:
+        rows: The query or the instances.
+        chunk_size: The number of rows fetched at a time for a query.
+
+    Returns:
+        The instances.
+
+    """
+    if isinstance(rows, orm.Query):
+        return rows.yield_per(chunk_size)
+    return rows
+
+
+def _property_keys(
+    *, mapper: typing.Any, columns: typing.Iterable[typing.Any]
+) -> typing.Tuple[str, ...]:
+    """
+    Calculate the property keys for the leading columns of a constraint or index.
+
+    Stops at the first expression that is not a column of the model.
+
+    Args:
+        mapper: The mapper of the model.
+        columns: The columns or expressions of the constraint or index.
+
+    Returns:
+        The property keys of the leading columns.
+
+    """
+    keys: typing.List[str] = []
+    for column in columns:
+        if not isinstance(column, sqlalchemy.Column):
+            break
+        try:
+            keys.append(mapper.get_property_by_column(column).key)
+        except orm_exc.UnmappedColumnError:
+            break
+    return tuple(keys)
+
+
+def index_keys(
+    *, model: typing.Type
+) -> typing.List[typing.Tuple[typing.Tuple[str, ...], bool]]:
+    """
+    Calculate the property keys of the primary key, unique constraints and indexes.
+
+    Args:
+        model: The model to calculate the keys for.
+
+    Returns:
+        The property keys of each primary key, unique constraint and index together
+        with whether the keys are unique. The primary key is first.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    keys = [
+        (_property_keys(mapper=mapper, columns=mapper.primary_key), True),
+    ]
+    for table in mapper.tables:
+        for constraint in table.constraints:
+            if isinstance(constraint, sqlalchemy.UniqueConstraint):
+                keys.append(
+                    (_property_keys(mapper=mapper, columns=constraint.columns), True)
+                )
+        for index in table.indexes:
+            keys.append(
+                (
+                    _property_keys(mapper=mapper, columns=index.expressions),
+                    bool(index.unique),
+                )
+            )
+    return [(key, unique) for key, unique in keys if key]
+
+
+def keyset(
+    *,
+    query: orm.Query,
+    model: typing.Type,
+    ordering: typing.Sequence[typing.Tuple[str, bool]],
+    after: typing.Optional[typing.Sequence[typing.Any]],
+    limit: int,
+) -> orm.Query:
+    """
+    Order a query and filter it to the rows after a position.
+
+    Any existing ordering of the query is replaced. One more row than the limit is
+    selected so that it can be determined whether there is a next page.
+
+    Args:
+        query: The query to paginate.
+        model: The model that is queried.
+        ordering: The property keys to order by and whether each is descending.
+        after: The values of the ordering properties of the last row of the previous
+            page.
+        limit: The number of rows of the page.
+
+    Returns:
+        The query for the page.
+
+    """
+    columns = [getattr(model, key) for key, _ in ordering]
+    query = query.order_by(None).order_by(
+        *(
+            column.desc() if descending else column.asc()
+            for column, (_, descending) in zip(columns, ordering)
+        )
+    )
+
+    if after is not None:
+        directions = {descending for _, descending in ordering}
+        if len(columns) > 1 and len(directions) == 1:
+            # Compare row values so that the database can use the index directly
+            left = sqlalchemy.tuple_(*columns)
+            right = sqlalchemy.tuple_(*after)
+            query = query.filter(left < right if directions.pop() else left > right)
+        else:
+            clauses = []
+            for position, (column, (_, descending)) in enumerate(
+                zip(columns, ordering)
+            ):
+                value = after[position]
+                clauses.append(
+                    sqlalchemy.and_(
+                        *(
+                            previous == after[index]
+                            for index, previous in enumerate(columns[:position])
+                        ),
+                        column < value if descending else column > value,
+                    )
+                )
+            query = query.filter(sqlalchemy.or_(*clauses))
+
+    return query.limit(limit + 1)
+
+
+def filter_expression(
+    *, model: typing.Type, name: str, operator: str, value: typing.Any
+) -> typing.Any:
+    """
+    Construct the SQL expression of a filter on a property.
+
+    Args:
+        model: The model to filter.
+        name: The name of the property.
+        operator: One of eq, in, range, gt, gte, lt, lte or prefix.
+        value: The value to compare with. A list of values for in and the lower and
+            upper bound for range where either may be None.
+
+    Returns:
+        The SQL expression.
+
+    """
+    column = getattr(model, name)
+    if operator == "in":
+        return column.in_(value)
+    if operator == "range":
+        lower, upper = value
+        if lower is None:
+            return column <= upper
+        if upper is None:
+            return column >= lower
+        return column.between(lower, upper)
+    if operator == "prefix":
+        return column.startswith(value, autoescape=True)
+    if operator == "gt":
+        return column > value
+    if operator == "gte":
+        return column >= value
+    if operator == "lt":
+        return column < value
+    if operator == "lte":
+        return column <= value
+    return column == value
+
+
+def _selectin_options(
+    *, model: typing.Type, paths: typing.Sequence[typing.Sequence[str]]
+) -> typing.List[typing.Any]:
+    """Construct a selectinload option for each path of relationship names."""
+    options: typing.List[typing.Any] = []
+    for path in paths:
+        current = model
+        option: typing.Any = None
+        for name in path:
+            attribute = getattr(current, name)
+            if option is None:
+                option = orm.selectinload(attribute)
+            else:
+                option = option.selectinload(attribute)
+            current = attribute.property.mapper.class_
+        options.append(option)
+    return options
+
+
+def eager(
+    *,
+    session: orm.Session,
+    model: typing.Type,
+    query: typing.Optional[orm.Query],
+    paths: typing.Sequence[typing.Sequence[str]],
+) -> orm.Query:
+    """
+    Bind a query to a session and load relationships using selectinload.
+
+    Args:
+        session: The session to execute the query with.
+        model: The model that is queried.
+        query: The query that is not bound to a session. Defaults to all instances of
+            the model.
+        paths: The relationship names from the model to each relationship to load.
+
+    Returns:
+        The query bound to the session.
+
+    """
+    if query is None:
+        query = orm.Query(model)
+    return query.with_session(session).options(
+        *_selectin_options(model=model, paths=paths)
+    )
+
+
+def load_relationships(
+    *,
+    session: orm.Session,
+    instance: typing.Any,
+    paths: typing.Sequence[typing.Sequence[str]],
+) -> None:
+    """
+    Load the relationships of a persistent instance that have not been loaded.
+
+    The row of the instance is selected again with selectinload for the paths which
+    populates the attributes that have not been loaded without overwriting any other
+    attribute. Instances that are not persistent are left unchanged.
+
+    Args:
+        session: The session of the instance.
+        instance: The instance to load the relationships of.
+        paths: The relationship names from the model to each relationship to load.
+
+    """
+    state = sqlalchemy.inspect(instance)
+    if not state.persistent or not paths:
+        return
+    model = type(instance)
+    eager(session=session, model=model, query=None, paths=paths).filter(
+        *(
+            column == value
+            for column, value in zip(state.mapper.primary_key, state.identity)
+        )
+    ).all()
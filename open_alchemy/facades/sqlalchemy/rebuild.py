@@ -0,0 +1,103 @@
+"""Construct declarative bases and copy tables for reloading models."""
+
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+
+def fresh_base(*, base: typing.Any) -> typing.Any:
+    """
+    Construct a declarative base like an existing base with new metadata.
+
+    The base has the same name, bases, metaclass and naming convention as the existing
+    base but a separate class registry and metadata.
+
+    Args:
+        base: The existing declarative base.
+
+    Returns:
+        The new declarative base.
+
+    """
+    return declarative.declarative_base(
+        cls=base.__bases__,
+        name=base.__name__,
+        metaclass=type(base),
+        metadata=sqlalchemy.MetaData(
+            naming_convention=dict(base.metadata.naming_convention)
+        ),
+    )
+
+
+def table_names(*, model: typing.Any) -> typing.Set[str]:
+    """
+    Calculate the names of the tables of a model and its association tables.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The full names of the tables.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    tables = list(mapper.tables)
+    tables.extend(
+        relationship.secondary
+        for relationship in mapper.relationships
+        if isinstance(relationship.secondary, sqlalchemy.Table)
+    )
+    return {table.fullname for table in tables}
+
+
+def copy_tables(
+    *,
+    source: sqlalchemy.MetaData,
+    target: sqlalchemy.MetaData,
+    exclude: typing.Set[str],
+) -> None:
+    """
+    Copy the tables of a metadata that are not excluded and not in another metadata.
+
+    Args:
+        source: The metadata to copy the tables from.
+        target: The metadata to copy the tables to.
+        exclude: The full names of the tables not to copy.
+
+    """
+    for name, table in source.tables.items():
+        if name in exclude or name in target.tables:
+            continue
+        table.tometadata(target)
+
+
+def configure_mappers() -> None:
+    """Configure the mappers of all models to raise any error in relationships."""
+    orm.configure_mappers()
+
+
+def dispose(*, base: typing.Any) -> None:
+    """
+    Remove the mappers of the models of a base so that they are not configured.
+
+    Uses the registry of the base where SQLAlchemy defines one and otherwise removes
+    the mappers from the registry of all mappers.
+
+    Args:
+        base: The declarative base of the models.
+
+    """
+    registry = getattr(base, "registry", None)
+    if registry is not None and hasattr(registry, "dispose"):
+        registry.dispose()
+        return
+
+    # pylint: disable=protected-access
+    mapperlib: typing.Any = orm.mapperlib
+    with mapperlib._CONFIGURE_MUTEX:
+        for mapper in list(mapperlib._mapper_registry):
+            if issubclass(mapper.class_, base):
+                mapperlib._mapper_registry.pop(mapper, None)
+                mapper.dispose()
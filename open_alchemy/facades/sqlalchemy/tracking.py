@@ -0,0 +1,44 @@
+"""Listen to the statements and instance loads of all engines and sessions."""
+
+import typing
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy import orm
+
+
+def listen_statements(*, callback: typing.Callable[[str], None]) -> None:
+    """
+    Call a function with every statement that is executed by any engine.
+
+    Args:
+        callback: The function to call with the SQL of the statement.
+
+    """
+
+    def handle(
+        _conn: typing.Any,
+        _cursor: typing.Any,
+        statement: str,
+        *_: typing.Any,
+    ) -> None:
+        """Pass the statement to the callback."""
+        callback(statement)
+
+    event.listen(sqlalchemy.engine.Engine, "before_cursor_execute", handle)
+
+
+def listen_loads(*, callback: typing.Callable[[typing.Type], None]) -> None:
+    """
+    Call a function with the model of every instance that is loaded from a row.
+
+    Args:
+        callback: The function to call with the model.
+
+    """
+
+    def handle(target: typing.Any, _context: typing.Any) -> None:
+        """Pass the model of the instance to the callback."""
+        callback(type(target))
+
+    event.listen(orm.Mapper, "load", handle)
@@ -4,6 +4,7 @@
 from . import all_of as all_of
 from . import backref as backref
 from . import ext_prop as ext_prop
+from . import frozen as frozen
 from . import inheritance as inheritance
 from . import oa_to_py_type as oa_to_py_type
 from . import peek as peek
@@ -11,3 +12,4 @@ from . import ref as ref
 from . import schema as schema
 from .calculate_nullable import calculate_nullable as calculate_nullable
 from .define_all import define_all as define_all
+from .index_foreign_keys import index_foreign_keys as index_foreign_keys
@@ -0,0 +1,158 @@
+"""Immutable schemas that share identical fragments."""
+
+import copy
+import sys
+import typing
+import weakref
+
+TKey = typing.Optional[typing.Hashable]
+
+
+def _immutable(self: typing.Any, *_args: typing.Any, **_kwargs: typing.Any) -> None:
+    """Refuse to modify a frozen value."""
+    raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+
+class FrozenDict(dict):
+    """
+    Dictionary that can not be modified.
+
+    Compares equal to a dictionary with the same items. A deep copy is a mutable
+    dictionary.
+
+    """
+
+    __slots__ = ("_key", "__weakref__")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable  # type: ignore[assignment]
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable  # type: ignore[assignment]
+    setdefault = _immutable
+    update = _immutable
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickle as a dictionary."""
+        return (dict, (dict(self),))
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> typing.Dict:
+        """Copy to a mutable dictionary."""
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+class FrozenList(list):
+    """
+    List that can not be modified.
+
+    Compares equal to a list with the same items. A deep copy is a mutable list.
+
+    """
+
+    __slots__ = ("_key", "__weakref__")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable  # type: ignore[assignment]
+    __imul__ = _immutable  # type: ignore[assignment]
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickle as a list."""
+        return (list, (list(self),))
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> typing.List:
+        """Copy to a mutable list."""
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+# The frozen values by the structure of their contents
+_INTERNED: "weakref.WeakValueDictionary[typing.Hashable, typing.Any]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern(key: TKey, frozen: typing.Any) -> typing.Tuple[typing.Any, TKey]:
+    """Return the frozen value with the same contents as the key, recording it."""
+    if key is None:
+        return frozen, None
+    existing = _INTERNED.get(key)
+    if existing is not None:
+        return existing, existing._key  # pylint: disable=protected-access
+    frozen._key = key  # pylint: disable=protected-access
+    _INTERNED[key] = frozen
+    return frozen, key
+
+
+def _freeze(value: typing.Any) -> typing.Tuple[typing.Any, TKey]:
+    """
+    Freeze a value and calculate a key that identifies its contents.
+
+    The key includes the type of scalar values so that, for example, 1 and True are
+    not shared. The key is None if the value contains an unhashable value, in which
+    case it is frozen but not shared.
+
+    """
+    if isinstance(value, (FrozenDict, FrozenList)) and hasattr(value, "_key"):
+        return value, value._key  # pylint: disable=protected-access
+    if isinstance(value, dict):
+        items: typing.List[typing.Tuple[str, typing.Any]] = []
+        keys: typing.Optional[typing.List[typing.Hashable]] = []
+        for name, sub_value in value.items():
+            if isinstance(name, str):
+                name = sys.intern(name)
+            frozen_value, sub_key = _freeze(sub_value)
+            items.append((name, frozen_value))
+            if keys is not None and sub_key is not None:
+                keys.append((name, sub_key))
+            else:
+                keys = None
+        frozen_dict = FrozenDict(items)
+        return _intern(None if keys is None else (dict, tuple(keys)), frozen_dict)
+    if isinstance(value, list):
+        values: typing.List[typing.Any] = []
+        value_keys: typing.Optional[typing.List[typing.Hashable]] = []
+        for sub_value in value:
+            frozen_value, sub_key = _freeze(sub_value)
+            values.append(frozen_value)
+            if value_keys is not None and sub_key is not None:
+                value_keys.append(sub_key)
+            else:
+                value_keys = None
+        frozen_list = FrozenList(values)
+        return _intern(
+            None if value_keys is None else (list, tuple(value_keys)), frozen_list
+        )
+    try:
+        hash(value)
+    except TypeError:
+        return value, None
+    return value, (type(value), value)
+
+
+def freeze(value: typing.Any) -> typing.Any:
+    """
+    Freeze the dictionaries and lists in a value.
+
+    Dictionaries and lists with the same contents, including the order of the keys of
+    dictionaries, share the same frozen value so that identical fragments of schemas
+    are only stored once in memory.
+
+    Args:
+        value: The value to freeze.
+
+    Returns:
+        The value with any dictionary replaced with a FrozenDict and any list replaced
+        with a FrozenList.
+
+    """
+    frozen, _ = _freeze(value)
+    return frozen
@@ -0,0 +1,43 @@
+"""Index the foreign key columns of the table of a model."""
+
+import typing
+import warnings
+
+from .. import exceptions
+from .. import facades
+
+
+def index_foreign_keys(
+    *, model: typing.Type, column_names: typing.Optional[typing.Set[str]] = None
+) -> None:
+    """
+    Index foreign key columns of the table of a model that do not have an index.
+
+    Foreign key columns are only indexed if the model was constructed with foreign key
+    indexing enabled, either through x-index-foreign-keys on the schema or by default.
+    Warn about any foreign key column that is left without an index.
+
+    Args:
+        model: The constructed model.
+        column_names: The names of the columns to check, defaults to all columns of the
+            table.
+
+    """
+    table = getattr(model, "__table__", None)
+    if table is None:
+        return
+    enabled = model._index_foreign_keys  # pylint: disable=protected-access
+
+    for column in facades.sqlalchemy.unindexed_foreign_keys(table=table):
+        if column_names is not None and column.name not in column_names:
+            continue
+        if enabled:
+            facades.sqlalchemy.add_index(column_=column)
+            continue
+        warnings.warn(
+            f"The foreign key column {table.name}.{column.name} of {model.__name__} is "
+            "not indexed which means that joins and cascades scan the table. Set "
+            'x-index on the column or "x-index-foreign-keys" on the schema to add an '
+            'index or set "x-index" to false to silence this warning.',
+            exceptions.UnindexedForeignKeyWarning,
+        )
@@ -278,6 +278,32 @@ def json(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optional[boo
     return value
 
 
+def deferred(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[typing.Union[bool, str]]:
+    """
+    Retrieve the value of the x-deferred extension property of the schema.
+
+    Raises MalformedSchemaError if the value is not a boolean or string.
+
+    Args:
+        schema: The schema to get x-deferred from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The x-deferred value or None if the schema does not have the key.
+
+    """
+    value = peek_key(schema=schema, schemas=schemas, key="x-deferred")
+    if value is None:
+        return None
+    if not isinstance(value, (bool, str)):
+        raise exceptions.MalformedSchemaError(
+            "The x-deferred property must be of type boolean or string."
+        )
+    return value
+
+
 def default(*, schema: types.Schema, schemas: types.Schemas) -> types.TColumnDefault:
     """
     Retrieve the default value and check it against the schema.
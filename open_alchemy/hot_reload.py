@@ -0,0 +1,382 @@
+"""Reload the models when the specification they are constructed from changes."""
+
+import copy
+import dataclasses
+import functools
+import os
+import threading
+import time
+import typing
+import warnings
+
+from . import exceptions
+from . import facades
+from . import helpers
+from . import model_factory as model_factory_module
+from . import types
+
+DEFAULT_INTERVAL = 1.0
+
+_LOCAL_REF_PREFIX = "#/components/schemas/"
+
+TLoadSpec = typing.Callable[[str], types.Schema]
+
+
+def get_schemas(*, spec: types.Schema) -> types.Schemas:
+    """
+    Retrieve the schemas from a specification.
+
+    Raise MalformedSpecificationError if the specification does not have components
+    or the components do not have schemas.
+
+    Args:
+        spec: The OpenAPI specification.
+
+    Returns:
+        The schemas.
+
+    """
+    if "components" not in spec:
+        raise exceptions.MalformedSpecificationError(
+            '"components" is a required key in the specification.'
+        )
+    components = spec.get("components", {})
+    if "schemas" not in components:
+        raise exceptions.MalformedSpecificationError(
+            '"schemas" is a required key in the components of the specification.'
+        )
+    return components.get("schemas", {})
+
+
+def _references(value: typing.Any) -> typing.Set[str]:
+    """Find the names of the schemas that a value references or inherits from."""
+    names: typing.Set[str] = set()
+    pending = [value]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, list):
+            pending.extend(current)
+            continue
+        if not isinstance(current, dict):
+            continue
+        ref = current.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_LOCAL_REF_PREFIX):
+            names.add(ref.split("/")[-1])
+        inherits = current.get("x-inherits")
+        if isinstance(inherits, str):
+            names.add(inherits)
+        pending.extend(current.values())
+    return names
+
+
+def changed(*, old: types.Schemas, new: types.Schemas) -> typing.Set[str]:
+    """
+    Calculate the names of the schemas that were added, removed or changed.
+
+    Args:
+        old: The previous schemas.
+        new: The current schemas.
+
+    Returns:
+        The names of the schemas that are different.
+
+    """
+    return {name for name in {*old, *new} if old.get(name) != new.get(name)}
+
+
+def closure(
+    *, names: typing.Iterable[str], old: types.Schemas, new: types.Schemas
+) -> typing.Set[str]:
+    """
+    Calculate the schemas that are connected to schemas by references or inheritance.
+
+    Back references are defined on references, so models that are related in any way
+    in either the previous or the current schemas are connected.
+
+    Args:
+        names: The names of the schemas to start from.
+        old: The previous schemas.
+        new: The current schemas.
+
+    Returns:
+        The names of the schemas that are connected to the schemas, including them.
+
+    """
+    graph: typing.Dict[str, typing.Set[str]] = {}
+    for schemas in (old, new):
+        for name, schema in schemas.items():
+            for reference in _references(schema):
+                graph.setdefault(name, set()).add(reference)
+                graph.setdefault(reference, set()).add(name)
+
+    connected = set(names)
+    pending = list(connected)
+    while pending:
+        for neighbour in graph.get(pending.pop(), ()):
+            if neighbour not in connected:
+                connected.add(neighbour)
+                pending.append(neighbour)
+    return connected
+
+
+@dataclasses.dataclass(frozen=True)
+class ReloadResult:
+    """
+    The outcome of reloading the models.
+
+    Attrs:
+        changed: The names of the schemas that were added, removed or changed.
+        rebuilt: The names of the models that were constructed again.
+        removed: The names of the models that were removed.
+        duration: The number of seconds the reload took.
+
+    """
+
+    changed: typing.FrozenSet[str]
+    rebuilt: typing.FrozenSet[str]
+    removed: typing.FrozenSet[str]
+    duration: float
+
+
+class Watcher:
+    """Reload the models when the specification file changes."""
+
+    def __init__(
+        self,
+        *,
+        spec_filename: str,
+        load_spec: TLoadSpec,
+        base: typing.Any,
+        schemas: types.Schemas,
+        get_base: types.GetBase,
+        index_foreign_keys: bool = False,
+    ) -> None:
+        """
+        Construct.
+
+        Args:
+            spec_filename: The path to the specification file.
+            load_spec: Reads the specification from the file.
+            base: The declarative base the current models are constructed on.
+            schemas: The schemas the current models are constructed from, as they were
+                before the models were constructed.
+            get_base: Retrieves the base class of a model.
+            index_foreign_keys: Whether to index foreign key columns by default.
+
+        """
+        self.spec_filename = spec_filename
+        self.base = base
+        self.error: typing.Optional[Exception] = None
+        self._load_spec = load_spec
+        self._schemas = schemas
+        self._construct = functools.partial(
+            model_factory_module.model_factory,
+            get_base=get_base,
+            index_foreign_keys=index_foreign_keys,
+        )
+        self._stat = self._read_stat()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def _read_stat(self) -> typing.Tuple[int, int]:
+        """Read the modification time and size of the specification file."""
+        stat = os.stat(self.spec_filename)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def model_factory(*, name: str) -> typing.Type:
+        """
+        Retrieve the current model by name.
+
+        Raise SchemaNotFoundError if the model does not exist.
+
+        Args:
+            name: The name of the model.
+
+        Returns:
+            The model.
+
+        """
+        model = facades.models.get_model(name=name)
+        if model is None:
+            raise exceptions.SchemaNotFoundError(f"The model {name} was not found.")
+        return model
+
+    def check(self) -> typing.Optional[ReloadResult]:
+        """
+        Reload the models if the specification file has changed since it was read.
+
+        Returns:
+            The outcome of the reload or None if the file has not changed.
+
+        """
+        stat = self._read_stat()
+        if stat == self._stat:
+            return None
+        self._stat = stat
+        return self.reload()
+
+    def reload(self) -> ReloadResult:
+        """
+        Reconstruct the changed models and the models connected to them.
+
+        The schemas are compared with the schemas the current models were constructed
+        from. The models that changed and any models that are connected to them by
+        references, back references or inheritance are constructed on a new declarative
+        base while the other models are kept. The new models are staged and then
+        swapped onto open_alchemy.models in a single update, so that other threads see
+        either the previous or the new models. The tables of the models that are kept
+        are copied to the metadata of the new base. If constructing the models fails,
+        the current models are left unchanged.
+
+        Returns:
+            The outcome of the reload.
+
+        """
+        with self._lock:
+            start = time.perf_counter()
+            loaded = get_schemas(spec=self._load_spec(self.spec_filename))
+            changed_names = changed(old=self._schemas, new=loaded)
+            if not changed_names:
+                return ReloadResult(
+                    changed=frozenset(),
+                    rebuilt=frozenset(),
+                    removed=frozenset(),
+                    duration=time.perf_counter() - start,
+                )
+
+            # Constructing the models adds to the schemas
+            schemas = copy.deepcopy(loaded)
+            names = closure(names=changed_names, old=self._schemas, new=schemas)
+            rebuilt = {
+                name
+                for name in names
+                if name in schemas
+                and helpers.schema.constructable(schema=schemas[name], schemas=schemas)
+            }
+            previous = {
+                name: model
+                for name, model in (
+                    (name, facades.models.get_model(name=name)) for name in names
+                )
+                if model is not None
+            }
+
+            base = facades.sqlalchemy.rebuild.fresh_base(base=self.base)
+            cached_model_factory = functools.lru_cache(maxsize=None)(
+                functools.partial(self._construct, schemas=schemas)
+            )
+
+            def _register_model(*, name: str) -> typing.Type:
+                """Construct the rebuilt models and retrieve the other models."""
+                if name not in rebuilt:
+                    return self.model_factory(name=name)
+                model: typing.Any = cached_model_factory(name=name)
+                facades.models.set_model(name=name, model=model)
+                return model
+
+            facades.models.reset_backrefs()
+            with facades.models.staged(base=base, exclude=previous) as staged_models:
+                try:
+                    helpers.define_all(model_factory=_register_model, schemas=schemas)
+                    facades.sqlalchemy.rebuild.configure_mappers()
+                except Exception:
+                    facades.sqlalchemy.rebuild.dispose(base=base)
+                    raise
+
+            excluded_tables: typing.Set[str] = set()
+            for model in previous.values():
+                excluded_tables.update(
+                    facades.sqlalchemy.rebuild.table_names(model=model)
+                )
+            facades.sqlalchemy.rebuild.copy_tables(
+                source=self.base.metadata, target=base.metadata, exclude=excluded_tables
+            )
+            facades.models.swap(staged_models=staged_models)
+            self.base = base
+            self._schemas = loaded
+
+            return ReloadResult(
+                changed=frozenset(changed_names),
+                rebuilt=frozenset(rebuilt),
+                removed=frozenset(set(previous) - rebuilt),
+                duration=time.perf_counter() - start,
+            )
+
+    def _run(self, interval: float) -> None:
+        """Check the specification file until the watcher is stopped."""
+        while not self._stop.wait(interval):
+            try:
+                self.check()
+                self.error = None
+            except Exception as exc:  # pylint: disable=broad-except
+                self.error = exc
+                warnings.warn(
+                    f"Reloading the models from {self.spec_filename} failed: {exc}",
+                    exceptions.ReloadFailedWarning,
+                )
+
+    def start(self, *, interval: float = DEFAULT_INTERVAL) -> None:
+        """
+        Check the specification file for changes in a background thread.
+
+        Errors are recorded on error and warned with ReloadFailedWarning and the
+        current models are kept until the file changes again.
+
+        Args:
+            interval: The number of seconds between checks.
+
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="open-alchemy-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking the specification file for changes."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+class _WatcherStore:
+    """Store the watcher of the specification that the models were constructed from."""
+
+    watcher: typing.Optional[Watcher]
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.watcher = None
+
+
+_watcher_store = _WatcherStore()  # pylint: disable=invalid-name
+
+
+def get_watcher() -> typing.Optional[Watcher]:
+    """
+    Get the watcher started by init_yaml or init_json with watch.
+
+    Returns:
+        The watcher or None if the models are not watched.
+
+    """
+    return _watcher_store.watcher
+
+
+def set_watcher(watcher: typing.Optional[Watcher]) -> None:
+    """
+    Set the watcher of the models, stopping any previous watcher.
+
+    Args:
+        watcher: The watcher or None to stop watching.
+
+    """
+    if _watcher_store.watcher is not None:
+        _watcher_store.watcher.stop()
+    _watcher_store.watcher = watcher
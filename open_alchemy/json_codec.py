@@ -0,0 +1,125 @@
+"""JSON codecs used by to_str and from_str."""
+
+import datetime
+import json
+import typing
+
+from . import types
+
+
+class JsonCodec(types.Protocol):
+    """Defines interface for a JSON codec."""
+
+    def dumps(self, value: typing.Any) -> str:
+        """
+        Serialize a value to a JSON string.
+
+        The value may contain date, datetime and bytes values which must be serialized
+        as ISO formatted strings and UTF-8 decoded strings, respectively.
+
+        """
+        ...
+
+    def loads(self, value: str) -> typing.Any:
+        """De-serialize a JSON string."""
+        ...
+
+
+def _default(value: typing.Any) -> str:
+    """
+    Serialize values that JSON does not support natively.
+
+    Raise TypeError if the value is not a date, datetime or bytes.
+
+    Args:
+        value: The value to serialize.
+
+    Returns:
+        The serialized value.
+
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StdlibCodec:
+    """JSON codec based on the json module in the standard library."""
+
+    @staticmethod
+    def dumps(value: typing.Any) -> str:
+        """Serialize a value to a JSON string."""
+        return json.dumps(value, default=_default)
+
+    @staticmethod
+    def loads(value: str) -> typing.Any:
+        """De-serialize a JSON string."""
+        return json.loads(value)
+
+
+class OrjsonCodec:
+    """JSON codec based on the orjson package which serializes dates natively."""
+
+    def __init__(self) -> None:
+        """
+        Construct.
+
+        Raise ImportError if orjson has not been installed.
+
+        """
+        try:
+            import orjson  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ImportError(
+                "Using OrjsonCodec requires the orjson package. Try "
+                "`pip install orjson`."
+            )
+        self._orjson = orjson
+
+    def dumps(self, value: typing.Any) -> str:
+        """Serialize a value to a JSON string."""
+        return self._orjson.dumps(value, default=_default).decode()
+
+    def loads(self, value: str) -> typing.Any:
+        """De-serialize a JSON string."""
+        return self._orjson.loads(value)
+
+
+class _DefaultCodecStore:
+    """Store the JSON codec used for models that do not define their own."""
+
+    codec: JsonCodec
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.codec = StdlibCodec()
+
+
+_default_codec_store = _DefaultCodecStore()  # pylint: disable=invalid-name
+
+
+def get_default() -> JsonCodec:
+    """
+    Get the JSON codec used for all models that do not define their own.
+
+    Defaults to StdlibCodec. OrjsonCodec is only used if it is set, it is not selected
+    when orjson is installed because its output omits whitespace after separators.
+
+    Returns:
+        The JSON codec.
+
+    """
+    return _default_codec_store.codec
+
+
+def set_default(codec: typing.Optional[JsonCodec]) -> None:
+    """
+    Set the JSON codec used for all models that do not define their own.
+
+    Args:
+        codec: The JSON codec. If it is None, StdlibCodec is used.
+
+    """
+    _default_codec_store.codec = codec if codec is not None else StdlibCodec()
@@ -0,0 +1,187 @@
+"""Track the queries issued while model instances are converted to dictionaries."""
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import typing
+import warnings
+
+from . import exceptions
+from . import facades
+
+THRESHOLD_ACTIONS = ("raise", "warn")
+
+TSource = typing.Tuple[typing.Optional[str], typing.Optional[str]]
+
+
+@dataclasses.dataclass(frozen=True)
+class TrackedQuery:
+    """
+    A query that was issued while loads were tracked.
+
+    Attrs:
+        model: The name of the model whose property was read by to_dict when the query
+            was issued or None if it was not issued by to_dict.
+        property_name: The name of the property that was read or None if the query
+            was not issued by to_dict.
+        statement: The SQL of the query.
+
+    """
+
+    model: typing.Optional[str]
+    property_name: typing.Optional[str]
+    statement: str
+
+
+class LoadReport:
+    """The queries and instance loads recorded by track_loads."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.queries: typing.List[TrackedQuery] = []
+        self.loads: typing.Counter[str] = collections.Counter()
+
+    @property
+    def count(self) -> int:
+        """The number of queries."""
+        return len(self.queries)
+
+    def by_property(self) -> typing.Dict[TSource, int]:
+        """
+        Count the queries per model and property that caused them.
+
+        Returns:
+            The number of queries for each model and property name where queries that
+            were not issued by to_dict are counted under (None, None).
+
+        """
+        return dict(
+            collections.Counter(
+                (query.model, query.property_name) for query in self.queries
+            )
+        )
+
+
+# The reports of the track_loads contexts that are active
+_REPORTS: "contextvars.ContextVar[typing.Tuple[LoadReport, ...]]" = (
+    contextvars.ContextVar("reports", default=())
+)
+# The model and property that to_dict is reading
+_SOURCE: "contextvars.ContextVar[TSource]" = contextvars.ContextVar(
+    "source", default=(None, None)
+)
+
+
+def tracking() -> bool:
+    """Check whether loads are being tracked."""
+    return bool(_REPORTS.get())
+
+
+@contextlib.contextmanager
+def attribute(*, model: str, property_name: str) -> typing.Iterator[None]:
+    """
+    Attribute the queries issued in the context to a property of a model.
+
+    Args:
+        model: The name of the model.
+        property_name: The name of the property that is read.
+
+    """
+    token = _SOURCE.set((model, property_name))
+    try:
+        yield
+    finally:
+        _SOURCE.reset(token)
+
+
+def _record_statement(statement: str) -> None:
+    """Record a query with the active reports."""
+    reports = _REPORTS.get()
+    if not reports:
+        return
+    model, property_name = _SOURCE.get()
+    query = TrackedQuery(model=model, property_name=property_name, statement=statement)
+    for report in reports:
+        report.queries.append(query)
+
+
+def _record_load(model: typing.Type) -> None:
+    """Record an instance load with the active reports."""
+    for report in _REPORTS.get():
+        report.loads[model.__name__] += 1
+
+
+@functools.lru_cache(maxsize=None)
+def _listen() -> None:
+    """Listen to the statements and instance loads, once."""
+    facades.sqlalchemy.tracking.listen_statements(callback=_record_statement)
+    facades.sqlalchemy.tracking.listen_loads(callback=_record_load)
+
+
+def _check(*, report: LoadReport, threshold: int, action: str) -> None:
+    """
+    Check that the number of queries does not exceed the threshold.
+
+    Raise TooManyQueriesError if it does and action is raise and warn with
+    TooManyQueriesWarning if action is warn.
+
+    """
+    if report.count <= threshold:
+        return
+    sources = ", ".join(
+        (
+            f"{model}.{property_name}: {count}"
+            if model is not None
+            else f"not by to_dict: {count}"
+        )
+        for (model, property_name), count in report.by_property().items()
+    )
+    message = (
+        f"{report.count} queries were issued which is more than the threshold of "
+        f"{threshold} ({sources})."
+    )
+    if action == "warn":
+        warnings.warn(message, exceptions.TooManyQueriesWarning)
+        return
+    raise exceptions.TooManyQueriesError(message, by_property=report.by_property())
+
+
+@contextlib.contextmanager
+def track_loads(
+    *, threshold: typing.Optional[int] = None, action: str = "raise"
+) -> typing.Iterator[LoadReport]:
+    """
+    Record the queries and instance loads of all engines issued in the context.
+
+    Queries issued while to_dict reads a property, such as implicit lazy loads of
+    relationships, are attributed to the model and the property. The threshold is
+    checked when the context exits without an error.
+
+    Raise InvalidArgumentError if action is not raise or warn.
+    Raise TooManyQueriesError if more queries than the threshold were issued and
+    action is raise and warn with TooManyQueriesWarning if action is warn.
+
+    Args:
+        threshold: The maximum number of queries. Defaults to no maximum.
+        action: How to handle more queries than the threshold. One of raise or warn.
+
+    Returns:
+        The report that the queries and loads are recorded in.
+
+    """
+    if action not in THRESHOLD_ACTIONS:
+        raise exceptions.InvalidArgumentError(
+            f"action must be one of {', '.join(THRESHOLD_ACTIONS)}.", action=action
+        )
+    _listen()
+
+    report = LoadReport()
+    token = _REPORTS.set((*_REPORTS.get(), report))
+    try:
+        yield report
+    finally:
+        _REPORTS.reset(token)
+    if threshold is not None:
+        _check(report=report, threshold=threshold, action=action)
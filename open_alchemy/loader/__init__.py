@@ -0,0 +1,240 @@
+"""Stream the rows of an NDJSON or CSV file into the table of a model."""
+
+# pylint: disable=useless-import-alias
+
+import collections
+import dataclasses
+import functools
+import itertools
+import time
+import typing
+from concurrent import futures
+
+from .. import cache
+from .. import exceptions
+from .. import facades
+from .. import types as oa_types
+from ..utility_base import bulk
+from . import checkpoint as checkpoint
+from . import reader as reader
+
+DEFAULT_BATCH_SIZE = bulk.DEFAULT_BATCH_SIZE
+DEFAULT_COMMIT_INTERVAL = 10000
+
+_TChunk = typing.Tuple[int, typing.List[typing.Any]]
+
+
+@dataclasses.dataclass
+class Progress:
+    """Progress of a load."""
+
+    # The number of rows skipped because a previous load already committed them
+    rows_skipped: int = 0
+    # The number of rows committed by this load
+    rows_written: int = 0
+    # The number of seconds since the load started
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Calculate the throughput of the load."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rows_written / self.elapsed
+
+
+TProgressCallback = typing.Callable[[Progress], None]
+
+
+def load(
+    *,
+    model: typing.Type,
+    filename: str,
+    bind: typing.Any,
+    format_: typing.Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_interval: int = DEFAULT_COMMIT_INTERVAL,
+    processes: typing.Optional[int] = None,
+    checkpoint_filename: typing.Optional[str] = None,
+    progress: typing.Optional[TProgressCallback] = None,
+) -> Progress:
+    """
+    Stream the rows of a file into the table of a model.
+
+    The file is read row by row and split into chunks of batch_size rows. Each chunk is
+    validated against the model schema and converted, optionally in a process pool,
+    and written using a batched Core INSERT statement. Only a bounded number of chunks
+    are in flight at any time so that memory use does not depend on the size of the
+    file. The transaction is committed every commit_interval rows after which the
+    checkpoint is updated and progress is reported. The primary key cache of the model
+    is cleared when each transaction ends.
+
+    Raise MalformedModelDictionaryError if a row is not valid. The row_number
+    attribute of the exception is the 1-based number of the row in the file.
+
+    Args:
+        model: The model to load the rows into.
+        filename: The name of the NDJSON or CSV file.
+        bind: The session, engine or connection to write with.
+        format_: The format of the file, either ndjson or csv. Determined from the
+            extension of the filename by default.
+        batch_size: The number of rows validated and inserted together.
+        commit_interval: The number of rows between commits.
+        processes: The number of processes used to validate and convert rows. By
+            default rows are validated in the current process.
+        checkpoint_filename: The file used to record the number of committed rows. If
+            it already exists, rows that were committed are skipped.
+        progress: Called with the progress after each commit.
+
+    Returns:
+        The final progress.
+
+    """
+    if commit_interval < 1:
+        raise exceptions.InvalidArgumentError(
+            "The commit interval must be at least 1.", commit_interval=commit_interval
+        )
+    if format_ is None:
+        format_ = reader.format_from_filename(filename)
+    schema: oa_types.Schema = model._schema  # pylint: disable=protected-access
+    bulk.check_schema(schema=schema)
+    column_keys = facades.sqlalchemy.bulk.column_keys(model=model)
+    statement = facades.sqlalchemy.bulk.insert(table=model.__table__)
+
+    start = time.monotonic()
+    result = Progress(
+        rows_skipped=checkpoint.read(filename=checkpoint_filename, source=filename)
+    )
+    with open(filename, newline="") as in_file:
+        raw_rows = itertools.islice(
+            reader.read(in_file=in_file, format_=format_), result.rows_skipped, None
+        )
+        chunks = _number_chunks(
+            bulk.batch(raw_rows, batch_size=batch_size), start=result.rows_skipped
+        )
+        convert = functools.partial(
+            _convert_chunk, schema=schema, column_keys=column_keys, format_=format_
+        )
+        batches = iter(_convert(chunks, convert=convert, processes=processes))
+
+        while True:
+            written = 0
+            with facades.sqlalchemy.bulk.transaction(bind=bind) as connection:
+                for rows_batch in batches:
+                    for _, rows_group in bulk.group(rows_batch):
+                        facades.sqlalchemy.bulk.execute(
+                            bind=connection, statement=statement, rows=rows_group
+                        )
+                    written += len(rows_batch)
+                    if written >= commit_interval:
+                        break
+                if written:
+                    cache.clear_written(model=model, bind=connection)
+            if not written:
+                break
+
+            result.rows_written += written
+            result.elapsed = time.monotonic() - start
+            checkpoint.write(
+                filename=checkpoint_filename,
+                source=filename,
+                rows=result.rows_skipped + result.rows_written,
+            )
+            if progress is not None:
+                progress(result)
+
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def _number_chunks(
+    chunks: typing.Iterable[typing.List[typing.Any]], *, start: int
+) -> typing.Iterator[_TChunk]:
+    """Pair each chunk with the 1-based row number of its first row."""
+    row_number = start + 1
+    for chunk in chunks:
+        yield row_number, chunk
+        row_number += len(chunk)
+
+
+def _convert_chunk(
+    chunk: _TChunk,
+    *,
+    schema: oa_types.Schema,
+    column_keys: typing.Dict[str, str],
+    format_: str,
+) -> typing.List[bulk.TRow]:
+    """
+    Validate and convert a chunk of rows.
+
+    Defined at the module level so that it can be sent to a process pool.
+
+    Args:
+        chunk: The row number of the first row and the rows.
+        schema: The schema of the model.
+        column_keys: The column key for each property that maps to a column.
+        format_: The format of the file the rows were read from.
+
+    Returns:
+        The converted rows.
+
+    """
+    row_number, values = chunk
+    validator = facades.jsonschema.validator(schema=schema)
+    properties = schema["properties"]
+    rows: typing.List[bulk.TRow] = []
+    for offset, value in enumerate(values):
+        try:
+            if format_ == "csv":
+                value = reader.coerce_csv(value, properties=properties)
+            rows.append(
+                bulk.convert(
+                    value=value,
+                    schema=schema,
+                    validator=validator,
+                    column_keys=column_keys,
+                )
+            )
+        except exceptions.BaseError as exc:
+            exc.row_number = row_number + offset  # type: ignore
+            raise
+    return rows
+
+
+def _convert(
+    chunks: typing.Iterable[_TChunk],
+    *,
+    convert: typing.Callable[[_TChunk], typing.List[bulk.TRow]],
+    processes: typing.Optional[int],
+) -> typing.Iterator[typing.List[bulk.TRow]]:
+    """
+    Convert chunks in order, in a process pool if processes is given.
+
+    At most twice as many chunks as there are processes are submitted to the pool
+    ahead of the chunk that is being written.
+
+    Args:
+        chunks: The chunks to convert.
+        convert: Converts a single chunk.
+        processes: The number of processes of the pool.
+
+    Returns:
+        The converted chunks.
+
+    """
+    if processes is None:
+        yield from map(convert, chunks)
+        return
+    if processes < 1:
+        raise exceptions.InvalidArgumentError(
+            "The number of processes must be at least 1.", processes=processes
+        )
+
+    with futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: typing.Deque[futures.Future] = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(convert, chunk))
+            if len(pending) >= processes * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
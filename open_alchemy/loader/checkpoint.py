@@ -0,0 +1,57 @@
+"""Record how many rows of a file have been committed to allow resuming a load."""
+
+import json
+import os
+import typing
+
+from .. import exceptions
+
+
+def read(*, filename: typing.Optional[str], source: str) -> int:
+    """
+    Read the number of rows that were committed by a previous load.
+
+    Raise InvalidArgumentError if the checkpoint was recorded for a different file.
+
+    Args:
+        filename: The name of the checkpoint file. If it is None or does not exist, no
+            rows have been committed.
+        source: The name of the file being loaded.
+
+    Returns:
+        The number of rows that have already been committed.
+
+    """
+    if filename is None or not os.path.exists(filename):
+        return 0
+    with open(filename) as in_file:
+        checkpoint = json.load(in_file)
+    if checkpoint.get("source") != os.path.abspath(source):
+        raise exceptions.InvalidArgumentError(
+            "The checkpoint was recorded for a different file.",
+            checkpoint=filename,
+            checkpoint_source=checkpoint.get("source"),
+            source=source,
+        )
+    return int(checkpoint["rows"])
+
+
+def write(*, filename: typing.Optional[str], source: str, rows: int) -> None:
+    """
+    Record the number of rows that have been committed.
+
+    The file is replaced atomically so that a failure while writing never leaves a
+    corrupt checkpoint behind.
+
+    Args:
+        filename: The name of the checkpoint file. Nothing is written if it is None.
+        source: The name of the file being loaded.
+        rows: The number of rows that have been committed.
+
+    """
+    if filename is None:
+        return
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "w") as out_file:
+        json.dump({"source": os.path.abspath(source), "rows": rows}, out_file)
+    os.replace(tmp_filename, filename)
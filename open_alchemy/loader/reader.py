@@ -0,0 +1,158 @@
+"""Stream rows from NDJSON and CSV files."""
+
+import csv
+import json
+import typing
+
+from .. import exceptions
+from .. import helpers
+from .. import types as oa_types
+
+FORMATS = ("ndjson", "csv")
+_EXTENSIONS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+_TRUE = {"true", "1", "t", "yes", "y"}
+_FALSE = {"false", "0", "f", "no", "n"}
+
+
+def format_from_filename(filename: str) -> str:
+    """
+    Determine the format of a file based on its extension.
+
+    Raise InvalidArgumentError if the extension is not recognised.
+
+    Args:
+        filename: The name of the file.
+
+    Returns:
+        The format of the file.
+
+    """
+    for extension, format_ in _EXTENSIONS.items():
+        if filename.lower().endswith(extension):
+            return format_
+    raise exceptions.InvalidArgumentError(
+        "Could not determine the format of the file from its extension. Pass the "
+        f"format explicitly, supported formats are {FORMATS}.",
+        filename=filename,
+    )
+
+
+def ndjson(in_file: typing.TextIO) -> typing.Iterator[typing.Any]:
+    """
+    Read a file with a JSON document on each line.
+
+    Blank lines are skipped.
+
+    Raise MalformedModelDictionaryError if a line is not valid JSON.
+
+    Args:
+        in_file: The file to read.
+
+    Returns:
+        The de-serialized document for each line.
+
+    """
+    for line_number, line in enumerate(in_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            raise exceptions.MalformedModelDictionaryError(
+                "The line is not valid JSON.", line_number=line_number
+            )
+
+
+def csv_(in_file: typing.TextIO) -> typing.Iterator[typing.Dict[str, str]]:
+    """
+    Read a CSV file with a header row.
+
+    Args:
+        in_file: The file to read.
+
+    Returns:
+        Each row keyed by the column names in the header.
+
+    """
+    return iter(csv.DictReader(in_file))
+
+
+def read(*, in_file: typing.TextIO, format_: str) -> typing.Iterator[typing.Any]:
+    """
+    Read the rows of a file.
+
+    Raise InvalidArgumentError if the format is not supported.
+
+    Args:
+        in_file: The file to read.
+        format_: The format of the file.
+
+    Returns:
+        The rows of the file.
+
+    """
+    if format_ == "ndjson":
+        return ndjson(in_file)
+    if format_ == "csv":
+        return csv_(in_file)
+    raise exceptions.InvalidArgumentError(
+        f"The {format_} format is not supported, supported formats are {FORMATS}."
+    )
+
+
+def coerce_csv(
+    row: typing.Dict[str, str], *, properties: oa_types.Schema
+) -> typing.Dict[str, typing.Any]:
+    """
+    Convert the string values of a CSV row to the types of the model properties.
+
+    Empty values are treated as missing so that any default applies. Values of any
+    property that is not in the schema are left as strings so that validation reports
+    them.
+
+    Raise MalformedModelDictionaryError if a value cannot be converted.
+
+    Args:
+        row: The row to convert.
+        properties: The properties of the model schema.
+
+    Returns:
+        The row with values converted to the types of the properties.
+
+    """
+    coerced: typing.Dict[str, typing.Any] = {}
+    for name, value in row.items():
+        if value is None or value == "":
+            continue
+        property_schema = properties.get(name)
+        if property_schema is None:
+            coerced[name] = value
+            continue
+        try:
+            coerced[name] = _coerce_value(value, schema=property_schema)
+        except ValueError:
+            raise exceptions.MalformedModelDictionaryError(
+                "The CSV value could not be converted to the type of the property.",
+                property_name=name,
+                property_value=value,
+            )
+    return coerced
+
+
+def _coerce_value(value: str, *, schema: oa_types.Schema) -> typing.Any:
+    """Convert a CSV string value to the type of a property."""
+    if helpers.peek.json(schema=schema, schemas={}):
+        return json.loads(value)
+    type_ = helpers.peek.type_(schema=schema, schemas={})
+    if type_ == "integer":
+        return int(value)
+    if type_ == "number":
+        return float(value)
+    if type_ == "boolean":
+        lower = value.strip().lower()
+        if lower in _TRUE:
+            return True
+        if lower in _FALSE:
+            return False
+        raise ValueError(f"{value} is not a boolean.")
+    return value
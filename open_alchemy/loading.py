@@ -0,0 +1,64 @@
+"""Loading strategies of relationships and the raise mode for implicit lazy loads."""
+
+import typing
+
+# The loading strategy that implicit lazy loads are replaced with in raise mode
+RAISE_STRATEGY = "raise_on_sql"
+# The loading strategies that issue a query when the relationship is accessed
+_IMPLICIT_STRATEGIES = {None, "select"}
+
+
+class _RaiseModeStore:
+    """Store whether implicit lazy loads raise an error."""
+
+    enabled: bool
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.enabled = False
+
+
+_raise_mode_store = _RaiseModeStore()  # pylint: disable=invalid-name
+
+
+def get_raise_mode() -> bool:
+    """
+    Get whether implicit lazy loads of relationships raise an error.
+
+    Returns:
+        Whether raise mode is enabled.
+
+    """
+    return _raise_mode_store.enabled
+
+
+def set_raise_mode(enabled: bool) -> None:
+    """
+    Set whether implicit lazy loads of relationships raise an error.
+
+    Only relationships constructed after raise mode is changed are affected.
+
+    Args:
+        enabled: Whether to enable raise mode.
+
+    """
+    _raise_mode_store.enabled = enabled
+
+
+def calculate_lazy(lazy: typing.Optional[str]) -> typing.Optional[str]:
+    """
+    Calculate the loading strategy of a relationship.
+
+    In raise mode, relationships that would be loaded by issuing a query when they are
+    accessed instead raise an error.
+
+    Args:
+        lazy: The loading strategy defined for the relationship.
+
+    Returns:
+        The loading strategy to construct the relationship with.
+
+    """
+    if _raise_mode_store.enabled and lazy in _IMPLICIT_STRATEGIES:
+        return RAISE_STRATEGY
+    return lazy
@@ -0,0 +1,295 @@
+"""Metrics of the throughput and latency of converting model instances."""
+
+import collections
+import dataclasses
+import functools
+import itertools
+import threading
+import time
+import typing
+
+from . import exceptions
+from . import types
+
+DEFAULT_MAX_SAMPLES = 10000
+
+TFunc = typing.TypeVar("TFunc", bound=typing.Callable[..., typing.Any])
+
+
+@dataclasses.dataclass(frozen=True)
+class Event:
+    """
+    A recorded call of a conversion function.
+
+    Attrs:
+        model: The name of the model.
+        operation: The name of the function such as to_dict.
+        duration: The wall time of the call in seconds.
+        size: The length of the string for from_str and to_str and the number of
+            keys of the dictionary otherwise. None if the call failed before the
+            payload was available.
+        failed: Whether the call raised an OpenAlchemy error such as
+            MalformedModelDictionaryError.
+        weight: The number of calls the event stands for based on the sampling.
+
+    """
+
+    model: str
+    operation: str
+    duration: float
+    size: typing.Optional[int]
+    failed: bool
+    weight: int
+
+
+class Collector(types.Protocol):
+    """Defines interface for a metrics collector."""
+
+    def record(self, event: Event) -> None:
+        """Record a call of a conversion function."""
+        ...
+
+
+class NullCollector:
+    """Collector that discards every event, the default."""
+
+    @staticmethod
+    def record(event: Event) -> None:
+        """Discard the event."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Summary:
+    """
+    The aggregated metrics of a function for a model.
+
+    Attrs:
+        calls: The estimated number of calls.
+        failures: The estimated number of calls that failed.
+        total_time: The estimated total wall time of the calls in seconds.
+        p50: The median wall time of the sampled calls in seconds.
+        p90: The 90th percentile wall time of the sampled calls in seconds.
+        p99: The 99th percentile wall time of the sampled calls in seconds.
+        mean_size: The mean size of the payloads or None if no size was recorded.
+
+    """
+
+    calls: int
+    failures: int
+    total_time: float
+    p50: float
+    p90: float
+    p99: float
+    mean_size: typing.Optional[float]
+
+
+class _Aggregate:
+    """The running totals and recent durations of a function for a model."""
+
+    def __init__(self, *, max_samples: int) -> None:
+        """Construct."""
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.size_total = 0
+        self.size_count = 0
+        self.durations: typing.Deque[float] = collections.deque(maxlen=max_samples)
+
+
+def _percentile(values: typing.Sequence[float], fraction: float) -> float:
+    """Calculate the nearest rank percentile of sorted values."""
+    index = max(0, min(len(values) - 1, int(round(fraction * len(values))) - 1))
+    return values[index]
+
+
+class MemoryCollector:
+    """Collector that aggregates events in memory per model and function."""
+
+    def __init__(self, *, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """
+        Construct.
+
+        Args:
+            max_samples: The number of most recent durations per model and function
+                that percentiles are calculated from.
+
+        """
+        self._max_samples = max_samples
+        self._aggregates: typing.Dict[typing.Tuple[str, str], _Aggregate] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: Event) -> None:
+        """Add the event to the aggregate of its model and function."""
+        key = (event.model, event.operation)
+        with self._lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                aggregate = _Aggregate(max_samples=self._max_samples)
+                self._aggregates[key] = aggregate
+            aggregate.calls += event.weight
+            aggregate.total_time += event.duration * event.weight
+            if event.failed:
+                aggregate.failures += event.weight
+            if event.size is not None:
+                aggregate.size_total += event.size
+                aggregate.size_count += 1
+            aggregate.durations.append(event.duration)
+
+    def summary(self) -> typing.Dict[typing.Tuple[str, str], Summary]:
+        """
+        Summarize the recorded events.
+
+        Returns:
+            The summary for each model name and function name.
+
+        """
+        with self._lock:
+            aggregates = [
+                (key, aggregate, sorted(aggregate.durations))
+                for key, aggregate in self._aggregates.items()
+            ]
+        return {
+            key: Summary(
+                calls=aggregate.calls,
+                failures=aggregate.failures,
+                total_time=aggregate.total_time,
+                p50=_percentile(durations, 0.5),
+                p90=_percentile(durations, 0.9),
+                p99=_percentile(durations, 0.99),
+                mean_size=(
+                    aggregate.size_total / aggregate.size_count
+                    if aggregate.size_count
+                    else None
+                ),
+            )
+            for key, aggregate, durations in aggregates
+        }
+
+    def clear(self) -> None:
+        """Remove all recorded events."""
+        with self._lock:
+            self._aggregates.clear()
+
+
+class _CollectorStore:
+    """Store the collector and how often calls are sampled."""
+
+    collector: Collector
+    enabled: bool
+    sample_interval: int
+    counters: typing.DefaultDict[typing.Tuple[str, str], typing.Iterator[int]]
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.collector = NullCollector()
+        self.enabled = False
+        self.sample_interval = 1
+        self.counters = collections.defaultdict(itertools.count)
+
+
+_collector_store = _CollectorStore()  # pylint: disable=invalid-name
+
+
+def get_collector() -> Collector:
+    """
+    Get the collector that conversion functions are recorded with.
+
+    Returns:
+        The collector.
+
+    """
+    return _collector_store.collector
+
+
+def set_collector(
+    collector: typing.Optional[Collector], *, sample_interval: int = 1
+) -> None:
+    """
+    Set the collector that conversion functions are recorded with.
+
+    Raise InvalidArgumentError if the sample interval is less than 1.
+
+    Args:
+        collector: The collector. If it is None, calls are not recorded.
+        sample_interval: Record one in every sample_interval calls of each function
+            of each model. Each event is weighted by the interval so that the counts
+            and total time of a collector are estimates of all calls.
+
+    """
+    if sample_interval < 1:
+        raise exceptions.InvalidArgumentError(
+            "The sample interval must be at least 1.", sample_interval=sample_interval
+        )
+    _collector_store.collector = collector if collector is not None else NullCollector()
+    _collector_store.enabled = not isinstance(_collector_store.collector, NullCollector)
+    _collector_store.sample_interval = sample_interval
+    _collector_store.counters.clear()
+
+
+def _size(value: typing.Any) -> typing.Optional[int]:
+    """Calculate the size of a payload."""
+    if isinstance(value, (str, bytes, dict)):
+        return len(value)
+    return None
+
+
+def instrument(operation: str, *, output: bool) -> typing.Callable[[TFunc], TFunc]:
+    """
+    Record the calls of a conversion function of models with the collector.
+
+    The function is called directly when no collector is set or the call is not
+    sampled. Calls are sampled separately for each function of each model so that
+    functions that call each other are all sampled.
+
+    Args:
+        operation: The name of the function.
+        output: Whether the size is calculated from the return value instead of the
+            first argument or the keyword arguments.
+
+    Returns:
+        Decorator for the function that takes the model or instance as its first
+        argument.
+
+    """
+
+    def decorator(func: TFunc) -> TFunc:
+        """Wrap the function."""
+
+        @functools.wraps(func)
+        def wrapper(
+            owner: typing.Any, *args: typing.Any, **kwargs: typing.Any
+        ) -> typing.Any:
+            """Call the function and record the call."""
+            store = _collector_store
+            if not store.enabled:
+                return func(owner, *args, **kwargs)
+            model = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+            if next(store.counters[(model, operation)]) % store.sample_interval:
+                return func(owner, *args, **kwargs)
+
+            size = None if output else _size(args[0] if args else kwargs)
+            failed = False
+            start = time.perf_counter()
+            try:
+                result = func(owner, *args, **kwargs)
+                if output:
+                    size = _size(result)
+                return result
+            except exceptions.BaseError:
+                failed = True
+                raise
+            finally:
+                store.collector.record(
+                    Event(
+                        model=model,
+                        operation=operation,
+                        duration=time.perf_counter() - start,
+                        size=size,
+                        failed=failed,
+                        weight=store.sample_interval,
+                    )
+                )
+
+        return typing.cast(TFunc, wrapper)
+
+    return decorator
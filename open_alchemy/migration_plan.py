@@ -0,0 +1,447 @@
+"""Plan the migration of the database between two versions of a specification."""
+
+import copy
+import dataclasses
+import functools
+import typing
+
+import open_alchemy
+
+from . import exceptions
+from . import facades
+from . import helpers
+from . import hot_reload
+from . import model_factory as model_factory_module
+from . import types
+
+DEFAULT_DIALECT = "postgresql"
+
+# The key of the metadata info that maps table names to the names of their models
+_MODELS_KEY = "open_alchemy_models"
+
+# The order that the kinds of operations are applied in
+_STAGES = (
+    "create table",
+    "add column",
+    "alter column",
+    "drop index",
+    "drop constraint",
+    "create index",
+    "add constraint",
+    "drop column",
+    "drop table",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Operation:
+    """
+    A step of a migration plan.
+
+    Attrs:
+        kind: The kind of the step such as create table or add column.
+        description: What the step changes.
+        statements: The DDL statements of the step.
+        warning: Why the step rewrites, scans or drops existing data or None if it
+            does not.
+        transactional: Whether the statements can run inside a transaction.
+
+    """
+
+    kind: str
+    description: str
+    statements: typing.Tuple[str, ...]
+    warning: typing.Optional[str] = None
+    transactional: bool = True
+
+
+def build_metadata(
+    *, spec: types.Schema, spec_path: typing.Optional[str] = None
+) -> typing.Any:
+    """
+    Construct the tables of a specification without changing open_alchemy.models.
+
+    Raise MalformedSpecificationError if the specification does not have schemas.
+
+    Args:
+        spec: The OpenAPI specification.
+        spec_path: The path to the specification used to resolve remote references.
+
+    Returns:
+        The metadata with the tables of the models and association tables.
+
+    """
+    if spec_path is not None:
+        helpers.ref.set_context(path=spec_path)
+    schemas = copy.deepcopy(hot_reload.get_schemas(spec=spec))
+    base = facades.sqlalchemy.declarative_base()
+    cached_model_factory = functools.lru_cache(maxsize=None)(
+        functools.partial(
+            model_factory_module.model_factory,
+            schemas=schemas,
+            get_base=open_alchemy._get_base,  # pylint: disable=protected-access
+        )
+    )
+    tables: typing.Dict[str, str] = {}
+
+    def _register_model(*, name: str) -> typing.Type:
+        """Construct the model and record its table."""
+        model: typing.Any = cached_model_factory(name=name)
+        facades.models.set_model(name=name, model=model)
+        tables.setdefault(model.__table__.name, name)
+        return model
+
+    facades.models.reset_backrefs()
+    try:
+        with facades.models.staged(base=base):
+            helpers.define_all(model_factory=_register_model, schemas=schemas)
+    finally:
+        facades.sqlalchemy.rebuild.dispose(base=base)
+        facades.models.reset_backrefs()
+
+    base.metadata.info[_MODELS_KEY] = tables
+    return base.metadata
+
+
+def _describe_table(*, metadata: typing.Any, name: str) -> str:
+    """Describe a table as the table of a model or an association table."""
+    model = metadata.info.get(_MODELS_KEY, {}).get(name)
+    if model is None:
+        return f"association table {name}"
+    return f"table {name} of {model}"
+
+
+def _index_key(index: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    """Calculate what identifies the definition of an index."""
+    return (
+        index.name,
+        index.unique,
+        tuple(str(expression) for expression in index.expressions),
+        tuple(sorted((key, str(value)) for key, value in index.kwargs.items())),
+    )
+
+
+def _column_names(constraint: typing.Any) -> typing.Tuple[str, ...]:
+    """Calculate the names of the columns of a constraint."""
+    return tuple(column.name for column in constraint.columns)
+
+
+def _unique_key(constraint: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    """Calculate what identifies the definition of a unique constraint."""
+    return (constraint.name, _column_names(constraint))
+
+
+def _foreign_key_key(constraint: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    """Calculate what identifies the definition of a foreign key."""
+    return (
+        constraint.name,
+        _column_names(constraint),
+        tuple(element.target_fullname for element in constraint.elements),
+        constraint.ondelete,
+        constraint.onupdate,
+    )
+
+
+def _constraint_name(*, constraint: typing.Any, suffix: str) -> str:
+    """Get the name of a constraint, defaulting to the name PostgreSQL generates."""
+    if constraint.name is not None:
+        return constraint.name
+    return "_".join((constraint.table.name, *_column_names(constraint), suffix))
+
+
+def _unique_constraints(table: typing.Any) -> typing.Dict[typing.Any, typing.Any]:
+    """Get the unique constraints of a table by their definitions."""
+    return {
+        _unique_key(constraint): constraint
+        for constraint in table.constraints
+        if isinstance(constraint, facades.sqlalchemy.UniqueConstraint)
+    }
+
+
+class _Planner:
+    """Collect the operations of a migration plan for a dialect."""
+
+    def __init__(self, *, dialect: str) -> None:
+        """Construct."""
+        self.dialect = facades.sqlalchemy.ddl.dialect(name=dialect)
+        self.operations: typing.List[Operation] = []
+
+    def add(
+        self,
+        kind: str,
+        description: str,
+        *statements: str,
+        warning: typing.Optional[str] = None,
+        transactional: bool = True,
+    ) -> None:
+        """Add an operation."""
+        self.operations.append(
+            Operation(
+                kind=kind,
+                description=description,
+                statements=statements,
+                warning=warning,
+                transactional=transactional,
+            )
+        )
+
+    @property
+    def concurrently(self) -> bool:
+        """Whether indexes are created and dropped concurrently."""
+        return self.dialect.name == "postgresql"
+
+    def create_index(self, index: typing.Any) -> None:
+        """Add the operation that creates an index."""
+        self.add(
+            "create index",
+            f"Create index {index.name} on {index.table.name}",
+            facades.sqlalchemy.ddl.create_index(
+                index=index, dialect_=self.dialect, concurrently=self.concurrently
+            ),
+            warning=(
+                "fails if the existing values are not unique" if index.unique else None
+            ),
+            transactional=not self.concurrently,
+        )
+
+    def drop_index(self, index: typing.Any) -> None:
+        """Add the operation that drops an index."""
+        self.add(
+            "drop index",
+            f"Drop index {index.name} on {index.table.name}",
+            facades.sqlalchemy.ddl.drop_index(
+                index=index, dialect_=self.dialect, concurrently=self.concurrently
+            ),
+            transactional=not self.concurrently,
+        )
+
+    def create_table(self, *, metadata: typing.Any, table: typing.Any) -> None:
+        """Add the operations that create a table and its indexes."""
+        self.add(
+            "create table",
+            f"Create {_describe_table(metadata=metadata, name=table.name)}",
+            facades.sqlalchemy.ddl.create_table(table=table, dialect_=self.dialect),
+        )
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            # The table is empty so the index does not need to be built concurrently
+            self.add(
+                "create index",
+                f"Create index {index.name} on {table.name}",
+                facades.sqlalchemy.ddl.create_index(
+                    index=index, dialect_=self.dialect, concurrently=False
+                ),
+            )
+
+    def drop_table(self, *, metadata: typing.Any, table: typing.Any) -> None:
+        """Add the operation that drops a table."""
+        self.add(
+            "drop table",
+            f"Drop {_describe_table(metadata=metadata, name=table.name)}",
+            facades.sqlalchemy.ddl.drop_table(table=table, dialect_=self.dialect),
+            warning="drops the data of the table",
+        )
+
+    def columns(self, *, old: typing.Any, new: typing.Any) -> None:
+        """Add the operations that add, remove and alter the columns of a table."""
+        for column in new.columns:
+            if column.name in old.columns:
+                self.alter_column(old=old.columns[column.name], new=column)
+                continue
+            self.add(
+                "add column",
+                f"Add column {new.name}.{column.name}",
+                facades.sqlalchemy.ddl.add_column(column=column, dialect_=self.dialect),
+                warning=(
+                    "adds a NOT NULL column without a server default which fails if "
+                    "the table has rows"
+                    if not column.nullable and column.server_default is None
+                    else None
+                ),
+            )
+        for column in old.columns:
+            if column.name in new.columns:
+                continue
+            self.add(
+                "drop column",
+                f"Drop column {old.name}.{column.name}",
+                facades.sqlalchemy.ddl.drop_column(
+                    column=column, dialect_=self.dialect
+                ),
+                warning="drops the data of the column",
+            )
+
+    def alter_column(self, *, old: typing.Any, new: typing.Any) -> None:
+        """Add the operation that changes the type or nullability of a column."""
+        old_type = facades.sqlalchemy.ddl.column_type(column=old, dialect_=self.dialect)
+        new_type = facades.sqlalchemy.ddl.column_type(column=new, dialect_=self.dialect)
+        type_changed = old_type != new_type
+        nullable_changed = old.nullable != new.nullable
+        if not type_changed and not nullable_changed:
+            return
+
+        changes = []
+        warnings = []
+        if type_changed:
+            changes.append(f"type {old_type} to {new_type}")
+            if not facades.sqlalchemy.ddl.widens(old=old, new=new):
+                warnings.append("rewrites the table to convert the values")
+        if nullable_changed:
+            changes.append("nullable" if new.nullable else "not nullable")
+            if not new.nullable:
+                warnings.append("scans the table and fails if any value is NULL")
+        self.add(
+            "alter column",
+            f"Alter column {new.table.name}.{new.name}: {', '.join(changes)}",
+            *facades.sqlalchemy.ddl.alter_column(
+                column=new,
+                dialect_=self.dialect,
+                type_=type_changed,
+                nullable=nullable_changed,
+            ),
+            warning=", ".join(warnings) or None,
+        )
+
+    def indexes(self, *, old: typing.Any, new: typing.Any) -> None:
+        """Add the operations that add and remove the indexes of a table."""
+        old_indexes = {_index_key(index): index for index in old.indexes}
+        new_indexes = {_index_key(index): index for index in new.indexes}
+        for key in sorted(set(old_indexes) - set(new_indexes), key=str):
+            self.drop_index(old_indexes[key])
+        for key in sorted(set(new_indexes) - set(old_indexes), key=str):
+            self.create_index(new_indexes[key])
+
+    def unique_constraints(self, *, old: typing.Any, new: typing.Any) -> None:
+        """Add the operations that add and remove the unique constraints of a table."""
+        old_constraints = _unique_constraints(old)
+        new_constraints = _unique_constraints(new)
+        for key in sorted(set(old_constraints) - set(new_constraints), key=str):
+            constraint = old_constraints[key]
+            name = _constraint_name(constraint=constraint, suffix="key")
+            self.add(
+                "drop constraint",
+                f"Drop unique constraint {name} on {old.name}",
+                facades.sqlalchemy.ddl.drop_constraint(
+                    constraint=constraint, name=name, dialect_=self.dialect
+                ),
+            )
+        for key in sorted(set(new_constraints) - set(old_constraints), key=str):
+            constraint = new_constraints[key]
+            name = _constraint_name(constraint=constraint, suffix="key")
+            self.add(
+                "add constraint",
+                f"Add unique constraint {name} on {new.name}",
+                *facades.sqlalchemy.ddl.add_unique_constraint(
+                    constraint=constraint, name=name, dialect_=self.dialect
+                ),
+                warning="fails if the existing values are not unique",
+                transactional=not self.concurrently,
+            )
+
+    def foreign_keys(self, *, old: typing.Any, new: typing.Any) -> None:
+        """Add the operations that add and remove the foreign keys of a table."""
+        old_constraints = {
+            _foreign_key_key(constraint): constraint
+            for constraint in old.foreign_key_constraints
+        }
+        new_constraints = {
+            _foreign_key_key(constraint): constraint
+            for constraint in new.foreign_key_constraints
+        }
+        for key in sorted(set(old_constraints) - set(new_constraints), key=str):
+            constraint = old_constraints[key]
+            name = _constraint_name(constraint=constraint, suffix="fkey")
+            self.add(
+                "drop constraint",
+                f"Drop foreign key {name} on {old.name}",
+                facades.sqlalchemy.ddl.drop_constraint(
+                    constraint=constraint, name=name, dialect_=self.dialect
+                ),
+            )
+        for key in sorted(set(new_constraints) - set(old_constraints), key=str):
+            constraint = new_constraints[key]
+            self.add(
+                "add constraint",
+                f"Add foreign key on {new.name}.{', '.join(_column_names(constraint))}",
+                facades.sqlalchemy.ddl.add_foreign_key(
+                    constraint=constraint, dialect_=self.dialect
+                ),
+                warning="scans the table to check the existing values",
+            )
+
+
+def plan(
+    *, old: typing.Any, new: typing.Any, dialect: str = DEFAULT_DIALECT
+) -> typing.List[Operation]:
+    """
+    Plan the operations that migrate the database from one metadata to another.
+
+    The tables, columns, types, nullability, indexes, unique constraints and foreign
+    keys of the metadata are compared. Indexes on existing tables are created and
+    dropped concurrently on PostgreSQL and unique constraints on existing tables use
+    a unique index that is created concurrently. Operations that rewrite, scan or drop
+    existing data have a warning. Changes to primary keys and server defaults are not
+    planned.
+
+    Raise InvalidArgumentError if the dialect is not supported.
+
+    Args:
+        old: The metadata the database currently has, see build_metadata.
+        new: The metadata the database should have.
+        dialect: The dialect the statements are compiled for. One of postgresql and
+            mysql.
+
+    Returns:
+        The operations in the order they should be applied.
+
+    """
+    if dialect not in facades.sqlalchemy.ddl.DIALECTS:
+        raise exceptions.InvalidArgumentError(
+            f"dialect must be one of {', '.join(facades.sqlalchemy.ddl.DIALECTS)}.",
+            dialect=dialect,
+        )
+    planner = _Planner(dialect=dialect)
+
+    for table in new.sorted_tables:
+        if table.key not in old.tables:
+            planner.create_table(metadata=new, table=table)
+    for table in reversed(old.sorted_tables):
+        if table.key not in new.tables:
+            planner.drop_table(metadata=old, table=table)
+    for table in new.sorted_tables:
+        old_table = old.tables.get(table.key)
+        if old_table is None:
+            continue
+        planner.columns(old=old_table, new=table)
+        planner.indexes(old=old_table, new=table)
+        planner.unique_constraints(old=old_table, new=table)
+        planner.foreign_keys(old=old_table, new=table)
+
+    return sorted(
+        planner.operations, key=lambda operation: _STAGES.index(operation.kind)
+    )
+
+
+def format_plan(*, operations: typing.Sequence[Operation]) -> str:
+    """
+    Format a migration plan as a SQL script with comments.
+
+    Args:
+        operations: The operations of the plan.
+
+    Returns:
+        The SQL script.
+
+    """
+    if not operations:
+        return "-- No changes.\n"
+
+    blocks = []
+    for number, operation in enumerate(operations, start=1):
+        lines = [f"-- {number}. {operation.description}"]
+        if operation.warning is not None:
+            lines.append(f"-- WARNING: {operation.warning}")
+        if not operation.transactional:
+            lines.append("-- Run outside of a transaction.")
+        lines.extend(f"{statement};" for statement in operation.statements)
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
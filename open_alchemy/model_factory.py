@@ -3,8 +3,10 @@
 import itertools
 import typing
 
+from . import cache
 from . import column_factory
 from . import exceptions
+from . import facades
 from . import helpers
 from . import table_args
 from . import types
@@ -12,7 +14,11 @@ from . import utility_base
 
 
 def model_factory(
-    *, name: str, get_base: types.GetBase, schemas: types.Schemas
+    *,
+    name: str,
+    get_base: types.GetBase,
+    schemas: types.Schemas,
+    index_foreign_keys: bool = False,
 ) -> typing.Type:
     """
     Convert OpenAPI schema to SQLAlchemy model.
@@ -21,6 +27,8 @@ def model_factory(
         name: The name of the schema.
         get_base: Funcrtion to retrieve the base class for the model.
         schemas: The OpenAPI schemas.
+        index_foreign_keys: Whether to index foreign key columns by default, may be
+            overridden by x-index-foreign-keys on the schema.
 
     Returns:
         The model as a class.
@@ -64,19 +72,44 @@ def model_factory(
         if not dict_ignore:
             model_schema["properties"][prop_name] = prop_final_spec
 
+    # Merging backrefs recorded before the model was constructed
+    backrefs = facades.models.pop_backrefs(name=name)
+    if backrefs:
+        model_schema["x-backrefs"] = {**model_schema.get("x-backrefs", {}), **backrefs}
+
+    # Constructing the primary key cache
+    model_cache = None
+    cache_spec = helpers.ext_prop.get(source=schema, name="x-cache")
+    if cache_spec is not None:
+        model_cache = cache.calculate(cache_spec)
+
     # Assembling model
     base = get_base(name=name, schemas=schemas)
-    return type(
+    class_vars = dict(itertools.chain.from_iterable(model_class_vars))
+    model = type(
         name,
         (base, utility_base.UtilityBase),
         {
-            "_schema": model_schema,
-            **dict(itertools.chain.from_iterable(model_class_vars)),
-            "__table_args__": table_args.construct(schema=schema),
-            **_get_kwargs(schema=schema),
+            "_schema": helpers.frozen.freeze(model_schema),
+            "_cache": model_cache,
+            "_dict_cache": helpers.ext_prop.get(
+                source=schema, name="x-dict-cache", default=False
+            ),
+            "_index_foreign_keys": helpers.ext_prop.get(
+                source=schema, name="x-index-foreign-keys", default=index_foreign_keys
+            ),
+            **class_vars,
+            "__table_args__": table_args.construct(schema=schema, schemas=schemas),
+            **_add_eager_defaults(
+                kwargs=_get_kwargs(schema=schema), class_vars=class_vars
+            ),
             **_prepare_model_dict(schema=schema),
         },
     )
+    helpers.index_foreign_keys(model=model)
+    if model_cache is not None:
+        cache.register(model=model, model_cache=model_cache)
+    return model
 
 
 def _get_schema(name: str, schemas: types.Schemas) -> types.Schema:
@@ -164,6 +197,32 @@ def _get_kwargs(*, schema: types.Schema) -> types.TKwargs:
     return kwargs
 
 
+def _add_eager_defaults(
+    *, kwargs: types.TKwargs, class_vars: typing.Dict[str, typing.Any]
+) -> types.TKwargs:
+    """
+    Fetch values generated by the database when a row is inserted or updated.
+
+    If any column has a server default or is computed, eager_defaults is added to the
+    __mapper_args__ unless it is already defined.
+
+    Args:
+        kwargs: The kwargs for the model.
+        class_vars: The columns and relationships of the model.
+
+    Returns:
+        The kwargs for the model.
+
+    """
+    if not any(
+        facades.sqlalchemy.column.server_generated(value=value)
+        for value in class_vars.values()
+    ):
+        return kwargs
+    mapper_args = {"eager_defaults": True, **kwargs.get("__mapper_args__", {})}
+    return {**kwargs, "__mapper_args__": mapper_args}
+
+
 def _prepare_model_dict(schema: types.Schema) -> typing.Dict[str, typing.Any]:
     """
     Prepare the dictionary used to construct the model.
@@ -14,20 +14,26 @@ TableArg = typing.Union[sa_schema.UniqueConstraint, sa_schema.Index]
 TableArgs = typing.Tuple[TableArg, ...]
 
 
-def construct(*, schema: types.Schema) -> TableArgs:
+def construct(
+    *, schema: types.Schema, schemas: typing.Optional[types.Schemas] = None
+) -> TableArgs:
     """
     Construct any table args from the object schema.
 
     Look for x-composite-unique and x-composite-index keys in the schema and construct
-    any unique constraints and indexes based on their value.
+    any unique constraints and indexes based on their value. Also construct an index for
+    any property that defines x-index as an object.
 
     Args:
         schema: The schema for the object.
+        schemas: Used to resolve any $ref of the properties.
 
     Returns:
         A tuple with any unique constraints and indexes.
 
     """
+    if schemas is None:
+        schemas = {}
     # Keep track of any table arguments
     table_args: typing.List[typing.Iterable[TableArg]] = []
 
@@ -39,5 +45,32 @@ def construct(*, schema: types.Schema) -> TableArgs:
     index_spec = helpers.ext_prop.get(source=schema, name="x-composite-index")
     if index_spec is not None:
         table_args.append(factory.index_factory(spec=index_spec))
+    # Handle x-index objects
+    table_args.append(_column_indexes(schema=schema, schemas=schemas))
 
     return tuple(itertools.chain.from_iterable(table_args))
+
+
+def _column_indexes(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Iterator[sa_schema.Index]:
+    """
+    Construct the indexes of properties that define x-index as an object.
+
+    Args:
+        schema: The schema for the object.
+        schemas: Used to resolve any $ref of the properties.
+
+    Returns:
+        The indexes.
+
+    """
+    for name, property_schema in schema.get("properties", {}).items():
+        value = helpers.peek.peek_key(
+            schema=property_schema, schemas=schemas, key="x-index"
+        )
+        if not isinstance(value, dict):
+            continue
+        spec = helpers.ext_prop.get(source={"x-index": value}, name="x-index")
+        if spec is not None:
+            yield factory.column_index_factory(column_name=name, spec=spec)
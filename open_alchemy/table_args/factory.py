@@ -5,6 +5,7 @@ import json
 import os
 import typing
 
+import sqlalchemy
 from sqlalchemy import schema
 
 from open_alchemy import exceptions
@@ -20,6 +21,54 @@ _COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, *_PATHS, "common-schemas.json")
 ) = facades.jsonschema.resolver(_COMMON_SCHEMAS_FILE)
 
 
+@functools.lru_cache(maxsize=None)
+def _validator(name: str) -> typing.Any:
+    """
+    Construct the validator for a schema in common-schemas.json.
+
+    Args:
+        name: The name of the schema.
+
+    Returns:
+        The validator for the schema.
+
+    """
+    return facades.jsonschema.validator(
+        schema=_COMMON_SCHEMAS[name], resolver=_resolver
+    )
+
+
+def _candidate_schema_names(
+    spec: typing.Union[types.AnyUnique, types.AnyIndex]
+) -> typing.Tuple[str, ...]:
+    """
+    Calculate the names of the schemas a specification could match based on its shape.
+
+    Args:
+        spec: The specification to classify.
+
+    Returns:
+        The names of the schemas that the specification could match.
+
+    """
+    if isinstance(spec, dict):
+        return tuple(
+            name
+            for name, key in (("Unique", "columns"), ("Index", "expressions"))
+            if key in spec
+        )
+    if not isinstance(spec, list) or not spec:
+        return ()
+    first = spec[0]
+    if isinstance(first, str):
+        return ("ColumnList",)
+    if isinstance(first, list):
+        return ("ColumnListList",)
+    if isinstance(first, dict):
+        return tuple(f"{name}List" for name in _candidate_schema_names(first))
+    return ()
+
+
 def _spec_to_schema_name(
     *,
     spec: typing.Union[types.AnyUnique, types.AnyIndex],
@@ -28,12 +77,14 @@ def _spec_to_schema_name(
     """
     Convert a specification to the name of the matched schema.
 
-    Use the schema names defined in common-schemas.json to find the first matching
-    schema.
+    The specification is classified based on its shape and only validated against the
+    schemas it could match, in the order of the schema names.
+
+    Raise SchemaNotFoundError if the specification does not match any of the schemas.
 
     Args:
         spec: The specification to convert.
-        schema_names: The names of the schemas to check.
+        schema_names: The names of the schemas defined in common-schemas.json to check.
 
     Returns:
         The name of the specification.
@@ -42,15 +93,27 @@ def _spec_to_schema_name(
     if schema_names is None:
         schema_names = list(_COMMON_SCHEMAS.keys())
 
+    candidates = _candidate_schema_names(spec)
+    message: typing.Optional[str] = None
     for name in schema_names:
+        if name not in candidates:
+            continue
         try:
-            facades.jsonschema.validate(
-                instance=spec, schema=_COMMON_SCHEMAS[name], resolver=_resolver
-            )
+            _validator(name).validate(spec)
             return name
-        except facades.jsonschema.ValidationError:
-            continue
-    raise exceptions.SchemaNotFoundError("Specification did not match any schemas.")
+        except facades.jsonschema.ValidationError as exc:
+            if message is None:
+                location = "".join(f"[{part!r}]" for part in exc.absolute_path)
+                message = f"{name}{location}: {exc.message}"
+
+    if message is None:
+        raise exceptions.SchemaNotFoundError(
+            "Specification did not match any schemas. Expected one of "
+            f"{', '.join(schema_names)}."
+        )
+    raise exceptions.SchemaNotFoundError(
+        f"Specification did not match any schemas. Invalid {message}"
+    )
 
 
 def _handle_column_list(spec, property_name):
@@ -145,6 +208,63 @@ def _construct_unique(spec: types.Unique) -> schema.UniqueConstraint:
     return schema.UniqueConstraint(*columns, name=name)
 
 
+def _construct_expression(
+    expression: typing.Union[str, types.IndexExpression]
+) -> typing.Any:
+    """
+    Construct an expression of an index.
+
+    Args:
+        expression: A column name or an object with a SQL expression such as
+            "lower(name)" or "created_at DESC".
+
+    Returns:
+        The column name or the SQL expression.
+
+    """
+    if isinstance(expression, str):
+        return expression
+    return sqlalchemy.text(expression["expression"])
+
+
+def _construct_index_kwargs(spec: types.ColumnIndex) -> typing.Dict[str, typing.Any]:
+    """
+    Construct the keyword arguments of an index.
+
+    The where clause is used for PostgreSQL and SQLite partial indexes. The include
+    columns, index method and operator classes are used for PostgreSQL. Any other
+    dialect specific keyword arguments are passed through from kwargs.
+
+    Args:
+        spec: The definition of the index.
+
+    Returns:
+        The keyword arguments for the index.
+
+    """
+    kwargs: typing.Dict[str, typing.Any] = {}
+    unique = spec.get("unique")
+    if unique is not None:
+        kwargs["unique"] = unique
+    where = spec.get("where")
+    if where is not None:
+        kwargs["postgresql_where"] = sqlalchemy.text(where)
+        kwargs["sqlite_where"] = sqlalchemy.text(where)
+    include = spec.get("include")
+    if include is not None:
+        kwargs["postgresql_include"] = include
+    using = spec.get("using")
+    if using is not None:
+        kwargs["postgresql_using"] = using
+    ops = spec.get("ops")
+    if ops is not None:
+        kwargs["postgresql_ops"] = ops
+    kwargs.update(spec.get("kwargs", {}))
+    if "postgresql_include" in kwargs:
+        facades.sqlalchemy.index.register_include()
+    return kwargs
+
+
 def _construct_index(spec: types.Index) -> schema.Index:
     """
     Construct composite index.
@@ -158,12 +278,9 @@ def _construct_index(spec: types.Index) -> schema.Index:
     """
     # There is a bug in the sqlalchemy-stubs where name is not Optional for Index
     name: str = spec.get("name")  # type: ignore
-    unique = spec.get("unique")
-    expressions = spec["expressions"]
+    expressions = map(_construct_expression, spec["expressions"])
 
-    if unique is not None:
-        return schema.Index(name, *expressions, unique=unique)
-    return schema.Index(name, *expressions)
+    return schema.Index(name, *expressions, **_construct_index_kwargs(spec))
 
 
 def unique_factory(
@@ -196,3 +313,20 @@ def index_factory(*, spec: types.AnyIndex) -> typing.Iterator[schema.Index]:
     """
     mapped_spec = _map_index(spec=spec)
     return map(_construct_index, mapped_spec)
+
+
+def column_index_factory(
+    *, column_name: str, spec: types.ColumnIndex
+) -> schema.Index:
+    """
+    Generate the index of a column from the x-index object specification.
+
+    Args:
+        column_name: The name of the column to index.
+        spec: The specification to use.
+
+    Returns:
+        The index.
+
+    """
+    return _construct_index({**spec, "expressions": [column_name]})  # type: ignore
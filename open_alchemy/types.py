@@ -58,17 +58,44 @@ AnyUnique = typing.Union[ColumnList, ColumnListList, Unique, UniqueList]
 # Index types
 
 
+class IndexExpression(TypedDict, total=True):
+    """SQL expression of an index."""
+
+    expression: str
+
+
 class _IndexBase(TypedDict, total=True):
     """Base class for index schema."""
 
-    expressions: typing.List[str]
+    expressions: typing.List[typing.Union[str, IndexExpression]]
 
 
-class Index(_IndexBase, total=False):
-    """Index schema."""
+class ColumnIndex(TypedDict, total=False):
+    """Index options schema."""
 
     name: typing.Optional[str]
     unique: bool
+    where: str
+    include: typing.List[str]
+    using: str
+    ops: typing.Dict[str, str]
+    kwargs: typing.Dict[str, typing.Any]
+
+
+class _ComputedBase(TypedDict, total=True):
+    """Base class for computed column schema."""
+
+    expression: str
+
+
+class Computed(_ComputedBase, total=False):
+    """Computed column schema."""
+
+    persisted: bool
+
+
+class Index(_IndexBase, ColumnIndex, total=False):
+    """Index schema."""
 
 
 IndexList = typing.List[Index]
@@ -90,6 +117,7 @@ _ColumnSchemaBase = TypedDict(  # pylint: disable=invalid-name
         "nullable": bool,
         "description": str,
         "x-json": bool,
+        "x-deferred": typing.Union[bool, str],
         "default": TColumnDefault,
         "x-generated": bool,
         "readOnly": bool,
@@ -131,6 +159,9 @@ class ExtensionColumnArtifacts:
     foreign_key: typing.Optional[str] = None
     foreign_key_kwargs: TOptKwargs = None
     kwargs: TOptKwargs = None
+    deferred: typing.Optional[typing.Union[bool, str]] = None
+    server_default: typing.Optional[str] = None
+    computed: typing.Optional[Computed] = None
 
 
 @dataclasses.dataclass
@@ -160,6 +191,8 @@ class BackReferenceArtifacts:
     property_name: str
     # Whether to use a list
     uselist: typing.Optional[bool] = None
+    # The loading strategy
+    lazy: typing.Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -174,6 +207,10 @@ class RelationshipArtifacts:
     secondary: typing.Optional[str] = None
     # Keyword arguments for the relationship construction
     kwargs: TOptKwargs = None
+    # Customization of the secondary table
+    secondary_table: typing.Optional[Schema] = None
+    # The loading strategy
+    lazy: typing.Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -1,14 +1,25 @@
 """Base class providing utilities for SQLAlchemy models."""
 
 import functools
-import json
 import typing
 
+from .. import cache
 from .. import exceptions
 from .. import facades
 from .. import helpers
+from .. import json_codec
+from .. import load_tracking
+from .. import metrics
 from .. import types as oa_types
+from . import binary
+from . import bulk
+from . import columns
+from . import dict_cache
+from . import eager
+from . import filters
 from . import from_dict
+from . import paginate
+from . import plan
 from . import repr_
 from . import to_dict
 
@@ -24,6 +35,20 @@ class UtilityBase:
     # be recorded as a free-form object and have a x-de-$ref extension property with
     # the de-referenced name of the schema.
     _schema: typing.ClassVar[oa_types.Schema]
+    # The JSON codec used by to_str and from_str, the default codec is used if it is
+    # None.
+    _json_codec: typing.ClassVar[typing.Optional[json_codec.JsonCodec]] = None
+    # The cache of instances read by primary key, caching is not enabled if it is None.
+    _cache: typing.ClassVar[typing.Optional[cache.ModelCache]] = None
+    # Whether to cache the dictionary of each instance until it or any instance it
+    # includes changes.
+    _dict_cache: typing.ClassVar[bool] = False
+    # Whether foreign key columns without an index are indexed, including those added
+    # after the model is constructed.
+    _index_foreign_keys: typing.ClassVar[bool] = False
+    # The flattened plan of the properties of the model and any models it inherits
+    # from, calculated on first use and recorded on each model separately.
+    _plan: typing.ClassVar[typing.Optional[plan.Plan]] = None
 
     def __init__(self, **kwargs: typing.Any) -> None:
         """Construct."""
@@ -69,6 +94,164 @@ class UtilityBase:
             )
         return properties
 
+    @classmethod
+    def _get_plan(cls) -> plan.Plan:
+        """
+        Get the flattened plan of the properties of the model and any parents.
+
+        The parents are resolved once and the plan is recorded on the model.
+
+        Raise ModelAttributeError if _schema is not defined.
+        Raise MalformedSchemaError if a schema does not have any properties or
+        x-inherits is not a string.
+        Raise SchemaNotFoundError if a parent is not on open_alchemy.models.
+
+        Returns:
+            The plan of the model.
+
+        """
+        model_plan = vars(cls).get("_plan")
+        if model_plan is not None:
+            return model_plan
+
+        model: typing.Type[UtilityBase] = cls
+        # Check that each schema has properties
+        model.get_properties()
+        schemas = [model._get_schema()]
+        while helpers.schema.inherits(schema=model._get_schema(), schemas={}):
+            model = model._get_parent(schema=model._get_schema())
+            model.get_properties()
+            schemas.append(model._get_schema())
+        model_plan = plan.calculate(schemas=list(reversed(schemas)))
+        cls._plan = model_plan
+        return model_plan
+
+    @classmethod
+    def _get_all_properties(cls) -> oa_types.Schema:
+        """Get the properties of the model including those of any parents."""
+        return cls._get_plan().properties
+
+    @classmethod
+    def set_json_codec(cls, codec: typing.Optional[json_codec.JsonCodec]) -> None:
+        """
+        Set the JSON codec used by to_str and from_str for the model.
+
+        Args:
+            codec: The JSON codec. If it is None, the default codec is used.
+
+        """
+        cls._json_codec = codec
+
+    @classmethod
+    def _get_json_codec(cls) -> json_codec.JsonCodec:
+        """Get the JSON codec of the model or the default codec."""
+        if cls._json_codec is not None:
+            return cls._json_codec
+        return json_codec.get_default()
+
+    @classmethod
+    def _get_cache(cls) -> cache.ModelCache:
+        """
+        Get the cache of the model.
+
+        Raise CacheNotEnabledError if x-cache is not set on the schema of the model.
+
+        Returns:
+            The cache of the model.
+
+        """
+        model_cache = vars(cls).get("_cache")
+        if model_cache is None:
+            raise exceptions.CacheNotEnabledError(
+                f"Caching is not enabled for {cls.__name__}. Set x-cache on the schema "
+                "of the model to enable it.",
+            )
+        return model_cache
+
+    @classmethod
+    def get_cached(
+        cls,
+        identity: typing.Any,
+        *,
+        session: typing.Any = None,
+        as_dict: bool = False,
+    ) -> typing.Any:
+        """
+        Read an instance of the model by its primary key through the cache.
+
+        On a miss the instance is read using the session and its column values are
+        cached. On a hit a detached instance is constructed from the cached values
+        which can be attached to a session using merge with load=False. Relationships
+        and instances of models that inherit from the model are not cached. Cached
+        values are invalidated when the transaction that updated or deleted an instance
+        through the ORM is committed or rolled back and expire after the ttl of
+        x-cache.
+
+        Raise CacheNotEnabledError if x-cache is not set on the schema of the model.
+        Raise MissingArgumentError if session is not passed and the model does not
+        have a query property.
+
+        Args:
+            identity: The primary key or a tuple of the primary key values.
+            session: The session used to read the instance on a miss. Defaults to the
+                query property of the model.
+            as_dict: Whether to return the output of to_dict instead of the instance.
+
+        Returns:
+            The instance or its dictionary or None if it does not exist.
+
+        """
+        model_cache = cls._get_cache()
+        key = tuple(identity) if isinstance(identity, (tuple, list)) else (identity,)
+
+        values = model_cache.get(key)
+        if values is not None:
+            instance = facades.sqlalchemy.cache.detached(model=cls, values=values)
+            return instance.to_dict() if as_dict else instance
+
+        if session is not None:
+            query = session.query(cls)
+        elif hasattr(cls, "query"):
+            query = getattr(cls, "query")
+        else:
+            raise exceptions.MissingArgumentError(
+                "session is required when the model does not have a query property."
+            )
+        instance = facades.sqlalchemy.cache.get(query=query, identity_=key)
+        if instance is None:
+            return None
+        if type(instance) is cls:
+            model_cache.set(
+                key, facades.sqlalchemy.cache.column_values(instance=instance)
+            )
+        return instance.to_dict() if as_dict else instance
+
+    @classmethod
+    def cache_stats(cls) -> cache.CacheStats:
+        """
+        Get the number of reads served from the cache and from the database.
+
+        Raise CacheNotEnabledError if x-cache is not set on the schema of the model.
+
+        Returns:
+            The number of hits and misses of the cache.
+
+        """
+        return cls._get_cache().stats()
+
+    @classmethod
+    def set_cache_backend(cls, backend: cache.Backend) -> None:
+        """
+        Set the backend that stores the cached values of the model.
+
+        Raise CacheNotEnabledError if x-cache is not set on the schema of the model.
+
+        Args:
+            backend: The cache backend.
+
+        """
+        cls._get_cache().backend = backend
+
     @staticmethod
     def _get_parent(*, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
         """Get the parent model of a model."""
@@ -92,55 +275,38 @@ class UtilityBase:
         return parent
 
     @classmethod
+    def _convert_from_dict(
+        cls,
+        kwargs: typing.Dict[str, typing.Any],
+        *,
+        validator: typing.Any,
+        function_name: str = "from_dict",
+    ) -> typing.Dict[str, typing.Any]:
+        """Validate a dictionary and convert its values to column values."""
+        return from_dict.convert_dict(
+            value=kwargs,
+            schema=cls._get_schema(),
+            properties=cls._get_plan().properties,
+            validator=validator,
+            function_name=function_name,
+        )
+
+    @classmethod
+    @metrics.instrument("construct_from_dict_init", output=False)
     def construct_from_dict_init(
         cls: typing.Type[TUtilityBase], **kwargs: typing.Any
     ) -> typing.Dict[str, typing.Any]:
         """Construct the dictionary passed to model construction."""
-        # Check dictionary
-        schema = cls._get_schema()
-        try:
-            facades.jsonschema.validate(instance=kwargs, schema=schema)
-        except facades.jsonschema.ValidationError:
-            raise exceptions.MalformedModelDictionaryError(
-                "The dictionary passed to from_dict is not a valid instance of the "
-                "model schema.",
-                schema=schema,
-                kwargs=kwargs,
-            )
-
-        # Assemble dictionary for construction
-        properties = cls.get_properties()
-        model_dict: typing.Dict[str, typing.Any] = {}
-        for name, value in kwargs.items():
-            # Get the specification and type of the property
-            property_schema = properties.get(name)
-            if property_schema is None:
-                raise exceptions.MalformedModelDictionaryError(
-                    "A parameter was passed in that is not a property in the model "
-                    "schema.",
-                    parameter_name=name,
-                    schema=schema,
-                )
-
-            # Convert to column value
-            try:
-                model_dict[name] = from_dict.convert(
-                    value=value, schema=property_schema
-                )
-            except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
-                exc.property_name = name  # type: ignore
-                exc.property_value = value  # type: ignore
-                raise
-
-        return model_dict
+        return cls._convert_from_dict(kwargs, validator=cls._get_plan().validator)
 
     @classmethod
+    @metrics.instrument("from_dict", output=False)
     def from_dict(cls: typing.Type[TUtilityBase], **kwargs: typing.Any) -> TUtilityBase:
         """
         Construct model instance from a dictionary.
 
+        The properties of any models the model inherits from are included.
+
         Raise MalformedModelDictionaryError when the dictionary does not satisfy the
         model schema.
 
@@ -151,35 +317,10 @@ class UtilityBase:
             An instance of the model constructed using the dictionary.
 
         """
-        schema = cls._get_schema()
-        # Handle model that inherits
-        if helpers.schema.inherits(schema=schema, schemas={}):
-            # Retrieve parent model
-            parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
-
-            # Construct parent initialization dictionary
-            # Get properties for schema
-            properties = cls.get_properties()
-            # Pass kwargs that don't belong to the current model to the parent
-            parent_kwargs = {
-                key: value for key, value in kwargs.items() if key not in properties
-            }
-            parent_init_dict = parent.construct_from_dict_init(**parent_kwargs)
-
-            # COnstruct child (the current model) initialization dictionary
-            child_kwargs = {
-                key: value for key, value in kwargs.items() if key in properties
-            }
-            init_dict = {
-                **parent_init_dict,
-                **cls.construct_from_dict_init(**child_kwargs),
-            }
-        else:
-            init_dict = cls.construct_from_dict_init(**kwargs)
-
-        return cls(**init_dict)
+        return cls(**cls.construct_from_dict_init(**kwargs))
 
     @classmethod
+    @metrics.instrument("from_str", output=False)
     def from_str(cls: typing.Type[TUtilityBase], value: str) -> TUtilityBase:
         """
         Construct model instance from a JSON string.
@@ -199,8 +340,8 @@ class UtilityBase:
                 "The value is not of type string.", value=value, value_type=type(value)
             )
         try:
-            dict_value = json.loads(value)
-        except json.JSONDecodeError:
+            dict_value = cls._get_json_codec().loads(value)
+        except ValueError:
             raise exceptions.MalformedModelDictionaryError(
                 "The string value is not valid JSON.", value=value
             )
@@ -212,70 +353,660 @@ class UtilityBase:
             )
         return cls.from_dict(**dict_value)
 
+    def apply_patch(self, body: typing.Dict[str, typing.Any]) -> typing.List[str]:
+        """
+        Update the instance using a dictionary with some of the properties.
+
+        Only the properties in the dictionary are validated against the model schema,
+        required is ignored, and they are converted in the same way as for from_dict.
+        Only values that are different from the current values are assigned so that
+        the UPDATE only includes the changed columns.
+
+        Raise MalformedModelDictionaryError when the dictionary does not satisfy the
+        model schema or includes a relationship.
+
+        Args:
+            body: The values of the properties to update.
+
+        Returns:
+            The names of the properties that were changed.
+
+        """
+        values = self._convert_from_dict(
+            body,
+            validator=self._get_plan().patch_validator,
+            function_name="apply_patch",
+        )
+        column_keys = facades.sqlalchemy.bulk.column_keys(model=type(self))
+        for name in values:
+            if name not in column_keys:
+                raise exceptions.MalformedModelDictionaryError(
+                    "apply_patch only supports properties that map to a column.",
+                    parameter_name=name,
+                    schema=self._get_schema(),
+                )
+        changed: typing.List[str] = []
+        for name, value in values.items():
+            if getattr(self, name) == value:
+                continue
+            setattr(self, name, value)
+            changed.append(name)
+        return changed
+
+    @classmethod
+    def patch_where(
+        cls,
+        criteria: typing.Any,
+        body: typing.Dict[str, typing.Any],
+        *,
+        bind: typing.Any,
+    ) -> int:
+        """
+        Update the rows that match criteria using a single Core UPDATE statement.
+
+        The rows are not loaded. The dictionary is validated and converted in the same
+        way as for apply_patch. Instances that are already loaded in a session are not
+        refreshed, their values are only updated once they are expired or refreshed.
+        The primary key cache of the model is cleared when the transaction of the
+        session ends or straight away for a connection or engine.
+
+        Raise MalformedModelDictionaryError when the dictionary does not satisfy the
+        model schema or includes a relationship.
+        Raise FeatureNotImplementedError if the model inherits from another model.
+
+        Args:
+            criteria: An expression or a list of expressions, such as those returned by
+                filter_from_params, that the rows to update must all match.
+            body: The values of the properties to update.
+            bind: The session, connection or engine to execute the statement with.
+
+        Returns:
+            The number of rows that matched the criteria or 0 if the dictionary is
+            empty.
+
+        """
+        schema = cls._get_schema()
+        bulk.check_schema(schema=schema)
+        row = bulk.convert(
+            value=body,
+            schema=schema,
+            validator=cls._get_plan().patch_validator,
+            column_keys=facades.sqlalchemy.bulk.column_keys(model=cls),
+        )
+        if not row:
+            return 0
+        if not isinstance(criteria, (list, tuple)):
+            criteria = [criteria]
+        count = facades.sqlalchemy.bulk.update(
+            bind=bind,
+            table=cls.__table__,  # type: ignore  # pylint: disable=no-member
+            criteria=criteria,
+            row=row,
+        )
+        cache.clear_written(model=cls, bind=bind)
+        return count
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        bind: typing.Any,
+        batch_size: int = bulk.DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert many dictionaries using batched Core INSERT statements.
+
+        Each dictionary is validated against the model schema and converted in the same
+        way as for from_dict. The rows are written without going through the ORM unit
+        of work, so relationships are not supported.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the model
+        schema or includes a relationship.
+
+        Args:
+            values: The dictionaries to insert.
+            bind: The session, connection or engine to execute the statements with.
+            batch_size: The number of rows passed to each executemany call.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        table = cls.__table__  # type: ignore  # pylint: disable=no-member
+        statement = facades.sqlalchemy.bulk.insert(table=table)
+        return cls._bulk_execute(
+            values=values,
+            bind=bind,
+            batch_size=batch_size,
+            get_statement=lambda _: statement,
+        )
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        bind: typing.Any,
+        conflict: typing.Optional[typing.Union[str, typing.Sequence[str]]] = None,
+        batch_size: int = bulk.DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert or update many dictionaries using INSERT ... ON CONFLICT DO UPDATE.
+
+        Supported for the SQLite and PostgreSQL dialects. Columns in a dictionary that
+        are not part of the conflict target are updated when a row already exists.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the model
+        schema or includes a relationship.
+        Raise InvalidConflictTargetError if the conflict target is not the primary key,
+        a unique column or a composite unique constraint.
+
+        Args:
+            values: The dictionaries to upsert.
+            bind: The session, connection or engine to execute the statements with.
+            conflict: The property or properties that identify an existing row.
+                Defaults to the primary key.
+            batch_size: The number of rows passed to each executemany call.
+
+        Returns:
+            The number of rows that were inserted or updated.
+
+        """
+        table = cls.__table__  # type: ignore  # pylint: disable=no-member
+        column_keys = facades.sqlalchemy.bulk.column_keys(model=cls)
+        index_elements = bulk.conflict_target(
+            conflict=conflict,
+            column_keys=column_keys,
+            targets=facades.sqlalchemy.bulk.conflict_targets(table=table),
+        )
+        dialect = facades.sqlalchemy.bulk.dialect_name(bind=bind, table=table)
+
+        def get_statement(keys: typing.Tuple[str, ...]) -> typing.Any:
+            """Construct the upsert for rows with the keys."""
+            missing = set(index_elements) - set(keys)
+            if missing:
+                raise exceptions.MalformedModelDictionaryError(
+                    "Every dictionary passed to bulk_upsert must include the conflict "
+                    "target.",
+                    missing=sorted(missing),
+                )
+            update = [key for key in keys if key not in index_elements]
+            return facades.sqlalchemy.bulk.upsert(
+                table=table,
+                dialect=dialect,
+                index_elements=index_elements,
+                update=update,
+            )
+
+        return cls._bulk_execute(
+            values=values,
+            bind=bind,
+            batch_size=batch_size,
+            get_statement=get_statement,
+        )
+
     @classmethod
-    def instance_to_dict(cls, instance: TUtilityBase) -> typing.Dict[str, typing.Any]:
-        """Convert instance of the model to a dictionary."""
+    def _bulk_execute(
+        cls,
+        *,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        bind: typing.Any,
+        batch_size: int,
+        get_statement: typing.Callable[[typing.Tuple[str, ...]], typing.Any],
+    ) -> int:
+        """Convert, batch and execute rows for bulk_insert and bulk_upsert."""
         schema = cls._get_schema()
-        properties = cls.get_properties()
+        bulk.check_schema(schema=schema)
+        validator = facades.jsonschema.validator(schema=schema)
+        column_keys = facades.sqlalchemy.bulk.column_keys(model=cls)
+
+        rows = (
+            bulk.convert(
+                value=value, schema=schema, validator=validator, column_keys=column_keys
+            )
+            for value in values
+        )
+        statements: typing.Dict[typing.Tuple[str, ...], typing.Any] = {}
+        count = 0
+        try:
+            for rows_batch in bulk.batch(rows, batch_size=batch_size):
+                for keys, rows_group in bulk.group(rows_batch):
+                    if keys not in statements:
+                        statements[keys] = get_statement(keys)
+                    facades.sqlalchemy.bulk.execute(
+                        bind=bind, statement=statements[keys], rows=rows_group
+                    )
+                count += len(rows_batch)
+        finally:
+            if statements:
+                cache.clear_written(model=cls, bind=bind)
+        return count
+
+    @classmethod
+    def instance_to_dict(
+        cls,
+        instance: TUtilityBase,
+        *,
+        native: bool = False,
+        load_deferred: bool = False,
+    ) -> typing.Dict[str, typing.Any]:
+        """Convert instance of the model, including any parents, to a dictionary."""
+        unloaded: typing.Optional[typing.Set[str]] = None
+        tracking = load_tracking.tracking()
 
         # Collecting the values of the properties
         return_dict: typing.Dict[str, typing.Any] = {}
-        for name, property_schema in properties.items():
-            # Handle for writeOnly
-            if helpers.peek.write_only(schema=property_schema, schemas={}):
-                continue
-
-            value = getattr(instance, name, None)
+        for property_plan in cls._get_plan().read:
+            name = property_plan.name
+            # Skip deferred properties that have not been loaded
+            if not load_deferred and property_plan.deferred:
+                if unloaded is None:
+                    unloaded = facades.sqlalchemy.unloaded(instance=instance)
+                if name in unloaded:
+                    continue
+
+            if tracking:
+                with load_tracking.attribute(model=cls.__name__, property_name=name):
+                    value = getattr(instance, name, None)
+            else:
+                value = getattr(instance, name, None)
+            if property_plan.relationship and dict_cache.recording():
+                dict_cache.visit(value)
 
             # Handle none value
             if value is None:
-                return_none = to_dict.return_none(schema=schema, property_name=name)
-                if return_none is True:
+                if property_plan.return_none:
                     return_dict[name] = None
                 # Don't consider for coverage due to coverage bug
                 continue  # pragma: no cover
 
             try:
-                return_dict[name] = to_dict.convert(schema=property_schema, value=value)
+                return_dict[name] = to_dict.convert(
+                    schema=property_plan.schema, value=value, native=native
+                )
             except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
+                exc.schema = property_plan.model_schema  # type: ignore
+                exc.property_schema = property_plan.schema  # type: ignore
                 exc.property_name = name  # type: ignore
                 exc.property_value = value  # type: ignore
                 raise
 
         return return_dict
 
-    def to_dict(self) -> typing.Dict[str, typing.Any]:
+    @classmethod
+    def to_columns(
+        cls,
+        rows: typing.Iterable[typing.Any],
+        *,
+        fields: typing.Optional[typing.Sequence[str]] = None,
+        arrays: bool = True,
+        chunk_size: int = columns.DEFAULT_CHUNK_SIZE,
+    ) -> columns.TColumns:
+        """
+        Convert a query or instances of the model to a column of values per property.
+
+        With arrays, integer, number and boolean properties become NumPy arrays with a
+        dtype based on the format, date and date-time properties become datetime64
+        arrays and any other properties become object arrays. Nullable columns are
+        returned as masked arrays. Queries are read using yield_per and converted in
+        chunks of chunk_size rows. Without arrays, a list of values is returned for each
+        property.
+
+        Raise InvalidArgumentError if a field is not a property that maps to a column.
+        Raise ImportError if arrays is True and numpy has not been installed.
+
+        Args:
+            rows: The query or instances of the model to convert.
+            fields: The properties to convert. Defaults to every property that maps to
+                a column except writeOnly properties.
+            arrays: Whether to return NumPy arrays instead of lists.
+            chunk_size: The number of rows read and converted at a time.
+
+        Returns:
+            The values of the rows for each field.
+
+        """
+        properties = cls._get_all_properties()
+        nullable = facades.sqlalchemy.query.column_nullable(model=cls)
+        export_fields = columns.calculate_fields(
+            properties=properties, nullable=nullable, fields=fields
+        )
+
+        instances = facades.sqlalchemy.query.iterate(rows=rows, chunk_size=chunk_size)
+        if not arrays:
+            return columns.to_lists(instances, fields=export_fields)
+        return columns.to_arrays(
+            bulk.batch(instances, batch_size=chunk_size),
+            fields=export_fields,
+            dtypes={
+                name: columns.dtype(schema=properties[name]) for name in export_fields
+            },
+            nullable=nullable,
+        )
+
+    @classmethod
+    def filter_from_params(
+        cls, params: typing.Mapping[str, typing.Any], *, unindexed: str = "raise"
+    ) -> typing.List[typing.Any]:
+        """
+        Convert query parameters to SQL expressions that filter the model.
+
+        The name of a parameter is the name of a property optionally followed by __
+        and one of the eq, in, range, gt, gte, lt, lte or prefix operators where eq
+        is the default. The values of in and range are lists or comma separated
+        strings and either bound of a range may be empty. String values are coerced
+        to the type of the property and then validated against its schema.
+
+        Raise InvalidArgumentError if a parameter is not for a property that maps to
+        a column, is for a writeOnly property, the operator is not supported or the
+        value is not valid.
+        Raise UnindexedFilterError if a property is not the leading property of the
+        primary key, a unique constraint or an index and unindexed is raise.
+
+        Args:
+            params: The query parameters.
+            unindexed: How to handle filters on properties that are not indexed. One
+                of raise, warn or allow.
+
+        Returns:
+            The SQL expressions to pass to filter.
+
+        """
+        parsed = filters.parse(
+            params,
+            properties=cls._get_all_properties(),
+            nullable=facades.sqlalchemy.query.column_nullable(model=cls),
+            indexed_names=filters.indexed(
+                keys=facades.sqlalchemy.query.index_keys(model=cls)
+            ),
+            unindexed=unindexed,
+        )
+        return [
+            facades.sqlalchemy.query.filter_expression(
+                model=cls, name=name, operator=operator, value=value
+            )
+            for name, operator, value in parsed
+        ]
+
+    @classmethod
+    def paginate(
+        cls,
+        query: typing.Any,
+        *,
+        after: typing.Optional[str] = None,
+        limit: int = paginate.DEFAULT_LIMIT,
+        order_by: typing.Optional[typing.Union[str, typing.Sequence[str]]] = None,
+    ) -> paginate.Page:
+        """
+        Read a page of a query using keyset pagination.
+
+        Instead of skipping rows using an offset, the page starts after the position
+        recorded in the cursor of the previous page which means that the database can
+        find the start of the page using an index. The ordering must be supported by
+        the primary key, a unique constraint or an index of the model and the primary
+        key is added to it to break ties. Any existing ordering of the query is
+        replaced.
+
+        Raise InvalidArgumentError if the limit is not positive, if no index supports
+        the ordering or if the cursor is malformed or for a different ordering.
+
+        Args:
+            query: The query for instances of the model to paginate.
+            after: The next cursor of the previous page. Defaults to the first page.
+            limit: The maximum number of instances on the page.
+            order_by: The property names to order by where a - prefix orders in
+                descending order. Defaults to the primary key.
+
+        Returns:
+            The instances on the page and the cursor for the next page.
+
+        """
+        if limit < 1:
+            raise exceptions.InvalidArgumentError(
+                "The limit must be a positive integer.", limit=limit
+            )
+        properties = cls._get_all_properties()
+        ordering = paginate.calculate_ordering(
+            requested=paginate.parse_order_by(order_by),
+            keys=facades.sqlalchemy.query.index_keys(model=cls),
+            properties=properties,
+            nullable=facades.sqlalchemy.query.column_nullable(model=cls),
+        )
+        after_values = None
+        if after is not None:
+            after_values = paginate.decode_cursor(
+                after, ordering=ordering, properties=properties
+            )
+
+        items = facades.sqlalchemy.query.keyset(
+            query=query, model=cls, ordering=ordering, after=after_values, limit=limit
+        ).all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = paginate.encode_cursor(
+                items[-1], ordering=ordering, properties=properties
+            )
+        return paginate.Page(model=cls, items=items, next_cursor=next_cursor)
+
+    @classmethod
+    async def afetch_dicts(
+        cls, session: typing.Any, stmt: typing.Any = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Read instances of the model using an asyncio session and convert them.
+
+        The relationships that to_dict reads are calculated from the schemas and loaded
+        up front using selectinload. The query and the conversion run in run_sync of
+        the session so that to_dict does not do IO on the event loop.
+
+        Raise SchemaNotFoundError if a referenced model has not been constructed.
+
+        Args:
+            session: The asyncio session, any object with an awaitable run_sync that
+                calls a function with a synchronous session.
+            stmt: A query for the model that is not bound to a session, such as
+                orm.Query(Model).filter(...). Defaults to all instances.
+
+        Returns:
+            The dictionaries of the instances.
+
+        """
+        paths = eager.paths(model=cls)
+
+        def fetch(sync_session: typing.Any) -> typing.List[typing.Any]:
+            """Execute the query and convert the instances."""
+            query = facades.sqlalchemy.query.eager(
+                session=sync_session, model=cls, query=stmt, paths=paths
+            )
+            return [instance.to_dict() for instance in query]
+
+        return await session.run_sync(fetch)
+
+    async def ato_dict(self, session: typing.Any) -> typing.Dict[str, typing.Any]:
+        """
+        Convert model instance to dictionary using an asyncio session.
+
+        Relationships that to_dict reads and that have not been loaded are loaded
+        using selectinload with a single query per relationship before the instance is
+        converted in run_sync of the session.
+
+        Raise SchemaNotFoundError if a referenced model has not been constructed.
+
+        Args:
+            session: The asyncio session of the instance, any object with an awaitable
+                run_sync that calls a function with a synchronous session.
+
+        Returns:
+            The dictionary representation of the model.
+
+        """
+        paths = eager.paths(model=type(self))
+
+        def convert(sync_session: typing.Any) -> typing.Dict[str, typing.Any]:
+            """Load the relationships and convert the instance."""
+            facades.sqlalchemy.query.load_relationships(
+                session=sync_session, instance=self, paths=paths
+            )
+            return self.to_dict()
+
+        return await session.run_sync(convert)
+
+    @classmethod
+    async def afrom_dicts(
+        cls: typing.Type[TUtilityBase],
+        session: typing.Any,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        batch_size: int = bulk.DEFAULT_BATCH_SIZE,
+    ) -> typing.List[TUtilityBase]:
+        """
+        Construct instances from dictionaries and add them to an asyncio session.
+
+        The instances are constructed using from_dict, added to the session and the
+        session is flushed after each batch.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the model
+        schema.
+
+        Args:
+            session: The asyncio session, any object with add_all and an awaitable
+                flush.
+            values: The dictionaries to construct the instances with.
+            batch_size: The number of instances added before each flush.
+
+        Returns:
+            The instances.
+
+        """
+        instances: typing.List[TUtilityBase] = []
+        for values_batch in bulk.batch(values, batch_size=batch_size):
+            instances_batch = [cls.from_dict(**value) for value in values_batch]
+            session.add_all(instances_batch)
+            await session.flush()
+            instances.extend(instances_batch)
+        return instances
+
+    @metrics.instrument("to_dict", output=True)
+    def to_dict(self, *, load_deferred: bool = False) -> typing.Dict[str, typing.Any]:
         """
         Convert model instance to dictionary.
 
+        Deferred properties that have not been loaded are left out unless
+        load_deferred is set.
+
+        Args:
+            load_deferred: Whether to load and include deferred properties that have
+                not been loaded.
+
         Returns:
             The dictionary representation of the model.
 
         """
-        schema = self._get_schema()
-        if helpers.schema.inherits(schema=schema, schemas={}):
-            # Retrieve parent model and convert to dict
-            parent: typing.Type[UtilityBase] = self._get_parent(schema=schema)
-            parent_dict = parent.instance_to_dict(self)
-            return {**parent_dict, **self.instance_to_dict(self)}
+        return self._to_dict(native=False, load_deferred=load_deferred)
 
-        return self.instance_to_dict(self)
+    def _to_dict(
+        self, *, native: bool, load_deferred: bool = False
+    ) -> typing.Dict[str, typing.Any]:
+        """Convert model instance to dictionary, optionally with native values."""
+        if self._dict_cache:
+            return dict_cache.get(
+                self,
+                native=native,
+                load_deferred=load_deferred,
+                convert=functools.partial(
+                    self.instance_to_dict,
+                    self,
+                    native=native,
+                    load_deferred=load_deferred,
+                ),
+            )
+        dict_cache.visit(self)
+        return self.instance_to_dict(self, native=native, load_deferred=load_deferred)
 
+    @metrics.instrument("to_str", output=True)
     def to_str(self) -> str:
         """
         Convert model instance to a string.
 
+        Date, date-time and binary values are serialized by the JSON codec of the
+        model.
+
         Returns:
             The JSON string representation of the model.
 
         """
-        instance_dict = self.to_dict()
-        return json.dumps(instance_dict)
+        instance_dict = self._to_dict(native=True)
+        return self._get_json_codec().dumps(instance_dict)
 
     __str__ = to_str
 
+    @classmethod
+    def from_bytes(cls: typing.Type[TUtilityBase], value: bytes) -> TUtilityBase:
+        """
+        Construct model instance from the output of to_bytes.
+
+        The values are not validated against the schema, only use it for payloads
+        produced by to_bytes.
+
+        Raise MalformedBinaryError when the value is not bytes, was encoded for a
+        different schema of the model or is malformed.
+
+        Args:
+            value: The binary payload.
+
+        Returns:
+            An instance of the model constructed using the payload.
+
+        """
+        return binary.loads(value, model=cls, kind=binary.KIND_RECORD)[0]
+
+    @classmethod
+    def from_bytes_list(cls: typing.Type[TUtilityBase], value: bytes) -> typing.List:
+        """
+        Construct model instances from the output of to_bytes_list.
+
+        Raise MalformedBinaryError when the value is not bytes, was encoded for a
+        different schema of the model or is malformed.
+
+        Args:
+            value: The binary payload.
+
+        Returns:
+            The instances of the model constructed using the payload.
+
+        """
+        return binary.loads(value, model=cls, kind=binary.KIND_LIST)
+
+    def to_bytes(self) -> bytes:
+        """
+        Convert model instance to a compact binary payload.
+
+        Properties are encoded positionally based on the schema and the payload
+        includes a fingerprint of the schema. Relationships are encoded as nested
+        records.
+
+        Returns:
+            The binary representation of the model.
+
+        """
+        return binary.dumps([self], model=type(self), kind=binary.KIND_RECORD)
+
+    @classmethod
+    def to_bytes_list(cls, instances: typing.Iterable[typing.Any]) -> bytes:
+        """
+        Convert model instances to a single compact binary payload.
+
+        Args:
+            instances: The instances of the model.
+
+        Returns:
+            The binary representation of the instances.
+
+        """
+        return binary.dumps(instances, model=cls, kind=binary.KIND_LIST)
+
     def __repr__(self) -> str:
         """Calculate the repr for the model."""
         properties = self.get_properties()
@@ -0,0 +1,484 @@
+"""Compact binary serialization of model instances based on the model schema."""
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import struct
+import typing
+import weakref
+
+from .. import exceptions
+from .. import facades
+from .. import helpers
+from .. import types as oa_types
+
+KIND_RECORD = 1
+KIND_LIST = 2
+FINGERPRINT_LENGTH = 8
+
+_HEADER = struct.Struct(f"<B{FINGERPRINT_LENGTH}s")
+_DOUBLE = struct.Struct("<d")
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class _Reader:
+    """Read values from a binary payload."""
+
+    def __init__(self, value: bytes) -> None:
+        """Construct."""
+        self.value = value
+        self.offset = 0
+
+    def take(self, length: int) -> bytes:
+        """Read a number of bytes."""
+        end = self.offset + length
+        if end > len(self.value):
+            raise exceptions.MalformedBinaryError(
+                "The binary payload ended unexpectedly.", offset=self.offset
+            )
+        taken = self.value[self.offset:end]
+        self.offset = end
+        return taken
+
+    def varint(self) -> int:
+        """Read an unsigned variable length integer."""
+        result = 0
+        shift = 0
+        while True:
+            if self.offset >= len(self.value):
+                raise exceptions.MalformedBinaryError(
+                    "The binary payload ended unexpectedly.", offset=self.offset
+                )
+            byte = self.value[self.offset]
+            self.offset += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+
+TEncode = typing.Callable[[bytearray, typing.Any], None]
+TDecode = typing.Callable[[_Reader], typing.Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class Field:
+    """The encoding of a property of a model."""
+
+    # The name of the property
+    name: str
+    # Append the encoded value to a buffer
+    encode: TEncode
+    # Read the value from a payload
+    decode: TDecode
+
+
+TLayout = typing.Tuple[Field, ...]
+
+# Held weakly so that the caches do not keep discarded models and their mappers alive
+_LAYOUTS: typing.MutableMapping[typing.Type, TLayout] = weakref.WeakKeyDictionary()
+_FINGERPRINTS: typing.MutableMapping[typing.Type, bytes] = weakref.WeakKeyDictionary()
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """Append an unsigned variable length integer."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _encode_integer(buffer: bytearray, value: int) -> None:
+    """Append a zigzag encoded integer so that small negative values are short."""
+    _write_varint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def _decode_integer(reader: _Reader) -> int:
+    """Read a zigzag encoded integer."""
+    value = reader.varint()
+    return value // 2 if not value & 1 else -(value + 1) // 2
+
+
+def _encode_number(buffer: bytearray, value: float) -> None:
+    """Append a double precision float."""
+    buffer += _DOUBLE.pack(value)
+
+
+def _decode_number(reader: _Reader) -> float:
+    """Read a double precision float."""
+    return _DOUBLE.unpack(reader.take(_DOUBLE.size))[0]
+
+
+def _encode_boolean(buffer: bytearray, value: bool) -> None:
+    """Append a boolean as a single byte."""
+    buffer.append(1 if value else 0)
+
+
+def _decode_boolean(reader: _Reader) -> bool:
+    """Read a boolean."""
+    return reader.take(1) != b"\x00"
+
+
+def _encode_bytes(buffer: bytearray, value: bytes) -> None:
+    """Append length prefixed bytes."""
+    _write_varint(buffer, len(value))
+    buffer += value
+
+
+def _decode_bytes(reader: _Reader) -> bytes:
+    """Read length prefixed bytes."""
+    return reader.take(reader.varint())
+
+
+def _encode_string(buffer: bytearray, value: str) -> None:
+    """Append a length prefixed UTF-8 string."""
+    _encode_bytes(buffer, value.encode())
+
+
+def _decode_string(reader: _Reader) -> str:
+    """Read a length prefixed UTF-8 string."""
+    return _decode_bytes(reader).decode()
+
+
+def _encode_json(buffer: bytearray, value: typing.Any) -> None:
+    """Append a JSON value as a length prefixed string."""
+    _encode_string(buffer, json.dumps(value, separators=(",", ":")))
+
+
+def _decode_json(reader: _Reader) -> typing.Any:
+    """Read a JSON value."""
+    return json.loads(_decode_string(reader))
+
+
+def _encode_date(buffer: bytearray, value: datetime.date) -> None:
+    """Append a date as its ordinal."""
+    _write_varint(buffer, value.toordinal())
+
+
+def _decode_date(reader: _Reader) -> datetime.date:
+    """Read a date."""
+    return datetime.date.fromordinal(reader.varint())
+
+
+def _encode_date_time(buffer: bytearray, value: datetime.datetime) -> None:
+    """Append a datetime as microseconds since the epoch and its UTC offset."""
+    offset = value.utcoffset()
+    _encode_integer(buffer, (value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND)
+    if offset is None:
+        buffer.append(0)
+        return
+    buffer.append(1)
+    _encode_integer(buffer, offset // _MICROSECOND)
+
+
+def _decode_date_time(reader: _Reader) -> datetime.datetime:
+    """Read a datetime."""
+    value = _EPOCH + datetime.timedelta(microseconds=_decode_integer(reader))
+    if reader.take(1) == b"\x00":
+        return value
+    offset = datetime.timedelta(microseconds=_decode_integer(reader))
+    return value.replace(tzinfo=datetime.timezone(offset))
+
+
+def _get_ref_model(*, schema: oa_types.Schema) -> typing.Type:
+    """Retrieve the model referenced by an object property."""
+    ref_model_name = helpers.ext_prop.get(source=schema, name="x-de-$ref")
+    if ref_model_name is None:
+        raise exceptions.SchemaNotFoundError(
+            "The schema of the object property does not include the x-de-$ref "
+            "extension property with the name of the referenced model."
+        )
+    ref_model = facades.models.get_model(name=ref_model_name)
+    if ref_model is None:
+        raise exceptions.SchemaNotFoundError(
+            f"The referenced model {ref_model_name} was not found in the models."
+        )
+    return ref_model
+
+
+def _object_codec(*, schema: oa_types.Schema) -> typing.Tuple[TEncode, TDecode]:
+    """Encode a relationship as a sub-record with the layout of the related model."""
+
+    def encode(buffer: bytearray, value: typing.Any) -> None:
+        """Append the sub-record."""
+        encode_record(buffer, value, model=_get_ref_model(schema=schema))
+
+    def decode(reader: _Reader) -> typing.Any:
+        """Read the sub-record."""
+        return decode_record(reader, model=_get_ref_model(schema=schema))
+
+    return encode, decode
+
+
+def _array_codec(*, schema: oa_types.Schema) -> typing.Tuple[TEncode, TDecode]:
+    """Encode a one to many relationship as a count and sub-records."""
+    encode_item, decode_item = _object_codec(schema=schema["items"])
+
+    def encode(buffer: bytearray, value: typing.Any) -> None:
+        """Append the count and sub-records."""
+        _write_varint(buffer, len(value))
+        for item in value:
+            encode_item(buffer, item)
+
+    def decode(reader: _Reader) -> typing.List[typing.Any]:
+        """Read the count and sub-records."""
+        return [decode_item(reader) for _ in range(reader.varint())]
+
+    return encode, decode
+
+
+def _codec(*, schema: oa_types.Schema) -> typing.Tuple[TEncode, TDecode]:
+    """
+    Calculate the encoding of a property based on its type and format.
+
+    Raise FeatureNotImplementedError if the type is not supported.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        The function that encodes and the function that decodes the property.
+
+    """
+    if helpers.peek.json(schema=schema, schemas={}):
+        return _encode_json, _decode_json
+    type_ = helpers.peek.type_(schema=schema, schemas={})
+    format_ = helpers.peek.format_(schema=schema, schemas={})
+    if type_ == "integer":
+        return _encode_integer, _decode_integer
+    if type_ == "number":
+        return _encode_number, _decode_number
+    if type_ == "boolean":
+        return _encode_boolean, _decode_boolean
+    if type_ == "string":
+        if format_ == "date":
+            return _encode_date, _decode_date
+        if format_ == "date-time":
+            return _encode_date_time, _decode_date_time
+        if format_ == "binary":
+            return _encode_bytes, _decode_bytes
+        return _encode_string, _decode_string
+    if type_ == "object":
+        return _object_codec(schema=schema)
+    if type_ == "array":
+        return _array_codec(schema=schema)
+    raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+
+
+def _layout_properties(
+    *, model: typing.Type
+) -> typing.List[typing.Tuple[str, oa_types.Schema]]:
+    """
+    Calculate the properties that are serialized in the order they are serialized.
+
+    The properties are those that to_dict returns except for readOnly relationships
+    which are derived from the other side of the relationship.
+
+    Args:
+        model: The model to calculate the properties for.
+
+    Returns:
+        The name and schema of each serialized property.
+
+    """
+    read = model._get_plan().read  # pylint: disable=protected-access
+    return [
+        (property_plan.name, property_plan.schema)
+        for property_plan in sorted(read, key=lambda property_plan: property_plan.name)
+        if not (
+            property_plan.relationship
+            and helpers.peek.read_only(schema=property_plan.schema, schemas={})
+        )
+    ]
+
+
+def layout(*, model: typing.Type) -> TLayout:
+    """
+    Calculate the encoding of each property of a model.
+
+    Properties are encoded in order of their name.
+
+    Args:
+        model: The model to calculate the layout for.
+
+    Returns:
+        The encoding of each serialized property.
+
+    """
+    cached = _LAYOUTS.get(model)
+    if cached is not None:
+        return cached
+    fields = []
+    for name, schema in _layout_properties(model=model):
+        encode, decode = _codec(schema=schema)
+        fields.append(Field(name=name, encode=encode, decode=decode))
+    _LAYOUTS[model] = tuple(fields)
+    return _LAYOUTS[model]
+
+
+def _digest(*, model: typing.Type, stack: typing.Tuple[typing.Type, ...]) -> bytes:
+    """Calculate the digest of a model including the models it references."""
+    properties = _layout_properties(model=model)
+    digest = hashlib.sha256(
+        json.dumps(properties, sort_keys=True, separators=(",", ":")).encode()
+    )
+    for _, schema in properties:
+        if helpers.peek.json(schema=schema, schemas={}):
+            continue
+        type_ = helpers.peek.type_(schema=schema, schemas={})
+        if type_ == "array":
+            schema = schema["items"]
+        elif type_ != "object":
+            continue
+        ref_model = _get_ref_model(schema=schema)
+        if ref_model in stack or ref_model is model:
+            # Break cycles by only including the name of the model
+            digest.update(ref_model.__name__.encode())
+            continue
+        digest.update(_digest(model=ref_model, stack=(*stack, model)))
+    return digest.digest()
+
+
+def fingerprint(*, model: typing.Type) -> bytes:
+    """
+    Calculate the fingerprint of the layout of a model.
+
+    The fingerprint changes whenever the serialized properties of the model, or of any
+    model it references, change.
+
+    Args:
+        model: The model to calculate the fingerprint for.
+
+    Returns:
+        The fingerprint.
+
+    """
+    cached = _FINGERPRINTS.get(model)
+    if cached is None:
+        cached = _digest(model=model, stack=())[:FINGERPRINT_LENGTH]
+        _FINGERPRINTS[model] = cached
+    return cached
+
+
+def encode_record(buffer: bytearray, instance: typing.Any, *, model: typing.Type):
+    """
+    Append the record of a model instance to a buffer.
+
+    A record starts with a bitmap of the properties that are null followed by the
+    value of each property that is not null.
+
+    Args:
+        buffer: The buffer to append to.
+        instance: The model instance.
+        model: The model of the instance.
+
+    """
+    fields = layout(model=model)
+    values = [getattr(instance, field.name, None) for field in fields]
+    null_bitmap = bytearray((len(fields) + 7) // 8)
+    for index, value in enumerate(values):
+        if value is None:
+            null_bitmap[index >> 3] |= 1 << (index & 7)
+    buffer += null_bitmap
+    for field, value in zip(fields, values):
+        if value is not None:
+            field.encode(buffer, value)
+
+
+def decode_record(reader: _Reader, *, model: typing.Type) -> typing.Any:
+    """
+    Read the record of a model instance.
+
+    Args:
+        reader: The reader positioned at the start of the record.
+        model: The model of the instance.
+
+    Returns:
+        The model instance.
+
+    """
+    fields = layout(model=model)
+    null_bitmap = reader.take((len(fields) + 7) // 8)
+    kwargs = {
+        field.name: field.decode(reader)
+        for index, field in enumerate(fields)
+        if not null_bitmap[index >> 3] & (1 << (index & 7))
+    }
+    return model(**kwargs)
+
+
+def dumps(instances: typing.Iterable[typing.Any], *, model: typing.Type, kind: int):
+    """
+    Serialize model instances.
+
+    Args:
+        instances: The instances to serialize, must be a single instance for
+            KIND_RECORD.
+        model: The model of the instances.
+        kind: Whether a single record or a list of records is serialized.
+
+    Returns:
+        The binary payload.
+
+    """
+    buffer = bytearray(_HEADER.pack(kind, fingerprint(model=model)))
+    if kind == KIND_LIST:
+        instances = list(instances)
+        _write_varint(buffer, len(instances))
+    for instance in instances:
+        encode_record(buffer, instance, model=model)
+    return bytes(buffer)
+
+
+def loads(value: typing.Any, *, model: typing.Type, kind: int) -> typing.List:
+    """
+    De-serialize model instances.
+
+    Raise MalformedBinaryError if the value is not bytes, is not a payload of the
+    expected kind, was encoded for a different layout of the model or is malformed.
+
+    Args:
+        value: The binary payload.
+        model: The model of the instances.
+        kind: Whether a single record or a list of records is expected.
+
+    Returns:
+        The model instances.
+
+    """
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        raise exceptions.MalformedBinaryError(
+            "The value is not bytes.", value_type=type(value)
+        )
+    reader = _Reader(bytes(value))
+    payload_kind, payload_fingerprint = _HEADER.unpack(reader.take(_HEADER.size))
+    if payload_kind != kind:
+        raise exceptions.MalformedBinaryError(
+            "The binary payload is not of the expected kind.",
+            kind=payload_kind,
+            expected_kind=kind,
+        )
+    if payload_fingerprint != fingerprint(model=model):
+        raise exceptions.MalformedBinaryError(
+            "The binary payload was encoded for a different schema of the model.",
+            fingerprint=payload_fingerprint.hex(),
+            expected_fingerprint=fingerprint(model=model).hex(),
+        )
+
+    count = reader.varint() if kind == KIND_LIST else 1
+    try:
+        instances = [decode_record(reader, model=model) for _ in range(count)]
+    except (UnicodeDecodeError, ValueError, OverflowError) as exc:
+        if isinstance(exc, exceptions.BaseError):
+            raise
+        raise exceptions.MalformedBinaryError(
+            "The binary payload contains an invalid value.", error=str(exc)
+        )
+    if reader.offset != len(reader.value):
+        raise exceptions.MalformedBinaryError(
+            "The binary payload has unexpected trailing bytes.",
+            trailing=len(reader.value) - reader.offset,
+        )
+    return instances
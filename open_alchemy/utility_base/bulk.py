@@ -0,0 +1,176 @@
+"""Convert dictionaries to rows for batched Core INSERT statements."""
+
+import itertools
+import typing
+
+from .. import exceptions
+from .. import helpers
+from .. import types as oa_types
+from . import from_dict
+
+DEFAULT_BATCH_SIZE = 1000
+
+TRow = typing.Dict[str, typing.Any]
+
+
+def check_schema(*, schema: oa_types.Schema) -> None:
+    """
+    Check that the model can be written using bulk operations.
+
+    Raise FeatureNotImplementedError if the model inherits from another model because
+    its values could be spread across multiple tables.
+
+    Args:
+        schema: The schema of the model.
+
+    """
+    if helpers.schema.inherits(schema=schema, schemas={}):
+        raise exceptions.FeatureNotImplementedError(
+            "Bulk operations are not supported for models that inherit."
+        )
+
+
+def convert(
+    *,
+    value: typing.Any,
+    schema: oa_types.Schema,
+    validator: typing.Any,
+    column_keys: typing.Dict[str, str],
+) -> TRow:
+    """
+    Validate a dictionary against the model schema and convert it to a row.
+
+    Raise MalformedModelDictionaryError if the value is not a valid instance of the
+    schema, includes a property that is not in the schema or includes a property that
+    does not map to a column (such as a relationship).
+
+    Args:
+        value: The dictionary to convert.
+        schema: The schema of the model.
+        validator: The validator for the schema of the model.
+        column_keys: The column key for each property that maps to a column.
+
+    Returns:
+        The row keyed by column key.
+
+    """
+    if not isinstance(value, dict):
+        raise exceptions.MalformedModelDictionaryError(
+            "The value is not a dictionary.", value=value, value_type=type(value)
+        )
+    properties = schema["properties"]
+    for name in value:
+        if name in properties and name not in column_keys:
+            raise exceptions.MalformedModelDictionaryError(
+                "Bulk operations only support properties that map to a column.",
+                parameter_name=name,
+                schema=schema,
+            )
+
+    converted = from_dict.convert_dict(
+        value=value,
+        schema=schema,
+        properties=properties,
+        validator=validator,
+        function_name="a bulk operation",
+    )
+    return {column_keys[name]: column_value for name, column_value in converted.items()}
+
+
+def batch(
+    rows: typing.Iterable[TRow], *, batch_size: int
+) -> typing.Iterator[typing.List[TRow]]:
+    """
+    Split rows into batches of at most batch_size rows.
+
+    Raise InvalidArgumentError if the batch size is less than 1.
+
+    Args:
+        rows: The rows to split.
+        batch_size: The maximum number of rows in a batch.
+
+    Returns:
+        The batches.
+
+    """
+    if batch_size < 1:
+        raise exceptions.InvalidArgumentError(
+            "The batch size must be at least 1.", batch_size=batch_size
+        )
+    iterator = iter(rows)
+    while True:
+        rows_batch = list(itertools.islice(iterator, batch_size))
+        if not rows_batch:
+            return
+        yield rows_batch
+
+
+def group(
+    rows: typing.List[TRow],
+) -> typing.Iterator[typing.Tuple[typing.Tuple[str, ...], typing.List[TRow]]]:
+    """
+    Group rows by the keys that they define.
+
+    executemany requires all rows to have the same keys. Filling in missing keys with
+    None would replace any column default, so rows are grouped instead.
+
+    Args:
+        rows: The rows to group.
+
+    Returns:
+        The keys and the rows with those keys, in order of first appearance.
+
+    """
+    groups: typing.Dict[typing.Tuple[str, ...], typing.List[TRow]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row.keys())), []).append(row)
+    return iter(groups.items())
+
+
+def conflict_target(
+    *,
+    conflict: typing.Optional[typing.Union[str, typing.Sequence[str]]],
+    column_keys: typing.Dict[str, str],
+    targets: typing.List[typing.Tuple[str, ...]],
+) -> typing.Tuple[str, ...]:
+    """
+    Calculate the column keys of the conflict target of an upsert.
+
+    Raise InvalidConflictTargetError if the table does not have a primary key or unique
+    constraint over exactly the requested properties.
+
+    Args:
+        conflict: The property or properties that identify a conflict. Defaults to the
+            primary key.
+        column_keys: The column key for each property that maps to a column.
+        targets: The column keys of the primary key and unique constraints of the
+            table.
+
+    Returns:
+        The column keys of the conflict target.
+
+    """
+    if conflict is None:
+        if not targets:
+            raise exceptions.InvalidConflictTargetError(
+                "The model does not have a primary key nor any unique constraints to "
+                "use as the conflict target."
+            )
+        return targets[0]
+
+    names = [conflict] if isinstance(conflict, str) else list(conflict)
+    unknown = [name for name in names if name not in column_keys]
+    if unknown:
+        raise exceptions.InvalidConflictTargetError(
+            "The conflict target includes properties that are not columns.",
+            properties=unknown,
+        )
+    keys = tuple(column_keys[name] for name in names)
+    for target in targets:
+        if set(target) == set(keys):
+            return keys
+    raise exceptions.InvalidConflictTargetError(
+        "The conflict target must match the primary key (x-primary-key), a unique "
+        "column (x-unique) or a unique constraint (x-composite-unique).",
+        conflict=names,
+    )
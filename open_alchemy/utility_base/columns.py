@@ -0,0 +1,213 @@
+"""Convert model instances to columns of values."""
+
+import datetime
+import typing
+
+from .. import exceptions
+from .. import helpers
+from .. import types as oa_types
+
+DEFAULT_CHUNK_SIZE = 1000
+
+TColumns = typing.Dict[str, typing.Any]
+
+_FILL_VALUES = {"bool": False, "object": None}
+
+
+def _numpy() -> typing.Any:
+    """
+    Import NumPy.
+
+    Raise ImportError if numpy has not been installed.
+
+    Returns:
+        The numpy module.
+
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError(
+            "Using to_columns with arrays requires the numpy package. Try "
+            "`pip install numpy` or pass arrays=False."
+        )
+    return numpy
+
+
+def calculate_fields(
+    *,
+    properties: oa_types.Schema,
+    nullable: typing.Dict[str, bool],
+    fields: typing.Optional[typing.Sequence[str]],
+) -> typing.List[str]:
+    """
+    Calculate the properties to export.
+
+    By default, every property that maps to a column is exported except for writeOnly
+    properties.
+
+    Raise InvalidArgumentError if a requested field is not a property that maps to a
+    column.
+
+    Args:
+        properties: The properties of the model.
+        nullable: The nullability of each property that maps to a column.
+        fields: The requested properties.
+
+    Returns:
+        The names of the properties to export.
+
+    """
+    if fields is None:
+        return [
+            name
+            for name, schema in properties.items()
+            if name in nullable
+            and not helpers.peek.write_only(schema=schema, schemas={})
+        ]
+
+    unknown = [
+        name for name in fields if name not in properties or name not in nullable
+    ]
+    if unknown:
+        raise exceptions.InvalidArgumentError(
+            "Only properties that map to a column can be exported to columns.",
+            fields=unknown,
+        )
+    return list(fields)
+
+
+def dtype(*, schema: oa_types.Schema) -> str:
+    """
+    Calculate the NumPy dtype of a property based on its type and format.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        The name of the dtype.
+
+    """
+    if helpers.peek.json(schema=schema, schemas={}):
+        return "object"
+    type_ = helpers.peek.type_(schema=schema, schemas={})
+    format_ = helpers.peek.format_(schema=schema, schemas={})
+    if type_ == "integer":
+        return "int32" if format_ == "int32" else "int64"
+    if type_ == "number":
+        return "float32" if format_ == "float" else "float64"
+    if type_ == "boolean":
+        return "bool"
+    if type_ == "string" and format_ == "date":
+        return "datetime64[D]"
+    if type_ == "string" and format_ == "date-time":
+        return "datetime64[us]"
+    return "object"
+
+
+def to_lists(
+    instances: typing.Iterable[typing.Any], *, fields: typing.Sequence[str]
+) -> TColumns:
+    """
+    Collect the values of the fields of instances into lists.
+
+    Args:
+        instances: The model instances.
+        fields: The names of the properties to collect.
+
+    Returns:
+        A list of values for each field.
+
+    """
+    columns: TColumns = {name: [] for name in fields}
+    for instance in instances:
+        for name in fields:
+            columns[name].append(getattr(instance, name, None))
+    return columns
+
+
+def _datetime64_value(value: typing.Any) -> typing.Any:
+    """Convert timezone aware datetimes to UTC because datetime64 is naive."""
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _fill_value(dtype_: str) -> typing.Any:
+    """Calculate the value stored underneath the mask for a null value."""
+    if dtype_ in _FILL_VALUES:
+        return _FILL_VALUES[dtype_]
+    if dtype_.startswith("datetime64"):
+        # Converted to NaT
+        return None
+    return 0
+
+
+def _array(numpy: typing.Any, values: typing.List[typing.Any], *, dtype_: str):
+    """Convert a list of values to an array, masking any null values."""
+    mask = [value is None for value in values]
+    fill_value = _fill_value(dtype_)
+    if dtype_.startswith("datetime64"):
+        values = [_datetime64_value(value) for value in values]
+    filled = [fill_value if is_null else value for value, is_null in zip(values, mask)]
+
+    if dtype_ == "object":
+        # Assign element wise so that list and dictionary values stay as elements
+        array = numpy.empty(len(filled), dtype=object)
+        array[:] = filled
+    else:
+        array = numpy.array(filled, dtype=dtype_)
+    if any(mask):
+        return numpy.ma.MaskedArray(array, mask=mask)
+    return array
+
+
+def to_arrays(
+    chunks: typing.Iterable[typing.List[typing.Any]],
+    *,
+    fields: typing.Sequence[str],
+    dtypes: typing.Dict[str, str],
+    nullable: typing.Dict[str, bool],
+) -> TColumns:
+    """
+    Convert chunks of instances to NumPy arrays.
+
+    Each chunk is converted to arrays before the next one is read so that only a
+    single chunk of Python values is held in memory. Nullable columns are returned as
+    masked arrays where null values are masked.
+
+    Raise ImportError if numpy has not been installed.
+
+    Args:
+        chunks: The chunks of model instances.
+        fields: The names of the properties to convert.
+        dtypes: The NumPy dtype of each property.
+        nullable: Whether each property is nullable.
+
+    Returns:
+        An array for each field.
+
+    """
+    numpy = _numpy()
+    parts: typing.Dict[str, typing.List[typing.Any]] = {name: [] for name in fields}
+    for chunk in chunks:
+        for name, values in to_lists(chunk, fields=fields).items():
+            parts[name].append(_array(numpy, values, dtype_=dtypes[name]))
+
+    columns: TColumns = {}
+    for name in fields:
+        arrays = parts[name]
+        masked = nullable[name] or any(
+            isinstance(array, numpy.ma.MaskedArray) for array in arrays
+        )
+        if not arrays:
+            array = numpy.empty(0, dtype=dtypes[name])
+        elif masked:
+            array = numpy.ma.concatenate(arrays)
+        else:
+            array = numpy.concatenate(arrays)
+        if masked:
+            # Expand the mask so that it always has an entry for each value
+            array = numpy.ma.MaskedArray(array, mask=numpy.ma.getmaskarray(array))
+        columns[name] = array
+    return columns
@@ -0,0 +1,132 @@
+"""Cache of the dictionaries of instances that is invalidated when they change."""
+
+import contextvars
+import typing
+import weakref
+
+from .. import facades
+
+TKey = typing.Tuple[bool, bool]
+TConvert = typing.Callable[[], typing.Dict[str, typing.Any]]
+
+
+class _Entry:
+    """The cached dictionaries of an instance and the instances that depend on it."""
+
+    __slots__ = ("values", "dependents")
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.values: typing.Dict[TKey, typing.Dict[str, typing.Any]] = {}
+        self.dependents: "weakref.WeakSet[typing.Any]" = weakref.WeakSet()
+
+
+# The cache entry of each instance that is cached or that a cached instance depends on
+_ENTRIES: "weakref.WeakKeyDictionary[typing.Any, _Entry]" = weakref.WeakKeyDictionary()
+# The instances visited while converting the instance that is being cached
+_VISITED: "contextvars.ContextVar[typing.Optional[typing.Set[typing.Any]]]" = (
+    contextvars.ContextVar("visited", default=None)
+)
+# The models whose instances are listened to for changes
+_LISTENED: "weakref.WeakSet[typing.Type]" = weakref.WeakSet()
+
+
+def recording() -> bool:
+    """Check whether the dictionary of an instance is being calculated for caching."""
+    return _VISITED.get() is not None
+
+
+def visit(value: typing.Any) -> None:
+    """
+    Record that the dictionary being cached depends on an instance or instances.
+
+    Args:
+        value: An instance, an iterable of instances or None.
+
+    """
+    visited = _VISITED.get()
+    if visited is None or value is None:
+        return
+    if isinstance(value, (list, tuple, set)):
+        visited.update(value)
+        return
+    visited.add(value)
+
+
+def invalidate(instance: typing.Any) -> None:
+    """
+    Remove the cached dictionaries of an instance and of the instances that include it.
+
+    Args:
+        instance: The instance that changed.
+
+    """
+    pending = [instance]
+    seen: typing.Set[int] = set()
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        entry = _ENTRIES.get(current)
+        if entry is None:
+            continue
+        entry.values.clear()
+        pending.extend(entry.dependents)
+
+
+def _listen(model: typing.Type) -> None:
+    """Invalidate the cached dictionaries of the instances of a model, once."""
+    if model in _LISTENED:
+        return
+    _LISTENED.add(model)
+    facades.sqlalchemy.cache.listen_instance_changes(model=model, callback=invalidate)
+
+
+def _copy(value: typing.Any) -> typing.Any:
+    """Copy the dictionaries and lists of a dictionary."""
+    if isinstance(value, dict):
+        return {key: _copy(sub_value) for key, sub_value in value.items()}
+    if isinstance(value, list):
+        return [_copy(sub_value) for sub_value in value]
+    return value
+
+
+def get(
+    instance: typing.Any, *, native: bool, load_deferred: bool, convert: TConvert
+) -> typing.Dict[str, typing.Any]:
+    """
+    Get the dictionary of an instance from the cache or convert and cache it.
+
+    The cached dictionary is removed when the instance, or any instance that was read
+    to convert it, is changed. A copy of the cached dictionary is returned.
+
+    Args:
+        instance: The instance to convert.
+        native: Whether the dictionary keeps native values.
+        load_deferred: Whether the dictionary includes deferred properties that have not
+            been loaded.
+        convert: Converts the instance to a dictionary.
+
+    Returns:
+        The dictionary of the instance.
+
+    """
+    key = (native, load_deferred)
+    visit(instance)
+    entry = _ENTRIES.get(instance)
+    if entry is not None and key in entry.values:
+        return _copy(entry.values[key])
+
+    visited: typing.Set[typing.Any] = {instance}
+    token = _VISITED.set(visited)
+    try:
+        value = convert()
+    finally:
+        _VISITED.reset(token)
+
+    for dependency in visited:
+        _listen(type(dependency))
+        _ENTRIES.setdefault(dependency, _Entry()).dependents.add(instance)
+    _ENTRIES[instance].values[key] = value
+    return _copy(value)
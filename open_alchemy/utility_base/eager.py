@@ -0,0 +1,80 @@
+"""Calculate the relationships that to_dict reads to load them up front."""
+
+import typing
+
+from .. import exceptions
+from .. import facades
+from .. import helpers
+from .. import types as oa_types
+
+TPath = typing.Tuple[str, ...]
+
+
+def _get_ref_model(*, schema: oa_types.Schema) -> typing.Type:
+    """Retrieve the model referenced by a relationship property."""
+    if helpers.peek.type_(schema=schema, schemas={}) == "array":
+        schema = schema["items"]
+    ref_model_name = helpers.ext_prop.get(source=schema, name="x-de-$ref")
+    if ref_model_name is None:
+        raise exceptions.SchemaNotFoundError(
+            "The schema of the relationship property does not include the x-de-$ref "
+            "extension property with the name of the referenced model."
+        )
+    ref_model = facades.models.get_model(name=ref_model_name)
+    if ref_model is None:
+        raise exceptions.SchemaNotFoundError(
+            f"The referenced model {ref_model_name} was not found in the models."
+        )
+    return ref_model
+
+
+def _read_only(*, schema: oa_types.Schema) -> bool:
+    """Check whether a relationship is converted using its readOnly properties."""
+    if helpers.peek.read_only(schema=schema, schemas={}):
+        return True
+    if helpers.peek.type_(schema=schema, schemas={}) != "array":
+        return False
+    return bool(helpers.peek.read_only(schema=schema["items"], schemas={}))
+
+
+def _paths(
+    *, model: typing.Any, prefix: TPath, seen: typing.Tuple[typing.Any, ...]
+) -> typing.List[TPath]:
+    """Calculate the paths for a model that is reached through prefix."""
+    paths: typing.List[TPath] = []
+    for property_plan in model._get_plan().read:  # pylint: disable=protected-access
+        if not property_plan.relationship:
+            continue
+        path = (*prefix, property_plan.name)
+        if _read_only(schema=property_plan.schema):
+            paths.append(path)
+            continue
+        ref_model = _get_ref_model(schema=property_plan.schema)
+        if ref_model in seen:
+            paths.append(path)
+            continue
+        paths.extend(
+            _paths(model=ref_model, prefix=path, seen=(*seen, ref_model)) or [path]
+        )
+    return paths
+
+
+def paths(*, model: typing.Any) -> typing.List[TPath]:
+    """
+    Calculate the relationship paths that to_dict of a model reads.
+
+    Relationships that are converted using their readOnly properties are read but the
+    relationships of the related model are not. The relationships of a model that is
+    already on the path are not followed to avoid cycles.
+
+    Raise SchemaNotFoundError if the schema of a relationship does not name the
+    referenced model or if a referenced model has not been constructed.
+
+    Args:
+        model: The model to calculate the paths for.
+
+    Returns:
+        The paths of relationship names that are not a prefix of another path.
+
+    """
+    return _paths(model=model, prefix=(), seen=(model,))
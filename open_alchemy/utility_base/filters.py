@@ -0,0 +1,274 @@
+"""Convert query parameters to filters on the properties of a model."""
+
+import typing
+import warnings
+
+from .. import exceptions
+from .. import facades
+from .. import helpers
+from .. import types as oa_types
+from . import from_dict
+
+SEPARATOR = "__"
+OPERATORS = ("eq", "in", "range", "gt", "gte", "lt", "lte", "prefix")
+UNINDEXED_POLICIES = ("raise", "warn", "allow")
+LIST_SEPARATOR = ","
+
+TFilter = typing.Tuple[str, str, typing.Any]
+
+_BOOLEANS = {"true": True, "false": False}
+_PREFIX_EXCLUDED_FORMATS = {"date", "date-time", "binary"}
+
+
+def parse_key(key: str) -> typing.Tuple[str, str]:
+    """
+    Split a parameter name into the property name and the operator.
+
+    The operator follows the property name separated by a double underscore and
+    defaults to eq.
+
+    Raise InvalidArgumentError if the operator is not supported.
+
+    Args:
+        key: The name of the parameter.
+
+    Returns:
+        The property name and the operator.
+
+    """
+    name, separator, operator = key.rpartition(SEPARATOR)
+    if not separator:
+        return key, "eq"
+    if operator not in OPERATORS:
+        raise exceptions.InvalidArgumentError(
+            f"The operator {operator} of the parameter {key} is not supported. "
+            f"Expected one of {', '.join(OPERATORS)}.",
+            parameter_name=key,
+        )
+    return name, operator
+
+
+def indexed(
+    *, keys: typing.Iterable[typing.Tuple[typing.Tuple[str, ...], bool]]
+) -> typing.Set[str]:
+    """
+    Calculate the properties that are the leading property of an index.
+
+    Args:
+        keys: The property names of the primary key, unique constraints and indexes
+            and whether each is unique.
+
+    Returns:
+        The names of the indexed properties.
+
+    """
+    return {key[0] for key, _ in keys if key}
+
+
+def _coerce(value: typing.Any, *, schema: oa_types.Schema) -> typing.Any:
+    """
+    Coerce a query string value to the JSON type of a property.
+
+    Values that are not strings are returned unchanged.
+
+    Raise ValueError if the value cannot be coerced.
+
+    Args:
+        value: The value to coerce.
+        schema: The schema of the property.
+
+    Returns:
+        The coerced value.
+
+    """
+    if not isinstance(value, str):
+        return value
+    type_ = helpers.peek.type_(schema=schema, schemas={})
+    if type_ == "integer":
+        return int(value)
+    if type_ == "number":
+        return float(value)
+    if type_ == "boolean":
+        return _BOOLEANS[value.lower()] if value.lower() in _BOOLEANS else value
+    return value
+
+
+def convert(value: typing.Any, *, name: str, schema: oa_types.Schema) -> typing.Any:
+    """
+    Validate a parameter value against the schema of a property and convert it.
+
+    Raise InvalidArgumentError if the value is not valid for the property.
+
+    Args:
+        value: The value of the parameter.
+        name: The name of the property.
+        schema: The schema of the property.
+
+    Returns:
+        The value converted for the column of the property.
+
+    """
+    try:
+        coerced = _coerce(value, schema=schema)
+        facades.jsonschema.validate(instance=coerced, schema=schema)
+        return from_dict.simple.convert(coerced, schema=schema)
+    except (
+        ValueError,
+        facades.jsonschema.ValidationError,
+        exceptions.InvalidInstanceError,
+    ) as exc:
+        raise exceptions.InvalidArgumentError(
+            f"The value {value!r} is not valid for the property {name}.",
+            property_name=name,
+        ) from exc
+
+
+def _split(value: typing.Any) -> typing.List[typing.Any]:
+    """Split a comma separated value unless it already is a list."""
+    if isinstance(value, str):
+        return value.split(LIST_SEPARATOR)
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _convert_operand(
+    value: typing.Any, *, name: str, operator: str, schema: oa_types.Schema
+) -> typing.Any:
+    """
+    Convert the value of a parameter based on the operator.
+
+    Raise InvalidArgumentError if the value is not valid for the operator.
+
+    Args:
+        value: The value of the parameter.
+        name: The name of the property.
+        operator: The operator of the parameter.
+        schema: The schema of the property.
+
+    Returns:
+        A list of values for in, the lower and upper bound for range where an empty
+        bound is None and a single value otherwise.
+
+    """
+    if operator == "in":
+        return [convert(item, name=name, schema=schema) for item in _split(value)]
+    if operator == "range":
+        bounds = _split(value)
+        if len(bounds) != 2 or all(bound in {None, ""} for bound in bounds):
+            raise exceptions.InvalidArgumentError(
+                f"The range for the property {name} must have a lower and an upper "
+                "bound where one of them may be empty.",
+                property_name=name,
+            )
+        return tuple(
+            None if bound in {None, ""} else convert(bound, name=name, schema=schema)
+            for bound in bounds
+        )
+    if operator == "prefix":
+        type_ = helpers.peek.type_(schema=schema, schemas={})
+        format_ = helpers.peek.format_(schema=schema, schemas={})
+        if (
+            type_ != "string"
+            or format_ in _PREFIX_EXCLUDED_FORMATS
+            or not isinstance(value, str)
+        ):
+            raise exceptions.InvalidArgumentError(
+                f"The prefix operator of the property {name} is only supported for "
+                "string properties and values.",
+                property_name=name,
+            )
+        return value
+    return convert(value, name=name, schema=schema)
+
+
+def _check_indexed(
+    *, name: str, indexed_names: typing.Set[str], unindexed: str
+) -> None:
+    """
+    Check that a property is the leading property of an index.
+
+    Raise UnindexedFilterError if the property is not indexed and unindexed is raise
+    and warn with UnindexedFilterWarning if unindexed is warn.
+
+    Args:
+        name: The name of the property.
+        indexed_names: The names of the indexed properties.
+        unindexed: How to handle filters on properties that are not indexed.
+
+    """
+    if name in indexed_names or unindexed == "allow":
+        return
+    message = (
+        f"The property {name} is not the leading property of the primary key, a "
+        "unique constraint or an index which means that filtering by it scans the "
+        "table. Set x-index, x-unique or x-composite-index to add an index."
+    )
+    if unindexed == "warn":
+        warnings.warn(message, exceptions.UnindexedFilterWarning)
+        return
+    raise exceptions.UnindexedFilterError(message, property_name=name)
+
+
+def parse(
+    params: typing.Mapping[str, typing.Any],
+    *,
+    properties: oa_types.Schema,
+    nullable: typing.Dict[str, bool],
+    indexed_names: typing.Set[str],
+    unindexed: str,
+) -> typing.List[TFilter]:
+    """
+    Convert query parameters to filters on the properties of a model.
+
+    Raise InvalidArgumentError if unindexed is not supported, a parameter is not for
+    a property of a simple type that maps to a column, is for a writeOnly property or
+    has an invalid value.
+    Raise UnindexedFilterError if a property is not indexed and unindexed is raise.
+
+    Args:
+        params: The query parameters.
+        properties: The properties of the model.
+        nullable: The nullability of each property that maps to a column.
+        indexed_names: The names of the indexed properties.
+        unindexed: How to handle filters on properties that are not indexed, one of
+            raise, warn or allow.
+
+    Returns:
+        The property name, the operator and the converted value for each parameter.
+
+    """
+    if unindexed not in UNINDEXED_POLICIES:
+        raise exceptions.InvalidArgumentError(
+            f"unindexed must be one of {', '.join(UNINDEXED_POLICIES)}.",
+            unindexed=unindexed,
+        )
+
+    filters: typing.List[TFilter] = []
+    for key, value in params.items():
+        name, operator = parse_key(key)
+        schema = properties.get(name)
+        if (
+            schema is None
+            or name not in nullable
+            or helpers.peek.json(schema=schema, schemas={})
+        ):
+            raise exceptions.InvalidArgumentError(
+                f"The parameter {key} is not for a property that maps to a column.",
+                parameter_name=key,
+            )
+        if helpers.peek.write_only(schema=schema, schemas={}):
+            raise exceptions.InvalidArgumentError(
+                f"The parameter {key} is for a writeOnly property which cannot be "
+                "filtered by.",
+                parameter_name=key,
+            )
+        _check_indexed(name=name, indexed_names=indexed_names, unindexed=unindexed)
+        filters.append(
+            (
+                name,
+                operator,
+                _convert_operand(value, name=name, operator=operator, schema=schema),
+            )
+        )
+    return filters
@@ -3,6 +3,7 @@
 import typing
 
 from ... import exceptions
+from ... import facades
 from ... import helpers
 from ... import types as oa_types
 from .. import types
@@ -39,3 +40,60 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyCol:
     if type_ in {"integer", "number", "string", "boolean"}:
         return simple.convert(value, schema=schema)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+
+
+def convert_dict(
+    *,
+    value: typing.Dict[str, typing.Any],
+    schema: oa_types.Schema,
+    properties: oa_types.Schema,
+    validator: typing.Any,
+    function_name: str,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Validate a dictionary against the schema of a model and convert its values.
+
+    Raise MalformedModelDictionaryError if the dictionary is not a valid instance of
+    the schema or includes a property that is not one of the properties.
+
+    Args:
+        value: The dictionary to convert.
+        schema: The schema of the model.
+        properties: The schema of each property of the model.
+        validator: The validator for the dictionary.
+        function_name: The name of the function the dictionary was passed to.
+
+    Returns:
+        The column value of each property.
+
+    """
+    try:
+        validator.validate(value)
+    except facades.jsonschema.ValidationError:
+        raise exceptions.MalformedModelDictionaryError(
+            f"The dictionary passed to {function_name} is not a valid instance of the "
+            "model schema.",
+            schema=schema,
+            kwargs=value,
+        )
+
+    converted: typing.Dict[str, typing.Any] = {}
+    for name, property_value in value.items():
+        property_schema = properties.get(name)
+        if property_schema is None:
+            raise exceptions.MalformedModelDictionaryError(
+                "A parameter was passed in that is not a property in the model schema.",
+                parameter_name=name,
+                schema=schema,
+            )
+
+        try:
+            converted[name] = convert(value=property_value, schema=property_schema)
+        except exceptions.BaseError as exc:
+            exc.schema = schema  # type: ignore
+            exc.property_schema = property_schema  # type: ignore
+            exc.property_name = name  # type: ignore
+            exc.property_value = property_value  # type: ignore
+            raise
+
+    return converted
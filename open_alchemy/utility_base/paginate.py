@@ -0,0 +1,240 @@
+"""Keyset pagination of queries using opaque cursors."""
+
+import base64
+import binascii
+import dataclasses
+import json
+import typing
+
+from .. import exceptions
+from .. import helpers
+from .. import types as oa_types
+from . import from_dict
+from . import to_dict
+
+DEFAULT_LIMIT = 100
+
+TOrdering = typing.List[typing.Tuple[str, bool]]
+TKeys = typing.Sequence[typing.Tuple[typing.Tuple[str, ...], bool]]
+
+_SUPPORTED_TYPES = {"integer", "number", "string", "boolean"}
+
+
+@dataclasses.dataclass
+class Page:
+    """
+    A page of instances of a model.
+
+    Attrs:
+        model: The model of the instances.
+        items: The instances on the page.
+        next_cursor: The cursor for the next page or None if this is the last page.
+
+    """
+
+    model: typing.Any
+    items: typing.List[typing.Any]
+    next_cursor: typing.Optional[str]
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Convert the page to a dictionary.
+
+        Returns:
+            The dictionary representation of the instances and the next cursor.
+
+        """
+        return {
+            "items": [item.to_dict() for item in self.items],
+            "next_cursor": self.next_cursor,
+        }
+
+    def to_str(self) -> str:
+        """
+        Convert the page to a string using the JSON codec of the model.
+
+        Returns:
+            The JSON string representation of the page.
+
+        """
+        # pylint: disable=protected-access
+        value = {
+            "items": [item._to_dict(native=True) for item in self.items],
+            "next_cursor": self.next_cursor,
+        }
+        return self.model._get_json_codec().dumps(value)
+
+
+def parse_order_by(
+    order_by: typing.Optional[typing.Union[str, typing.Sequence[str]]],
+) -> TOrdering:
+    """
+    Parse the requested ordering.
+
+    A property name prefixed with - is ordered in descending order.
+
+    Raise InvalidArgumentError if a property name is empty or repeated.
+
+    Args:
+        order_by: The property name or names to order by.
+
+    Returns:
+        The property names and whether each is descending.
+
+    """
+    if order_by is None:
+        return []
+    if isinstance(order_by, str):
+        order_by = [order_by]
+
+    ordering: TOrdering = []
+    for value in order_by:
+        descending = value.startswith("-")
+        name = value[1:] if descending else value
+        if not name:
+            raise exceptions.InvalidArgumentError(
+                "order_by must only contain property names."
+            )
+        if name in (ordered_name for ordered_name, _ in ordering):
+            raise exceptions.InvalidArgumentError(
+                f"The property {name} is repeated in order_by."
+            )
+        ordering.append((name, descending))
+    return ordering
+
+
+def calculate_ordering(
+    *,
+    requested: TOrdering,
+    keys: TKeys,
+    properties: oa_types.Schema,
+    nullable: typing.Dict[str, bool],
+) -> TOrdering:
+    """
+    Calculate the ordering of a page based on the requested ordering.
+
+    The requested properties must be the leading properties of the primary key, a
+    unique constraint or an index so that the database can find the start of a page
+    using the index. Unless the requested properties include a unique key, the
+    primary key is added to break ties in the same direction as the last requested
+    property. By default the page is ordered by the primary key.
+
+    Raise InvalidArgumentError if no primary key, unique constraint or index
+    supports the ordering or if a property is nullable or not of a simple type.
+
+    Args:
+        requested: The requested ordering.
+        keys: The property names of the primary key, unique constraints and indexes
+            and whether each is unique. The primary key is first.
+        properties: The properties of the model.
+        nullable: The nullability of each property that maps to a column.
+
+    Returns:
+        The property names to order by and whether each is descending.
+
+    """
+    primary_key = keys[0][0] if keys else ()
+    if not primary_key:
+        raise exceptions.InvalidArgumentError(
+            "Only models with a primary key can be paginated."
+        )
+
+    names = tuple(name for name, _ in requested)
+    if names and not any(key[: len(names)] == names for key, _ in keys):
+        raise exceptions.InvalidArgumentError(
+            "The ordering is not supported by the primary key, a unique constraint or "
+            "an index.",
+            order_by=list(names),
+        )
+
+    ordering = list(requested)
+    if not any(unique and set(key).issubset(names) for key, unique in keys):
+        descending = ordering[-1][1] if ordering else False
+        ordering.extend((name, descending) for name in primary_key if name not in names)
+
+    for name, _ in ordering:
+        schema = properties.get(name)
+        if (
+            schema is None
+            or helpers.peek.json(schema=schema, schemas={})
+            or helpers.peek.type_(schema=schema, schemas={}) not in _SUPPORTED_TYPES
+        ):
+            raise exceptions.InvalidArgumentError(
+                f"The property {name} is not of a type that can be paginated by."
+            )
+        if nullable.get(name, True):
+            raise exceptions.InvalidArgumentError(
+                f"The property {name} is nullable and cannot be paginated by."
+            )
+    return ordering
+
+
+def encode_cursor(
+    instance: typing.Any, *, ordering: TOrdering, properties: oa_types.Schema
+) -> str:
+    """
+    Encode the position of an instance as a cursor.
+
+    Args:
+        instance: The last instance of a page.
+        ordering: The ordering of the page.
+        properties: The properties of the model.
+
+    Returns:
+        The URL safe cursor.
+
+    """
+    values = [
+        to_dict.simple.convert(getattr(instance, name), schema=properties[name])
+        for name, _ in ordering
+    ]
+    value = {"o": [[name, descending] for name, descending in ordering], "v": values}
+    encoded = json.dumps(value, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(encoded).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, *, ordering: TOrdering, properties: oa_types.Schema
+) -> typing.List[typing.Any]:
+    """
+    Decode a cursor to the values of the ordering properties.
+
+    Raise InvalidArgumentError if the cursor is malformed or was constructed for a
+    different ordering.
+
+    Args:
+        cursor: The cursor to decode.
+        ordering: The ordering of the page.
+        properties: The properties of the model.
+
+    Returns:
+        The values of the ordering properties of the last instance of the previous
+        page.
+
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise exceptions.InvalidArgumentError("The cursor is malformed.") from exc
+
+    if (
+        not isinstance(value, dict)
+        or value.get("o") != [[name, descending] for name, descending in ordering]
+        or not isinstance(value.get("v"), list)
+        or len(value["v"]) != len(ordering)
+    ):
+        raise exceptions.InvalidArgumentError(
+            "The cursor was not constructed for this ordering."
+        )
+
+    try:
+        values = [
+            from_dict.simple.convert(item, schema=properties[name])
+            for item, (name, _) in zip(value["v"], ordering)
+        ]
+    except (exceptions.InvalidInstanceError, ValueError) as exc:
+        raise exceptions.InvalidArgumentError("The cursor is malformed.") from exc
+    if any(item is None for item in values):
+        raise exceptions.InvalidArgumentError("The cursor is malformed.")
+    return values
@@ -0,0 +1,108 @@
+"""Flattened plans of the properties of a model and the models it inherits from."""
+
+import dataclasses
+import typing
+
+from .. import facades
+from .. import helpers
+from .. import types as oa_types
+from . import to_dict
+
+
+@dataclasses.dataclass(frozen=True)
+class PropertyPlan:
+    """
+    How a property is converted to a dictionary.
+
+    Attrs:
+        name: The name of the property.
+        schema: The schema of the property.
+        model_schema: The schema of the model that defines the property.
+        deferred: Whether the column of the property is deferred.
+        return_none: Whether a null value is included in the dictionary.
+        relationship: Whether the property is a relationship to other instances.
+
+    """
+
+    name: str
+    schema: oa_types.Schema
+    model_schema: oa_types.Schema
+    deferred: bool
+    return_none: bool
+    relationship: bool
+
+
+@dataclasses.dataclass(frozen=True)
+class Plan:
+    """
+    The properties of a model including those of any models it inherits from.
+
+    Attrs:
+        properties: The schema of each property where the schema of a model overrides
+            the schemas of the models it inherits from.
+        read: The properties that are converted to a dictionary in order.
+        validator: Validates dictionaries passed to from_dict against the schemas of
+            the model and the models it inherits from.
+        patch_validator: Validates partial dictionaries passed to apply_patch and
+            patch_where against the properties of the model ignoring required.
+
+    """
+
+    properties: oa_types.Schema
+    read: typing.Tuple[PropertyPlan, ...]
+    validator: typing.Any
+    patch_validator: typing.Any
+
+
+def _relationship(*, schema: oa_types.Schema) -> bool:
+    """Check whether the schema of a property is for a relationship."""
+    if helpers.peek.json(schema=schema, schemas={}):
+        return False
+    return helpers.peek.type_(schema=schema, schemas={}) in {"object", "array"}
+
+
+def calculate(*, schemas: typing.Sequence[oa_types.Schema]) -> Plan:
+    """
+    Flatten the schemas of a model and the models it inherits from into a plan.
+
+    The properties are ordered as they are returned by to_dict which is the order of
+    the properties of the root model first and the properties of the model last.
+
+    Args:
+        schemas: The schemas of the models starting with the root of the inheritance
+            hierarchy and ending with the model.
+
+    Returns:
+        The plan for the model.
+
+    """
+    properties: oa_types.Schema = {}
+    read: typing.Dict[str, PropertyPlan] = {}
+    required: typing.Dict[str, None] = {}
+    for model_schema in schemas:
+        required.update(dict.fromkeys(model_schema.get("required", [])))
+        for name, schema in model_schema["properties"].items():
+            properties[name] = schema
+            if helpers.peek.write_only(schema=schema, schemas={}):
+                continue
+            read[name] = PropertyPlan(
+                name=name,
+                schema=schema,
+                model_schema=model_schema,
+                deferred=bool(helpers.peek.deferred(schema=schema, schemas={})),
+                return_none=to_dict.return_none(
+                    schema=model_schema, property_name=name
+                ),
+                relationship=_relationship(schema=schema),
+            )
+
+    patch_schema: oa_types.Schema = {"type": "object", "properties": properties}
+    validation_schema = patch_schema
+    if required:
+        validation_schema = {**patch_schema, "required": list(required)}
+    return Plan(
+        properties=properties,
+        read=tuple(read.values()),
+        validator=facades.jsonschema.validator(schema=validation_schema),
+        patch_validator=facades.jsonschema.validator(schema=patch_schema),
+    )
@@ -11,13 +11,17 @@ from . import object_
 from . import simple
 
 
-def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
+def convert(
+    *, schema: oa_types.Schema, value: typing.Any, native: bool = False
+) -> types.TAnyDict:
     """
     Convert value for a schema to a dictionary.
 
     Args:
         value: The value to convert.
         schema: The schema of the value.
+        native: Whether to keep date, date-time and binary values as Python objects
+            for a JSON codec that serializes them.
 
     Returns:
         The converted value.
@@ -28,11 +32,11 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
         return value
     type_ = helpers.peek.type_(schema=schema, schemas={})
     if type_ == "object":
-        return object_.convert(value, schema=schema)
+        return object_.convert(value, schema=schema, native=native)
     if type_ == "array":
-        return array.convert(value, schema=schema)
+        return array.convert(value, schema=schema, native=native)
     if type_ in {"integer", "number", "string", "boolean"}:
-        return simple.convert(value, schema=schema)
+        return simple.convert(value, schema=schema, native=native)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
@@ -10,7 +10,9 @@ from .. import types
 from . import object_
 
 
-def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDict:
+def convert(
+    value: typing.Any, *, schema: ao_types.Schema, native: bool = False
+) -> types.TOptArrayDict:
     """
     Convert array property so that it can be included in an object dictionary.
 
@@ -21,6 +23,7 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
     Args:
         value: The value to convert.
         schema: The schema for the value.
+        native: Whether to keep simple values as Python objects.
 
     Returns:
         The value converted to a list of dictionary.
@@ -40,7 +43,7 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
         )
     read_only = helpers.peek.read_only(schema=schema, schemas={})
     item_conversion = functools.partial(
-        object_.convert, schema=item_schema, read_only=read_only
+        object_.convert, schema=item_schema, read_only=read_only, native=native
     )
     try:
         converted_items = map(item_conversion, value)
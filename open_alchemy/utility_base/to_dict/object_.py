@@ -8,7 +8,9 @@ from ... import types as oa_types
 from .. import types
 
 
-def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
+def _convert_relationship(
+    *, value: types.TModel, native: bool = False
+) -> types.TOptObjectDict:
     """
     Convert object relationship property to a dictionary.
 
@@ -18,6 +20,7 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
 
     Args:
         value: The value to convert.
+        native: Whether to keep simple values as Python objects.
 
     Returns:
         The object as a dictionary.
@@ -27,6 +30,8 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
         return None
 
     try:
+        if native:
+            return value._to_dict(native=True)  # pylint: disable=protected-access
         return value.to_dict()
     except AttributeError:
         raise exceptions.InvalidModelInstanceError(
@@ -75,6 +80,7 @@ def convert(
     *,
     schema: oa_types.Schema,
     read_only: typing.Optional[bool] = None,
+    native: bool = False,
 ) -> types.TOptObjectDict:
     """
     Convert object schema value to dictionary.
@@ -83,9 +89,10 @@ def convert(
         value: The value to convert.
         schema: The schema for the value.
         read_only (optional): Whether the schema is read only.
+        native (optional): Whether to keep simple values as Python objects.
 
     """
     schema_read_only = helpers.peek.read_only(schema=schema, schemas={})
     if read_only or schema_read_only:
         return _convert_read_only(schema=schema, value=value)
-    return _convert_relationship(value=value)
+    return _convert_relationship(value=value, native=native)
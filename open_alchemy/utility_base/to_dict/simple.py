@@ -9,8 +9,8 @@ from .. import types
 
 
 def convert(
-    value: types.TOptSimpleCol, *, schema: oa_types.Schema
-) -> types.TOptSimpleDict:
+    value: types.TOptSimpleCol, *, schema: oa_types.Schema, native: bool = False
+) -> types.TOptSimpleCol:
     """
     Convert values with basic types to dictionary values.
 
@@ -19,6 +19,8 @@ def convert(
     Args:
         value: The value to convert.
         schema: The schema for the value.
+        native: Whether to return date, date-time and binary values unchanged for a
+            JSON codec that serializes them.
 
     Returns:
         The value converted to the expected dictionary value.
@@ -41,7 +43,7 @@ def convert(
             )
         return value
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        return _handle_string(value, schema=schema, native=native)
     if type_ == "boolean":
         if not isinstance(value, bool):
             raise exceptions.InvalidInstanceError(
@@ -52,7 +54,9 @@ def convert(
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
-def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
+def _handle_string(
+    value: types.TSimpleCol, *, schema: oa_types.Schema, native: bool = False
+) -> types.TStringCol:
     """
     Convert string type column to str.
 
@@ -60,6 +64,7 @@ def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
 
     Args:
         value: The value to convert.
+        native: Whether to return date, date-time and binary values unchanged.
 
     Returns:
         The converted value.
@@ -71,6 +76,8 @@ def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
             raise exceptions.InvalidInstanceError(
                 "String type columns with date format must have date values."
             )
+        if native:
+            return value
         return value.isoformat()
     if format_ == "date-time":
         if not isinstance(value, datetime.datetime):
@@ -78,12 +85,16 @@ def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
                 "String type columns with date-time format must have datetime "
                 "values."
             )
+        if native:
+            return value
         return value.isoformat()
     if format_ == "binary":
         if not isinstance(value, bytes):
             raise exceptions.InvalidInstanceError(
                 "String type columns with binary format must have bytes values."
             )
+        if native:
+            return value
         return value.decode()
     if not isinstance(value, str):
         raise exceptions.InvalidInstanceError(
@@ -13,7 +13,8 @@ TOptObjectDict = typing.Optional[TObjectDict]
 TArrayDict = typing.List[TOptObjectDict]
 TOptArrayDict = typing.Optional[TArrayDict]
 TComplexDict = typing.Union[TOptObjectDict, TOptArrayDict]
-TAnyDict = typing.Union[TComplexDict, TOptSimpleDict]
+TNativeDict = typing.Union[bytes, datetime.date, datetime.datetime]
+TAnyDict = typing.Union[TComplexDict, TOptSimpleDict, TNativeDict]
 # Types for converting from a dictionary
 TStringCol = typing.Union[str, bytes, datetime.date, datetime.datetime]
 TSimpleCol = typing.Union[int, float, TStringCol, bool]
@@ -29,6 +30,10 @@ TAnyCol = typing.Union[TComplexCol, TSimpleCol]
 class TModel(oa_types.Protocol):
     """Defines interface for a model."""
 
-    def to_dict(self) -> TObjectDict:
+    def to_dict(self, *, load_deferred: bool = False) -> TObjectDict:
         """Interface for to_dict."""
         ...
+
+    def _to_dict(self, *, native: bool, load_deferred: bool = False) -> TObjectDict:
+        """Interface for _to_dict."""
+        ...
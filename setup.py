@@ -38,8 +38,11 @@ setuptools.setup(
         "sqlalchemy-stubs>=0.3",
     ],
     include_package_data=True,
+    entry_points={"console_scripts": ["open_alchemy=open_alchemy.cli:main"]},
     extras_require={
         "yaml": ["PyYAML"],
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
         "dev": [
             "tox",
             "tox-pyenv",
@@ -67,10 +70,13 @@ setuptools.setup(
             "PyYAML",
             "connexion[swagger-ui]",
             "typeguard",
+            "numpy",
+            "orjson",
         ],
         ":python_version<'3.7'": [
             "dataclasses>=0.7",
             "backports-datetime-fromisoformat>=1.0.0",
+            "contextvars>=2.4",
         ],
         ":python_version<'3.8'": ["typing_extensions>=3.7.4"],
     },
@@ -1,11 +1,14 @@
 """Fixtures for all tests."""
+
 # pylint: disable=redefined-outer-name
 
 import pytest
 import sqlalchemy
 from sqlalchemy import orm
 
+from open_alchemy import facades
 from open_alchemy import helpers
+from open_alchemy import loading
 
 
 @pytest.fixture(scope="function", params=["sqlite:///:memory:"])
@@ -30,3 +33,23 @@ def _clean_remote_schemas_store():
     yield
 
     helpers.ref._remote_schema_store.reset()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _clean_backref_store():
+    """Discard backrefs recorded for models that were not constructed by a test."""
+    facades.models.reset_backrefs()
+
+    yield
+
+    facades.models.reset_backrefs()
+
+
+@pytest.fixture(scope="function")
+def _raise_mode():
+    """Enable raise mode for implicit lazy loads during test execution."""
+    loading.set_raise_mode(True)
+
+    yield
+
+    loading.set_raise_mode(False)
@@ -3,6 +3,7 @@
 import sys
 
 import pytest
+import sqlalchemy
 
 from open_alchemy import exceptions
 from open_alchemy.column_factory import array_ref
@@ -381,3 +382,125 @@ def test_construct(mocked_facades_models, mocked_facades_sqlalchemy):
     else:
         _, kwargs = call_args_list[1]
     assert kwargs["artifacts"].open_api.type == "string"
+
+
+_PARENT_SCHEMA = {
+    "type": "object",
+    "x-tablename": "parent",
+    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+}
+_CHILD_SCHEMA = {
+    "type": "object",
+    "x-tablename": "child",
+    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+}
+
+
+def _construct_table(mocked_facades_models, table_schema):
+    """Construct an association table with real metadata."""
+    # pylint: disable=protected-access
+    mocked_facades_models.get_base.return_value.metadata = sqlalchemy.MetaData()
+
+    return array_ref._association_table.construct(
+        parent_schema=_PARENT_SCHEMA,
+        child_schema=_CHILD_SCHEMA,
+        schemas={},
+        tablename="association",
+        table_schema=table_schema,
+    )
+
+
+@pytest.mark.parametrize(
+    "table_schema",
+    [None, {}, {"primary-key": True, "index": True}],
+    ids=["not defined", "empty", "enabled"],
+)
+@pytest.mark.column
+def test_construct_primary_key_index(mocked_facades_models, table_schema):
+    """
+    GIVEN parent and child schema and x-secondary-table that does not disable anything
+    WHEN construct is called
+    THEN the table has a composite primary key in the order (parent, child) and an index
+        in the order (child, parent).
+    """
+    table = _construct_table(mocked_facades_models, table_schema)
+
+    assert [column.name for column in table.primary_key.columns] == [
+        "parent_id",
+        "child_id",
+    ]
+    (index,) = table.indexes
+    assert index.name == "ix_association_child_id"
+    assert [column.name for column in index.columns] == ["child_id", "parent_id"]
+
+
+@pytest.mark.column
+def test_construct_index_name(mocked_facades_models):
+    """
+    GIVEN parent and child schema and x-secondary-table with the index name
+    WHEN construct is called
+    THEN the index has the name.
+    """
+    table = _construct_table(mocked_facades_models, {"index": "ix_custom"})
+
+    (index,) = table.indexes
+    assert index.name == "ix_custom"
+
+
+@pytest.mark.column
+def test_construct_disabled(mocked_facades_models):
+    """
+    GIVEN parent and child schema and x-secondary-table that disables the primary key
+        and index
+    WHEN construct is called
+    THEN the table has neither a primary key nor an index.
+    """
+    table = _construct_table(
+        mocked_facades_models, {"primary-key": False, "index": False}
+    )
+
+    assert not table.primary_key.columns
+    assert not table.indexes
+
+
+@pytest.mark.column
+def test_construct_properties_kwargs(mocked_facades_models):
+    """
+    GIVEN parent and child schema and x-secondary-table with properties and kwargs
+    WHEN construct is called
+    THEN the table has columns for the properties and the kwargs are applied.
+    """
+    table = _construct_table(
+        mocked_facades_models,
+        {
+            "properties": {
+                "position": {"type": "integer", "nullable": False, "default": 0},
+                "note": {"type": "string", "maxLength": 10},
+            },
+            "kwargs": {"comment": "association comment"},
+        },
+    )
+
+    assert [column.name for column in table.columns] == [
+        "parent_id",
+        "child_id",
+        "position",
+        "note",
+    ]
+    assert not table.columns["position"].nullable
+    assert table.columns["note"].type.length == 10
+    assert table.comment == "association comment"
+
+
+@pytest.mark.column
+def test_construct_properties_clash(mocked_facades_models):
+    """
+    GIVEN parent and child schema and x-secondary-table with a property that has the
+        name of a foreign key column
+    WHEN construct is called
+    THEN MalformedSchemaError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError):
+        _construct_table(
+            mocked_facades_models, {"properties": {"child_id": {"type": "integer"}}}
+        )
@@ -2,6 +2,7 @@
 
 import pytest
 
+from open_alchemy import facades
 from open_alchemy.column_factory import array_ref
 
 
@@ -102,12 +103,6 @@ def test_handle_array_backref():
         "RefSchema": {
             "allOf": [
                 {"type": "object", "x-tablename": "ref_schema", "properties": {}},
-                {
-                    "type": "object",
-                    "x-backrefs": {
-                        "schema": {"type": "object", "x-de-$ref": model_name}
-                    },
-                },
                 {
                     "type": "object",
                     "properties": {
@@ -121,3 +116,6 @@ def test_handle_array_backref():
             ]
         }
     }
+    assert facades.models.pop_backrefs(name="RefSchema") == {
+        "schema": {"type": "object", "x-de-$ref": model_name}
+    }
@@ -3,6 +3,7 @@
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import types
 from open_alchemy.helpers import backref
 
@@ -154,19 +155,7 @@ def test_record():
         artifacts=artifacts, ref_from_array=False, model_name="Model", schemas=schemas
     )
 
-    assert schemas == {
-        "RefModel": {
-            "allOf": [
-                {"type": "object", "properties": {}},
-                {
-                    "type": "object",
-                    "x-backrefs": {
-                        "model": {
-                            "type": "array",
-                            "items": {"type": "object", "x-de-$ref": "Model"},
-                        }
-                    },
-                },
-            ]
-        }
+    assert schemas == {"RefModel": {"type": "object", "properties": {}}}
+    assert facades.models.pop_backrefs(name="RefModel") == {
+        "model": {"type": "array", "items": {"type": "object", "x-de-$ref": "Model"}}
     }
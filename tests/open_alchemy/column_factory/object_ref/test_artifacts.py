@@ -57,6 +57,21 @@ def test_ref_error(schemas):
             {"x-secondary": "secondary 1"},
             {"x-secondary": "secondary 2"},
         ],
+        [
+            {"$ref": "#/components/schemas/Schema1"},
+            {"x-secondary-table": {"index": False}},
+            {"x-secondary-table": {"primary-key": False}},
+        ],
+        [
+            {"$ref": "#/components/schemas/Schema1"},
+            {"x-lazy": "select"},
+            {"x-lazy": "joined"},
+        ],
+        [
+            {"$ref": "#/components/schemas/Schema1"},
+            {"x-backref-lazy": "select"},
+            {"x-backref-lazy": "joined"},
+        ],
         [
             {"$ref": "#/components/schemas/Schema1"},
             {"x-foreign-key-column": "column 1"},
@@ -88,6 +103,9 @@ def test_ref_error(schemas):
         "multiple ref",
         "multiple x-backref",
         "multiple x-secondary",
+        "multiple x-secondary-table",
+        "multiple x-lazy",
+        "multiple x-backref-lazy",
         "multiple x-foreign-key-column",
         "multiple x-uselist",
         "multiple nullable",
@@ -494,6 +512,200 @@ def test_gather_object_artifacts_secondary(schema, schemas, expected_secondary):
     assert obj_artifacts.relationship.secondary == expected_secondary
 
 
+@pytest.mark.parametrize(
+    "schema, schemas, expected_secondary_table",
+    [
+        (
+            {"$ref": "#/components/schemas/RefSchema"},
+            {"RefSchema": {"type": "object", "x-secondary": "secondary 1"}},
+            None,
+        ),
+        (
+            {"$ref": "#/components/schemas/RefSchema"},
+            {
+                "RefSchema": {
+                    "type": "object",
+                    "x-secondary": "secondary 1",
+                    "x-secondary-table": {"index": False},
+                }
+            },
+            {"index": False},
+        ),
+        (
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-secondary": "secondary 2"},
+                    {"x-secondary-table": {"index": "ix_name"}},
+                ]
+            },
+            {"RefSchema": {"type": "object"}},
+            {"index": "ix_name"},
+        ),
+        (
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-secondary-table": {"index": "ix_name"}},
+                ]
+            },
+            {
+                "RefSchema": {
+                    "type": "object",
+                    "x-secondary": "secondary 1",
+                    "x-secondary-table": {"index": False},
+                }
+            },
+            {"index": "ix_name"},
+        ),
+    ],
+    ids=[
+        "$ref no secondary table",
+        "$ref secondary table",
+        "allOf secondary table",
+        "allOf secondary table $ref secondary table",
+    ],
+)
+@pytest.mark.column
+def test_gather_object_artifacts_secondary_table(
+    schema, schemas, expected_secondary_table
+):
+    """
+    GIVEN schema and schemas and expected secondary table
+    WHEN gather_object_artifacts is called with the schema and schemas
+    THEN the expected secondary table is returned.
+    """
+    obj_artifacts = artifacts.gather(schema=schema, logical_name="", schemas=schemas)
+
+    assert obj_artifacts.relationship.secondary_table == expected_secondary_table
+
+
+@pytest.mark.column
+def test_gather_object_artifacts_secondary_table_no_secondary():
+    """
+    GIVEN schema with x-secondary-table but no x-secondary
+    WHEN gather_object_artifacts is called with the schema and schemas
+    THEN MalformedRelationshipError is raised.
+    """
+    schema = {"$ref": "#/components/schemas/RefSchema"}
+    schemas = {"RefSchema": {"type": "object", "x-secondary-table": {"index": False}}}
+
+    with pytest.raises(exceptions.MalformedRelationshipError):
+        artifacts.gather(schema=schema, logical_name="", schemas=schemas)
+
+
+@pytest.mark.parametrize(
+    "schema, schemas, expected_lazy, expected_backref_lazy",
+    [
+        pytest.param(
+            {"$ref": "#/components/schemas/RefSchema"},
+            {"RefSchema": {"type": "object", "x-backref": "schema"}},
+            None,
+            None,
+            id="$ref no lazy",
+        ),
+        pytest.param(
+            {"$ref": "#/components/schemas/RefSchema"},
+            {
+                "RefSchema": {
+                    "type": "object",
+                    "x-backref": "schema",
+                    "x-lazy": "selectin",
+                    "x-backref-lazy": "raise",
+                }
+            },
+            "selectin",
+            "raise",
+            id="$ref lazy",
+        ),
+        pytest.param(
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-lazy": "joined"},
+                    {"x-backref-lazy": "dynamic"},
+                ]
+            },
+            {
+                "RefSchema": {
+                    "type": "object",
+                    "x-backref": "schema",
+                    "x-lazy": "selectin",
+                    "x-backref-lazy": "raise",
+                }
+            },
+            "joined",
+            "dynamic",
+            id="allOf lazy $ref lazy",
+        ),
+    ],
+)
+@pytest.mark.column
+def test_gather_object_artifacts_lazy(
+    schema, schemas, expected_lazy, expected_backref_lazy
+):
+    """
+    GIVEN schema and schemas and expected lazy and backref lazy
+    WHEN gather_object_artifacts is called with the schema and schemas
+    THEN the expected lazy and backref lazy are returned.
+    """
+    obj_artifacts = artifacts.gather(schema=schema, logical_name="", schemas=schemas)
+
+    assert obj_artifacts.relationship.lazy == expected_lazy
+    assert obj_artifacts.relationship.back_reference.lazy == expected_backref_lazy
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param(
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-lazy": "eager"},
+                ]
+            },
+            id="lazy invalid",
+        ),
+        pytest.param(
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-backref-lazy": "select"},
+                ]
+            },
+            id="backref lazy no backref",
+        ),
+        pytest.param(
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefSchema"},
+                    {"x-lazy": "select"},
+                    {"x-kwargs": {"lazy": "joined"}},
+                ]
+            },
+            id="lazy in kwargs",
+        ),
+    ],
+)
+@pytest.mark.column
+def test_gather_object_artifacts_lazy_error(schema):
+    """
+    GIVEN schema with invalid lazy
+    WHEN gather_object_artifacts is called with the schema and schemas
+    THEN MalformedRelationshipError or MalformedExtensionPropertyError is raised.
+    """
+    schemas = {"RefSchema": {"type": "object"}}
+
+    with pytest.raises(
+        (
+            exceptions.MalformedRelationshipError,
+            exceptions.MalformedExtensionPropertyError,
+        )
+    ):
+        artifacts.gather(schema=schema, logical_name="", schemas=schemas)
+
+
 @pytest.mark.parametrize(
     "schema, schemas, expected_fk_column",
     [
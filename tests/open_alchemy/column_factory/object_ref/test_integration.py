@@ -23,8 +23,18 @@ from open_alchemy.column_factory import object_ref
                 }
             },
         ),
+        (
+            {"$ref": "#/components/schemas/Schema"},
+            {
+                "Schema": {
+                    "type": "object",
+                    "x-tablename": "table",
+                    "x-lazy": "dynamic",
+                }
+            },
+        ),
     ],
-    ids=["object", "allOf with object", "secondary defined"],
+    ids=["object", "allOf with object", "secondary defined", "dynamic defined"],
 )
 @pytest.mark.column
 def test_handle_object_error(schema, schemas):
@@ -182,22 +192,15 @@ def test_integration_object_ref_backref():
     assert relationship.backref == ("schema", {"uselist": None})
     assert schemas == {
         "RefSchema": {
-            "allOf": [
-                {
-                    "type": "object",
-                    "x-tablename": "ref_schema",
-                    "properties": {"id": {"type": "integer"}},
-                },
-                {
-                    "type": "object",
-                    "x-backrefs": {
-                        "schema": {
-                            "type": "array",
-                            "items": {"type": "object", "x-de-$ref": model_name},
-                        }
-                    },
-                },
-            ]
+            "type": "object",
+            "x-tablename": "ref_schema",
+            "properties": {"id": {"type": "integer"}},
+        }
+    }
+    assert facades.models.pop_backrefs(name="RefSchema") == {
+        "schema": {
+            "type": "array",
+            "items": {"type": "object", "x-de-$ref": model_name},
         }
     }
 
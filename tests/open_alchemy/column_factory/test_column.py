@@ -1,4 +1,5 @@
 """Tests for the column factory."""
+
 # pylint: disable=protected-access
 
 import copy
@@ -65,6 +66,26 @@ ColArt = types.ColumnArtifacts
             exceptions.MalformedExtensionPropertyError,
             id="json not boolean",
         ),
+        pytest.param(
+            {"type": "type 1", "x-deferred": 1},
+            exceptions.MalformedExtensionPropertyError,
+            id="deferred not boolean or string",
+        ),
+        pytest.param(
+            {"type": "type 1", "x-server-default": 1},
+            exceptions.MalformedExtensionPropertyError,
+            id="server default not string",
+        ),
+        pytest.param(
+            {"type": "type 1", "x-computed": {"persisted": True}},
+            exceptions.MalformedExtensionPropertyError,
+            id="computed no expression",
+        ),
+        pytest.param(
+            {"type": "type 1", "x-computed": "a + b", "readOnly": False},
+            exceptions.MalformedSchemaError,
+            id="computed not readOnly",
+        ),
         pytest.param(
             {"type": "type 1", "x-foreign-key": True},
             exceptions.MalformedExtensionPropertyError,
@@ -183,6 +204,11 @@ def test_check_schema_invalid(schema, expected_exception):
             ColArt(open_api=OAColArt(type="type 1"), extension=ExtColArt(index=True)),
             id="index",
         ),
+        pytest.param(
+            {"type": "type 1", "x-index": {"using": "gin"}},
+            ColArt(open_api=OAColArt(type="type 1")),
+            id="index object",
+        ),
         pytest.param(
             {"type": "type 1", "x-unique": True},
             ColArt(open_api=OAColArt(type="type 1"), extension=ExtColArt(unique=True)),
@@ -193,6 +219,50 @@ def test_check_schema_invalid(schema, expected_exception):
             ColArt(open_api=OAColArt(type="type 1"), extension=ExtColArt(json=True)),
             id="json",
         ),
+        pytest.param(
+            {"type": "type 1", "x-deferred": True},
+            ColArt(
+                open_api=OAColArt(type="type 1"), extension=ExtColArt(deferred=True)
+            ),
+            id="deferred",
+        ),
+        pytest.param(
+            {"type": "type 1", "x-deferred": "group 1"},
+            ColArt(
+                open_api=OAColArt(type="type 1"),
+                extension=ExtColArt(deferred="group 1"),
+            ),
+            id="deferred group",
+        ),
+        pytest.param(
+            {"type": "string", "x-server-default": "'draft'"},
+            ColArt(
+                open_api=OAColArt(type="string", nullable=False),
+                extension=ExtColArt(server_default="'draft'"),
+            ),
+            id="server default",
+        ),
+        pytest.param(
+            {"type": "integer", "x-computed": "a + b"},
+            ColArt(
+                open_api=OAColArt(type="integer", read_only=True),
+                extension=ExtColArt(computed={"expression": "a + b"}),
+            ),
+            id="computed",
+        ),
+        pytest.param(
+            {
+                "type": "integer",
+                "x-computed": {"expression": "a + b", "persisted": True},
+            },
+            ColArt(
+                open_api=OAColArt(type="integer", read_only=True),
+                extension=ExtColArt(
+                    computed={"expression": "a + b", "persisted": True}
+                ),
+            ),
+            id="computed persisted",
+        ),
         pytest.param(
             {"type": "type 1", "x-foreign-key": "table.column"},
             ColArt(
@@ -214,6 +284,14 @@ def test_check_schema_invalid(schema, expected_exception):
             ),
             id="kwargs",
         ),
+        pytest.param(
+            {"type": "string", "x-kwargs": {"server_default": "value 1"}},
+            ColArt(
+                open_api=OAColArt(type="string"),
+                extension=ExtColArt(kwargs={"server_default": "value 1"}),
+            ),
+            id="kwargs server_default",
+        ),
         pytest.param(
             {
                 "type": "string",
@@ -311,6 +389,26 @@ def test_check_schema_required():
             {"type": "type 1", "x-json": True},
             id="type with x-json",
         ),
+        pytest.param(
+            ColArt(
+                open_api=OAColArt(type="type 1"),
+                extension=ExtColArt(deferred="group 1"),
+            ),
+            None,
+            None,
+            {"type": "type 1", "x-deferred": "group 1"},
+            id="type with x-deferred",
+        ),
+        pytest.param(
+            ColArt(
+                open_api=OAColArt(type="type 1"),
+                extension=ExtColArt(server_default="'draft'"),
+            ),
+            None,
+            None,
+            {"type": "type 1", "x-generated": True},
+            id="type with x-server-default",
+        ),
         pytest.param(
             ColArt(open_api=OAColArt(type="type 1", default="value 1")),
             None,
@@ -493,6 +591,78 @@ class TestCheckArtifacts:
         with pytest.raises(exceptions.FeatureNotImplementedError):
             column._check_artifacts(artifacts=artifacts)
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "open_api, extension",
+        [
+            pytest.param(
+                OAColArt(type="integer", default=1),
+                ExtColArt(computed={"expression": "a + b"}),
+                id="default",
+            ),
+            pytest.param(
+                OAColArt(type="integer"),
+                ExtColArt(computed={"expression": "a + b"}, server_default="1"),
+                id="server default",
+            ),
+            pytest.param(
+                OAColArt(type="integer"),
+                ExtColArt(computed={"expression": "a + b"}, autoincrement=True),
+                id="autoincrement",
+            ),
+            pytest.param(
+                OAColArt(type="integer"),
+                ExtColArt(computed={"expression": "a + b"}, primary_key=True),
+                id="primary key",
+            ),
+        ],
+    )
+    @pytest.mark.column
+    def test_invalid_computed(open_api, extension):
+        """
+        GIVEN computed column with another way of generating the value
+        WHEN _check_artifacts is called
+        THEN MalformedSchemaError is raised.
+        """
+        artifacts = ColArt(open_api=open_api, extension=extension)
+
+        with pytest.raises(exceptions.MalformedSchemaError):
+            column._check_artifacts(artifacts=artifacts)
+
+    @staticmethod
+    @pytest.mark.column
+    def test_invalid_server_default_kwargs():
+        """
+        GIVEN column with a server default and server_default in kwargs
+        WHEN _check_artifacts is called
+        THEN MalformedSchemaError is raised.
+        """
+        artifacts = ColArt(
+            open_api=OAColArt(type="string"),
+            extension=ExtColArt(
+                server_default="'draft'", kwargs={"server_default": "'active'"}
+            ),
+        )
+
+        with pytest.raises(exceptions.MalformedSchemaError):
+            column._check_artifacts(artifacts=artifacts)
+
+    @staticmethod
+    @pytest.mark.column
+    def test_invalid_deferred_primary_key():
+        """
+        GIVEN primary key column that is deferred
+        WHEN _check_artifacts is called
+        THEN MalformedSchemaError is raised.
+        """
+        artifacts = ColArt(
+            open_api=OAColArt(type="integer"),
+            extension=ExtColArt(primary_key=True, deferred=True),
+        )
+
+        with pytest.raises(exceptions.MalformedSchemaError):
+            column._check_artifacts(artifacts=artifacts)
+
     @staticmethod
     @pytest.mark.parametrize(
         "type_, format_, max_length, autoincrement",
@@ -106,6 +106,44 @@ def test_integration_kwargs():
     assert column.doc == "doc 1"
 
 
+@pytest.mark.parametrize(
+    "schema, expected_group",
+    [
+        pytest.param(
+            {"type": "string", "format": "binary", "x-deferred": True},
+            None,
+            id="boolean",
+        ),
+        pytest.param(
+            {"type": "object", "x-json": True, "x-deferred": "documents"},
+            "documents",
+            id="JSON group",
+        ),
+    ],
+)
+@pytest.mark.column
+def test_integration_deferred(schema, expected_group):
+    """
+    GIVEN schema with x-deferred
+    WHEN column_factory is called with the schema
+    THEN a deferred column property with the expected group is returned.
+    """
+    schemas = {}
+    ([(logical_name, value)], returned_schema) = column_factory.column_factory(
+        schema=schema,
+        schemas=schemas,
+        logical_name="column_1",
+        model_schema={},
+        model_name="schema",
+    )
+
+    assert logical_name == "column_1"
+    assert isinstance(value, facades.sqlalchemy.column.ColumnProperty)
+    assert value.deferred is True
+    assert value.group == expected_group
+    assert returned_schema["x-deferred"] == schema["x-deferred"]
+
+
 @pytest.mark.column
 def test_integration_all_of():
     """
@@ -0,0 +1,98 @@
+"""Tests for the bulk statements of the SQLAlchemy facade."""
+
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from open_alchemy import exceptions
+from open_alchemy import facades
+
+
+def _table():
+    """Construct a table with a primary key and unique constraints."""
+    metadata = sqlalchemy.MetaData()
+    return sqlalchemy.Table(
+        "table",
+        metadata,
+        sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+        sqlalchemy.Column("name", sqlalchemy.String, unique=True),
+        sqlalchemy.Column("first", sqlalchemy.String),
+        sqlalchemy.Column("last", sqlalchemy.String),
+        sqlalchemy.Column("division", sqlalchemy.String),
+        sqlalchemy.UniqueConstraint("first", "last"),
+        sqlalchemy.Index("ix_division_last", "division", "last", unique=True),
+    )
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_conflict_targets():
+    """
+    GIVEN table with primary key, unique column, constraint and index
+    WHEN conflict_targets is called with the table
+    THEN all the unique sets of columns are returned.
+    """
+    targets = facades.sqlalchemy.bulk.conflict_targets(table=_table())
+
+    assert set(targets) == {
+        ("id",),
+        ("name",),
+        ("first", "last"),
+        ("division", "last"),
+    }
+
+
+@pytest.mark.parametrize(
+    "dialect, update, expected_suffix",
+    [
+        pytest.param(
+            postgresql.dialect(),
+            ["name", "first"],
+            "ON CONFLICT (id) DO UPDATE SET name = excluded.name, "
+            "first = excluded.first",
+            id="postgresql update",
+        ),
+        pytest.param(
+            postgresql.dialect(), [], "ON CONFLICT (id) DO NOTHING", id="postgresql"
+        ),
+        pytest.param(
+            sqlite.dialect(),
+            ["name", "first"],
+            "ON CONFLICT (id) DO UPDATE SET name = excluded.name, "
+            "first = excluded.first",
+            id="sqlite update",
+        ),
+        pytest.param(sqlite.dialect(), [], "ON CONFLICT (id) DO NOTHING", id="sqlite"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_upsert(dialect, update, expected_suffix):
+    """
+    GIVEN dialect and columns to update
+    WHEN upsert is called and the statement compiled for the dialect
+    THEN the statement ends with the expected ON CONFLICT clause.
+    """
+    statement = facades.sqlalchemy.bulk.upsert(
+        table=_table(), dialect=dialect.name, index_elements=["id"], update=update
+    )
+
+    compiled = str(statement.compile(dialect=dialect))
+
+    assert compiled.startswith('INSERT INTO "table"')
+    assert compiled.endswith(expected_suffix)
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_upsert_dialect_not_supported():
+    """
+    GIVEN dialect that does not support ON CONFLICT
+    WHEN upsert is called
+    THEN FeatureNotImplementedError is raised.
+    """
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        facades.sqlalchemy.bulk.upsert(
+            table=_table(), dialect="mysql", index_elements=["id"], update=[]
+        )
@@ -273,6 +273,95 @@ def test_construct_kwargs():
     assert returned_column.doc == "doc 1"
 
 
+@pytest.mark.facade
+def test_construct_server_default():
+    """
+    GIVEN artifacts with server default
+    WHEN construct is called with the artifacts
+    THEN the column is constructed with the server default SQL expression.
+    """
+    artifacts = ColArt(
+        open_api=OAColArt(type="string"),
+        extension=ExtColArt(server_default="'draft'"),
+    )
+
+    returned_column = column.construct(artifacts=artifacts)
+
+    assert str(returned_column.server_default.arg) == "'draft'"
+    assert column.server_generated(value=returned_column) is True
+
+
+@pytest.mark.parametrize(
+    "computed, expected_persisted",
+    [
+        pytest.param({"expression": "a + b"}, None, id="expression"),
+        pytest.param({"expression": "a + b", "persisted": True}, True, id="persisted"),
+    ],
+)
+@pytest.mark.facade
+def test_construct_computed(computed, expected_persisted):
+    """
+    GIVEN artifacts with computed
+    WHEN construct is called with the artifacts
+    THEN the column is constructed as a computed column.
+    """
+    artifacts = ColArt(
+        open_api=OAColArt(type="integer"), extension=ExtColArt(computed=computed)
+    )
+
+    returned_column = column.construct(artifacts=artifacts)
+
+    assert str(returned_column.computed.sqltext) == "a + b"
+    assert returned_column.computed.persisted == expected_persisted
+    assert column.server_generated(value=returned_column) is True
+
+
+@pytest.mark.facade
+def test_construct_computed_not_supported(monkeypatch):
+    """
+    GIVEN artifacts with computed and SQLAlchemy without computed columns
+    WHEN construct is called with the artifacts
+    THEN FeatureNotImplementedError is raised.
+    """
+    monkeypatch.delattr(sqlalchemy, "Computed")
+    artifacts = ColArt(
+        open_api=OAColArt(type="integer"),
+        extension=ExtColArt(computed={"expression": "a + b"}),
+    )
+
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        column.construct(artifacts=artifacts)
+
+
+@pytest.mark.parametrize(
+    "value, expected_generated",
+    [
+        pytest.param(sqlalchemy.Column(sqlalchemy.Integer), False, id="column"),
+        pytest.param(
+            sqlalchemy.Column(sqlalchemy.Integer, server_default="1"),
+            True,
+            id="column server default",
+        ),
+        pytest.param(
+            sqlalchemy.orm.deferred(
+                sqlalchemy.Column(sqlalchemy.Integer, server_default="1")
+            ),
+            True,
+            id="deferred server default",
+        ),
+        pytest.param(sqlalchemy.orm.relationship("Model"), False, id="relationship"),
+    ],
+)
+@pytest.mark.facade
+def test_server_generated(value, expected_generated):
+    """
+    GIVEN column, column property or relationship
+    WHEN server_generated is called with the value
+    THEN whether the value is generated by the database is returned.
+    """
+    assert column.server_generated(value=value) == expected_generated
+
+
 class TestDetermineType:
     """Tests for _determine_type."""
 
@@ -0,0 +1,92 @@
+"""Tests for the index support of the SQLAlchemy facade."""
+
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from open_alchemy import facades
+
+
+@pytest.mark.parametrize(
+    "index_kwargs, expected_sql",
+    [
+        ({}, 'CREATE INDEX ix_1 ON "table" (name)'),
+        (
+            {"postgresql_include": ["id"]},
+            'CREATE INDEX ix_1 ON "table" (name) INCLUDE (id)',
+        ),
+        (
+            {
+                "postgresql_include": ["id", "order"],
+                "postgresql_using": "btree",
+                "postgresql_with": {"fillfactor": 50},
+                "postgresql_where": sqlalchemy.text("id > 0"),
+            },
+            'CREATE INDEX ix_1 ON "table" USING btree (lower(name)) '
+            'INCLUDE (id, "order") WITH (fillfactor = 50) WHERE id > 0',
+        ),
+    ],
+    ids=["no include", "include", "include with other options"],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_include(index_kwargs, expected_sql):
+    """
+    GIVEN index with postgresql_include and other options
+    WHEN the CREATE INDEX statement is compiled for PostgreSQL
+    THEN the INCLUDE clause follows the column list.
+    """
+    facades.sqlalchemy.index.register_include()
+    expression = (
+        sqlalchemy.text("lower(name)") if "postgresql_using" in index_kwargs else "name"
+    )
+    index = sqlalchemy.Index("ix_1", expression, **index_kwargs)
+    sqlalchemy.Table(
+        "table",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("id", sqlalchemy.Integer),
+        sqlalchemy.Column("name", sqlalchemy.String),
+        sqlalchemy.Column("order", sqlalchemy.Integer),
+        index,
+    )
+
+    sql = str(
+        sqlalchemy.schema.CreateIndex(index).compile(dialect=postgresql.dialect())
+    )
+
+    assert sql == expected_sql
+
+
+@pytest.mark.parametrize(
+    "index_kwargs, expected_sql",
+    [
+        ({}, "CREATE INDEX ix_1 ON table (name) custom"),
+        (
+            {"postgresql_include": ["id"]},
+            "CREATE INDEX ix_1 ON table (name) INCLUDE (id) custom",
+        ),
+    ],
+    ids=["no include", "include"],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_compile_create_index_previous(mocker, index_kwargs, expected_sql):
+    """
+    GIVEN index with and without postgresql_include and a previously registered
+        compilation function
+    WHEN the CREATE INDEX statement is compiled by the INCLUDE override
+    THEN the statement of the previous function is used with INCLUDE added only for
+        the index with include.
+    """
+    index = sqlalchemy.Index("ix_1", "name", **index_kwargs)
+    create = sqlalchemy.schema.CreateIndex(index)
+    compiler = mocker.MagicMock()
+    compiler.preparer = postgresql.dialect().identifier_preparer
+    previous = mocker.MagicMock(return_value="CREATE INDEX ix_1 ON table (name) custom")
+
+    # pylint: disable=protected-access
+    sql = facades.sqlalchemy.index._compile_create_index(previous, create, compiler)
+
+    assert sql == expected_sql
+    previous.assert_called_once_with(create, compiler)
+    compiler.visit_create_index.assert_not_called()
@@ -10,7 +10,9 @@ from open_alchemy import types
 
 
 @pytest.mark.parametrize(
-    "name, expected_value", [("Table", sqlalchemy.Table)], ids=["Table"]
+    "name, expected_value",
+    [("Table", sqlalchemy.Table), ("Index", sqlalchemy.Index)],
+    ids=["Table", "Index"],
 )
 @pytest.mark.facade
 def test_mapping(name, expected_value):
@@ -92,6 +94,80 @@ def test_construct_relationship_kwargs():
     assert relationship.order_by == "id"
 
 
+@pytest.mark.parametrize(
+    "artifacts, expected_lazy, expected_backref_lazy",
+    [
+        pytest.param(
+            types.RelationshipArtifacts("RefModel", lazy="selectin"),
+            "selectin",
+            None,
+            id="lazy",
+        ),
+        pytest.param(
+            types.RelationshipArtifacts("RefModel", kwargs={"lazy": "joined"}),
+            "joined",
+            None,
+            id="lazy kwargs",
+        ),
+        pytest.param(
+            types.RelationshipArtifacts(
+                "RefModel",
+                back_reference=types.BackReferenceArtifacts(
+                    "BackRefModel", lazy="raise"
+                ),
+            ),
+            "select",
+            "raise",
+            id="backref lazy",
+        ),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_construct_relationship_lazy(artifacts, expected_lazy, expected_backref_lazy):
+    """
+    GIVEN given relationship artifacts with lazy
+    WHEN construct_relationship is called with the artifacts
+    THEN a relationship with the expected lazy and backref lazy is returned.
+    """
+    relationship = facades.sqlalchemy.relationship(artifacts=artifacts)
+
+    assert relationship.lazy == expected_lazy
+    if expected_backref_lazy is not None:
+        assert relationship.backref[1]["lazy"] == expected_backref_lazy
+
+
+@pytest.mark.parametrize(
+    "lazy, expected_lazy",
+    [
+        pytest.param(None, "raise_on_sql", id="default"),
+        pytest.param("select", "raise_on_sql", id="select"),
+        pytest.param("selectin", "selectin", id="selectin"),
+        pytest.param("dynamic", "dynamic", id="dynamic"),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+@pytest.mark.usefixtures("_raise_mode")
+def test_construct_relationship_raise_mode(lazy, expected_lazy):
+    """
+    GIVEN raise mode and relationship artifacts with lazy and a back reference
+    WHEN construct_relationship is called with the artifacts
+    THEN implicit lazy loads of the relationship and back reference are changed to
+        raise.
+    """
+    artifacts = types.RelationshipArtifacts(
+        "RefModel",
+        back_reference=types.BackReferenceArtifacts("BackRefModel"),
+        lazy=lazy,
+    )
+
+    relationship = facades.sqlalchemy.relationship(artifacts=artifacts)
+
+    assert relationship.lazy == expected_lazy
+    assert relationship.backref[1]["lazy"] == "raise_on_sql"
+
+
 @pytest.mark.facade
 def test_construct():
     """
@@ -116,3 +192,75 @@ def test_construct():
     assert len(returned_table.columns) == 2
     assert isinstance(returned_table.columns["column_1"].type, sqlalchemy.Integer)
     assert isinstance(returned_table.columns["column_2"].type, sqlalchemy.String)
+
+
+@pytest.mark.parametrize(
+    "column_kwargs, extra_args, expected_names",
+    [
+        ({}, (), ["ref_id"]),
+        ({"index": True}, (), []),
+        ({"index": False}, (), []),
+        ({"unique": True}, (), []),
+        ({"primary_key": True}, (), ["ref_id"]),
+        ({}, (sqlalchemy.Index("ix_ref_other", "ref_id", "other"),), []),
+        ({}, (sqlalchemy.Index("ix_other_ref", "other", "ref_id"),), ["ref_id"]),
+        ({}, (sqlalchemy.UniqueConstraint("ref_id", "other"),), []),
+        ({}, (sqlalchemy.UniqueConstraint("other", "ref_id"),), ["ref_id"]),
+    ],
+    ids=[
+        "no index",
+        "index",
+        "index disabled",
+        "unique",
+        "primary key not leading",
+        "composite index leading",
+        "composite index not leading",
+        "composite unique leading",
+        "composite unique not leading",
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_unindexed_foreign_keys(column_kwargs, extra_args, expected_names):
+    """
+    GIVEN table with a foreign key column and indexes and constraints
+    WHEN unindexed_foreign_keys is called with the table
+    THEN the foreign key columns that do not lead an index or constraint are returned.
+    """
+    table = sqlalchemy.Table(
+        "table",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+        sqlalchemy.Column(
+            "ref_id",
+            sqlalchemy.Integer,
+            sqlalchemy.ForeignKey("ref.id"),
+            **column_kwargs,
+        ),
+        sqlalchemy.Column("other", sqlalchemy.Integer),
+        *extra_args,
+    )
+
+    columns = facades.sqlalchemy.unindexed_foreign_keys(table=table)
+
+    assert [column.name for column in columns] == expected_names
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_add_index():
+    """
+    GIVEN table with a column
+    WHEN add_index is called with the column
+    THEN an index named using the naming convention is added to the table.
+    """
+    table = sqlalchemy.Table(
+        "table",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("ref_id", sqlalchemy.Integer),
+    )
+
+    index = facades.sqlalchemy.add_index(column_=table.columns["ref_id"])
+
+    assert index.name == "ix_table_ref_id"
+    assert table.indexes == {index}
@@ -0,0 +1,47 @@
+"""Tests for rebuilding models in the SQLAlchemy facade."""
+
+from unittest import mock
+
+import pytest
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+from open_alchemy import facades
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_dispose():
+    """
+    GIVEN declarative base with a model
+    WHEN dispose is called with the base
+    THEN the mapper of the model is no longer configured.
+    """
+    base = declarative.declarative_base()
+
+    class Model(base):  # pylint: disable=too-few-public-methods,unused-variable
+        """Model to dispose."""
+
+        __tablename__ = "model"
+        id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+
+    facades.sqlalchemy.rebuild.dispose(base=base)
+
+    assert not sqlalchemy.inspect(Model, raiseerr=False)
+    orm.configure_mappers()
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_dispose_registry():
+    """
+    GIVEN declarative base with a registry
+    WHEN dispose is called with the base
+    THEN the registry is disposed.
+    """
+    base = mock.MagicMock()
+
+    facades.sqlalchemy.rebuild.dispose(base=base)
+
+    base.registry.dispose.assert_called_once_with()
@@ -77,3 +77,23 @@ def test_resolver_multiple(tmp_path):
     jsonschema.validate(instance, schema, resolver=resolver)
     assert schema1_dict == {"RefSchema1": {"type": "string"}}
     assert schema2_dict == {"RefSchema2": {"type": "integer"}}
+
+
+@pytest.mark.parametrize(
+    "instance, raises",
+    [pytest.param(1, False, id="valid"), pytest.param("1", True, id="invalid")],
+)
+@pytest.mark.facade
+def test_validator(instance, raises):
+    """
+    GIVEN schema and instance
+    WHEN validator is called with the schema and used to validate the instance
+    THEN ValidationError is raised if the instance is not valid.
+    """
+    validator = facades.jsonschema.validator(schema={"type": "integer"})
+
+    if raises:
+        with pytest.raises(facades.jsonschema.ValidationError):
+            validator.validate(instance)
+    else:
+        validator.validate(instance)
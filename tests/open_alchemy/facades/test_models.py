@@ -1,10 +1,12 @@
 """Tests for models facade."""
 
+import copy
 from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import helpers
 from open_alchemy.facades import models
 
 
@@ -177,17 +179,21 @@ class TestAddBackrefToModel:
         """
         GIVEN given schema and backref to add
         WHEN _add_backref_to_model is called with the schema and backref to add
-        THEN the backref is added to the schema.
+        THEN a frozen schema with the backref is returned and the schema is not
+            modified.
         """
         # pylint: disable=protected-access
         backref = {"type": "object", "x-de-$ref": "RefSchema"}
         property_name = "ref_schema"
+        original_schema = copy.deepcopy(schema)
 
-        models._add_backref_to_model(
+        returned_schema = models._add_backref_to_model(
             schema=schema, backref=backref, property_name=property_name
         )
 
-        assert schema == expected_schema
+        assert returned_schema == expected_schema
+        assert isinstance(returned_schema, helpers.frozen.FrozenDict)
+        assert schema == original_schema
 
     @staticmethod
     @pytest.mark.facade
@@ -237,27 +243,50 @@ class TestAddBackrefToSchemas:
         """
         GIVEN given given name, schemas and backref
         WHEN _add_backref_to_schemas is called with the name, schemas and backref
-        THEN the backref is added to the schemas.
+        THEN the backref is recorded and the schemas are not modified.
         """
         backref = {"type": "object", "x-de-$ref": "Schema"}
         name = "RefSchema"
 
+        expected_schemas = copy.deepcopy(schemas)
+
         models._add_backref_to_schemas(
             name=name, schemas=schemas, backref=backref, property_name="ref_schema"
         )
 
-        assert schemas == {
-            "RefSchema": {
-                "allOf": [
-                    {"type": "object", "properties": {}},
-                    {
-                        "type": "object",
-                        "x-backrefs": {
-                            "ref_schema": {"type": "object", "x-de-$ref": "Schema"}
-                        },
-                    },
-                ]
-            }
+        assert schemas == expected_schemas
+        assert models.pop_backrefs(name=name) == {
+            "ref_schema": {"type": "object", "x-de-$ref": "Schema"}
+        }
+        assert models.pop_backrefs(name=name) == {}
+
+    @staticmethod
+    @pytest.mark.facade
+    def test_multiple():
+        """
+        GIVEN schemas
+        WHEN _add_backref_to_schemas is called multiple times for the same name
+        THEN all the backrefs are recorded without modifying the schemas.
+        """
+        schemas = {"RefSchema": {"type": "object", "properties": {}}}
+
+        models._add_backref_to_schemas(
+            name="RefSchema",
+            schemas=schemas,
+            backref={"type": "object", "x-de-$ref": "Schema1"},
+            property_name="ref_schema1",
+        )
+        models._add_backref_to_schemas(
+            name="RefSchema",
+            schemas=schemas,
+            backref={"type": "object", "x-de-$ref": "Schema2"},
+            property_name="ref_schema2",
+        )
+
+        assert schemas == {"RefSchema": {"type": "object", "properties": {}}}
+        assert models.pop_backrefs(name="RefSchema") == {
+            "ref_schema1": {"type": "object", "x-de-$ref": "Schema1"},
+            "ref_schema2": {"type": "object", "x-de-$ref": "Schema2"},
         }
 
 
@@ -286,7 +315,7 @@ def test_add_backref_model_not_defined(mocked_models):
     """
     GIVEN mocked models with model not defined and backref schema
     WHEN add_backref is called
-    THEN the backref schema is added to the model.
+    THEN the backref schema is recorded for the model and the schemas are not modified.
     """
     del mocked_models.RefModel
     schemas = {"RefModel": {"type": "object", "properties": {}}}
@@ -296,14 +325,7 @@ def test_add_backref_model_not_defined(mocked_models):
         name="RefModel", schemas=schemas, backref=backref, property_name="model"
     )
 
-    assert schemas == {
-        "RefModel": {
-            "allOf": [
-                {"type": "object", "properties": {}},
-                {
-                    "type": "object",
-                    "x-backrefs": {"model": {"type": "object", "x-de-$ref": "Model"}},
-                },
-            ]
-        }
+    assert schemas == {"RefModel": {"type": "object", "properties": {}}}
+    assert models.pop_backrefs(name="RefModel") == {
+        "model": {"type": "object", "x-de-$ref": "Model"}
     }
@@ -0,0 +1,130 @@
+"""Tests for frozen schemas."""
+
+import copy
+import pickle
+
+import pytest
+
+from open_alchemy.helpers import frozen
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(None, id="None"),
+        pytest.param(1, id="scalar"),
+        pytest.param({}, id="empty dict"),
+        pytest.param([], id="empty list"),
+        pytest.param({"key": [1, {"type": "integer"}]}, id="nested"),
+    ],
+)
+@pytest.mark.helper
+def test_freeze(value):
+    """
+    GIVEN value
+    WHEN freeze is called with the value
+    THEN a value equal to the value is returned that can be pickled and deep copied.
+    """
+    returned_value = frozen.freeze(value)
+
+    assert returned_value == value
+    assert pickle.loads(pickle.dumps(returned_value)) == value
+    assert copy.deepcopy(returned_value) == value
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        pytest.param(lambda value: value.__setitem__("key", 1), id="dict set"),
+        pytest.param(lambda value: value.__delitem__("list"), id="dict delete"),
+        pytest.param(lambda value: value.update({"key": 1}), id="dict update"),
+        pytest.param(lambda value: value.pop("list"), id="dict pop"),
+        pytest.param(lambda value: value.setdefault("key", 1), id="dict setdefault"),
+        pytest.param(lambda value: value["list"].append(1), id="list append"),
+        pytest.param(lambda value: value["list"].__setitem__(0, 2), id="list set"),
+        pytest.param(lambda value: value["list"].extend([1]), id="list extend"),
+        pytest.param(lambda value: value["list"].sort(), id="list sort"),
+    ],
+)
+@pytest.mark.helper
+def test_freeze_immutable(modify):
+    """
+    GIVEN frozen dictionary with a list
+    WHEN it is modified
+    THEN TypeError is raised.
+    """
+    value = frozen.freeze({"list": [1]})
+
+    with pytest.raises(TypeError):
+        modify(value)
+
+
+@pytest.mark.helper
+def test_freeze_deepcopy_mutable():
+    """
+    GIVEN frozen dictionary with a list
+    WHEN it is deep copied and the copy is modified
+    THEN the frozen dictionary is not modified.
+    """
+    value = frozen.freeze({"list": [1], "dict": {"key": 1}})
+
+    copied_value = copy.deepcopy(value)
+    copied_value["list"].append(2)
+    copied_value["dict"]["key"] = 2
+
+    assert value == {"list": [1], "dict": {"key": 1}}
+
+
+@pytest.mark.helper
+def test_freeze_shared():
+    """
+    GIVEN values with identical fragments
+    WHEN freeze is called with the values
+    THEN the identical fragments are the same object.
+    """
+    value_1 = frozen.freeze({"id": {"type": "integer"}, "required": ["id"]})
+    value_2 = frozen.freeze({"key": {"type": "integer"}, "required": ["id"]})
+
+    assert value_1["id"] is value_2["key"]
+    assert value_1["required"] is value_2["required"]
+
+
+@pytest.mark.parametrize(
+    "value_1, value_2",
+    [
+        pytest.param({"key": 1}, {"key": True}, id="int and bool"),
+        pytest.param({"key": 1}, {"key": 1.0}, id="int and float"),
+        pytest.param({"a": 1, "b": 2}, {"b": 2, "a": 1}, id="key order"),
+        pytest.param([1, 2], [2, 1], id="list order"),
+    ],
+)
+@pytest.mark.helper
+def test_freeze_not_shared(value_1, value_2):
+    """
+    GIVEN values that only differ in the type or order of their contents
+    WHEN freeze is called with the values
+    THEN the frozen values are not the same object and keep their type and order.
+    """
+    returned_value_1 = frozen.freeze(value_1)
+    returned_value_2 = frozen.freeze(value_2)
+
+    assert returned_value_1 is not returned_value_2
+    assert repr(returned_value_1) == repr(value_1)
+    assert repr(returned_value_2) == repr(value_2)
+
+
+@pytest.mark.helper
+def test_freeze_unhashable():
+    """
+    GIVEN value with a value that is not hashable
+    WHEN freeze is called with the value twice
+    THEN the value is frozen but not shared.
+    """
+    value = {"key": {"values": {1, 2}}}
+
+    returned_value_1 = frozen.freeze(value)
+    returned_value_2 = frozen.freeze(value)
+
+    assert returned_value_1 == value
+    assert isinstance(returned_value_1, frozen.FrozenDict)
+    assert returned_value_1 is not returned_value_2
@@ -339,6 +339,36 @@ def test_json(schema, expected_json):
     assert returned_json == expected_json
 
 
+@pytest.mark.helper
+def test_deferred_wrong_type():
+    """
+    GIVEN schema with x-deferred defined as an integer
+    WHEN deferred is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    schema = {"x-deferred": 1}
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        helpers.peek.deferred(schema=schema, schemas={})
+
+
+@pytest.mark.parametrize(
+    "schema, expected_deferred",
+    [({}, None), ({"x-deferred": True}, True), ({"x-deferred": "group 1"}, "group 1")],
+    ids=["missing", "boolean", "group"],
+)
+@pytest.mark.helper
+def test_deferred(schema, expected_deferred):
+    """
+    GIVEN schema and expected deferred
+    WHEN deferred is called with the schema
+    THEN the expected deferred is returned.
+    """
+    returned_deferred = helpers.peek.deferred(schema=schema, schemas={})
+
+    assert returned_deferred == expected_deferred
+
+
 @pytest.mark.parametrize(
     "schema",
     [
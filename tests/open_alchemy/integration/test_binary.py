@@ -0,0 +1,140 @@
+"""Integration tests for to_bytes and from_bytes."""
+
+import datetime
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+def _spec(division_properties):
+    """Construct a specification with an employee and division schema."""
+    return {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "joined": {"type": "string", "format": "date"},
+                        "updated": {"type": "string", "format": "date-time"},
+                        "data": {"type": "object", "x-json": True},
+                        "division": {"$ref": "#/components/schemas/Division"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Division": {
+                    "properties": division_properties,
+                    "x-tablename": "division",
+                    "x-backref": "employees",
+                    "type": "object",
+                },
+            }
+        }
+    }
+
+
+def _init(division_properties):
+    """Construct the models."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base, spec=_spec(division_properties)
+    )
+    return model_factory(name="Employee"), model_factory(name="Division")
+
+
+DIVISION_PROPERTIES = {
+    "id": {"type": "integer", "x-primary-key": True},
+    "name": {"type": "string"},
+}
+
+
+@pytest.mark.integration
+def test_to_from_bytes(engine, sessionmaker):
+    """
+    GIVEN model with a relationship
+    WHEN an instance is stored, queried, converted to bytes and back
+    THEN the instance has the same dictionary and the payload is smaller than JSON.
+    """
+    employee_model, division_model = _init(DIVISION_PROPERTIES)
+    employee_model.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(
+        employee_model(
+            id=1,
+            name="name 1",
+            joined=datetime.date(2000, 1, 1),
+            updated=datetime.datetime(2000, 1, 1, 1, 1, 1),
+            data={"key": [1, 2]},
+            division=division_model(id=2, name="division 2"),
+        )
+    )
+    session.flush()
+    instance = session.query(employee_model).first()
+
+    value = instance.to_bytes()
+    returned_instance = employee_model.from_bytes(value)
+
+    assert returned_instance.to_dict() == instance.to_dict()
+    assert len(value) < len(instance.to_str())
+
+
+@pytest.mark.integration
+def test_to_from_bytes_read_only():
+    """
+    GIVEN model with a readOnly primary key
+    WHEN an instance is converted to bytes and back
+    THEN the primary key is kept.
+    """
+    _, division_model = _init(
+        {
+            "id": {"type": "integer", "x-primary-key": True, "readOnly": True},
+            "name": {"type": "string"},
+        }
+    )
+    instance = division_model(id=5, name="division 5")
+
+    returned_instance = division_model.from_bytes(instance.to_bytes())
+
+    assert returned_instance.id == 5
+    assert returned_instance.to_dict() == instance.to_dict()
+
+
+@pytest.mark.integration
+def test_to_from_bytes_list():
+    """
+    GIVEN instances of a model
+    WHEN to_bytes_list is called and the output is passed to from_bytes_list
+    THEN instances with the same dictionaries are returned.
+    """
+    employee_model, _ = _init(DIVISION_PROPERTIES)
+    instances = [employee_model(id=1, name="name 1"), employee_model(id=2)]
+
+    returned_instances = employee_model.from_bytes_list(
+        employee_model.to_bytes_list(instances)
+    )
+
+    assert [instance.to_dict() for instance in returned_instances] == [
+        {"id": 1, "name": "name 1"},
+        {"id": 2},
+    ]
+
+
+@pytest.mark.integration
+def test_from_bytes_schema_changed():
+    """
+    GIVEN payload encoded for a model
+    WHEN the schema of a referenced model changes and from_bytes is called
+    THEN MalformedBinaryError is raised.
+    """
+    employee_model, _ = _init(DIVISION_PROPERTIES)
+    value = employee_model(id=1).to_bytes()
+    changed_employee_model, _ = _init(
+        {**DIVISION_PROPERTIES, "budget": {"type": "number"}}
+    )
+
+    with pytest.raises(exceptions.MalformedBinaryError):
+        changed_employee_model.from_bytes(value)
@@ -0,0 +1,275 @@
+"""Integration tests against database for the asyncio functions."""
+
+import asyncio
+
+import pytest
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+class _AsyncSession:
+    """Stand in for an asyncio session that wraps a synchronous session."""
+
+    def __init__(self, sync_session):
+        """Construct."""
+        self.sync_session = sync_session
+        self.flush_count = 0
+
+    async def run_sync(self, function, *args, **kwargs):
+        """Call the function with the synchronous session."""
+        return function(self.sync_session, *args, **kwargs)
+
+    def add_all(self, instances):
+        """Add the instances to the synchronous session."""
+        self.sync_session.add_all(instances)
+
+    async def flush(self):
+        """Flush the synchronous session."""
+        self.flush_count += 1
+        self.sync_session.flush()
+
+
+def _run(coroutine):
+    """Run a coroutine to completion."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _init(engine):
+    """Construct the models and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "employees": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Employee"},
+                        },
+                    },
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "address": {"$ref": "#/components/schemas/Address"},
+                        "manager": {
+                            "type": "object",
+                            "readOnly": True,
+                            "properties": {"id": {"type": "integer"}},
+                        },
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Address": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "city": {"type": "string"},
+                    },
+                    "x-tablename": "address",
+                    "type": "object",
+                },
+                "Manager": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "employees": {
+                            "type": "array",
+                            "items": {
+                                "allOf": [
+                                    {"$ref": "#/components/schemas/Employee"},
+                                    {"x-backref": "manager"},
+                                ]
+                            },
+                        },
+                    },
+                    "x-tablename": "manager",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        spec=spec, base=base, define_all=True
+    )
+    base.metadata.create_all(engine)
+    return model_factory(name="Division"), model_factory(name="Manager")
+
+
+def _add(models, session):
+    """Add divisions with employees that have an address and a manager."""
+    division_model, manager_model = models
+    for division_id in (1, 2):
+        division = division_model.from_dict(
+            id=division_id,
+            name=f"division {division_id}",
+            employees=[
+                {
+                    "id": division_id * 10 + index,
+                    "name": f"employee {index}",
+                    "address": {"id": division_id * 10 + index, "city": "city"},
+                }
+                for index in (1, 2)
+            ],
+        )
+        session.add(division)
+        session.add(manager_model(id=division_id, employees=list(division.employees)))
+    session.commit()
+
+
+def _record_statements(engine):
+    """Record the statements executed by the engine."""
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_: statements.append(statement),
+    )
+    return statements
+
+
+def _expected_division(division_id):
+    """Calculate the dictionary of a division added by _add."""
+    return {
+        "id": division_id,
+        "name": f"division {division_id}",
+        "employees": [
+            {
+                "id": division_id * 10 + index,
+                "name": f"employee {index}",
+                "address": {"id": division_id * 10 + index, "city": "city"},
+                "manager": {"id": division_id},
+            }
+            for index in (1, 2)
+        ],
+    }
+
+
+@pytest.mark.integration
+def test_afetch_dicts(engine, sessionmaker):
+    """
+    GIVEN models with nested relationships and instances in the database
+    WHEN afetch_dicts is called
+    THEN the dictionaries are returned using a query per relationship.
+    """
+    models = _init(engine)
+    division_model = models[0]
+    _add(models, sessionmaker())
+    statements = _record_statements(engine)
+
+    returned_dicts = _run(
+        division_model.afetch_dicts(
+            _AsyncSession(sessionmaker()),
+            orm.Query(division_model).order_by(division_model.id),
+        )
+    )
+
+    assert returned_dicts == [_expected_division(1), _expected_division(2)]
+    assert len(statements) == 4
+
+
+@pytest.mark.integration
+def test_afetch_dicts_default(engine, sessionmaker):
+    """
+    GIVEN models and instances in the database
+    WHEN afetch_dicts is called without a statement
+    THEN the dictionaries of all instances are returned.
+    """
+    models = _init(engine)
+    division_model = models[0]
+    _add(models, sessionmaker())
+
+    returned_dicts = _run(division_model.afetch_dicts(_AsyncSession(sessionmaker())))
+
+    assert sorted(value["id"] for value in returned_dicts) == [1, 2]
+
+
+@pytest.mark.integration
+def test_ato_dict(engine, sessionmaker):
+    """
+    GIVEN models with nested relationships and an instance with unloaded relationships
+    WHEN ato_dict is called
+    THEN the dictionary is returned and the relationships are loaded up front.
+    """
+    models = _init(engine)
+    division_model = models[0]
+    _add(models, sessionmaker())
+    session = sessionmaker()
+    division = session.query(division_model).get(2)
+    statements = _record_statements(engine)
+
+    returned_dict = _run(division.ato_dict(_AsyncSession(session)))
+
+    assert returned_dict == _expected_division(2)
+    assert len(statements) == 4
+
+
+@pytest.mark.integration
+def test_ato_dict_pending(engine, sessionmaker):
+    """
+    GIVEN models and an instance that has not been flushed
+    WHEN ato_dict is called
+    THEN the dictionary is returned without executing a query.
+    """
+    division_model, _ = _init(engine)
+    session = sessionmaker()
+    division = division_model.from_dict(id=1, name="division 1", employees=[])
+    session.add(division)
+    statements = _record_statements(engine)
+
+    returned_dict = _run(division.ato_dict(_AsyncSession(session)))
+
+    assert returned_dict == {"id": 1, "name": "division 1", "employees": []}
+    assert statements == []
+
+
+@pytest.mark.integration
+def test_afrom_dicts(engine, sessionmaker):
+    """
+    GIVEN models
+    WHEN afrom_dicts is called with dictionaries and a batch size
+    THEN the instances are added and the session is flushed after each batch.
+    """
+    division_model, _ = _init(engine)
+    session = _AsyncSession(sessionmaker())
+
+    instances = _run(
+        division_model.afrom_dicts(
+            session,
+            ({"id": division_id, "name": "division"} for division_id in range(1, 6)),
+            batch_size=2,
+        )
+    )
+
+    assert [instance.id for instance in instances] == [1, 2, 3, 4, 5]
+    assert session.flush_count == 3
+    assert session.sync_session.query(division_model).count() == 5
+
+
+@pytest.mark.integration
+def test_afrom_dicts_invalid(engine, sessionmaker):
+    """
+    GIVEN models
+    WHEN afrom_dicts is called with an invalid dictionary
+    THEN MalformedModelDictionaryError is raised.
+    """
+    division_model, _ = _init(engine)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        _run(
+            division_model.afrom_dicts(
+                _AsyncSession(sessionmaker()), [{"id": "invalid"}]
+            )
+        )
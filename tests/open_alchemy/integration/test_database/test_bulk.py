@@ -0,0 +1,178 @@
+"""Integration tests against database for bulk operations."""
+
+import datetime
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+def _init(engine, x_cache=False):
+    """Construct the models and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "email": {"type": "string", "x-unique": True},
+                        "joined": {"type": "string", "format": "date"},
+                        "division": {"type": "string", "default": "engineering"},
+                    },
+                    "required": ["id"],
+                    "x-tablename": "employee",
+                    "x-cache": x_cache,
+                    "type": "object",
+                }
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    return model
+
+
+@pytest.mark.integration
+def test_bulk_insert(engine, sessionmaker):
+    """
+    GIVEN model and dictionaries with different keys
+    WHEN bulk_insert is called with a batch size smaller than the number of rows
+    THEN all rows are inserted with converted values and defaults applied.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+
+    count = model.bulk_insert(
+        [
+            {"id": 1, "name": "name 1", "joined": "2000-01-01"},
+            {"id": 2, "name": "name 2"},
+            {"id": 3, "name": "name 3", "joined": "2000-01-03"},
+        ],
+        bind=session,
+        batch_size=2,
+    )
+
+    assert count == 3
+    queried = session.query(model).order_by(model.id).all()
+    assert [(row.id, row.name, row.joined, row.division) for row in queried] == [
+        (1, "name 1", datetime.date(2000, 1, 1), "engineering"),
+        (2, "name 2", None, "engineering"),
+        (3, "name 3", datetime.date(2000, 1, 3), "engineering"),
+    ]
+
+
+@pytest.mark.integration
+def test_bulk_insert_invalid(engine, sessionmaker):
+    """
+    GIVEN model and dictionary that does not satisfy the schema
+    WHEN bulk_insert is called
+    THEN MalformedModelDictionaryError is raised.
+    """
+    model = _init(engine)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.bulk_insert([{"name": "name 1"}], bind=sessionmaker())
+
+
+@pytest.mark.integration
+def test_bulk_upsert_primary_key(engine, sessionmaker):
+    """
+    GIVEN model with existing rows
+    WHEN bulk_upsert is called with existing and new rows
+    THEN existing rows are updated and new rows are inserted.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    model.bulk_insert([{"id": 1, "name": "name 1", "division": "legal"}], bind=session)
+
+    count = model.bulk_upsert(
+        [{"id": 1, "name": "name 1 new"}, {"id": 2, "name": "name 2"}], bind=session
+    )
+
+    assert count == 2
+    queried = session.query(model).order_by(model.id).all()
+    assert [(row.id, row.name, row.division) for row in queried] == [
+        (1, "name 1 new", "legal"),
+        (2, "name 2", "engineering"),
+    ]
+
+
+@pytest.mark.integration
+def test_bulk_upsert_cached(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a cached instance in the database
+    WHEN bulk_upsert is called for the instance and the session is committed
+    THEN get_cached returns the new values.
+    """
+    model = _init(engine, x_cache=True)
+    session = sessionmaker()
+    model.bulk_insert([{"id": 1, "name": "name 1"}], bind=session)
+    session.commit()
+    model.get_cached(1, session=session)
+
+    model.bulk_upsert([{"id": 1, "name": "name 1 new"}], bind=session)
+    session.commit()
+
+    assert model.get_cached(1, session=session).name == "name 1 new"
+
+
+@pytest.mark.integration
+def test_bulk_upsert_unique(engine):
+    """
+    GIVEN model with existing rows
+    WHEN bulk_upsert is called with a connection and a unique column as conflict
+    THEN the row with the same value for the unique column is updated.
+    """
+    model = _init(engine)
+    with engine.connect() as connection:
+        model.bulk_insert(
+            [{"id": 1, "email": "email 1", "name": "name 1"}], bind=connection
+        )
+
+        model.bulk_upsert(
+            [{"id": 1, "email": "email 1", "name": "name 1 new"}],
+            bind=connection,
+            conflict="email",
+        )
+
+        rows = connection.execute(model.__table__.select()).fetchall()
+    assert [(row.id, row.email, row.name) for row in rows] == [
+        (1, "email 1", "name 1 new")
+    ]
+
+
+@pytest.mark.parametrize(
+    "conflict, values, expected_exception",
+    [
+        pytest.param(
+            "name",
+            [{"id": 1, "name": "name 1"}],
+            exceptions.InvalidConflictTargetError,
+            id="not unique",
+        ),
+        pytest.param(
+            "email",
+            [{"id": 1, "name": "name 1"}],
+            exceptions.MalformedModelDictionaryError,
+            id="conflict target missing",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_upsert_invalid(
+    engine, sessionmaker, conflict, values, expected_exception
+):
+    """
+    GIVEN model and invalid conflict or values
+    WHEN bulk_upsert is called
+    THEN the expected exception is raised.
+    """
+    model = _init(engine)
+
+    with pytest.raises(expected_exception):
+        model.bulk_upsert(values, bind=sessionmaker(), conflict=conflict)
@@ -0,0 +1,259 @@
+"""Integration tests against database for the primary key cache."""
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import cache
+from open_alchemy import exceptions
+
+
+def _init(engine, x_cache=True):
+    """Construct the model and create the table."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                    },
+                    "x-tablename": "division",
+                    "x-cache": x_cache,
+                    "type": "object",
+                }
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Division")
+    base.metadata.create_all(engine)
+    return model
+
+
+@pytest.mark.integration
+def test_get_cached(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a row in the database
+    WHEN get_cached is called twice
+    THEN the first read is a miss, the second is a hit that returns a detached
+        instance with the same values.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    session.add(model(id=1, name="division 1"))
+    session.commit()
+
+    first = model.get_cached(1, session=session)
+    second = model.get_cached(1, session=session)
+
+    assert first.name == "division 1"
+    assert second is not first
+    assert second.to_dict() == {"id": 1, "name": "division 1"}
+    assert model.cache_stats() == cache.CacheStats(hits=1, misses=1)
+    merged = session.merge(second, load=False)
+    assert merged is first
+
+
+@pytest.mark.integration
+def test_get_cached_as_dict_missing(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a row in the database
+    WHEN get_cached is called with as_dict and for a primary key that does not exist
+    THEN the dictionary is returned for the row and None for the missing primary key.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    session.add(model(id=1, name="division 1"))
+    session.commit()
+
+    assert model.get_cached((1,), session=session, as_dict=True) == {
+        "id": 1,
+        "name": "division 1",
+    }
+    assert model.get_cached(1, session=session, as_dict=True) == {
+        "id": 1,
+        "name": "division 1",
+    }
+    assert model.get_cached(2, session=session) is None
+    assert model.get_cached(2, session=session) is None
+    assert model.cache_stats() == cache.CacheStats(hits=1, misses=3)
+
+
+@pytest.mark.integration
+def test_get_cached_invalidate(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a cached row in the database
+    WHEN the row is updated, updated by a query and deleted
+    THEN the next read is a miss that returns the new values.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    session.add(model(id=1, name="division 1"))
+    session.commit()
+    model.get_cached(1, session=session)
+
+    session.query(model).get(1).name = "division 2"
+    session.commit()
+    assert model.get_cached(1, session=session).name == "division 2"
+
+    session.query(model).filter(model.id == 1).update({"name": "division 3"})
+    session.commit()
+    assert model.get_cached(1, session=session).name == "division 3"
+
+    session.delete(session.query(model).get(1))
+    session.commit()
+    assert model.get_cached(1, session=session) is None
+    assert model.cache_stats() == cache.CacheStats(hits=0, misses=4)
+
+
+@pytest.mark.integration
+def test_get_cached_invalidate_transaction(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a cached row in the database
+    WHEN the row is updated and flushed and the transaction is committed or rolled
+        back
+    THEN the cached values are kept until the transaction ends and values read
+        during a transaction that is rolled back are invalidated.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    session.add(model(id=1, name="division 1"))
+    session.commit()
+    model.get_cached(1, session=session)
+
+    session.query(model).get(1).name = "division 2"
+    session.flush()
+    assert model.get_cached(1, session=session).name == "division 1"
+    session.commit()
+    assert model.get_cached(1, session=session).name == "division 2"
+
+    session.query(model).get(1).name = "division 3"
+    session.flush()
+    session.query(model).filter(model.id == 1).update({"name": "division 4"})
+    session.rollback()
+    assert model.get_cached(1, session=session).name == "division 2"
+    assert model.cache_stats() == cache.CacheStats(hits=1, misses=3)
+
+
+@pytest.mark.integration
+def test_get_cached_inheritance(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a model that inherits from it without x-cache
+    WHEN get_cached is called on both for an instance of the inheriting model
+    THEN the instance is read but not cached and CacheNotEnabledError is raised.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "type": {"type": "string"},
+                    },
+                    "x-tablename": "employee",
+                    "x-cache": True,
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Employee"},
+                        {
+                            "x-inherits": "Employee",
+                            "type": "object",
+                            "properties": {"manager_data": {"type": "string"}},
+                            "x-kwargs": {
+                                "__mapper_args__": {"polymorphic_identity": "manager"}
+                            },
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    employee = model_factory(name="Employee")
+    manager = model_factory(name="Manager")
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(manager(id=1, manager_data="data 1"))
+    session.commit()
+
+    first = employee.get_cached(1, session=session)
+    second = employee.get_cached(1, session=session)
+
+    assert isinstance(first, manager)
+    assert second is first
+    assert employee.cache_stats() == cache.CacheStats(hits=0, misses=2)
+    with pytest.raises(exceptions.CacheNotEnabledError):
+        manager.get_cached(1, session=session)
+
+
+@pytest.mark.integration
+def test_clear_written(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a cached row in the database
+    WHEN the row is updated using Core statements with a session and with the engine
+        and clear_written is called
+    THEN the cache is cleared when the transaction of the session ends and straight
+        away for the engine.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    session.add(model(id=1, name="division 1"))
+    session.commit()
+    model.get_cached(1, session=session)
+    table = model.__table__
+
+    session.execute(table.update().values(name="division 2"))
+    cache.clear_written(model=model, bind=session)
+    assert model.get_cached(1, session=session).name == "division 1"
+    session.commit()
+    assert model.get_cached(1, session=session).name == "division 2"
+
+    engine.execute(table.update().values(name="division 3"))
+    cache.clear_written(model=model, bind=engine)
+    assert model.get_cached(1, session=session).name == "division 3"
+    assert model.cache_stats() == cache.CacheStats(hits=1, misses=3)
+
+
+@pytest.mark.integration
+def test_set_cache_backend(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a row in the database
+    WHEN the cache backend is replaced and get_cached is called twice
+    THEN the values are stored in the new backend.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    session.add(model(id=1, name="division 1"))
+    session.commit()
+    backend = cache.LruBackend()
+
+    model.set_cache_backend(backend)
+    model.get_cached(1, session=session)
+
+    assert backend.get((1,)) == {"id": 1, "name": "division 1"}
+
+
+@pytest.mark.integration
+def test_get_cached_errors(engine, sessionmaker):
+    """
+    GIVEN models with and without x-cache
+    WHEN get_cached is called without x-cache or without a session
+    THEN CacheNotEnabledError and MissingArgumentError are raised.
+    """
+    model = _init(engine, x_cache=False)
+
+    with pytest.raises(exceptions.CacheNotEnabledError):
+        model.get_cached(1, session=sessionmaker())
+    with pytest.raises(exceptions.MissingArgumentError):
+        _init(engine).get_cached(1)
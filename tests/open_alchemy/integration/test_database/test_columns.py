@@ -0,0 +1,176 @@
+"""Integration tests against database for converting queries to columns."""
+
+import datetime
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+
+def _init(engine):
+    """Construct the models and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "salary": {"type": "number", "format": "float"},
+                        "joined": {"type": "string", "format": "date"},
+                        "division": {
+                            "$ref": "#/components/schemas/Division",
+                        },
+                    },
+                    "required": ["id"],
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Division": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Employee")
+    model_factory(name="Division")
+    base.metadata.create_all(engine)
+    return model
+
+
+@pytest.mark.integration
+def test_to_columns(engine, sessionmaker):
+    """
+    GIVEN model with rows in the database
+    WHEN to_columns is called with a query and a chunk size smaller than the rows
+    THEN an array with the expected values is returned for each column except for
+        relationships.
+    """
+    numpy = pytest.importorskip("numpy")
+    model = _init(engine)
+    session = sessionmaker()
+    model.bulk_insert(
+        [
+            {"id": 1, "name": "name 1", "salary": 1.5, "joined": "2000-01-01"},
+            {"id": 2, "name": "name 2"},
+            {"id": 3, "salary": 3.5, "joined": "2000-01-03"},
+        ],
+        bind=session,
+    )
+
+    returned_columns = model.to_columns(
+        session.query(model).order_by(model.id), chunk_size=2
+    )
+
+    assert list(returned_columns) == ["id", "name", "salary", "joined"]
+    assert returned_columns["id"].tolist() == [1, 2, 3]
+    assert returned_columns["name"].tolist() == ["name 1", "name 2", None]
+    assert returned_columns["salary"].dtype == numpy.float32
+    assert returned_columns["salary"].mask.tolist() == [False, True, False]
+    assert returned_columns["joined"].tolist() == [
+        datetime.date(2000, 1, 1),
+        None,
+        datetime.date(2000, 1, 3),
+    ]
+
+
+@pytest.mark.integration
+def test_to_columns_lists(engine, sessionmaker):
+    """
+    GIVEN model with rows in the database
+    WHEN to_columns is called with fields and arrays False
+    THEN a list of values is returned for each field.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    model.bulk_insert([{"id": 1, "name": "name 1"}, {"id": 2}], bind=session)
+
+    returned_columns = model.to_columns(
+        session.query(model).order_by(model.id), fields=["id", "name"], arrays=False
+    )
+
+    assert returned_columns == {"id": [1, 2], "name": ["name 1", None]}
+
+
+def _init_joined(engine):
+    """Construct a model with joined table inheritance and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "type": {"type": "string"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Employee"},
+                        {
+                            "x-tablename": "manager",
+                            "x-inherits": "Employee",
+                            "type": "object",
+                            "properties": {
+                                "id": {
+                                    "type": "integer",
+                                    "x-primary-key": True,
+                                    "x-foreign-key": "employee.id",
+                                },
+                                "manager_data": {"type": "string"},
+                            },
+                            "x-kwargs": {
+                                "__mapper_args__": {"polymorphic_identity": "manager"}
+                            },
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model_factory(name="Employee")
+    model = model_factory(name="Manager")
+    base.metadata.create_all(engine)
+    return model
+
+
+@pytest.mark.integration
+def test_to_columns_joined_inheritance(engine, sessionmaker):
+    """
+    GIVEN model with joined table inheritance with rows in the database
+    WHEN to_columns is called
+    THEN a list of values is returned for each property including the primary key
+        that is shared with the parent.
+    """
+    model = _init_joined(engine)
+    session = sessionmaker()
+    session.add_all(
+        [model(id=1, name="name 1", manager_data="data 1"), model(id=2, name="name 2")]
+    )
+    session.flush()
+
+    returned_columns = model.to_columns(
+        session.query(model).order_by(model.id), arrays=False
+    )
+
+    assert returned_columns == {
+        "id": [1, 2],
+        "name": ["name 1", "name 2"],
+        "type": ["manager", "manager"],
+        "manager_data": ["data 1", None],
+    }
@@ -0,0 +1,248 @@
+"""Integration tests against database for the cache of to_dict."""
+
+import json
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+
+def _init(engine, x_dict_cache=True):
+    """Construct the models and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "employees": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Employee"},
+                        },
+                    },
+                    "x-tablename": "division",
+                    "x-dict-cache": x_dict_cache,
+                    "type": "object",
+                },
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "manager": {
+                            "type": "object",
+                            "readOnly": True,
+                            "properties": {"id": {"type": "integer"}},
+                        },
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Manager": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "employees": {
+                            "type": "array",
+                            "items": {
+                                "allOf": [
+                                    {"$ref": "#/components/schemas/Employee"},
+                                    {"x-backref": "manager"},
+                                ]
+                            },
+                        },
+                    },
+                    "x-tablename": "manager",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        spec=spec, base=base, define_all=True
+    )
+    base.metadata.create_all(engine)
+    return (
+        model_factory(name="Division"),
+        model_factory(name="Employee"),
+        model_factory(name="Manager"),
+    )
+
+
+def _add(models, session):
+    """Add a division with an employee that has a manager."""
+    division_model, employee_model, manager_model = models
+    employee = employee_model(id=21, name="employee 1")
+    manager = manager_model(id=31, name="manager 1", employees=[employee])
+    division = division_model(id=11, name="division 1", employees=[employee])
+    session.add(division)
+    session.flush()
+    return division, employee, manager
+
+
+@pytest.mark.integration
+def test_to_dict_cached(engine, sessionmaker):
+    """
+    GIVEN model with x-dict-cache and an instance
+    WHEN to_dict is called twice and the first dictionary is modified
+    THEN the instance is only converted once and the second dictionary is not
+        modified.
+    """
+    models = _init(engine)
+    division, _, _ = _add(models, sessionmaker())
+    division_model = models[0]
+
+    with mock.patch.object(
+        division_model,
+        "instance_to_dict",
+        wraps=division_model.instance_to_dict,
+    ) as mock_instance_to_dict:
+        first = division.to_dict()
+        first["employees"][0]["name"] = "modified"
+        second = division.to_dict()
+
+    assert mock_instance_to_dict.call_count == 1
+    assert second == {
+        "id": 11,
+        "name": "division 1",
+        "employees": [{"id": 21, "name": "employee 1", "manager": {"id": 31}}],
+    }
+
+
+@pytest.mark.integration
+def test_to_dict_not_cached(engine, sessionmaker):
+    """
+    GIVEN model without x-dict-cache and an instance
+    WHEN to_dict is called twice
+    THEN the instance is converted each time.
+    """
+    models = _init(engine, x_dict_cache=False)
+    division, _, _ = _add(models, sessionmaker())
+    division_model = models[0]
+
+    with mock.patch.object(
+        division_model,
+        "instance_to_dict",
+        wraps=division_model.instance_to_dict,
+    ) as mock_instance_to_dict:
+        division.to_dict()
+        division.to_dict()
+
+    assert mock_instance_to_dict.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "change, expected_dict",
+    [
+        pytest.param(
+            lambda division, *_: setattr(division, "name", "division 2"),
+            {
+                "id": 11,
+                "name": "division 2",
+                "employees": [{"id": 21, "name": "employee 1", "manager": {"id": 31}}],
+            },
+            id="property",
+        ),
+        pytest.param(
+            lambda division, employee, _: division.employees.remove(employee),
+            {"id": 11, "name": "division 1", "employees": []},
+            id="relationship remove",
+        ),
+        pytest.param(
+            lambda division, employee, _: division.employees.append(
+                type(employee)(id=22, name="employee 2")
+            ),
+            {
+                "id": 11,
+                "name": "division 1",
+                "employees": [
+                    {"id": 21, "name": "employee 1", "manager": {"id": 31}},
+                    {"id": 22, "name": "employee 2"},
+                ],
+            },
+            id="relationship append",
+        ),
+        pytest.param(
+            lambda _, employee, __: setattr(employee, "name", "employee 2"),
+            {
+                "id": 11,
+                "name": "division 1",
+                "employees": [{"id": 21, "name": "employee 2", "manager": {"id": 31}}],
+            },
+            id="related property",
+        ),
+        pytest.param(
+            lambda _, employee, __: setattr(employee, "manager", None),
+            {
+                "id": 11,
+                "name": "division 1",
+                "employees": [{"id": 21, "name": "employee 1"}],
+            },
+            id="related relationship",
+        ),
+        pytest.param(
+            lambda _, __, manager: setattr(manager, "id", 32),
+            {
+                "id": 11,
+                "name": "division 1",
+                "employees": [{"id": 21, "name": "employee 1", "manager": {"id": 32}}],
+            },
+            id="read only related property",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_to_dict_invalidate(engine, sessionmaker, change, expected_dict):
+    """
+    GIVEN model with x-dict-cache and an instance that has been converted
+    WHEN the instance or an instance it includes is changed
+    THEN to_dict returns the changed dictionary.
+    """
+    models = _init(engine)
+    division, employee, manager = _add(models, sessionmaker())
+    division.to_dict()
+
+    change(division, employee, manager)
+
+    assert division.to_dict() == expected_dict
+
+
+@pytest.mark.integration
+def test_to_dict_invalidate_commit(engine, sessionmaker):
+    """
+    GIVEN model with x-dict-cache and an instance that has been converted
+    WHEN the row is updated by a query and the session is committed
+    THEN to_dict returns the values of the row in the database.
+    """
+    models = _init(engine)
+    division_model = models[0]
+    session = sessionmaker()
+    division, _, _ = _add(models, session)
+    session.commit()
+    division.to_dict()
+
+    session.query(division_model).filter(division_model.id == 11).update(
+        {"name": "division 2"}
+    )
+    session.commit()
+
+    assert division.to_dict()["name"] == "division 2"
+
+
+@pytest.mark.integration
+def test_to_str_cached(engine, sessionmaker):
+    """
+    GIVEN model with x-dict-cache and an instance
+    WHEN to_str is called before and after the instance is changed
+    THEN the strings reflect the instance.
+    """
+    models = _init(engine)
+    division, _, _ = _add(models, sessionmaker())
+    division.to_str()
+
+    division.name = "division 2"
+
+    assert json.loads(division.to_str())["name"] == "division 2"
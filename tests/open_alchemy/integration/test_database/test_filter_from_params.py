@@ -0,0 +1,176 @@
+"""Integration tests against database for filtering using query parameters."""
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+def _init(engine):
+    """Construct the model and create the table."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string", "x-index": True},
+                        "joined": {"type": "string", "format": "date"},
+                        "level": {
+                            "type": "string",
+                            "enum": ["junior", "senior"],
+                        },
+                        "salary": {"type": "number"},
+                    },
+                    "required": ["id", "name"],
+                    "x-tablename": "employee",
+                    "x-composite-index": ["joined", "level"],
+                    "type": "object",
+                }
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    return model
+
+
+def _init_joined(engine):
+    """Construct a model with joined table inheritance and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "type": {"type": "string"},
+                    },
+                    "required": ["id"],
+                    "x-tablename": "employee",
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Employee"},
+                        {
+                            "x-tablename": "manager",
+                            "x-inherits": "Employee",
+                            "type": "object",
+                            "properties": {
+                                "id": {
+                                    "type": "integer",
+                                    "x-primary-key": True,
+                                    "x-foreign-key": "employee.id",
+                                },
+                            },
+                            "required": ["id"],
+                            "x-kwargs": {
+                                "__mapper_args__": {"polymorphic_identity": "manager"}
+                            },
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model_factory(name="Employee")
+    model = model_factory(name="Manager")
+    base.metadata.create_all(engine)
+    return model
+
+
+@pytest.mark.parametrize(
+    "params, expected_ids",
+    [
+        pytest.param({}, [1, 2, 3, 4], id="empty"),
+        pytest.param({"id": "2"}, [2], id="eq"),
+        pytest.param({"id__in": "1,3"}, [1, 3], id="in"),
+        pytest.param({"id__range": "2,3"}, [2, 3], id="range"),
+        pytest.param({"id__range": "3,"}, [3, 4], id="range no upper"),
+        pytest.param({"joined__lt": "2000-01-03"}, [1, 2], id="lt date"),
+        pytest.param({"name__prefix": "b_"}, [4], id="prefix escaped"),
+        pytest.param({"name__prefix": "b"}, [3, 4], id="prefix"),
+        pytest.param(
+            {"joined__gte": "2000-01-02", "name__prefix": "a"}, [2], id="multiple"
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_filter_from_params(engine, sessionmaker, params, expected_ids):
+    """
+    GIVEN model with rows in the database and query parameters
+    WHEN filter_from_params is called with the parameters and the query is filtered
+    THEN the expected rows are returned.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    model.bulk_insert(
+        [
+            {"id": 1, "name": "a1", "joined": "2000-01-01", "level": "junior"},
+            {"id": 2, "name": "a2", "joined": "2000-01-02", "level": "senior"},
+            {"id": 3, "name": "bb", "joined": "2000-01-03", "level": "junior"},
+            {"id": 4, "name": "b_", "joined": "2000-01-04", "level": "senior"},
+        ],
+        bind=session,
+    )
+
+    expressions = model.filter_from_params(params)
+
+    query = session.query(model).filter(*expressions).order_by(model.id)
+    assert [instance.id for instance in query] == expected_ids
+
+
+@pytest.mark.integration
+def test_filter_from_params_unindexed(engine):
+    """
+    GIVEN model
+    WHEN filter_from_params is called with parameters for properties that are not
+        the leading property of an index
+    THEN UnindexedFilterError is raised unless unindexed is allow.
+    """
+    model = _init(engine)
+
+    with pytest.raises(exceptions.UnindexedFilterError):
+        model.filter_from_params({"level": "junior"})
+    with pytest.raises(exceptions.UnindexedFilterError):
+        model.filter_from_params({"salary": "1.5"})
+    assert len(model.filter_from_params({"salary": "1.5"}, unindexed="allow")) == 1
+
+
+@pytest.mark.parametrize(
+    "params, expected_ids",
+    [
+        pytest.param({"id": "1"}, [1], id="eq"),
+        pytest.param({"id__gt": "1"}, [2, 3], id="gt"),
+    ],
+)
+@pytest.mark.integration
+def test_filter_from_params_joined_inheritance(
+    engine, sessionmaker, params, expected_ids
+):
+    """
+    GIVEN model with joined table inheritance with rows in the database
+    WHEN filter_from_params is called with parameters for the primary key that is
+        shared with the parent and the query is filtered
+    THEN the expected rows are returned.
+    """
+    model = _init_joined(engine)
+    session = sessionmaker()
+    session.add_all([model(id=1), model(id=2), model(id=3)])
+    session.flush()
+
+    expressions = model.filter_from_params(params)
+
+    query = session.query(model).filter(*expressions).order_by(model.id)
+    assert [instance.id for instance in query] == expected_ids
@@ -0,0 +1,232 @@
+"""Integration tests against database for reloading the models."""
+
+# pylint: disable=redefined-outer-name
+
+import copy
+import json
+import os
+
+import pytest
+import sqlalchemy
+import yaml
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import hot_reload
+from open_alchemy import models
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "employees": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Employee"},
+                    },
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Project": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "project",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def _stop_watcher():
+    """Stop the watcher after each test."""
+    yield
+    hot_reload.set_watcher(None)
+
+
+@pytest.fixture
+def spec_file(tmp_path):
+    """Write the specification to a YAML file."""
+    path = tmp_path / "spec.yaml"
+    path.write_text(yaml.dump(SPEC))
+    return path
+
+
+def _write(path, spec):
+    """Write a specification and move the modification time forward."""
+    path.write_text(yaml.dump(spec))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _changed_spec():
+    """Add a column to Employee."""
+    spec = copy.deepcopy(SPEC)
+    spec["components"]["schemas"]["Employee"]["properties"]["salary"] = {
+        "type": "number"
+    }
+    return spec
+
+
+@pytest.mark.integration
+def test_reload(engine, sessionmaker, spec_file):
+    """
+    GIVEN models initialized with watch
+    WHEN the specification changes and check is called
+    THEN the changed and connected models are rebuilt while the others are kept.
+    """
+    base, model_factory = open_alchemy.init_yaml(str(spec_file), watch=True)
+    watcher = hot_reload.get_watcher()
+    project = model_factory(name="Project")
+    employee = model_factory(name="Employee")
+    _write(spec_file, _changed_spec())
+
+    result = watcher.check()
+
+    assert result.changed == {"Employee"}
+    assert result.rebuilt == {"Employee", "Division"}
+    assert result.removed == frozenset()
+    assert model_factory(name="Project") is project
+    assert models.Project is project
+    assert model_factory(name="Employee") is not employee
+    assert models.Employee is model_factory(name="Employee")
+    assert models.Base is watcher.base
+    assert models.Base is not base
+    assert set(models.Base.metadata.tables) == {"division", "employee", "project"}
+
+    models.Base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(models.Division(id=1, employees=[models.Employee(id=2, salary=1.5)]))
+    session.add(models.Project(id=3))
+    session.flush()
+    queried_division = session.query(models.Division).one()
+    assert queried_division.to_dict() == {
+        "id": 1,
+        "employees": [{"id": 2, "salary": 1.5}],
+    }
+    assert session.query(sqlalchemy.func.count(models.Project.id)).scalar() == 1
+
+
+@pytest.mark.integration
+def test_reload_json(tmp_path):
+    """
+    GIVEN models initialized from a JSON file with watch
+    WHEN the specification changes and reload is called
+    THEN the changed model is rebuilt.
+    """
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(SPEC))
+    _, model_factory = open_alchemy.init_json(str(path), watch=True)
+    path.write_text(json.dumps(_changed_spec()))
+
+    hot_reload.get_watcher().reload()
+
+    assert "salary" in model_factory(name="Employee").__table__.columns
+
+
+@pytest.mark.integration
+def test_reload_unchanged(spec_file):
+    """
+    GIVEN models initialized with watch
+    WHEN check is called before and reload after the file is written unchanged
+    THEN no models are rebuilt.
+    """
+    _, model_factory = open_alchemy.init_yaml(str(spec_file), watch=True)
+    watcher = hot_reload.get_watcher()
+    employee = model_factory(name="Employee")
+
+    assert watcher.check() is None
+    _write(spec_file, SPEC)
+    result = watcher.check()
+
+    assert result.changed == frozenset()
+    assert result.rebuilt == frozenset()
+    assert model_factory(name="Employee") is employee
+
+
+@pytest.mark.integration
+def test_reload_removed(spec_file):
+    """
+    GIVEN models initialized with watch
+    WHEN a schema is removed from the specification and reload is called
+    THEN the model is removed.
+    """
+    _, model_factory = open_alchemy.init_yaml(str(spec_file), watch=True)
+    spec = copy.deepcopy(SPEC)
+    del spec["components"]["schemas"]["Project"]
+    _write(spec_file, spec)
+
+    result = hot_reload.get_watcher().reload()
+
+    assert result.removed == {"Project"}
+    assert not hasattr(models, "Project")
+    assert "project" not in models.Base.metadata.tables
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        model_factory(name="Project")
+
+
+@pytest.mark.integration
+def test_reload_invalid(spec_file):
+    """
+    GIVEN models initialized with watch
+    WHEN the specification changes to an invalid schema and reload is called
+    THEN the error is raised and the models are not changed.
+    """
+    base, model_factory = open_alchemy.init_yaml(str(spec_file), watch=True)
+    employee = model_factory(name="Employee")
+    division = model_factory(name="Division")
+    spec = _changed_spec()
+    spec["components"]["schemas"]["Employee"]["properties"]["salary"] = {
+        "type": "invalid"
+    }
+    _write(spec_file, spec)
+
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        hot_reload.get_watcher().reload()
+
+    assert models.Employee is employee
+    assert models.Division is division
+    assert models.Base is base
+    assert division.__mapper__.relationships["employees"].mapper.class_ is employee
+
+
+@pytest.mark.integration
+def test_init_watch_define_all_false(spec_file):
+    """
+    GIVEN specification file
+    WHEN init_yaml is called with watch without define_all
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        open_alchemy.init_yaml(str(spec_file), define_all=False, watch=True)
+
+
+@pytest.mark.integration
+def test_init_not_watched_stops_watcher(spec_file, tmp_path):
+    """
+    GIVEN models initialized with watch
+    WHEN init_yaml is called again without watch
+    THEN the watcher is stopped and removed.
+    """
+    open_alchemy.init_yaml(str(spec_file), watch=True)
+    watcher = hot_reload.get_watcher()
+    spec = copy.deepcopy(SPEC)
+    del spec["components"]["schemas"]["Division"]
+    other_spec_file = tmp_path / "other.yaml"
+    other_spec_file.write_text(yaml.dump(spec))
+
+    open_alchemy.init_yaml(str(other_spec_file))
+
+    assert hot_reload.get_watcher() is None
+    # pylint: disable=protected-access
+    assert watcher._thread is None
@@ -0,0 +1,185 @@
+"""Integration tests against database for track_loads."""
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+def _init(engine):
+    """Construct the models and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "employees": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Employee"},
+                        },
+                    },
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "address": {"$ref": "#/components/schemas/Address"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Address": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "address",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        spec=spec, base=base, define_all=True
+    )
+    base.metadata.create_all(engine)
+    return model_factory(name="Division")
+
+
+def _add(model, session):
+    """Add divisions with an employee that has an address."""
+    for division_id in (1, 2):
+        session.add(
+            model.from_dict(
+                id=division_id,
+                employees=[{"id": division_id, "address": {"id": division_id}}],
+            )
+        )
+    session.commit()
+
+
+@pytest.mark.integration
+def test_track_loads(engine, sessionmaker):
+    """
+    GIVEN model with nested relationships that are loaded lazily
+    WHEN the instances are read and converted in track_loads
+    THEN the queries are attributed to the properties that caused them.
+    """
+    model = _init(engine)
+    _add(model, sessionmaker())
+    session = sessionmaker()
+
+    with open_alchemy.track_loads() as report:
+        [division.to_dict() for division in session.query(model)]
+
+    assert report.count == 5
+    assert report.by_property() == {
+        (None, None): 1,
+        ("Division", "employees"): 2,
+        ("Employee", "address"): 2,
+    }
+    assert report.queries[1].statement.startswith("SELECT")
+    assert report.loads == {"Division": 2, "Employee": 2, "Address": 2}
+
+
+@pytest.mark.integration
+def test_track_loads_nested(engine, sessionmaker):
+    """
+    GIVEN model with relationships that are loaded lazily
+    WHEN an instance is converted in nested track_loads
+    THEN the queries are recorded by both.
+    """
+    model = _init(engine)
+    _add(model, sessionmaker())
+    session = sessionmaker()
+
+    with open_alchemy.track_loads() as outer_report:
+        division = session.query(model).get(1)
+        with open_alchemy.track_loads() as inner_report:
+            division.to_dict()
+
+    assert outer_report.count == 3
+    assert inner_report.count == 2
+
+
+@pytest.mark.integration
+def test_track_loads_not_tracked(engine, sessionmaker):
+    """
+    GIVEN model with relationships that are loaded lazily
+    WHEN an instance is converted after track_loads exits
+    THEN the queries are not recorded.
+    """
+    model = _init(engine)
+    _add(model, sessionmaker())
+    session = sessionmaker()
+
+    with open_alchemy.track_loads() as report:
+        division = session.query(model).get(1)
+    division.to_dict()
+
+    assert report.count == 1
+
+
+@pytest.mark.integration
+def test_track_loads_threshold_raise(engine, sessionmaker):
+    """
+    GIVEN model with relationships that are loaded lazily
+    WHEN the instances are converted in track_loads with a threshold that is exceeded
+    THEN TooManyQueriesError is raised.
+    """
+    model = _init(engine)
+    _add(model, sessionmaker())
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.TooManyQueriesError) as exc_info:
+        with open_alchemy.track_loads(threshold=3):
+            [division.to_dict() for division in session.query(model)]
+
+    assert exc_info.value.by_property[("Division", "employees")] == 2
+
+
+@pytest.mark.integration
+def test_track_loads_threshold_warn(engine, sessionmaker):
+    """
+    GIVEN model with relationships that are loaded lazily
+    WHEN the instances are converted in track_loads with a threshold that is exceeded
+        and action is warn
+    THEN TooManyQueriesWarning is warned.
+    """
+    model = _init(engine)
+    _add(model, sessionmaker())
+    session = sessionmaker()
+
+    with pytest.warns(exceptions.TooManyQueriesWarning):
+        with open_alchemy.track_loads(threshold=3, action="warn"):
+            [division.to_dict() for division in session.query(model)]
+
+
+@pytest.mark.integration
+def test_track_loads_threshold_not_exceeded(engine, sessionmaker):
+    """
+    GIVEN model with relationships that are loaded lazily
+    WHEN the instances are converted in track_loads with a threshold that is met
+    THEN no error is raised.
+    """
+    model = _init(engine)
+    _add(model, sessionmaker())
+    session = sessionmaker()
+
+    with open_alchemy.track_loads(threshold=5) as report:
+        [division.to_dict() for division in session.query(model)]
+
+    assert report.count == 5
+
+
+@pytest.mark.integration
+def test_track_loads_invalid_action():
+    """
+    GIVEN action that is not supported
+    WHEN track_loads is entered
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        with open_alchemy.track_loads(action="invalid"):
+            pass  # pragma: no cover
@@ -0,0 +1,202 @@
+"""Integration tests against database for keyset pagination."""
+
+import json
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+def _init(engine):
+    """Construct the model and create the table."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string", "x-unique": True},
+                        "division": {"type": "string"},
+                        "salary": {"type": "number"},
+                    },
+                    "required": ["id", "name", "division", "salary"],
+                    "x-tablename": "employee",
+                    "x-composite-index": ["division", "salary"],
+                    "type": "object",
+                }
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    return model
+
+
+def _init_joined(engine):
+    """Construct a model with joined table inheritance and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "type": {"type": "string"},
+                    },
+                    "required": ["id"],
+                    "x-tablename": "employee",
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Employee"},
+                        {
+                            "x-tablename": "manager",
+                            "x-inherits": "Employee",
+                            "type": "object",
+                            "properties": {
+                                "id": {
+                                    "type": "integer",
+                                    "x-primary-key": True,
+                                    "x-foreign-key": "employee.id",
+                                },
+                            },
+                            "required": ["id"],
+                            "x-kwargs": {
+                                "__mapper_args__": {"polymorphic_identity": "manager"}
+                            },
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model_factory(name="Employee")
+    model = model_factory(name="Manager")
+    base.metadata.create_all(engine)
+    return model
+
+
+def _read_all(model, query, **kwargs):
+    """Read every page of the query and return the ids of each page."""
+    pages = []
+    after = None
+    while True:
+        page = model.paginate(query, after=after, **kwargs)
+        pages.append([item.id for item in page.items])
+        if page.next_cursor is None:
+            return pages
+        after = page.next_cursor
+
+
+@pytest.mark.parametrize(
+    "order_by, expected_pages",
+    [
+        pytest.param(None, [[1, 2], [3, 4], [5]], id="default"),
+        pytest.param("-id", [[5, 4], [3, 2], [1]], id="primary key descending"),
+        pytest.param("name", [[5, 4], [3, 2], [1]], id="unique"),
+        pytest.param("division", [[1, 3], [5, 2], [4]], id="index prefix"),
+        pytest.param(["division", "-salary"], [[3, 5], [1, 4], [2]], id="index mixed"),
+        pytest.param(
+            ["-division", "-salary"], [[4, 2], [3, 5], [1]], id="index descending"
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_paginate(engine, sessionmaker, order_by, expected_pages):
+    """
+    GIVEN model with an index and rows in the database
+    WHEN paginate is called repeatedly with the next cursor
+    THEN every row is returned once in the expected order.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    model.bulk_insert(
+        [
+            {"id": 1, "name": "e", "division": "a", "salary": 1.0},
+            {"id": 2, "name": "d", "division": "b", "salary": 1.0},
+            {"id": 3, "name": "c", "division": "a", "salary": 2.0},
+            {"id": 4, "name": "b", "division": "b", "salary": 2.0},
+            {"id": 5, "name": "a", "division": "a", "salary": 1.0},
+        ],
+        bind=session,
+    )
+
+    pages = _read_all(model, session.query(model), limit=2, order_by=order_by)
+
+    assert pages == expected_pages
+
+
+@pytest.mark.integration
+def test_paginate_joined_inheritance(engine, sessionmaker):
+    """
+    GIVEN model with joined table inheritance with rows in the database
+    WHEN paginate is called repeatedly with the next cursor
+    THEN every row is returned once in the order of the primary key.
+    """
+    model = _init_joined(engine)
+    session = sessionmaker()
+    session.add_all([model(id=3), model(id=1), model(id=2)])
+    session.flush()
+
+    pages = _read_all(model, session.query(model), limit=2)
+
+    assert pages == [[1, 2], [3]]
+
+
+@pytest.mark.integration
+def test_paginate_serialize(engine, sessionmaker):
+    """
+    GIVEN model with rows in the database
+    WHEN paginate is called and the page is converted to a dictionary and a string
+    THEN the instances and the next cursor are returned.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    model.bulk_insert(
+        [
+            {"id": 1, "name": "a", "division": "a", "salary": 1.0},
+            {"id": 2, "name": "b", "division": "a", "salary": 1.0},
+        ],
+        bind=session,
+    )
+
+    page = model.paginate(session.query(model).filter(model.id > 0), limit=1)
+
+    expected_items = [{"id": 1, "name": "a", "division": "a", "salary": 1.0}]
+    assert page.to_dict() == {"items": expected_items, "next_cursor": page.next_cursor}
+    assert json.loads(page.to_str()) == page.to_dict()
+    assert page.next_cursor is not None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"order_by": "salary"}, id="no index"),
+        pytest.param({"limit": 0}, id="limit"),
+        pytest.param({"after": "invalid"}, id="cursor"),
+    ],
+)
+@pytest.mark.integration
+def test_paginate_invalid(engine, sessionmaker, kwargs):
+    """
+    GIVEN model and invalid arguments
+    WHEN paginate is called with the arguments
+    THEN InvalidArgumentError is raised.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+
+    with pytest.raises(exceptions.InvalidArgumentError):
+        model.paginate(session.query(model), **kwargs)
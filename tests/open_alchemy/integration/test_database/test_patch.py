@@ -0,0 +1,222 @@
+"""Integration tests against database for apply_patch and patch_where."""
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+
+
+def _init(engine, x_cache=False):
+    """Construct the models and create the tables."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "division": {"type": "string"},
+                        "salary": {"type": "number"},
+                        "joined": {"type": "string", "format": "date"},
+                        "manager": {"$ref": "#/components/schemas/Manager"},
+                    },
+                    "required": ["id", "name", "division", "salary"],
+                    "x-tablename": "employee",
+                    "x-cache": x_cache,
+                    "type": "object",
+                },
+                "Manager": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                    },
+                    "x-tablename": "manager",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        spec=spec, base=base, define_all=True
+    )
+    base.metadata.create_all(engine)
+    return model_factory(name="Employee")
+
+
+def _add(model, session):
+    """Add employees."""
+    session.add_all(
+        [
+            model(id=1, name="employee 1", division="division 1", salary=1.0),
+            model(id=2, name="employee 2", division="division 1", salary=2.0),
+            model(id=3, name="employee 3", division="division 2", salary=3.0),
+        ]
+    )
+    session.commit()
+
+
+def _record_statements(engine):
+    """Record the statements executed by the engine."""
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_: statements.append(statement),
+    )
+    return statements
+
+
+@pytest.mark.integration
+def test_apply_patch(engine, sessionmaker):
+    """
+    GIVEN model and an instance in the database
+    WHEN apply_patch is called with some of the properties, not all of which changed
+    THEN only the changed properties are assigned and included in the UPDATE.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    _add(model, session)
+    employee = session.query(model).get(1)
+    statements = _record_statements(engine)
+
+    changed = employee.apply_patch(
+        {"name": "employee 1", "salary": 4.0, "joined": "2020-01-02"}
+    )
+    session.commit()
+
+    assert changed == ["salary", "joined"]
+    updates = [statement for statement in statements if statement.startswith("UPDATE")]
+    assert len(updates) == 1
+    assert "salary" in updates[0]
+    assert "joined" in updates[0]
+    assert "name" not in updates[0]
+    assert employee.to_dict() == {
+        "id": 1,
+        "name": "employee 1",
+        "division": "division 1",
+        "salary": 4.0,
+        "joined": "2020-01-02",
+    }
+
+
+@pytest.mark.integration
+def test_apply_patch_relationship(engine, sessionmaker):
+    """
+    GIVEN model with a relationship and an instance in the database with the
+        relationship
+    WHEN apply_patch is called with the unchanged relationship
+    THEN MalformedModelDictionaryError is raised and the instance is not changed.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    _add(model, session)
+    employee = session.query(model).get(1)
+    employee.manager = model.__mapper__.relationships["manager"].mapper.class_(
+        id=11, name="manager 1"
+    )
+    session.commit()
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        employee.apply_patch({"manager": {"id": 11, "name": "manager 1"}})
+    session.commit()
+
+    assert employee.manager.id == 11
+    assert session.query(model).get(1).to_dict()["manager"] == {
+        "id": 11,
+        "name": "manager 1",
+    }
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param({"salary": "invalid"}, id="invalid type"),
+        pytest.param({"invalid": 1}, id="not a property"),
+        pytest.param(["invalid"], id="not a dictionary"),
+    ],
+)
+@pytest.mark.integration
+def test_apply_patch_invalid(engine, sessionmaker, body):
+    """
+    GIVEN model and an instance in the database
+    WHEN apply_patch is called with an invalid dictionary
+    THEN MalformedModelDictionaryError is raised.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    _add(model, session)
+    employee = session.query(model).get(1)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        employee.apply_patch(body)
+
+
+@pytest.mark.integration
+def test_patch_where(engine, sessionmaker):
+    """
+    GIVEN model and instances in the database
+    WHEN patch_where is called with filters and some of the properties
+    THEN a single UPDATE is executed for the matching rows.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    _add(model, session)
+    statements = _record_statements(engine)
+
+    count = model.patch_where(
+        model.filter_from_params({"division": "division 1"}, unindexed="allow"),
+        {"salary": 5.0, "joined": "2020-01-02"},
+        bind=session,
+    )
+    session.commit()
+
+    assert count == 2
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+    assert [
+        (employee.salary, employee.to_dict().get("joined"))
+        for employee in session.query(model).order_by(model.id)
+    ] == [(5.0, "2020-01-02"), (5.0, "2020-01-02"), (3.0, None)]
+
+
+@pytest.mark.integration
+def test_patch_where_cached(engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a cached instance in the database
+    WHEN patch_where is called for the instance and the session is committed
+    THEN get_cached returns the new values.
+    """
+    model = _init(engine, x_cache=True)
+    session = sessionmaker()
+    _add(model, session)
+    model.get_cached(1, session=session)
+
+    model.patch_where(model.id == 1, {"name": "employee 4"}, bind=session)
+    session.commit()
+
+    assert model.get_cached(1, session=session).name == "employee 4"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param({"salary": "invalid"}, id="invalid type"),
+        pytest.param({"manager": {"id": 11}}, id="relationship"),
+    ],
+)
+@pytest.mark.integration
+def test_patch_where_invalid(engine, sessionmaker, body):
+    """
+    GIVEN model and instances in the database
+    WHEN patch_where is called with an invalid dictionary
+    THEN MalformedModelDictionaryError is raised.
+    """
+    model = _init(engine)
+    session = sessionmaker()
+    _add(model, session)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.patch_where(model.id == 1, body, bind=session)
@@ -1,9 +1,12 @@
 """Integration tests against database for relationships."""
 
 import pytest
+import sqlalchemy
+from sqlalchemy import exc
 from sqlalchemy.ext import declarative
 
 import open_alchemy
+from open_alchemy import exceptions
 
 
 @pytest.mark.integration
@@ -68,6 +71,133 @@ def test_many_to_one(engine, sessionmaker):
     assert queried_ref_model.tables[0].id == 12
 
 
+@pytest.mark.parametrize(
+    "table_name, ref_schema",
+    [
+        (
+            "table",
+            {"$ref": "#/components/schemas/RefTable"},
+        ),
+        (
+            "ref_table",
+            {"type": "array", "items": {"$ref": "#/components/schemas/RefTable"}},
+        ),
+    ],
+    ids=["many to one", "one to many"],
+)
+@pytest.mark.integration
+def test_index_foreign_keys(engine, table_name, ref_schema):
+    """
+    GIVEN specification with a relationship and index_foreign_keys set
+    WHEN schema is created
+    THEN the foreign key column has an index.
+    """
+    # Defining specification
+    spec = {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                },
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_tables": ref_schema,
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        spec=spec, base=base, index_foreign_keys=True
+    )
+    model_factory(name="Table")
+    model_factory(name="RefTable")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    indexes = sqlalchemy.inspect(engine).get_indexes(table_name)
+    assert len(indexes) == 1
+    (column_name,) = indexes[0]["column_names"]
+    assert column_name.endswith("_id")
+
+
+def _one_to_many_spec(**kwargs):
+    """Construct a specification with a one to many relationship."""
+    return {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "employee",
+                    "type": "object",
+                    **kwargs,
+                },
+                "Division": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "employees": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Employee"},
+                        },
+                    },
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+            }
+        }
+    }
+
+
+@pytest.mark.integration
+def test_index_foreign_keys_ref_constructed(engine, recwarn):
+    """
+    GIVEN specification with a one to many relationship and x-index-foreign-keys on
+        the referenced schema
+    WHEN the referenced model is constructed before the model with the relationship
+    THEN the foreign key column added to the referenced model has an index.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        spec=_one_to_many_spec(**{"x-index-foreign-keys": True}), base=base
+    )
+    model_factory(name="Employee")
+    model_factory(name="Division")
+
+    base.metadata.create_all(engine)
+    indexes = sqlalchemy.inspect(engine).get_indexes("employee")
+    assert [index["column_names"] for index in indexes] == [["division_employees_id"]]
+    assert not [
+        warning
+        for warning in recwarn
+        if issubclass(warning.category, exceptions.UnindexedForeignKeyWarning)
+    ]
+
+
+@pytest.mark.integration
+def test_index_foreign_keys_ref_constructed_warning():
+    """
+    GIVEN specification with a one to many relationship without foreign key indexing
+    WHEN the referenced model is constructed before the model with the relationship
+    THEN UnindexedForeignKeyWarning is warned for the foreign key column added to the
+        referenced model.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=_one_to_many_spec(), base=base)
+    model_factory(name="Employee")
+
+    with pytest.warns(
+        exceptions.UnindexedForeignKeyWarning, match="employee.division_employees_id"
+    ):
+        model_factory(name="Division")
+
+
 @pytest.mark.integration
 def test_many_to_one_relationship_fk(engine, sessionmaker):
     """
@@ -446,6 +576,73 @@ def test_many_to_many(engine, sessionmaker):
     assert queried_ref_model.tables[0].name == "table name 1"
 
 
+@pytest.mark.integration
+def test_many_to_many_association_table(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with a many to many object relationship with
+        x-secondary-table
+    WHEN schema is created and links are inserted
+    THEN the association table has a composite primary key, a reverse index and the
+        additional column and duplicate links are rejected.
+    """
+    # Defining specification
+    spec = {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "ref_table",
+                    "x-secondary": "association",
+                    "x-secondary-table": {
+                        "properties": {"position": {"type": "integer", "default": 0}}
+                    },
+                    "type": "object",
+                },
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_tables": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/RefTable"},
+                        },
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Table")
+    ref_model = model_factory(name="RefTable")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    inspector = sqlalchemy.inspect(engine)
+    assert inspector.get_pk_constraint("association")["constrained_columns"] == [
+        "table_id",
+        "ref_table_id",
+    ]
+    indexes = inspector.get_indexes("association")
+    assert [(index["name"], index["column_names"]) for index in indexes] == [
+        ("ix_association_ref_table_id", ["ref_table_id", "table_id"])
+    ]
+    # Creating links through the relationship
+    ref_model_instance = ref_model(id=11)
+    model_instance = model(id=12, ref_tables=[ref_model_instance])
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+    association = base.metadata.tables["association"]
+    assert session.execute(association.select()).fetchall() == [(12, 11, 0)]
+
+    # Inserting a duplicate link
+    with pytest.raises(exc.IntegrityError):
+        session.execute(association.insert().values(table_id=12, ref_table_id=11))
+
+
 @pytest.mark.parametrize(
     "spec",
     [
@@ -621,3 +818,95 @@ def test_multiple(engine, sessionmaker):
     assert queried_model.ref_table_second.id == 21
     assert queried_model.ref_table_first.name == "ref table name 1"
     assert queried_model.ref_table_second.name == "ref table name 2"
+
+
+def _lazy_spec(ref_table_schema):
+    """Construct a specification with a one to many relationship."""
+    return {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                    },
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                    **ref_table_schema,
+                },
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_tables": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/RefTable"},
+                        },
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+            }
+        }
+    }
+
+
+@pytest.mark.integration
+def test_lazy(engine, sessionmaker):
+    """
+    GIVEN specification with a one to many relationship with x-lazy and x-backref-lazy
+    WHEN schema is created, values inserted in both tables and queried
+    THEN the relationship and back reference are loaded with the loading strategies.
+    """
+    spec = _lazy_spec(
+        {"x-lazy": "selectin", "x-backref": "table", "x-backref-lazy": "raise"}
+    )
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Table")
+    ref_model = model_factory(name="RefTable")
+
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(model(id=11, ref_tables=[ref_model(id=21, name="ref table 1")]))
+    session.flush()
+    session.expunge_all()
+
+    queried_model = session.query(model).first()
+    assert "ref_tables" not in sqlalchemy.inspect(queried_model).unloaded
+    session.expunge_all()
+    queried_ref_model = session.query(ref_model).first()
+    with pytest.raises(exc.InvalidRequestError):
+        getattr(queried_ref_model, "table")
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_raise_mode")
+def test_lazy_raise_mode(engine, sessionmaker):
+    """
+    GIVEN raise mode and specification with a one to many relationship
+    WHEN schema is created, values inserted, queried and converted to a dictionary
+    THEN the implicit lazy load raises an error unless the relationship is eager.
+    """
+    spec = _lazy_spec({})
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Table")
+    ref_model = model_factory(name="RefTable")
+
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(model(id=11, ref_tables=[ref_model(id=21, name="ref table 1")]))
+    session.flush()
+    session.expunge_all()
+
+    queried_model = session.query(model).first()
+    with pytest.raises(exc.InvalidRequestError):
+        queried_model.to_dict()
+    session.expunge_all()
+    queried_model = (
+        session.query(model).options(sqlalchemy.orm.selectinload("ref_tables")).first()
+    )
+    assert queried_model.to_dict() == {
+        "id": 11,
+        "ref_tables": [{"id": 21, "name": "ref table 1"}],
+    }
@@ -375,3 +375,119 @@ def test_default(engine, sessionmaker):
     queried_model = session.query(model).first()
     assert queried_model.id == 1
     assert queried_model.name == "name 1"
+
+
+@pytest.mark.integration
+def test_deferred(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with deferred columns in a group
+    WHEN schema is created, values inserted and queried
+    THEN the deferred columns are loaded together when accessed and to_dict only
+        includes them once loaded or when requested.
+    """
+    # Defining specification
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "body": {"type": "string", "x-deferred": "document"},
+                        "data": {
+                            "type": "object",
+                            "x-json": True,
+                            "x-deferred": "document",
+                        },
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating instance of model
+    model_instance = model(id=1, name="name 1", body="body 1", data={"key": "value"})
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+    session.expunge_all()
+
+    # Querying session
+    queried_model = session.query(model).first()
+    unloaded = sqlalchemy.inspect(queried_model).unloaded
+    assert {"body", "data"} <= unloaded
+    assert queried_model.to_dict() == {"id": 1, "name": "name 1"}
+    assert queried_model.to_dict(load_deferred=True) == {
+        "id": 1,
+        "name": "name 1",
+        "body": "body 1",
+        "data": {"key": "value"},
+    }
+
+    # Accessing a deferred column loads the group
+    session.expunge_all()
+    queried_model = session.query(model).first()
+    assert queried_model.body == "body 1"
+    assert "data" not in sqlalchemy.inspect(queried_model).unloaded
+    assert queried_model.to_dict()["data"] == {"key": "value"}
+
+
+@pytest.mark.integration
+def test_server_default_computed(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with a server default and a computed column
+    WHEN schema is created and values inserted without the generated values
+    THEN the values generated by the database are available after flush and computed
+        columns cannot be passed to from_dict.
+    """
+    # Defining specification
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "status": {"type": "string", "x-server-default": "'draft'"},
+                        "amount": {"type": "integer"},
+                        "double_amount": {
+                            "type": "integer",
+                            "x-computed": "amount * 2",
+                        },
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating instance of model
+    model_instance = model.from_dict(id=1, amount=2)
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+
+    assert model_instance.status == "draft"
+    assert model_instance.double_amount == 4
+    assert model_instance.to_dict() == {
+        "id": 1,
+        "status": "draft",
+        "amount": 2,
+        "double_amount": 4,
+    }
+    with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError):
+        model.from_dict(id=2, amount=2, double_amount=4)
@@ -1,11 +1,13 @@
 """Integration tests for initialization."""
 
+import copy
 import json
 import sys
 from unittest import mock
 
 import pytest
 import yaml
+from sqlalchemy.ext import declarative
 
 import open_alchemy
 from open_alchemy import facades
@@ -31,6 +33,7 @@ def test_init_optional_base_none_call(
         define_all=True,
         models_filename=None,
         spec_path=None,
+        index_foreign_keys=False,
     )
 
 
@@ -65,7 +68,12 @@ def test_init_optional_base_def_call(mocked_init_model_factory: mock.MagicMock):
     open_alchemy._init_optional_base(base=base, spec=spec, define_all=True)
 
     mocked_init_model_factory.assert_called_once_with(
-        base=base, spec=spec, define_all=True, models_filename=None, spec_path=None
+        base=base,
+        spec=spec,
+        define_all=True,
+        models_filename=None,
+        spec_path=None,
+        index_foreign_keys=False,
     )
 
 
@@ -174,6 +182,66 @@ def test_schema():
     assert isinstance(model.column.type, facades.sqlalchemy.column.Integer)
 
 
+def _backref_schema(name, backref):
+    """Construct the schema of a model with a back reference to RefTable."""
+    return {
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "ref_table": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/RefTable"},
+                    {"x-backref": backref},
+                ]
+            },
+        },
+        "x-tablename": name,
+        "type": "object",
+    }
+
+
+@pytest.mark.integration
+def test_backrefs_model_not_defined():
+    """
+    GIVEN specification with schemas with back references to a schema
+    WHEN the models with the back references are defined before the referenced model
+    THEN the back references are recorded on the schema of the referenced model and the
+        specification is not modified.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                },
+                "Table1": _backref_schema("table1", "tables1"),
+                "Table2": _backref_schema("table2", "tables2"),
+            }
+        }
+    }
+    expected_spec = copy.deepcopy(spec)
+    model_factory = open_alchemy.init_model_factory(
+        base=declarative.declarative_base(), spec=spec
+    )
+
+    model_factory(name="Table1")
+    model_factory(name="Table2")
+    ref_model = model_factory(name="RefTable")
+
+    assert ref_model._schema["x-backrefs"] == {  # pylint: disable=protected-access
+        "tables1": {
+            "type": "array",
+            "items": {"type": "object", "x-de-$ref": "Table1"},
+        },
+        "tables2": {
+            "type": "array",
+            "items": {"type": "object", "x-de-$ref": "Table2"},
+        },
+    }
+    assert spec == expected_spec
+
+
 BASIC_SPEC = {
     "components": {
         "schemas": {
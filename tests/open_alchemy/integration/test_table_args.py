@@ -75,6 +75,20 @@ import open_alchemy
                 'INDEX ix_table_column ON "table" ("column")',
             ],
         ),
+        (
+            {
+                "x-composite-index": {
+                    "name": "ix_partial",
+                    "expressions": ["column", {"expression": "id DESC"}],
+                    "where": '"column" IS NOT NULL',
+                }
+            },
+            "SELECT sql FROM sqlite_master WHERE type='index'",
+            [
+                'INDEX ix_partial ON "table" ("column", id DESC) '
+                'WHERE "column" IS NOT NULL'
+            ],
+        ),
     ],
     ids=[
         "unique array",
@@ -88,6 +102,7 @@ import open_alchemy
         "index object name",
         "index object unique",
         "index multiple object",
+        "index object partial expression",
     ],
 )
 @pytest.mark.integration
@@ -127,3 +142,47 @@ def test_table_args_unique(engine, schema_additions, sql, expected_contents):
     results = "\n".join(results_list)
     for expected_content in expected_contents:
         assert expected_content in results
+
+
+@pytest.mark.integration
+def test_table_args_column_index(engine):
+    """
+    GIVEN schema with a property that defines x-index as an object
+    WHEN models are constructed
+    THEN the column has an index with the options.
+    """
+    # Defining schema
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "column": {"$ref": "#/components/schemas/Column"},
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+                "Column": {
+                    "type": "integer",
+                    "x-index": {"unique": True, "where": '"column" > 0'},
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Query schema
+    results = "\n".join(
+        str(result)
+        for result in engine.execute("SELECT sql FROM sqlite_master WHERE type='index'")
+    )
+    assert 'UNIQUE INDEX ix_table_column ON "table" ("column") WHERE "column" > 0' in (
+        results
+    )
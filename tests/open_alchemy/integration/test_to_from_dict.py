@@ -4,6 +4,8 @@ import pytest
 from sqlalchemy.ext import declarative
 
 import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import metrics
 
 
 @pytest.mark.parametrize(
@@ -587,3 +589,141 @@ def test_inheritance(engine, sessionmaker):
     assert queried_employee.to_dict() == employee_dict
     queried_manager = session.query(manager).first()
     assert queried_manager.to_dict() == manager_dict
+
+
+def _joined_child_schema(*, parent: str, tablename: str, property_name: str):
+    """Construct the schema of a model with joined inheritance from the parent."""
+    return {
+        "allOf": [
+            {
+                "x-tablename": tablename,
+                "x-inherits": parent,
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-foreign-key": f"{parent.lower()}.id",
+                    },
+                    property_name: {"type": "string"},
+                },
+                "x-kwargs": {"__mapper_args__": {"polymorphic_identity": tablename}},
+            },
+            {"$ref": f"#/components/schemas/{parent}"},
+        ]
+    }
+
+
+@pytest.mark.integration
+def test_inheritance_multiple_levels(engine, sessionmaker):
+    """
+    GIVEN specification with a four level joined inheritance hierarchy
+    WHEN the model at the bottom is constructed using from_dict
+    THEN when to_dict is called the construction dictionary is returned with the
+        properties of the root model first.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "type": {"type": "string"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": _joined_child_schema(
+                    parent="Employee", tablename="manager", property_name="team"
+                ),
+                "Director": _joined_child_schema(
+                    parent="Manager", tablename="director", property_name="division"
+                ),
+                "Executive": _joined_child_schema(
+                    parent="Director", tablename="executive", property_name="board"
+                ),
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    for name in ["Employee", "Manager", "Director"]:
+        model_factory(name=name)
+    executive = model_factory(name="Executive")
+    base.metadata.create_all(engine)
+
+    executive_dict = {
+        "id": 1,
+        "name": "employee 1",
+        "type": "executive",
+        "team": "team 1",
+        "division": "division 1",
+        "board": "board 1",
+    }
+    session = sessionmaker()
+    session.add(executive.from_dict(**executive_dict))
+    session.flush()
+
+    queried_executive = session.query(executive).first()
+    returned_dict = queried_executive.to_dict()
+    assert returned_dict == executive_dict
+    assert list(returned_dict) == list(executive_dict)
+
+
+@pytest.mark.integration
+def test_metrics():
+    """
+    GIVEN specification with a schema and a memory metrics collector
+    WHEN the conversion functions are called, one with an invalid dictionary
+    THEN the calls are recorded per model and function.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    collector = metrics.MemoryCollector()
+    metrics.set_collector(collector)
+
+    try:
+        instance = model.from_str('{"id": 1, "name": "name 1"}')
+        instance.to_dict()
+        instance.to_str()
+        with pytest.raises(exceptions.MalformedModelDictionaryError):
+            model.from_dict(id="invalid")
+    finally:
+        metrics.set_collector(None)
+
+    summary = collector.summary()
+    assert {key: value.calls for key, value in summary.items()} == {
+        ("Table", "from_str"): 1,
+        ("Table", "from_dict"): 2,
+        ("Table", "construct_from_dict_init"): 2,
+        ("Table", "to_dict"): 1,
+        ("Table", "to_str"): 1,
+    }
+    assert summary[("Table", "from_dict")].failures == 1
+    assert summary[("Table", "construct_from_dict_init")].failures == 1
+    assert summary[("Table", "from_str")].mean_size == 27
+    assert summary[("Table", "to_dict")].mean_size == 2
@@ -0,0 +1,50 @@
+"""Tests for recording the progress of a load."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.loader import checkpoint
+
+
+@pytest.mark.utility_base
+def test_read_missing(tmp_path):
+    """
+    GIVEN checkpoint file that does not exist
+    WHEN read is called
+    THEN 0 is returned.
+    """
+    filename = str(tmp_path / "checkpoint.json")
+
+    assert checkpoint.read(filename=filename, source="data.ndjson") == 0
+    assert checkpoint.read(filename=None, source="data.ndjson") == 0
+
+
+@pytest.mark.utility_base
+def test_write_read(tmp_path):
+    """
+    GIVEN checkpoint that has been written
+    WHEN read is called for the same source
+    THEN the number of rows that was written is returned.
+    """
+    filename = str(tmp_path / "checkpoint.json")
+    source = str(tmp_path / "data.ndjson")
+
+    checkpoint.write(filename=filename, source=source, rows=10)
+    checkpoint.write(filename=filename, source=source, rows=20)
+
+    assert checkpoint.read(filename=filename, source=source) == 20
+    assert not (tmp_path / "checkpoint.json.tmp").exists()
+
+
+@pytest.mark.utility_base
+def test_read_different_source(tmp_path):
+    """
+    GIVEN checkpoint that has been written for a source
+    WHEN read is called for a different source
+    THEN InvalidArgumentError is raised.
+    """
+    filename = str(tmp_path / "checkpoint.json")
+    checkpoint.write(filename=filename, source=str(tmp_path / "data 1.ndjson"), rows=1)
+
+    with pytest.raises(exceptions.InvalidArgumentError):
+        checkpoint.read(filename=filename, source=str(tmp_path / "data 2.ndjson"))
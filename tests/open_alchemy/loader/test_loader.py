@@ -0,0 +1,221 @@
+"""Tests for streaming files into the table of a model."""
+
+# pylint: disable=redefined-outer-name
+
+import datetime
+import json
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import loader
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create an engine for a file backed database shared across connections."""
+    return sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'database.sqlite'}")
+
+
+@pytest.fixture
+def model(engine):
+    """Construct the model and create the table."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "active": {"type": "boolean"},
+                        "joined": {"type": "string", "format": "date"},
+                    },
+                    "required": ["id", "name"],
+                    "x-tablename": "employee",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    returned_model = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    return returned_model
+
+
+def _write_ndjson(path, count):
+    """Write an NDJSON file with count employees."""
+    with open(path, "w") as out_file:
+        for id_ in range(count):
+            row = {"id": id_, "name": f"name {id_}", "joined": "2000-01-01"}
+            out_file.write(json.dumps(row) + "\n")
+    return str(path)
+
+
+def _query(engine):
+    """Query the ids of the employees."""
+    return [row[0] for row in engine.execute("SELECT id FROM employee ORDER BY id")]
+
+
+@pytest.mark.parametrize("processes", [None, 2], ids=["in process", "process pool"])
+@pytest.mark.integration
+def test_load_ndjson(tmp_path, engine, model, processes):
+    """
+    GIVEN NDJSON file
+    WHEN load is called with a batch size and commit interval smaller than the file
+    THEN all rows are inserted and progress is reported after each commit.
+    """
+    filename = _write_ndjson(tmp_path / "data.ndjson", 25)
+    reports = []
+
+    progress = loader.load(
+        model=model,
+        filename=filename,
+        bind=engine,
+        batch_size=4,
+        commit_interval=10,
+        processes=processes,
+        progress=lambda value: reports.append(value.rows_written),
+    )
+
+    assert progress.rows_written == 25
+    assert reports == [12, 24, 25]
+    assert _query(engine) == list(range(25))
+
+
+@pytest.mark.integration
+def test_load_csv(tmp_path, engine, model, sessionmaker):
+    """
+    GIVEN CSV file
+    WHEN load is called with the file and a session
+    THEN the values are converted to the types of the properties.
+    """
+    path = tmp_path / "data.csv"
+    path.write_text("id,name,active,joined\n1,name 1,true,2000-01-01\n2,name 2,,\n")
+    session = sessionmaker()
+
+    loader.load(model=model, filename=str(path), bind=session)
+
+    queried = session.query(model).order_by(model.id).all()
+    assert [(row.id, row.name, row.active, row.joined) for row in queried] == [
+        (1, "name 1", True, datetime.date(2000, 1, 1)),
+        (2, "name 2", None, None),
+    ]
+
+
+@pytest.mark.integration
+def test_load_clears_cache(tmp_path, engine, sessionmaker):
+    """
+    GIVEN model with x-cache and a cached row in the database
+    WHEN load is called with a session
+    THEN the cache of the model is cleared when the rows are committed.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "joined": {"type": "string", "format": "date"},
+                    },
+                    "x-tablename": "employee",
+                    "x-cache": True,
+                    "type": "object",
+                }
+            }
+        }
+    }
+    base = declarative.declarative_base()
+    cached_model = open_alchemy.init_model_factory(spec=spec, base=base)(
+        name="Employee"
+    )
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(cached_model(id=100, name="name 100"))
+    session.commit()
+    cached_model.get_cached(100, session=session)
+    filename = _write_ndjson(tmp_path / "data.ndjson", 2)
+
+    loader.load(model=cached_model, filename=filename, bind=session)
+
+    cached_model.get_cached(100, session=session)
+    assert cached_model.cache_stats().misses == 2
+
+
+@pytest.mark.integration
+def test_load_invalid_row(tmp_path, engine, model):
+    """
+    GIVEN NDJSON file with an invalid row after the first commit
+    WHEN load is called with a checkpoint file
+    THEN MalformedModelDictionaryError is raised with the row number and rows before
+        the failing commit are kept.
+    """
+    filename = _write_ndjson(tmp_path / "data.ndjson", 10)
+    with open(filename, "a") as out_file:
+        out_file.write(json.dumps({"id": 10}) + "\n")
+    checkpoint_filename = str(tmp_path / "checkpoint.json")
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc:
+        loader.load(
+            model=model,
+            filename=filename,
+            bind=engine,
+            batch_size=2,
+            commit_interval=4,
+            checkpoint_filename=checkpoint_filename,
+        )
+
+    assert exc.value.row_number == 11
+    assert _query(engine) == list(range(8))
+    assert loader.checkpoint.read(filename=checkpoint_filename, source=filename) == 8
+
+
+@pytest.mark.integration
+def test_load_resume(tmp_path, engine, model):
+    """
+    GIVEN checkpoint recording that some rows were committed
+    WHEN load is called with the checkpoint file
+    THEN only the remaining rows are inserted.
+    """
+    filename = _write_ndjson(tmp_path / "data.ndjson", 10)
+    checkpoint_filename = str(tmp_path / "checkpoint.json")
+    loader.load(
+        model=model,
+        filename=_write_ndjson(tmp_path / "partial.ndjson", 6),
+        bind=engine,
+    )
+    loader.checkpoint.write(filename=checkpoint_filename, source=filename, rows=6)
+
+    progress = loader.load(
+        model=model,
+        filename=filename,
+        bind=engine,
+        checkpoint_filename=checkpoint_filename,
+    )
+
+    assert (progress.rows_skipped, progress.rows_written) == (6, 4)
+    assert _query(engine) == list(range(10))
+    assert loader.checkpoint.read(filename=checkpoint_filename, source=filename) == 10
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"commit_interval": 0}, {"batch_size": 0}, {"processes": 0}],
+    ids=["commit interval", "batch size", "processes"],
+)
+@pytest.mark.integration
+def test_load_invalid_argument(tmp_path, engine, model, kwargs):
+    """
+    GIVEN invalid argument
+    WHEN load is called with the argument
+    THEN InvalidArgumentError is raised.
+    """
+    filename = _write_ndjson(tmp_path / "data.ndjson", 1)
+
+    with pytest.raises(exceptions.InvalidArgumentError):
+        loader.load(model=model, filename=filename, bind=engine, **kwargs)
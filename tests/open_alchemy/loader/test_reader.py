@@ -0,0 +1,158 @@
+"""Tests for reading rows from NDJSON and CSV files."""
+
+import io
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.loader import reader
+
+
+@pytest.mark.parametrize(
+    "filename, expected_format",
+    [
+        ("file.ndjson", "ndjson"),
+        ("file.jsonl", "ndjson"),
+        ("file.csv", "csv"),
+        ("FILE.CSV", "csv"),
+    ],
+    ids=["ndjson", "jsonl", "csv", "upper case"],
+)
+@pytest.mark.utility_base
+def test_format_from_filename(filename, expected_format):
+    """
+    GIVEN filename
+    WHEN format_from_filename is called with the filename
+    THEN the expected format is returned.
+    """
+    returned_format = reader.format_from_filename(filename)
+
+    assert returned_format == expected_format
+
+
+@pytest.mark.utility_base
+def test_format_from_filename_unknown():
+    """
+    GIVEN filename with an unknown extension
+    WHEN format_from_filename is called with the filename
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        reader.format_from_filename("file.txt")
+
+
+@pytest.mark.utility_base
+def test_read_ndjson():
+    """
+    GIVEN NDJSON file with a blank line
+    WHEN read is called with the file
+    THEN the document on each non-blank line is returned.
+    """
+    in_file = io.StringIO('{"id": 1}\n\n{"id": 2}\n')
+
+    rows = list(reader.read(in_file=in_file, format_="ndjson"))
+
+    assert rows == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.utility_base
+def test_read_ndjson_invalid():
+    """
+    GIVEN NDJSON file with a line that is not valid JSON
+    WHEN read is called with the file
+    THEN MalformedModelDictionaryError is raised with the line number.
+    """
+    in_file = io.StringIO('{"id": 1}\n{"id": \n')
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc:
+        list(reader.read(in_file=in_file, format_="ndjson"))
+
+    assert exc.value.line_number == 2
+
+
+@pytest.mark.utility_base
+def test_read_csv():
+    """
+    GIVEN CSV file with a header row
+    WHEN read is called with the file
+    THEN each row keyed by the header is returned.
+    """
+    in_file = io.StringIO("id,name\n1,name 1\n2,name 2\n")
+
+    rows = list(reader.read(in_file=in_file, format_="csv"))
+
+    assert rows == [{"id": "1", "name": "name 1"}, {"id": "2", "name": "name 2"}]
+
+
+@pytest.mark.utility_base
+def test_read_unsupported():
+    """
+    GIVEN unsupported format
+    WHEN read is called with the format
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        reader.read(in_file=io.StringIO(""), format_="xml")
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected_value",
+    [
+        ({"type": "integer"}, "1", 1),
+        ({"type": "number"}, "1.5", 1.5),
+        ({"type": "boolean"}, "true", True),
+        ({"type": "boolean"}, "No", False),
+        ({"type": "string"}, "value 1", "value 1"),
+        ({"type": "string", "format": "date"}, "2000-01-01", "2000-01-01"),
+        ({"type": "object", "x-json": True}, '{"key": 1}', {"key": 1}),
+    ],
+    ids=[
+        "integer",
+        "number",
+        "boolean true",
+        "boolean false",
+        "string",
+        "date",
+        "json",
+    ],
+)
+@pytest.mark.utility_base
+def test_coerce_csv(schema, value, expected_value):
+    """
+    GIVEN property schema and CSV value
+    WHEN coerce_csv is called with a row with the value
+    THEN the value is converted to the type of the property.
+    """
+    coerced = reader.coerce_csv({"key": value}, properties={"key": schema})
+
+    assert coerced == {"key": expected_value}
+
+
+@pytest.mark.utility_base
+def test_coerce_csv_missing():
+    """
+    GIVEN CSV row with an empty value and a value that is not a property
+    WHEN coerce_csv is called with the row
+    THEN the empty value is removed and the other value is left as a string.
+    """
+    coerced = reader.coerce_csv(
+        {"key": "", "other": "1"}, properties={"key": {"type": "integer"}}
+    )
+
+    assert coerced == {"other": "1"}
+
+
+@pytest.mark.parametrize(
+    "schema, value",
+    [({"type": "integer"}, "a"), ({"type": "boolean"}, "maybe")],
+    ids=["integer", "boolean"],
+)
+@pytest.mark.utility_base
+def test_coerce_csv_invalid(schema, value):
+    """
+    GIVEN property schema and CSV value that cannot be converted
+    WHEN coerce_csv is called with a row with the value
+    THEN MalformedModelDictionaryError is raised.
+    """
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        reader.coerce_csv({"key": value}, properties={"key": schema})
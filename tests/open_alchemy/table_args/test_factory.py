@@ -3,6 +3,8 @@
 import functools
 
 import pytest
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
 
 from open_alchemy import exceptions
 from open_alchemy.table_args import factory
@@ -19,6 +21,17 @@ from open_alchemy.table_args import factory
         ({"expressions": ["column 1"], "unique": True}, "Index"),
         ({"name": "name 1", "expressions": ["column 1"]}, "Index"),
         ({"name": "name 1", "expressions": ["column 1"], "unique": True}, "Index"),
+        (
+            {
+                "expressions": ["column 1", {"expression": "lower(column 2)"}],
+                "where": "column 1 > 0",
+                "include": ["column 3"],
+                "using": "gin",
+                "ops": {"column 1": "jsonb_path_ops"},
+                "kwargs": {"postgresql_concurrently": True},
+            },
+            "Index",
+        ),
         ([{"name": "name 1", "expressions": ["column 1"]}], "IndexList"),
     ],
     ids=[
@@ -30,6 +43,7 @@ from open_alchemy.table_args import factory
         "Index no name",
         "Index no unique",
         "Index",
+        "Index options",
         "IndexList",
     ],
 )
@@ -84,6 +98,67 @@ def test_spec_to_name_schemas(schema_names, spec, raises):
         test_func()
 
 
+@pytest.mark.parametrize(
+    "spec, expected_names",
+    [
+        pytest.param(["column 1"], ("ColumnList",), id="ColumnList"),
+        pytest.param([["column 1"]], ("ColumnListList",), id="ColumnListList"),
+        pytest.param({"columns": ["column 1"]}, ("Unique",), id="Unique"),
+        pytest.param([{"columns": ["column 1"]}], ("UniqueList",), id="UniqueList"),
+        pytest.param({"expressions": ["column 1"]}, ("Index",), id="Index"),
+        pytest.param([{"expressions": ["column 1"]}], ("IndexList",), id="IndexList"),
+        pytest.param(
+            {"columns": ["column 1"], "expressions": ["column 1"]},
+            ("Unique", "Index"),
+            id="Unique and Index",
+        ),
+        pytest.param([], (), id="empty list"),
+        pytest.param({}, (), id="empty object"),
+        pytest.param([1], (), id="list of integer"),
+        pytest.param("column 1", (), id="string"),
+    ],
+)
+@pytest.mark.table_args
+def test_candidate_schema_names(spec, expected_names):
+    """
+    GIVEN spec and expected names
+    WHEN _candidate_schema_names is called with the spec
+    THEN the expected names are returned.
+    """
+    # pylint: disable=protected-access
+    returned_names = factory._candidate_schema_names(spec)
+
+    assert returned_names == expected_names
+
+
+@pytest.mark.parametrize(
+    "spec, expected_message",
+    [
+        pytest.param([], "Expected one of ColumnList", id="empty"),
+        pytest.param(
+            {"columns": ["column 1", 1]}, "Invalid Unique['columns'][1]", id="Unique"
+        ),
+        pytest.param(
+            [["column 1"], []], "Invalid ColumnListList[1]", id="ColumnListList"
+        ),
+    ],
+)
+@pytest.mark.table_args
+def test_spec_to_schema_name_message(spec, expected_message):
+    """
+    GIVEN malformed spec
+    WHEN _spec_to_schema_name is called with the spec and the unique schema names
+    THEN SchemaNotFoundError is raised with a message that locates the problem.
+    """
+    # pylint: disable=protected-access
+    with pytest.raises(exceptions.SchemaNotFoundError) as exc_info:
+        factory._spec_to_schema_name(
+            spec=spec, schema_names=factory._UNIQUE_SCHEMA_NAMES
+        )
+
+    assert expected_message in str(exc_info.value)
+
+
 @pytest.mark.parametrize(
     "spec, expected_spec",
     [
@@ -272,3 +347,107 @@ def test_index_factory():
 
     assert index_1.expressions == ["column 1"]
     assert index_2.expressions == ["column 2"]
+
+
+def _compile_index(index):
+    """Attach the index to a table and compile its DDL for PostgreSQL."""
+    sqlalchemy.Table(
+        "table",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("id", sqlalchemy.Integer),
+        sqlalchemy.Column("name", sqlalchemy.String),
+        sqlalchemy.Column("data", postgresql.JSONB),
+        sqlalchemy.Column("deleted_at", sqlalchemy.DateTime),
+        index,
+    )
+    return str(
+        sqlalchemy.schema.CreateIndex(index).compile(dialect=postgresql.dialect())
+    )
+
+
+@pytest.mark.parametrize(
+    "spec, expected_sql",
+    [
+        pytest.param(
+            {
+                "name": "ix_1",
+                "expressions": ["name"],
+                "where": "deleted_at IS NULL",
+            },
+            "CREATE INDEX ix_1 ON \"table\" (name) WHERE deleted_at IS NULL",
+            id="partial",
+        ),
+        pytest.param(
+            {"name": "ix_1", "expressions": ["name"], "include": ["id"]},
+            'CREATE INDEX ix_1 ON "table" (name) INCLUDE (id)',
+            id="covering",
+        ),
+        pytest.param(
+            {
+                "name": "ix_1",
+                "expressions": ["data"],
+                "using": "gin",
+                "ops": {"data": "jsonb_path_ops"},
+            },
+            'CREATE INDEX ix_1 ON "table" USING gin (data jsonb_path_ops)',
+            id="method and operator class",
+        ),
+        pytest.param(
+            {"name": "ix_1", "expressions": ["deleted_at"], "using": "brin"},
+            'CREATE INDEX ix_1 ON "table" USING brin (deleted_at)',
+            id="brin",
+        ),
+        pytest.param(
+            {
+                "name": "ix_1",
+                "expressions": [
+                    {"expression": "lower(name)"},
+                    {"expression": "id DESC"},
+                ],
+                "unique": True,
+            },
+            'CREATE UNIQUE INDEX ix_1 ON "table" (lower(name), id DESC)',
+            id="expression and descending",
+        ),
+        pytest.param(
+            {
+                "name": "ix_1",
+                "expressions": ["name"],
+                "kwargs": {"postgresql_concurrently": True},
+            },
+            'CREATE INDEX CONCURRENTLY ix_1 ON "table" (name)',
+            id="kwargs",
+        ),
+    ],
+)
+@pytest.mark.table_args
+def test_construct_index_postgresql(spec, expected_sql):
+    """
+    GIVEN spec with index options
+    WHEN _construct_index is called and the DDL of the index is compiled for PostgreSQL
+    THEN the expected SQL is returned.
+    """
+    assert (
+        factory._spec_to_schema_name(spec=spec)  # pylint: disable=protected-access
+        == "Index"
+    )
+
+    index = factory._construct_index(spec=spec)  # pylint: disable=protected-access
+
+    assert _compile_index(index) == expected_sql
+
+
+@pytest.mark.table_args
+def test_column_index_factory():
+    """
+    GIVEN column name and x-index specification
+    WHEN column_index_factory is called
+    THEN an index for the column with the options is returned.
+    """
+    spec = {"using": "hash"}
+
+    index = factory.column_index_factory(column_name="name", spec=spec)
+
+    assert _compile_index(index) == (
+        'CREATE INDEX ix_table_name ON "table" USING hash (name)'
+    )
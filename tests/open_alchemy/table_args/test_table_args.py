@@ -16,8 +16,28 @@ from open_alchemy import table_args
             {"x-composite-unique": ["column 1"], "x-composite-index": ["column 2"]},
             (sa_schema.UniqueConstraint, sa_schema.Index),
         ),
+        ({"properties": {"column 1": {"x-index": True}}}, tuple()),
+        (
+            {"properties": {"column 1": {"x-index": {"using": "gin"}}}},
+            (sa_schema.Index,),
+        ),
+        (
+            {
+                "x-composite-index": ["column 2"],
+                "properties": {"column 1": {"x-index": {"unique": True}}},
+            },
+            (sa_schema.Index, sa_schema.Index),
+        ),
+    ],
+    ids=[
+        "empty",
+        "x-composite-unique",
+        "x-composite-index",
+        "all",
+        "x-index boolean",
+        "x-index object",
+        "x-composite-index and x-index object",
     ],
-    ids=["empty", "x-composite-unique", "x-composite-index", "all"],
 )
 @pytest.mark.table_args
 def test_construct(schema, expected_args):
@@ -31,3 +51,22 @@ def test_construct(schema, expected_args):
     assert len(returned_args) == len(expected_args)
     for returned_arg, expected_arg in zip(returned_args, expected_args):
         assert isinstance(returned_arg, expected_arg)
+
+
+@pytest.mark.table_args
+def test_construct_column_index_ref():
+    """
+    GIVEN schema with a property that references a schema with x-index as an object
+    WHEN construct is called with the schema and schemas
+    THEN an index for the property with the options is returned.
+    """
+    schema = {"properties": {"column_1": {"$ref": "#/components/schemas/Column"}}}
+    schemas = {
+        "Column": {"type": "integer", "x-index": {"name": "ix_1", "unique": True}}
+    }
+
+    (index,) = table_args.construct(schema=schema, schemas=schemas)
+
+    assert index.name == "ix_1"
+    assert index.expressions == ["column_1"]
+    assert index.unique
@@ -0,0 +1,139 @@
+"""Tests for the caches of instances read by primary key."""
+
+import pytest
+
+from open_alchemy import cache
+
+
+class _Clock:
+    """Clock that only moves when it is advanced."""
+
+    def __init__(self):
+        """Construct."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Get the current time."""
+        return self.now
+
+
+@pytest.mark.utility_base
+def test_lru_backend_get_set_delete():
+    """
+    GIVEN LRU backend
+    WHEN values are set, read and deleted
+    THEN the cached values are returned until they are deleted.
+    """
+    backend = cache.LruBackend()
+
+    assert backend.get((1,)) is None
+    backend.set((1,), "value 1")
+    assert backend.get((1,)) == "value 1"
+    backend.delete((1,))
+    assert backend.get((1,)) is None
+    backend.delete((1,))
+
+
+@pytest.mark.utility_base
+def test_lru_backend_evict():
+    """
+    GIVEN LRU backend with a max size that is full
+    WHEN a value is read and then another value is set
+    THEN the least recently used value is evicted.
+    """
+    backend = cache.LruBackend(max_size=2)
+    backend.set((1,), "value 1")
+    backend.set((2,), "value 2")
+
+    backend.get((1,))
+    backend.set((3,), "value 3")
+
+    assert len(backend) == 2
+    assert backend.get((1,)) == "value 1"
+    assert backend.get((2,)) is None
+    assert backend.get((3,)) == "value 3"
+
+
+@pytest.mark.utility_base
+def test_lru_backend_expire():
+    """
+    GIVEN LRU backend with a ttl and a cached value
+    WHEN the value is read before and after the ttl has passed
+    THEN the value is returned before and None is returned after.
+    """
+    clock = _Clock()
+    backend = cache.LruBackend(ttl=10, clock=clock)
+    backend.set((1,), "value 1")
+
+    clock.now = 9.0
+    assert backend.get((1,)) == "value 1"
+    clock.now = 10.0
+    assert backend.get((1,)) is None
+    assert len(backend) == 0
+
+
+@pytest.mark.utility_base
+def test_lru_backend_clear():
+    """
+    GIVEN LRU backend with cached values
+    WHEN clear is called
+    THEN all values are removed.
+    """
+    backend = cache.LruBackend()
+    backend.set((1,), "value 1")
+    backend.set((2,), "value 2")
+
+    backend.clear()
+
+    assert len(backend) == 0
+
+
+@pytest.mark.utility_base
+def test_model_cache_stats():
+    """
+    GIVEN model cache
+    WHEN values are read that are and are not cached
+    THEN the hits and misses are counted.
+    """
+    model_cache = cache.ModelCache(backend=cache.LruBackend())
+    model_cache.set((1,), "value 1")
+
+    assert model_cache.get((1,)) == "value 1"
+    assert model_cache.get((2,)) is None
+    model_cache.invalidate((1,))
+    assert model_cache.get((1,)) is None
+
+    assert model_cache.stats() == cache.CacheStats(hits=1, misses=2)
+
+
+@pytest.mark.parametrize(
+    "value, expected_ttl, expected_max_size",
+    [
+        pytest.param(True, cache.DEFAULT_TTL, cache.DEFAULT_MAX_SIZE, id="enabled"),
+        pytest.param({"ttl": 10}, 10, cache.DEFAULT_MAX_SIZE, id="ttl"),
+        pytest.param({"max-size": 2}, cache.DEFAULT_TTL, 2, id="max-size"),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate(value, expected_ttl, expected_max_size):
+    """
+    GIVEN value of x-cache
+    WHEN calculate is called with the value
+    THEN a cache with the expected ttl and max size is returned.
+    """
+    # pylint: disable=protected-access
+    model_cache = cache.calculate(value)
+
+    assert model_cache is not None
+    assert model_cache.backend._ttl == expected_ttl
+    assert model_cache.backend._max_size == expected_max_size
+
+
+@pytest.mark.utility_base
+def test_calculate_disabled():
+    """
+    GIVEN x-cache that is false
+    WHEN calculate is called with the value
+    THEN None is returned.
+    """
+    assert cache.calculate(False) is None
@@ -0,0 +1,154 @@
+"""Tests for the command line interface."""
+
+import copy
+import json
+
+import pytest
+import sqlalchemy
+import yaml
+
+from open_alchemy import cli
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "test", "version": "0.1"},
+    "paths": {},
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            }
+        }
+    },
+}
+
+
+@pytest.mark.integration
+def test_load(tmp_path):
+    """
+    GIVEN specification and NDJSON file
+    WHEN the load command is run with --create-table
+    THEN the table is created and the rows are inserted.
+    """
+    spec_path = tmp_path / "spec.yml"
+    spec_path.write_text(yaml.dump(SPEC))
+    data_path = tmp_path / "data.ndjson"
+    data_path.write_text(
+        "\n".join(json.dumps({"id": id_, "name": f"name {id_}"}) for id_ in range(3))
+    )
+    url = f"sqlite:///{tmp_path / 'database.sqlite'}"
+
+    exit_code = cli.main(
+        [
+            "load",
+            str(spec_path),
+            "Employee",
+            str(data_path),
+            "--url",
+            url,
+            "--processes",
+            "1",
+            "--create-table",
+        ]
+    )
+
+    assert exit_code == 0
+    engine = sqlalchemy.create_engine(url)
+    assert list(engine.execute("SELECT id, name FROM employee ORDER BY id")) == [
+        (0, "name 0"),
+        (1, "name 1"),
+        (2, "name 2"),
+    ]
+
+
+@pytest.mark.integration
+def test_load_model_missing(tmp_path):
+    """
+    GIVEN specification
+    WHEN the load command is run for a model that is not in the specification
+    THEN a non-zero exit code is returned.
+    """
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(SPEC))
+
+    exit_code = cli.main(
+        ["load", str(spec_path), "Missing", "data.ndjson", "--url", "sqlite://"]
+    )
+
+    assert exit_code == 1
+
+
+def _write_specs(tmp_path, new_properties):
+    """Write the specification and a copy with other Employee properties."""
+    old_path = tmp_path / "old.yaml"
+    old_path.write_text(yaml.dump(SPEC))
+    new_spec = copy.deepcopy(SPEC)
+    new_spec["components"]["schemas"]["Employee"]["properties"].update(new_properties)
+    new_path = tmp_path / "new.json"
+    new_path.write_text(json.dumps(new_spec))
+    return str(old_path), str(new_path)
+
+
+@pytest.mark.integration
+def test_diff(tmp_path, capsys):
+    """
+    GIVEN YAML and JSON specifications where a property with an index is added
+    WHEN the diff command is run
+    THEN the migration plan is printed.
+    """
+    old_path, new_path = _write_specs(
+        tmp_path, {"salary": {"type": "number", "x-index": True}}
+    )
+
+    exit_code = cli.main(["diff", old_path, new_path])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == (
+        "-- 1. Add column employee.salary\n"
+        "ALTER TABLE employee ADD COLUMN salary FLOAT;\n"
+        "\n"
+        "-- 2. Create index ix_employee_salary on employee\n"
+        "-- Run outside of a transaction.\n"
+        "CREATE INDEX CONCURRENTLY ix_employee_salary ON employee (salary);\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "new_properties, expected_exit_code",
+    [
+        pytest.param({"salary": {"type": "number"}}, 0, id="not flagged"),
+        pytest.param({"name": {"type": "integer"}}, 2, id="flagged"),
+    ],
+)
+@pytest.mark.integration
+def test_diff_check(tmp_path, new_properties, expected_exit_code):
+    """
+    GIVEN specifications
+    WHEN the diff command is run with --check
+    THEN 2 is returned if any step rewrites, scans or drops data.
+    """
+    old_path, new_path = _write_specs(tmp_path, new_properties)
+
+    exit_code = cli.main(["diff", old_path, new_path, "--check"])
+
+    assert exit_code == expected_exit_code
+
+
+@pytest.mark.integration
+def test_diff_error(tmp_path, capsys):
+    """
+    GIVEN specifications with a property the dialect does not support
+    WHEN the diff command is run
+    THEN the error is printed and a non-zero exit code is returned.
+    """
+    old_path, new_path = _write_specs(tmp_path, {})
+
+    exit_code = cli.main(["diff", old_path, new_path, "--dialect", "mysql"])
+
+    assert exit_code == 1
+    assert "VARCHAR requires a length" in capsys.readouterr().err
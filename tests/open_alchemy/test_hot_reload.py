@@ -0,0 +1,86 @@
+"""Tests for reloading the models when the specification changes."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import hot_reload
+
+
+def _ref(name):
+    """Construct a reference to a schema."""
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        pytest.param({}, id="components missing"),
+        pytest.param({"components": {}}, id="schemas missing"),
+    ],
+)
+@pytest.mark.utility_base
+def test_get_schemas_invalid(spec):
+    """
+    GIVEN specification without schemas
+    WHEN get_schemas is called
+    THEN MalformedSpecificationError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSpecificationError):
+        hot_reload.get_schemas(spec=spec)
+
+
+@pytest.mark.utility_base
+def test_changed():
+    """
+    GIVEN previous and current schemas with added, removed, changed and kept schemas
+    WHEN changed is called
+    THEN the added, removed and changed names are returned.
+    """
+    old = {"Kept": {"type": "object"}, "Changed": {}, "Removed": {}}
+    new = {"Kept": {"type": "object"}, "Changed": {"type": "object"}, "Added": {}}
+
+    returned_names = hot_reload.changed(old=old, new=new)
+
+    assert returned_names == {"Changed", "Removed", "Added"}
+
+
+@pytest.mark.parametrize(
+    "old, new, expected_names",
+    [
+        pytest.param({"A": {}, "B": {}}, {"A": {}, "B": {}}, {"A"}, id="unrelated"),
+        pytest.param(
+            {"A": {"properties": {"b": _ref("B")}}, "B": {}},
+            {"A": {"properties": {"b": _ref("B")}}, "B": {}},
+            {"A", "B"},
+            id="reference",
+        ),
+        pytest.param(
+            {"A": {}, "B": {"properties": {"a": {"items": _ref("A")}}}},
+            {"A": {}, "B": {"properties": {"a": {"items": _ref("A")}}}},
+            {"A", "B"},
+            id="back reference",
+        ),
+        pytest.param(
+            {"A": {}, "B": {"allOf": [{"x-inherits": "A"}]}},
+            {"A": {}, "B": {"allOf": [{"x-inherits": "A"}]}},
+            {"A", "B"},
+            id="inherits",
+        ),
+        pytest.param(
+            {"A": {"properties": {"b": _ref("B")}}, "B": {}, "C": {}},
+            {"A": {}, "B": {"properties": {"c": _ref("C")}}, "C": {}},
+            {"A", "B", "C"},
+            id="previous and current",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_closure(old, new, expected_names):
+    """
+    GIVEN previous and current schemas
+    WHEN closure is called with a name
+    THEN the names of the schemas connected to it are returned.
+    """
+    returned_names = hot_reload.closure(names=["A"], old=old, new=new)
+
+    assert returned_names == expected_names
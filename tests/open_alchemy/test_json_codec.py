@@ -0,0 +1,90 @@
+"""Tests for the JSON codecs."""
+
+import datetime
+from unittest import mock
+
+import pytest
+
+from open_alchemy import json_codec
+
+
+def _codecs():
+    """Construct the available codecs."""
+    codecs = [pytest.param(json_codec.StdlibCodec(), id="stdlib")]
+    try:
+        codecs.append(pytest.param(json_codec.OrjsonCodec(), id="orjson"))
+    except ImportError:  # pragma: no cover
+        pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs())
+@pytest.mark.utility_base
+def test_dumps_loads(codec):
+    """
+    GIVEN codec and value with date, datetime and bytes values
+    WHEN dumps is called and the output is passed to loads
+    THEN the date, datetime and bytes values are returned as strings.
+    """
+    value = {
+        "date": datetime.date(2000, 1, 1),
+        "date_time": datetime.datetime(2000, 1, 1, 1, 1, 1, 1),
+        "date_time_tz": datetime.datetime(
+            2000, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+        ),
+        "binary": b"value 1",
+        "list": [1, 1.5, None, True],
+    }
+
+    returned_value = codec.loads(codec.dumps(value))
+
+    assert returned_value == {
+        "date": "2000-01-01",
+        "date_time": "2000-01-01T01:01:01.000001",
+        "date_time_tz": "2000-01-01T00:00:00+02:00",
+        "binary": "value 1",
+        "list": [1, 1.5, None, True],
+    }
+
+
+@pytest.mark.parametrize("codec", _codecs())
+@pytest.mark.utility_base
+def test_dumps_unsupported(codec):
+    """
+    GIVEN codec and value that is not JSON serializable
+    WHEN dumps is called with the value
+    THEN TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        codec.dumps({"key": object()})
+
+
+@pytest.mark.parametrize("codec", _codecs())
+@pytest.mark.utility_base
+def test_loads_invalid(codec):
+    """
+    GIVEN codec and string that is not valid JSON
+    WHEN loads is called with the string
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        codec.loads("{")
+
+
+@pytest.mark.utility_base
+def test_default():
+    """
+    GIVEN default codec that has been set and then reset
+    WHEN get_default is called
+    THEN the standard library codec, the set codec and then the standard library
+        codec are returned.
+    """
+    assert isinstance(json_codec.get_default(), json_codec.StdlibCodec)
+    codec = mock.MagicMock()
+    json_codec.set_default(codec)
+    try:
+        assert json_codec.get_default() is codec
+    finally:
+        json_codec.set_default(None)
+
+    assert isinstance(json_codec.get_default(), json_codec.StdlibCodec)
@@ -0,0 +1,51 @@
+"""Tests for the loading strategies of relationships."""
+
+import pytest
+
+from open_alchemy import loading
+
+
+@pytest.mark.parametrize(
+    "lazy, expected_lazy",
+    [
+        pytest.param(None, None, id="default"),
+        pytest.param("select", "select", id="select"),
+        pytest.param("joined", "joined", id="joined"),
+    ],
+)
+@pytest.mark.column
+def test_calculate_lazy(lazy, expected_lazy):
+    """
+    GIVEN lazy and raise mode is disabled
+    WHEN calculate_lazy is called with lazy
+    THEN the expected lazy is returned.
+    """
+    assert loading.get_raise_mode() is False
+
+    returned_lazy = loading.calculate_lazy(lazy)
+
+    assert returned_lazy == expected_lazy
+
+
+@pytest.mark.parametrize(
+    "lazy, expected_lazy",
+    [
+        pytest.param(None, "raise_on_sql", id="default"),
+        pytest.param("select", "raise_on_sql", id="select"),
+        pytest.param("joined", "joined", id="joined"),
+        pytest.param("raise", "raise", id="raise"),
+    ],
+)
+@pytest.mark.column
+@pytest.mark.usefixtures("_raise_mode")
+def test_calculate_lazy_raise_mode(lazy, expected_lazy):
+    """
+    GIVEN lazy and raise mode is enabled
+    WHEN calculate_lazy is called with lazy
+    THEN the expected lazy is returned.
+    """
+    assert loading.get_raise_mode() is True
+
+    returned_lazy = loading.calculate_lazy(lazy)
+
+    assert returned_lazy == expected_lazy
@@ -0,0 +1,194 @@
+"""Tests for the metrics of the conversion functions."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import metrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_collector():
+    """Remove the collector after each test."""
+    yield
+    metrics.set_collector(None)
+
+
+class _Model:
+    """Model with instrumented functions."""
+
+    @classmethod
+    @metrics.instrument("from_dict", output=False)
+    def from_dict(cls, **kwargs):
+        """Construct or raise if the value is invalid."""
+        if kwargs.get("id") == "invalid":
+            raise exceptions.MalformedModelDictionaryError("invalid")
+        return cls()
+
+    @metrics.instrument("to_str", output=True)
+    def to_str(self):
+        """Convert to a string."""
+        return '{"id": 1}'
+
+    @classmethod
+    @metrics.instrument("from_str", output=False)
+    def from_str(cls, value):
+        """Construct from a string using from_dict."""
+        return cls.from_dict(value=value)
+
+
+def _event(duration, *, model="Model", size=None, failed=False, weight=1):
+    """Construct an event."""
+    return metrics.Event(
+        model=model,
+        operation="to_dict",
+        duration=duration,
+        size=size,
+        failed=failed,
+        weight=weight,
+    )
+
+
+@pytest.mark.utility_base
+def test_memory_collector_summary():
+    """
+    GIVEN memory collector with events
+    WHEN summary is called
+    THEN the counts, total time, percentiles and mean size are returned.
+    """
+    collector = metrics.MemoryCollector()
+    for duration in range(1, 101):
+        collector.record(_event(float(duration), size=duration % 2 * 10))
+    collector.record(_event(1.0, model="Other", failed=True, weight=2))
+
+    summary = collector.summary()
+
+    assert summary[("Model", "to_dict")] == metrics.Summary(
+        calls=100,
+        failures=0,
+        total_time=5050.0,
+        p50=50.0,
+        p90=90.0,
+        p99=99.0,
+        mean_size=5.0,
+    )
+    assert summary[("Other", "to_dict")].calls == 2
+    assert summary[("Other", "to_dict")].failures == 2
+    assert summary[("Other", "to_dict")].mean_size is None
+
+
+@pytest.mark.utility_base
+def test_memory_collector_max_samples():
+    """
+    GIVEN memory collector with a maximum number of samples
+    WHEN more events are recorded and summary is called
+    THEN the percentiles are calculated from the most recent durations.
+    """
+    collector = metrics.MemoryCollector(max_samples=2)
+    for duration in (10.0, 1.0, 2.0):
+        collector.record(_event(duration))
+
+    summary = collector.summary()[("Model", "to_dict")]
+
+    assert summary.calls == 3
+    assert summary.p99 == 2.0
+
+
+@pytest.mark.utility_base
+def test_memory_collector_clear():
+    """
+    GIVEN memory collector with events
+    WHEN clear is called
+    THEN the summary is empty.
+    """
+    collector = metrics.MemoryCollector()
+    collector.record(_event(1.0))
+
+    collector.clear()
+
+    assert collector.summary() == {}
+
+
+@pytest.mark.utility_base
+def test_instrument():
+    """
+    GIVEN memory collector
+    WHEN instrumented functions are called, one of which fails
+    THEN an event is recorded for each call with the size of the payload.
+    """
+    collector = metrics.MemoryCollector()
+    metrics.set_collector(collector)
+
+    instance = _Model.from_dict(id=1, name="name 1")
+    instance.to_str()
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        _Model.from_dict(id="invalid")
+
+    summary = collector.summary()
+    assert summary[("_Model", "from_dict")].calls == 2
+    assert summary[("_Model", "from_dict")].failures == 1
+    assert summary[("_Model", "from_dict")].mean_size == 1.5
+    assert summary[("_Model", "to_str")].calls == 1
+    assert summary[("_Model", "to_str")].mean_size == 9
+
+
+@pytest.mark.utility_base
+def test_instrument_sampled(mocker):
+    """
+    GIVEN collector with a sample interval
+    WHEN an instrumented function is called multiple times
+    THEN only some calls are recorded with the interval as their weight.
+    """
+    collector = mocker.MagicMock()
+    metrics.set_collector(collector, sample_interval=3)
+
+    for _ in range(9):
+        _Model.from_dict(id=1)
+
+    assert collector.record.call_count == 3
+    assert collector.record.call_args[0][0].weight == 3
+
+
+@pytest.mark.utility_base
+def test_instrument_sampled_nested():
+    """
+    GIVEN collector with a sample interval
+    WHEN an instrumented function that calls another instrumented function is
+        called multiple times
+    THEN the calls of both functions are estimated from their own samples.
+    """
+    collector = metrics.MemoryCollector()
+    metrics.set_collector(collector, sample_interval=2)
+
+    for _ in range(100):
+        _Model.from_str('{"id": 1}')
+
+    summary = collector.summary()
+    assert summary[("_Model", "from_str")].calls == 100
+    assert summary[("_Model", "from_dict")].calls == 100
+
+
+@pytest.mark.utility_base
+def test_instrument_not_enabled(mocker):
+    """
+    GIVEN null collector
+    WHEN an instrumented function is called
+    THEN the collector is not called.
+    """
+    mock_record = mocker.patch.object(metrics.NullCollector, "record")
+    metrics.set_collector(metrics.NullCollector())
+
+    _Model.from_dict(id=1)
+
+    mock_record.assert_not_called()
+    assert isinstance(metrics.get_collector(), metrics.NullCollector)
+
+
+@pytest.mark.utility_base
+def test_set_collector_invalid_interval():
+    """
+    GIVEN sample interval less than 1
+    WHEN set_collector is called
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        metrics.set_collector(metrics.MemoryCollector(), sample_interval=0)
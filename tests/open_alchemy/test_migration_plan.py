@@ -0,0 +1,429 @@
+"""Tests for planning migrations between specifications."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import migration_plan
+from open_alchemy import models
+
+
+def _spec(properties=None, **kwargs):
+    """Construct a specification with an Employee schema."""
+    return {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        **(properties or {}),
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                    **kwargs,
+                }
+            }
+        }
+    }
+
+
+def _plan(old, new, dialect="postgresql"):
+    """Plan the migration between specifications."""
+    return migration_plan.plan(
+        old=migration_plan.build_metadata(spec=old),
+        new=migration_plan.build_metadata(spec=new),
+        dialect=dialect,
+    )
+
+
+@pytest.mark.integration
+def test_build_metadata():
+    """
+    GIVEN specification
+    WHEN build_metadata is called
+    THEN the tables are returned without adding the models to models.
+    """
+    spec = _spec()
+    spec["components"]["schemas"]["PlannedOnly"] = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "planned_only",
+        "type": "object",
+    }
+
+    metadata = migration_plan.build_metadata(spec=spec)
+
+    assert set(metadata.tables) == {"employee", "planned_only"}
+    assert not hasattr(models, "PlannedOnly")
+
+
+@pytest.mark.integration
+def test_plan_unchanged():
+    """
+    GIVEN the same specification twice
+    WHEN plan is called
+    THEN no operations are returned.
+    """
+    operations = _plan(_spec(), _spec())
+
+    assert operations == []
+    assert migration_plan.format_plan(operations=operations) == "-- No changes.\n"
+
+
+@pytest.mark.integration
+def test_plan_create_table():
+    """
+    GIVEN specification with a new schema with an index
+    WHEN plan is called
+    THEN the table and index are created in a transaction.
+    """
+    new = _spec()
+    new["components"]["schemas"]["Project"] = {
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "name": {"type": "string", "x-index": True},
+        },
+        "x-tablename": "project",
+        "type": "object",
+    }
+
+    operations = _plan(_spec(), new)
+
+    assert [operation.description for operation in operations] == [
+        "Create table project of Project",
+        "Create index ix_project_name on project",
+    ]
+    assert operations[0].statements[0].startswith("CREATE TABLE project (")
+    assert operations[1].statements == (
+        "CREATE INDEX ix_project_name ON project (name)",
+    )
+    assert all(operation.transactional for operation in operations)
+    assert all(operation.warning is None for operation in operations)
+
+
+@pytest.mark.integration
+def test_plan_association_table():
+    """
+    GIVEN specification with a new many to many relationship
+    WHEN plan is called
+    THEN the association table is created after the table it references.
+    """
+    project = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "project",
+        "type": "object",
+    }
+    old = _spec()
+    old["components"]["schemas"]["Project"] = project
+    new = _spec(
+        {
+            "projects": {
+                "type": "array",
+                "items": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Project"},
+                        {"x-secondary": "employee_project"},
+                    ]
+                },
+            }
+        }
+    )
+    new["components"]["schemas"]["Project"] = project
+
+    operations = _plan(old, new)
+
+    assert operations[0].description == "Create association table employee_project"
+    assert "REFERENCES project (id)" in operations[0].statements[0]
+
+
+@pytest.mark.integration
+def test_plan_add_column_index():
+    """
+    GIVEN specification with a new property with an index
+    WHEN plan is called
+    THEN the column is added and the index is created concurrently.
+    """
+    operations = _plan(_spec(), _spec({"name": {"type": "string", "x-index": True}}))
+
+    assert [operation.statements for operation in operations] == [
+        ("ALTER TABLE employee ADD COLUMN name VARCHAR",),
+        ("CREATE INDEX CONCURRENTLY ix_employee_name ON employee (name)",),
+    ]
+    assert operations[0].transactional
+    assert not operations[1].transactional
+
+
+@pytest.mark.integration
+def test_plan_add_column_not_nullable():
+    """
+    GIVEN specification with a new property that is not nullable
+    WHEN plan is called
+    THEN the operation is flagged.
+    """
+    operations = _plan(_spec(), _spec({"name": {"type": "string", "nullable": False}}))
+
+    assert operations[0].statements == (
+        "ALTER TABLE employee ADD COLUMN name VARCHAR NOT NULL",
+    )
+    assert "fails if the table has rows" in operations[0].warning
+
+
+@pytest.mark.parametrize(
+    "old_property, new_property, expected_statements, expected_warning",
+    [
+        pytest.param(
+            {"type": "string", "maxLength": 20},
+            {"type": "string", "maxLength": 40},
+            ("ALTER TABLE employee ALTER COLUMN name TYPE VARCHAR(40)",),
+            None,
+            id="longer string",
+        ),
+        pytest.param(
+            {"type": "string", "maxLength": 20},
+            {"type": "string"},
+            ("ALTER TABLE employee ALTER COLUMN name TYPE VARCHAR",),
+            None,
+            id="string without maximum length",
+        ),
+        pytest.param(
+            {"type": "string", "maxLength": 40},
+            {"type": "string", "maxLength": 20},
+            ("ALTER TABLE employee ALTER COLUMN name TYPE VARCHAR(20)",),
+            "rewrites the table to convert the values",
+            id="shorter string",
+        ),
+        pytest.param(
+            {"type": "integer"},
+            {"type": "string"},
+            ("ALTER TABLE employee ALTER COLUMN name TYPE VARCHAR",),
+            "rewrites the table to convert the values",
+            id="different type",
+        ),
+        pytest.param(
+            {"type": "string"},
+            {"type": "string", "nullable": False},
+            ("ALTER TABLE employee ALTER COLUMN name SET NOT NULL",),
+            "scans the table and fails if any value is NULL",
+            id="not nullable",
+        ),
+        pytest.param(
+            {"type": "string", "nullable": False},
+            {"type": "string"},
+            ("ALTER TABLE employee ALTER COLUMN name DROP NOT NULL",),
+            None,
+            id="nullable",
+        ),
+        pytest.param(
+            {"type": "integer"},
+            {"type": "string", "nullable": False},
+            (
+                "ALTER TABLE employee ALTER COLUMN name TYPE VARCHAR",
+                "ALTER TABLE employee ALTER COLUMN name SET NOT NULL",
+            ),
+            "rewrites the table to convert the values, scans the table and fails if "
+            "any value is NULL",
+            id="different type and not nullable",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_plan_alter_column(
+    old_property, new_property, expected_statements, expected_warning
+):
+    """
+    GIVEN specifications where the type or nullability of a property changes
+    WHEN plan is called
+    THEN the column is altered and data rewriting changes are flagged.
+    """
+    operations = _plan(_spec({"name": old_property}), _spec({"name": new_property}))
+
+    assert len(operations) == 1
+    assert operations[0].kind == "alter column"
+    assert operations[0].statements == expected_statements
+    assert operations[0].warning == expected_warning
+
+
+@pytest.mark.integration
+def test_plan_unique():
+    """
+    GIVEN specification where a property becomes unique
+    WHEN plan is called
+    THEN a unique index is created concurrently and used for the constraint.
+    """
+    old = _spec({"code": {"type": "string"}})
+    new = _spec({"code": {"type": "string", "x-unique": True}})
+
+    operations = _plan(old, new)
+
+    assert len(operations) == 1
+    assert operations[0].statements == (
+        "CREATE UNIQUE INDEX CONCURRENTLY employee_code_key ON employee (code)",
+        "ALTER TABLE employee ADD CONSTRAINT employee_code_key "
+        "UNIQUE USING INDEX employee_code_key",
+    )
+    assert operations[0].warning == "fails if the existing values are not unique"
+    assert not operations[0].transactional
+
+    (reverse_operation,) = _plan(new, old)
+    assert reverse_operation.statements == (
+        "ALTER TABLE employee DROP CONSTRAINT employee_code_key",
+    )
+
+
+@pytest.mark.integration
+def test_plan_composite_index_changed():
+    """
+    GIVEN specification where the columns of a composite index change
+    WHEN plan is called
+    THEN the previous index is dropped before the new index is created.
+    """
+    properties = {"name": {"type": "string"}, "code": {"type": "string"}}
+    old = _spec(
+        properties,
+        **{"x-composite-index": {"name": "ix_lookup", "expressions": ["name"]}},
+    )
+    new = _spec(
+        properties,
+        **{"x-composite-index": {"name": "ix_lookup", "expressions": ["name", "code"]}},
+    )
+
+    operations = _plan(old, new)
+
+    assert [operation.statements for operation in operations] == [
+        ("DROP INDEX CONCURRENTLY ix_lookup",),
+        ("CREATE INDEX CONCURRENTLY ix_lookup ON employee (name, code)",),
+    ]
+
+
+@pytest.mark.integration
+def test_plan_drop():
+    """
+    GIVEN specification where a schema and a property are removed
+    WHEN plan is called
+    THEN the column and table are dropped last and flagged.
+    """
+    old = _spec({"name": {"type": "string"}})
+    old["components"]["schemas"]["Project"] = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "project",
+        "type": "object",
+    }
+    new = _spec({"code": {"type": "string"}})
+
+    operations = _plan(old, new)
+
+    assert [(operation.kind, operation.statements) for operation in operations] == [
+        ("add column", ("ALTER TABLE employee ADD COLUMN code VARCHAR",)),
+        ("drop column", ("ALTER TABLE employee DROP COLUMN name",)),
+        ("drop table", ("DROP TABLE project",)),
+    ]
+    assert operations[1].warning == "drops the data of the column"
+    assert operations[2].warning == "drops the data of the table"
+
+
+@pytest.mark.integration
+def test_plan_foreign_key():
+    """
+    GIVEN specification with a new relationship to an existing schema
+    WHEN plan is called
+    THEN the foreign key column and constraint are added.
+    """
+    project = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "project",
+        "type": "object",
+    }
+    old = _spec()
+    old["components"]["schemas"]["Project"] = project
+    new = _spec({"project": {"$ref": "#/components/schemas/Project"}})
+    new["components"]["schemas"]["Project"] = project
+
+    operations = _plan(old, new)
+
+    assert [operation.kind for operation in operations] == [
+        "add column",
+        "add constraint",
+    ]
+    assert operations[1].statements == (
+        "ALTER TABLE employee ADD FOREIGN KEY(project_id) REFERENCES project (id)",
+    )
+
+    reverse_operations = _plan(new, old)
+    assert reverse_operations[0].statements == (
+        "ALTER TABLE employee DROP CONSTRAINT employee_project_id_fkey",
+    )
+
+
+@pytest.mark.integration
+def test_plan_mysql():
+    """
+    GIVEN specifications where a property changes and an index is added
+    WHEN plan is called for mysql
+    THEN the column is modified and the index is not created concurrently.
+    """
+    old = _spec({"name": {"type": "string", "maxLength": 20}})
+    new = _spec({"name": {"type": "string", "maxLength": 40, "x-index": True}})
+
+    operations = _plan(old, new, dialect="mysql")
+
+    assert [operation.statements for operation in operations] == [
+        ("ALTER TABLE employee MODIFY name VARCHAR(40)",),
+        ("CREATE INDEX ix_employee_name ON employee (name)",),
+    ]
+    assert all(operation.transactional for operation in operations)
+
+
+@pytest.mark.integration
+def test_plan_dialect_not_supported():
+    """
+    GIVEN specification with a property the dialect does not support
+    WHEN plan is called
+    THEN FeatureNotImplementedError is raised.
+    """
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        _plan(_spec(), _spec({"name": {"type": "string"}}), dialect="mysql")
+
+
+@pytest.mark.integration
+def test_plan_dialect_invalid():
+    """
+    GIVEN dialect that is not supported
+    WHEN plan is called
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        _plan(_spec(), _spec(), dialect="oracle")
+
+
+@pytest.mark.integration
+def test_format_plan():
+    """
+    GIVEN operations including a flagged operation outside of a transaction
+    WHEN format_plan is called
+    THEN a numbered SQL script with comments is returned.
+    """
+    operations = [
+        migration_plan.Operation(
+            kind="add column",
+            description="Add column employee.name",
+            statements=("ALTER TABLE employee ADD COLUMN name VARCHAR",),
+        ),
+        migration_plan.Operation(
+            kind="add constraint",
+            description="Add unique constraint employee_name_key on employee",
+            statements=("CREATE UNIQUE INDEX", "ALTER TABLE"),
+            warning="fails if the existing values are not unique",
+            transactional=False,
+        ),
+    ]
+
+    returned_script = migration_plan.format_plan(operations=operations)
+
+    assert returned_script == (
+        "-- 1. Add column employee.name\n"
+        "ALTER TABLE employee ADD COLUMN name VARCHAR;\n"
+        "\n"
+        "-- 2. Add unique constraint employee_name_key on employee\n"
+        "-- WARNING: fails if the existing values are not unique\n"
+        "-- Run outside of a transaction.\n"
+        "CREATE UNIQUE INDEX;\n"
+        "ALTER TABLE;\n"
+    )
@@ -7,8 +7,10 @@ from unittest import mock
 
 import pytest
 from sqlalchemy import schema as sql_schema
+from sqlalchemy.ext import declarative
 
 from open_alchemy import exceptions
+from open_alchemy import helpers
 from open_alchemy import model_factory
 
 
@@ -770,6 +772,157 @@ def test_kwargs():
     assert model.__mapper_args__ == {"passive_deletes": True}
 
 
+@pytest.mark.parametrize(
+    "property_schema, kwargs, expected_mapper_args",
+    [
+        pytest.param({"type": "integer"}, {}, None, id="plain"),
+        pytest.param(
+            {"type": "integer", "x-server-default": "0"},
+            {},
+            {"eager_defaults": True},
+            id="server default",
+        ),
+        pytest.param(
+            {"type": "integer", "x-computed": "id * 2"},
+            {},
+            {"eager_defaults": True},
+            id="computed",
+        ),
+        pytest.param(
+            {"type": "integer", "x-server-default": "0"},
+            {"x-kwargs": {"__mapper_args__": {"passive_deletes": True}}},
+            {"eager_defaults": True, "passive_deletes": True},
+            id="server default mapper args",
+        ),
+        pytest.param(
+            {"type": "integer", "x-server-default": "0"},
+            {"x-kwargs": {"__mapper_args__": {"eager_defaults": False}}},
+            {"eager_defaults": False},
+            id="server default eager defaults disabled",
+        ),
+    ],
+)
+@pytest.mark.model
+def test_eager_defaults(property_schema, kwargs, expected_mapper_args):
+    """
+    GIVEN schemas with a schema with a property and kwargs
+    WHEN model_factory is called with the name of the schema
+    THEN a model with the expected mapper args is returned.
+    """
+    base = declarative.declarative_base()
+
+    model = model_factory.model_factory(
+        name="Table",
+        get_base=lambda **_: base,
+        schemas={
+            "Table": {
+                "x-tablename": "table",
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "property_1": property_schema,
+                },
+                **kwargs,
+            }
+        },
+    )
+
+    assert getattr(model, "__mapper_args__", None) == expected_mapper_args
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_cached",
+    [
+        pytest.param({}, False, id="not defined"),
+        pytest.param({"x-cache": False}, False, id="disabled"),
+        pytest.param({"x-cache": True}, True, id="enabled"),
+        pytest.param({"x-cache": {"ttl": 10, "max-size": 2}}, True, id="options"),
+    ],
+)
+@pytest.mark.model
+def test_cache(kwargs, expected_cached):
+    """
+    GIVEN schemas with a schema with x-cache
+    WHEN model_factory is called with the name of the schema
+    THEN a model with the expected cache is returned.
+    """
+    # pylint: disable=protected-access
+    base = declarative.declarative_base()
+
+    model = model_factory.model_factory(
+        name="Table",
+        get_base=lambda **_: base,
+        schemas={
+            "Table": {
+                "x-tablename": "table",
+                "type": "object",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                **kwargs,
+            }
+        },
+    )
+
+    assert (model._cache is not None) == expected_cached
+
+
+@pytest.mark.model
+def test_cache_invalid():
+    """
+    GIVEN schemas with a schema with an invalid x-cache
+    WHEN model_factory is called with the name of the schema
+    THEN MalformedExtensionPropertyError is raised.
+    """
+    base = declarative.declarative_base()
+
+    with pytest.raises(exceptions.MalformedExtensionPropertyError):
+        model_factory.model_factory(
+            name="Table",
+            get_base=lambda **_: base,
+            schemas={
+                "Table": {
+                    "x-tablename": "table",
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-cache": {"ttl": 0},
+                }
+            },
+        )
+
+
+@pytest.mark.model
+def test_schema_frozen_shared():
+    """
+    GIVEN schemas with two schemas with an identical property
+    WHEN model_factory is called with the name of each schema
+    THEN the recorded schemas are frozen and share the schema of the property.
+    """
+    # pylint: disable=protected-access
+    base = declarative.declarative_base()
+    schemas = {
+        f"Table{index}": {
+            "x-tablename": f"table{index}",
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                "created": {"type": "string", "format": "date-time"},
+            },
+        }
+        for index in range(2)
+    }
+
+    model_0 = model_factory.model_factory(
+        name="Table0", get_base=lambda **_: base, schemas=schemas
+    )
+    model_1 = model_factory.model_factory(
+        name="Table1", get_base=lambda **_: base, schemas=schemas
+    )
+
+    assert isinstance(model_0._schema, helpers.frozen.FrozenDict)
+    assert model_0._schema["properties"] is model_1._schema["properties"]
+    with pytest.raises(TypeError):
+        model_0._schema["properties"]["created"]["format"] = "date"
+
+
 class TestPrepareModelDict:
     """Tests for _prepare_model_dict."""
 
@@ -798,3 +951,91 @@ class TestPrepareModelDict:
         returned_dict = model_factory._prepare_model_dict(schema=schema)
 
         assert expected_dict == returned_dict
+
+
+def _fk_schemas(**kwargs):
+    """Construct schemas with a model that has a foreign key column."""
+    return {
+        "Table": {
+            "x-tablename": "table",
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                "ref_id": {
+                    "type": "integer",
+                    "x-foreign-key": "ref.id",
+                    **kwargs.pop("column", {}),
+                },
+            },
+            **kwargs,
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "schemas, index_foreign_keys, expected_indexes",
+    [
+        (_fk_schemas(), True, ["ix_table_ref_id"]),
+        (_fk_schemas(**{"x-index-foreign-keys": True}), False, ["ix_table_ref_id"]),
+        (_fk_schemas(column={"x-index": True}), True, ["ix_table_ref_id"]),
+        (_fk_schemas(column={"x-index": False}), True, []),
+        (_fk_schemas(column={"x-index": False}), False, []),
+    ],
+    ids=[
+        "global",
+        "schema",
+        "column index",
+        "column index disabled global",
+        "column index disabled",
+    ],
+)
+@pytest.mark.model
+def test_index_foreign_keys(schemas, index_foreign_keys, expected_indexes, recwarn):
+    """
+    GIVEN schemas with a foreign key column and index_foreign_keys
+    WHEN model_factory is called with the name of the schema
+    THEN the expected indexes are defined on the table without any warnings.
+    """
+    base = declarative.declarative_base()
+
+    model = model_factory.model_factory(
+        name="Table",
+        get_base=lambda **_: base,
+        schemas=schemas,
+        index_foreign_keys=index_foreign_keys,
+    )
+
+    assert sorted(index.name for index in model.__table__.indexes) == expected_indexes
+    assert not [
+        warning
+        for warning in recwarn
+        if issubclass(warning.category, exceptions.UnindexedForeignKeyWarning)
+    ]
+
+
+@pytest.mark.parametrize(
+    "schemas, index_foreign_keys",
+    [
+        (_fk_schemas(), False),
+        (_fk_schemas(**{"x-index-foreign-keys": False}), True),
+    ],
+    ids=["default", "schema disabled"],
+)
+@pytest.mark.model
+def test_index_foreign_keys_warning(schemas, index_foreign_keys):
+    """
+    GIVEN schemas with a foreign key column that is not indexed
+    WHEN model_factory is called with the name of the schema
+    THEN UnindexedForeignKeyWarning is warned and no index is added.
+    """
+    base = declarative.declarative_base()
+
+    with pytest.warns(exceptions.UnindexedForeignKeyWarning, match="table.ref_id"):
+        model = model_factory.model_factory(
+            name="Table",
+            get_base=lambda **_: base,
+            schemas=schemas,
+            index_foreign_keys=index_foreign_keys,
+        )
+
+    assert not model.__table__.indexes
@@ -1,11 +1,13 @@
 """Integration tests for dictionary to model conversion."""
 
 import copy
+import datetime
 from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import utility_base
 
 
@@ -98,3 +100,51 @@ def test_convert_array(mocked_facades_models):
         mocked_facades_models.get_model.return_value.from_dict.return_value
     ]
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param({"id": "1"}, id="invalid"),
+        pytest.param({"name": "name 1"}, id="not a property"),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert_dict_invalid(value):
+    """
+    GIVEN dictionary that is not valid or includes a property that is not defined
+    WHEN convert_dict is called with the dictionary
+    THEN MalformedModelDictionaryError is raised.
+    """
+    properties = {"id": {"type": "integer"}}
+    schema = {"type": "object", "properties": properties}
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        utility_base.from_dict.convert_dict(
+            value=value,
+            schema=schema,
+            properties=properties,
+            validator=facades.jsonschema.validator(schema=schema),
+            function_name="from_dict",
+        )
+
+
+@pytest.mark.utility_base
+def test_convert_dict():
+    """
+    GIVEN valid dictionary
+    WHEN convert_dict is called with the dictionary
+    THEN the value of each property is converted.
+    """
+    properties = {"joined": {"type": "string", "format": "date"}}
+    schema = {"type": "object", "properties": properties}
+
+    returned_value = utility_base.from_dict.convert_dict(
+        value={"joined": "2000-01-01"},
+        schema=schema,
+        properties=properties,
+        validator=facades.jsonschema.validator(schema=schema),
+        function_name="from_dict",
+    )
+
+    assert returned_value == {"joined": datetime.date(2000, 1, 1)}
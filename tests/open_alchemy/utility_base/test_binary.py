@@ -0,0 +1,184 @@
+"""Tests for binary serialization."""
+
+import datetime
+import types
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import binary
+from open_alchemy.utility_base import plan
+
+
+class _Model(types.SimpleNamespace):
+    """Model with a fixed set of properties."""
+
+    _plan = plan.calculate(
+        schemas=[
+            {
+                "properties": {
+                    "name": {"type": "string"},
+                    "id": {"type": "integer", "readOnly": True},
+                    "secret": {"type": "string", "writeOnly": True},
+                    "parent": {"type": "object", "readOnly": True, "properties": {}},
+                }
+            }
+        ]
+    )
+
+    @classmethod
+    def _get_plan(cls):
+        """Return the plan."""
+        return cls._plan
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected_length",
+    [
+        pytest.param({"type": "integer"}, 0, 1, id="integer zero"),
+        pytest.param({"type": "integer"}, -1, 1, id="integer negative"),
+        pytest.param({"type": "integer"}, 2**40, 6, id="integer large"),
+        pytest.param({"type": "number"}, 1.1, 8, id="number"),
+        pytest.param({"type": "boolean"}, False, 1, id="boolean"),
+        pytest.param({"type": "string"}, "héllo", 7, id="string"),
+        pytest.param(
+            {"type": "string", "format": "binary"}, b"\x00\x01", 3, id="bytes"
+        ),
+        pytest.param(
+            {"type": "string", "format": "date"},
+            datetime.date(2000, 1, 1),
+            3,
+            id="date",
+        ),
+        pytest.param(
+            {"type": "string", "format": "date-time"},
+            datetime.datetime(2000, 1, 1, 1, 1, 1, 1),
+            9,
+            id="date-time naive",
+        ),
+        pytest.param(
+            {"type": "string", "format": "date-time"},
+            datetime.datetime(
+                2000, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=-2))
+            ),
+            14,
+            id="date-time aware",
+        ),
+        pytest.param({"type": "object", "x-json": True}, {"a": [1]}, 10, id="json"),
+    ],
+)
+@pytest.mark.utility_base
+def test_codec(schema, value, expected_length):
+    """
+    GIVEN property schema and value
+    WHEN the value is encoded and decoded with the codec for the schema
+    THEN the encoding has the expected length and the value is returned.
+    """
+    # pylint: disable=protected-access
+    encode, decode = binary._codec(schema=schema)
+    buffer = bytearray()
+
+    encode(buffer, value)
+    reader = binary._Reader(bytes(buffer))
+    returned_value = decode(reader)
+
+    assert len(buffer) == expected_length
+    assert returned_value == value
+    assert reader.offset == len(buffer)
+
+
+@pytest.mark.utility_base
+def test_layout():
+    """
+    GIVEN model with readOnly and writeOnly properties
+    WHEN layout is called with the model
+    THEN the properties except the writeOnly property and readOnly relationship are
+        returned in order of their names.
+    """
+    fields = binary.layout(model=_Model)
+
+    assert [field.name for field in fields] == ["id", "name"]
+
+
+@pytest.mark.utility_base
+def test_dumps_loads():
+    """
+    GIVEN instances with null values
+    WHEN dumps is called and the output is passed to loads
+    THEN equivalent instances are returned.
+    """
+    instances = [_Model(id=1, name="name 1"), _Model(id=2, name=None)]
+
+    value = binary.dumps(instances, model=_Model, kind=binary.KIND_LIST)
+    returned_instances = binary.loads(value, model=_Model, kind=binary.KIND_LIST)
+
+    assert returned_instances == [_Model(id=1, name="name 1"), _Model(id=2)]
+
+
+@pytest.mark.parametrize(
+    "value, kind",
+    [
+        pytest.param("value", binary.KIND_RECORD, id="not bytes"),
+        pytest.param(b"\x01", binary.KIND_RECORD, id="header truncated"),
+        pytest.param(
+            binary.dumps([_Model(id=1)], model=_Model, kind=binary.KIND_RECORD),
+            binary.KIND_LIST,
+            id="wrong kind",
+        ),
+        pytest.param(
+            binary.dumps([_Model(id=1)], model=_Model, kind=binary.KIND_RECORD)[:-1],
+            binary.KIND_RECORD,
+            id="record truncated",
+        ),
+        pytest.param(
+            binary.dumps([_Model(id=1)], model=_Model, kind=binary.KIND_RECORD)
+            + b"\x00",
+            binary.KIND_RECORD,
+            id="trailing bytes",
+        ),
+        pytest.param(
+            binary.dumps([_Model(name="\xe9")], model=_Model, kind=binary.KIND_RECORD)[
+                :-2
+            ]
+            + b"\xff",
+            binary.KIND_RECORD,
+            id="invalid string",
+        ),
+        pytest.param(
+            b"\x01" + b"\x00" * binary.FINGERPRINT_LENGTH + b"\x00",
+            binary.KIND_RECORD,
+            id="different fingerprint",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_loads_invalid(value, kind):
+    """
+    GIVEN invalid payload
+    WHEN loads is called with the payload
+    THEN MalformedBinaryError is raised.
+    """
+    with pytest.raises(exceptions.MalformedBinaryError):
+        binary.loads(value, model=_Model, kind=kind)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "object"}, id="object"),
+        pytest.param({"type": "array", "items": {"type": "object"}}, id="array"),
+    ],
+)
+@pytest.mark.utility_base
+def test_codec_ref_missing(schema):
+    """
+    GIVEN object or array property schema without x-de-$ref
+    WHEN the value is encoded with the codec for the schema
+    THEN SchemaNotFoundError is raised.
+    """
+    # pylint: disable=protected-access
+    encode, _ = binary._codec(schema=schema)
+    value = {} if schema["type"] == "object" else [{}]
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        encode(bytearray(), value)
@@ -0,0 +1,199 @@
+"""Tests for bulk operation helpers."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import facades
+from open_alchemy.utility_base import bulk
+
+
+@pytest.mark.parametrize(
+    "schema, raises",
+    [
+        pytest.param({"properties": {}}, False, id="no inherits"),
+        pytest.param({"properties": {}, "x-inherits": "Parent"}, True, id="inherits"),
+    ],
+)
+@pytest.mark.utility_base
+def test_check_schema(schema, raises):
+    """
+    GIVEN schema and whether it raises
+    WHEN check_schema is called with the schema
+    THEN FeatureNotImplementedError is raised if expected.
+    """
+    if raises:
+        with pytest.raises(exceptions.FeatureNotImplementedError):
+            bulk.check_schema(schema=schema)
+    else:
+        bulk.check_schema(schema=schema)
+
+
+_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "joined": {"type": "string", "format": "date"},
+        "ref": {"type": "object", "x-de-$ref": "RefModel"},
+    },
+    "required": ["id"],
+}
+_COLUMN_KEYS = {"id": "id", "joined": "joined_column"}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param([], id="not dict"),
+        pytest.param({}, id="required missing"),
+        pytest.param({"id": "1"}, id="wrong type"),
+        pytest.param({"id": 1, "other": 1}, id="not in properties"),
+        pytest.param({"id": 1, "ref": {}}, id="relationship"),
+    ],
+)
+@pytest.mark.utility_base
+def test_convert_invalid(value):
+    """
+    GIVEN value that is not valid for bulk operations
+    WHEN convert is called with the value
+    THEN MalformedModelDictionaryError is raised.
+    """
+    validator = facades.jsonschema.validator(schema=_SCHEMA)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        bulk.convert(
+            value=value, schema=_SCHEMA, validator=validator, column_keys=_COLUMN_KEYS
+        )
+
+
+@pytest.mark.utility_base
+def test_convert():
+    """
+    GIVEN valid value
+    WHEN convert is called with the value
+    THEN the value is converted and keyed by column key.
+    """
+    validator = facades.jsonschema.validator(schema=_SCHEMA)
+
+    row = bulk.convert(
+        value={"id": 1, "joined": "2000-01-02"},
+        schema=_SCHEMA,
+        validator=validator,
+        column_keys=_COLUMN_KEYS,
+    )
+
+    assert row["id"] == 1
+    assert row["joined_column"].isoformat() == "2000-01-02"
+
+
+@pytest.mark.parametrize(
+    "rows, batch_size, expected_batches",
+    [
+        pytest.param([], 2, [], id="empty"),
+        pytest.param([{"a": 1}], 2, [[{"a": 1}]], id="single"),
+        pytest.param(
+            [{"a": 1}, {"a": 2}, {"a": 3}],
+            2,
+            [[{"a": 1}, {"a": 2}], [{"a": 3}]],
+            id="multiple",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_batch(rows, batch_size, expected_batches):
+    """
+    GIVEN rows and batch size
+    WHEN batch is called with the rows and batch size
+    THEN the expected batches are returned.
+    """
+    assert list(bulk.batch(iter(rows), batch_size=batch_size)) == expected_batches
+
+
+@pytest.mark.utility_base
+def test_batch_invalid_size():
+    """
+    GIVEN batch size of 0
+    WHEN batch is called
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        list(bulk.batch([], batch_size=0))
+
+
+@pytest.mark.utility_base
+def test_group():
+    """
+    GIVEN rows with different keys
+    WHEN group is called with the rows
+    THEN the rows are grouped by their keys in order of first appearance.
+    """
+    rows = [{"a": 1, "b": 1}, {"a": 2}, {"b": 3, "a": 3}]
+
+    returned_groups = list(bulk.group(rows))
+
+    assert returned_groups == [
+        (("a", "b"), [{"a": 1, "b": 1}, {"b": 3, "a": 3}]),
+        (("a",), [{"a": 2}]),
+    ]
+
+
+_TARGETS = [("id",), ("first", "last")]
+_TARGET_COLUMN_KEYS = {"id": "id", "first": "first", "last": "last", "other": "other"}
+
+
+@pytest.mark.parametrize(
+    "conflict, expected_target",
+    [
+        pytest.param(None, ("id",), id="default"),
+        pytest.param("id", ("id",), id="string"),
+        pytest.param(["last", "first"], ("last", "first"), id="composite"),
+    ],
+)
+@pytest.mark.utility_base
+def test_conflict_target(conflict, expected_target):
+    """
+    GIVEN conflict
+    WHEN conflict_target is called with the conflict
+    THEN the expected target is returned.
+    """
+    target = bulk.conflict_target(
+        conflict=conflict, column_keys=_TARGET_COLUMN_KEYS, targets=_TARGETS
+    )
+
+    assert target == expected_target
+
+
+@pytest.mark.parametrize(
+    "conflict, targets",
+    [
+        pytest.param(None, [], id="no targets"),
+        pytest.param("missing", _TARGETS, id="not a column"),
+        pytest.param("other", _TARGETS, id="not unique"),
+        pytest.param(["first"], _TARGETS, id="partial composite"),
+    ],
+)
+@pytest.mark.utility_base
+def test_conflict_target_invalid(conflict, targets):
+    """
+    GIVEN conflict that is not backed by a unique constraint
+    WHEN conflict_target is called with the conflict
+    THEN InvalidConflictTargetError is raised.
+    """
+    with pytest.raises(exceptions.InvalidConflictTargetError):
+        bulk.conflict_target(
+            conflict=conflict, column_keys=_TARGET_COLUMN_KEYS, targets=targets
+        )
+
+
+@pytest.mark.utility_base
+def test_batch_lazy():
+    """
+    GIVEN iterator over rows
+    WHEN the first batch is retrieved
+    THEN only the rows of the first batch are consumed.
+    """
+    rows = iter([{"a": 1}, {"a": 2}, {"a": 3}])
+
+    batches = bulk.batch(rows, batch_size=2)
+    next(batches)
+
+    assert list(rows) == [{"a": 3}]
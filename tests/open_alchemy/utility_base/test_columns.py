@@ -0,0 +1,162 @@
+"""Tests for converting instances to columns."""
+
+import datetime
+import types
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import columns
+
+
+@pytest.mark.parametrize(
+    "fields, expected_fields",
+    [
+        pytest.param(None, ["id", "name"], id="default"),
+        pytest.param(["name"], ["name"], id="requested"),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_fields(fields, expected_fields):
+    """
+    GIVEN properties with a relationship and a writeOnly property and fields
+    WHEN calculate_fields is called
+    THEN the expected fields are returned.
+    """
+    properties = {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "secret": {"type": "string", "writeOnly": True},
+        "parent": {"type": "object", "x-de-$ref": "Parent"},
+    }
+    nullable = {"id": False, "name": True, "secret": True}
+
+    returned_fields = columns.calculate_fields(
+        properties=properties, nullable=nullable, fields=fields
+    )
+
+    assert returned_fields == expected_fields
+
+
+@pytest.mark.utility_base
+def test_calculate_fields_invalid():
+    """
+    GIVEN fields with a property that does not map to a column
+    WHEN calculate_fields is called
+    THEN InvalidArgumentError is raised.
+    """
+    properties = {"id": {"type": "integer"}, "parent": {"type": "object"}}
+
+    with pytest.raises(exceptions.InvalidArgumentError):
+        columns.calculate_fields(
+            properties=properties, nullable={"id": False}, fields=["id", "parent"]
+        )
+
+
+@pytest.mark.parametrize(
+    "schema, expected_dtype",
+    [
+        pytest.param({"type": "integer"}, "int64", id="integer"),
+        pytest.param({"type": "integer", "format": "int32"}, "int32", id="int32"),
+        pytest.param({"type": "integer", "format": "int64"}, "int64", id="int64"),
+        pytest.param({"type": "number"}, "float64", id="number"),
+        pytest.param({"type": "number", "format": "float"}, "float32", id="float"),
+        pytest.param({"type": "number", "format": "double"}, "float64", id="double"),
+        pytest.param({"type": "boolean"}, "bool", id="boolean"),
+        pytest.param({"type": "string"}, "object", id="string"),
+        pytest.param({"type": "string", "format": "date"}, "datetime64[D]", id="date"),
+        pytest.param(
+            {"type": "string", "format": "date-time"}, "datetime64[us]", id="date-time"
+        ),
+        pytest.param({"type": "integer", "x-json": True}, "object", id="json"),
+    ],
+)
+@pytest.mark.utility_base
+def test_dtype(schema, expected_dtype):
+    """
+    GIVEN property schema
+    WHEN dtype is called with the schema
+    THEN the expected dtype is returned.
+    """
+    assert columns.dtype(schema=schema) == expected_dtype
+
+
+@pytest.mark.utility_base
+def test_to_lists():
+    """
+    GIVEN instances
+    WHEN to_lists is called with the instances
+    THEN a list of values for each field is returned.
+    """
+    instances = [
+        types.SimpleNamespace(id=1, name="name 1"),
+        types.SimpleNamespace(id=2, name=None),
+    ]
+
+    returned_columns = columns.to_lists(instances, fields=["id", "name"])
+
+    assert returned_columns == {"id": [1, 2], "name": ["name 1", None]}
+
+
+@pytest.mark.utility_base
+def test_to_arrays():
+    """
+    GIVEN chunks of instances with null values
+    WHEN to_arrays is called with the chunks
+    THEN arrays with the expected dtypes are returned and null values are masked.
+    """
+    numpy = pytest.importorskip("numpy")
+    chunks = [
+        [
+            types.SimpleNamespace(
+                id=1, value=1.5, joined=datetime.date(2000, 1, 1), data=[1]
+            ),
+            types.SimpleNamespace(id=2, value=None, joined=None, data={"key": 1}),
+        ],
+        [types.SimpleNamespace(id=3, value=2.5, joined=None, data=None)],
+    ]
+    dtypes = {
+        "id": "int32",
+        "value": "float64",
+        "joined": "datetime64[D]",
+        "data": "object",
+    }
+    nullable = {"id": False, "value": True, "joined": True, "data": True}
+
+    returned_columns = columns.to_arrays(
+        chunks, fields=list(dtypes), dtypes=dtypes, nullable=nullable
+    )
+
+    assert not isinstance(returned_columns["id"], numpy.ma.MaskedArray)
+    assert returned_columns["id"].dtype == numpy.int32
+    assert returned_columns["id"].tolist() == [1, 2, 3]
+    assert returned_columns["value"].dtype == numpy.float64
+    assert returned_columns["value"].tolist() == [1.5, None, 2.5]
+    assert returned_columns["joined"].dtype == numpy.dtype("datetime64[D]")
+    assert returned_columns["joined"].mask.tolist() == [False, True, True]
+    assert returned_columns["data"].tolist() == [[1], {"key": 1}, None]
+
+
+@pytest.mark.utility_base
+def test_to_arrays_nullable_without_null():
+    """
+    GIVEN nullable field without null values and no chunks
+    WHEN to_arrays is called
+    THEN masked arrays are returned.
+    """
+    numpy = pytest.importorskip("numpy")
+
+    returned_columns = columns.to_arrays(
+        [[types.SimpleNamespace(id=1)]],
+        fields=["id"],
+        dtypes={"id": "int64"},
+        nullable={"id": True},
+    )
+    empty_columns = columns.to_arrays(
+        [], fields=["id"], dtypes={"id": "int64"}, nullable={"id": True}
+    )
+
+    assert isinstance(returned_columns["id"], numpy.ma.MaskedArray)
+    assert returned_columns["id"].mask.tolist() == [False]
+    assert isinstance(empty_columns["id"], numpy.ma.MaskedArray)
+    assert len(empty_columns["id"]) == 0
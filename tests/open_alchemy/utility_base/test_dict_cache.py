@@ -0,0 +1,56 @@
+"""Tests for the cache of to_dict."""
+
+from unittest import mock
+
+import pytest
+
+from open_alchemy.utility_base import dict_cache
+
+
+class _Instance:
+    """Instance that can be weakly referenced."""
+
+
+@pytest.mark.utility_base
+def test_get_invalidate(monkeypatch):
+    """
+    GIVEN instance that includes another instance and has been converted
+    WHEN get is called again before and after the included instance is invalidated
+    THEN the cached dictionary is returned before and the instance is converted again
+        after.
+    """
+    monkeypatch.setattr(dict_cache, "_listen", lambda _: None)
+    parent = _Instance()
+    child = _Instance()
+
+    def convert():
+        """Include the child in the dictionary."""
+        dict_cache.visit([child])
+        return {"child": {"key": "value"}}
+
+    mock_convert = mock.MagicMock(side_effect=convert)
+    first = dict_cache.get(
+        parent, native=False, load_deferred=False, convert=mock_convert
+    )
+    first["child"]["key"] = "modified"
+    second = dict_cache.get(
+        parent, native=False, load_deferred=False, convert=mock_convert
+    )
+    assert mock_convert.call_count == 1
+    assert second == {"child": {"key": "value"}}
+
+    dict_cache.invalidate(child)
+    dict_cache.get(parent, native=False, load_deferred=False, convert=mock_convert)
+    assert mock_convert.call_count == 2
+
+
+@pytest.mark.utility_base
+def test_visit_not_recording():
+    """
+    GIVEN no dictionary is being cached
+    WHEN visit is called
+    THEN nothing is recorded.
+    """
+    dict_cache.visit(_Instance())
+
+    assert not dict_cache.recording()
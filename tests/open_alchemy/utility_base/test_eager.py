@@ -0,0 +1,90 @@
+"""Tests for the relationship paths that to_dict reads."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import facades
+from open_alchemy.utility_base import eager
+from open_alchemy.utility_base import plan
+
+
+def _model(properties):
+    """Construct a model with a plan for the properties."""
+    model_plan = plan.calculate(schemas=[{"properties": properties}])
+    return type("Model", (), {"_get_plan": classmethod(lambda _: model_plan)})
+
+
+@pytest.mark.utility_base
+def test_paths(monkeypatch):
+    """
+    GIVEN models with nested, readOnly and cyclic relationships
+    WHEN paths is called
+    THEN the paths that are not a prefix of another path are returned.
+    """
+    models = {
+        "Division": _model(
+            {
+                "id": {"type": "integer"},
+                "employees": {
+                    "type": "array",
+                    "items": {"type": "object", "x-de-$ref": "Employee"},
+                },
+            }
+        ),
+        "Employee": _model(
+            {
+                "address": {"type": "object", "x-de-$ref": "Address"},
+                "division": {"type": "object", "x-de-$ref": "Division"},
+                "manager": {
+                    "type": "object",
+                    "readOnly": True,
+                    "properties": {"id": {"type": "integer"}},
+                },
+                "data": {"type": "object", "x-json": True},
+            }
+        ),
+        "Address": _model({"id": {"type": "integer"}}),
+    }
+    monkeypatch.setattr(facades.models, "get_model", lambda *, name: models.get(name))
+
+    returned_paths = eager.paths(model=models["Division"])
+
+    assert returned_paths == [
+        ("employees", "address"),
+        ("employees", "division"),
+        ("employees", "manager"),
+    ]
+
+
+@pytest.mark.utility_base
+def test_paths_model_not_found(monkeypatch):
+    """
+    GIVEN model with a relationship to a model that has not been constructed
+    WHEN paths is called
+    THEN SchemaNotFoundError is raised.
+    """
+    model = _model({"address": {"type": "object", "x-de-$ref": "Address"}})
+    monkeypatch.setattr(facades.models, "get_model", lambda *, name: None)
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        eager.paths(model=model)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "object"}, id="object"),
+        pytest.param({"type": "array", "items": {"type": "object"}}, id="array"),
+    ],
+)
+@pytest.mark.utility_base
+def test_paths_ref_missing(schema):
+    """
+    GIVEN model with a relationship whose schema does not include x-de-$ref
+    WHEN paths is called
+    THEN SchemaNotFoundError is raised.
+    """
+    model = _model({"address": schema})
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        eager.paths(model=model)
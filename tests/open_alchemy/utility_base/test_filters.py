@@ -0,0 +1,204 @@
+"""Tests for converting query parameters to filters."""
+
+import datetime
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import filters
+
+PROPERTIES = {
+    "id": {"type": "integer"},
+    "name": {"type": "string", "maxLength": 5},
+    "joined": {"type": "string", "format": "date"},
+    "active": {"type": "boolean"},
+    "level": {"type": "string", "enum": ["junior", "senior"]},
+    "salary": {"type": "number"},
+    "data": {"type": "object", "x-json": True},
+    "password": {"type": "string", "writeOnly": True},
+    "division": {"type": "object", "x-de-$ref": "Division"},
+}
+NULLABLE = {
+    "id": False,
+    "name": True,
+    "joined": True,
+    "active": True,
+    "level": True,
+    "salary": True,
+    "data": True,
+    "password": True,
+}
+INDEXED = {"id", "name", "joined", "active", "level", "data", "password"}
+
+
+@pytest.mark.parametrize(
+    "key, expected_name, expected_operator",
+    [
+        pytest.param("name", "name", "eq", id="default"),
+        pytest.param("name__prefix", "name", "prefix", id="operator"),
+        pytest.param("first_name__in", "first_name", "in", id="underscore"),
+    ],
+)
+@pytest.mark.utility_base
+def test_parse_key(key, expected_name, expected_operator):
+    """
+    GIVEN parameter name
+    WHEN parse_key is called with the name
+    THEN the expected property name and operator are returned.
+    """
+    returned_name, returned_operator = filters.parse_key(key)
+
+    assert returned_name == expected_name
+    assert returned_operator == expected_operator
+
+
+@pytest.mark.utility_base
+def test_indexed():
+    """
+    GIVEN keys of the primary key and indexes
+    WHEN indexed is called with the keys
+    THEN the leading property of each key is returned.
+    """
+    keys = [(("id",), True), (("division", "joined"), False)]
+
+    assert filters.indexed(keys=keys) == {"id", "division"}
+
+
+@pytest.mark.parametrize(
+    "params, expected_filters",
+    [
+        pytest.param({}, [], id="empty"),
+        pytest.param({"id": "1"}, [("id", "eq", 1)], id="integer"),
+        pytest.param({"id": 1}, [("id", "eq", 1)], id="integer not string"),
+        pytest.param({"active": "true"}, [("active", "eq", True)], id="boolean"),
+        pytest.param(
+            {"joined__gte": "2000-01-02"},
+            [("joined", "gte", datetime.date(2000, 1, 2))],
+            id="date",
+        ),
+        pytest.param({"level": "senior"}, [("level", "eq", "senior")], id="enum"),
+        pytest.param({"id__in": "1,2"}, [("id", "in", [1, 2])], id="in string"),
+        pytest.param({"id__in": ["1", 2]}, [("id", "in", [1, 2])], id="in list"),
+        pytest.param({"id__range": "1,2"}, [("id", "range", (1, 2))], id="range"),
+        pytest.param(
+            {"id__range": ",2"}, [("id", "range", (None, 2))], id="range no lower"
+        ),
+        pytest.param(
+            {"id__range": [1, None]},
+            [("id", "range", (1, None))],
+            id="range no upper",
+        ),
+        pytest.param({"name__prefix": "a%"}, [("name", "prefix", "a%")], id="prefix"),
+        pytest.param(
+            {"id__gt": "1", "name": "a"},
+            [("id", "gt", 1), ("name", "eq", "a")],
+            id="multiple",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_parse(params, expected_filters):
+    """
+    GIVEN query parameters
+    WHEN parse is called with the parameters
+    THEN the expected filters are returned.
+    """
+    returned_filters = filters.parse(
+        params,
+        properties=PROPERTIES,
+        nullable=NULLABLE,
+        indexed_names=INDEXED,
+        unindexed="raise",
+    )
+
+    assert returned_filters == expected_filters
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"id__like": "1"}, id="operator"),
+        pytest.param({"unknown": "1"}, id="unknown property"),
+        pytest.param({"division": "1"}, id="relationship"),
+        pytest.param({"data": "1"}, id="json"),
+        pytest.param({"password__prefix": "a"}, id="writeOnly"),
+        pytest.param({"id": "a"}, id="integer"),
+        pytest.param({"active": "yes"}, id="boolean"),
+        pytest.param({"joined": "2000-13-01"}, id="date"),
+        pytest.param({"level": "lead"}, id="enum"),
+        pytest.param({"name": "abcdef"}, id="max length"),
+        pytest.param({"id__in": "1,a"}, id="in"),
+        pytest.param({"id__range": "1"}, id="range single"),
+        pytest.param({"id__range": ","}, id="range empty"),
+        pytest.param({"id__prefix": "1"}, id="prefix integer"),
+        pytest.param({"joined__prefix": "2000"}, id="prefix date"),
+    ],
+)
+@pytest.mark.utility_base
+def test_parse_invalid(params):
+    """
+    GIVEN invalid query parameters
+    WHEN parse is called with the parameters
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        filters.parse(
+            params,
+            properties=PROPERTIES,
+            nullable=NULLABLE,
+            indexed_names=INDEXED,
+            unindexed="raise",
+        )
+
+
+@pytest.mark.utility_base
+def test_parse_unindexed_policy_invalid():
+    """
+    GIVEN unsupported unindexed policy
+    WHEN parse is called with the policy
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        filters.parse(
+            {},
+            properties=PROPERTIES,
+            nullable=NULLABLE,
+            indexed_names=INDEXED,
+            unindexed="ignore",
+        )
+
+
+@pytest.mark.utility_base
+def test_parse_unindexed_raise():
+    """
+    GIVEN parameter for a property that is not indexed
+    WHEN parse is called with unindexed raise
+    THEN UnindexedFilterError is raised.
+    """
+    with pytest.raises(exceptions.UnindexedFilterError):
+        filters.parse(
+            {"salary": "1.5"},
+            properties=PROPERTIES,
+            nullable=NULLABLE,
+            indexed_names=INDEXED,
+            unindexed="raise",
+        )
+
+
+@pytest.mark.utility_base
+def test_parse_unindexed_warn():
+    """
+    GIVEN parameter for a property that is not indexed
+    WHEN parse is called with unindexed warn
+    THEN UnindexedFilterWarning is warned and the filter is returned.
+    """
+    with pytest.warns(exceptions.UnindexedFilterWarning):
+        returned_filters = filters.parse(
+            {"salary": "1.5"},
+            properties=PROPERTIES,
+            nullable=NULLABLE,
+            indexed_names=INDEXED,
+            unindexed="warn",
+        )
+
+    assert returned_filters == [("salary", "eq", 1.5)]
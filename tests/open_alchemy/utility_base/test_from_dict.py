@@ -219,13 +219,22 @@ def test_from_dict_inheritance_model_undefined(__init__):
 
 
 @pytest.mark.utility_base
-def test_from_dict_inheritance_call(mocked_facades_models, __init__):
+def test_from_dict_inheritance(mocked_facades_models, __init__):
     """
-    GIVEN schema with parent model that has been mocked and dictionary
-    WHEN from_dict is called with the dictionary
-    THEN from_dict on the mocked model is called with the portion of the dictionary
-        for that model.
+    GIVEN schema with a parent model that has been mocked and dictionary
+    WHEN from_dict is called with the dictionary twice
+    THEN the instance has the values of the properties of the model and the parent
+        and the parent is only looked up once.
     """
+    parent = type(
+        "Parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"parent_key": {"type": "string"}}},
+            "__init__": __init__,
+        },
+    )
+    mocked_facades_models.get_model.return_value = parent
     model = type(
         "model",
         (utility_base.UtilityBase,),
@@ -239,22 +248,39 @@ def test_from_dict_inheritance_call(mocked_facades_models, __init__):
     )
 
     model.from_dict(**{"key": "value", "parent_key": "parent value"})
+    instance = model.from_dict(**{"key": "value", "parent_key": "parent value"})
 
     mocked_facades_models.get_model.assert_called_once_with(name="Parent")
-    check_func = mocked_facades_models.get_model.return_value.construct_from_dict_init
-    check_func.assert_called_once_with(**{"parent_key": "parent value"})
+    assert instance.key == "value"  # pylint: disable=no-member
+    assert instance.parent_key == "parent value"  # pylint: disable=no-member
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"key": "value"}, id="parent required missing"),
+        pytest.param({"parent_key": 1}, id="parent invalid"),
+        pytest.param({"parent_key": "parent value", "other": 1}, id="unknown"),
+    ],
+)
 @pytest.mark.utility_base
-def test_from_dict_inheritance_return(mocked_facades_models, __init__):
+def test_from_dict_inheritance_invalid(mocked_facades_models, __init__, kwargs):
     """
-    GIVEN schema with parent model that has been mocked and dictionary
+    GIVEN schema with a parent model that has been mocked and an invalid dictionary
     WHEN from_dict is called with the dictionary
-    THEN the from_dict on the mocked model return value is merged with the from_dict for
-        the child.
+    THEN MalformedModelDictionaryError is raised.
     """
-    return_func = mocked_facades_models.get_model.return_value.construct_from_dict_init
-    return_func.return_value = {"parent_key": "parent value"}
+    mocked_facades_models.get_model.return_value = type(
+        "Parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"parent_key": {"type": "string"}},
+                "required": ["parent_key"],
+            },
+            "__init__": __init__,
+        },
+    )
     model = type(
         "model",
         (utility_base.UtilityBase,),
@@ -267,11 +293,8 @@ def test_from_dict_inheritance_return(mocked_facades_models, __init__):
         },
     )
 
-    instance = model.from_dict(**{"key": "value", "parent_key": "parent value"})
-
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
-    assert instance.key == "value"  # pylint: disable=no-member
-    assert instance.parent_key == "parent value"  # pylint: disable=no-member
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(**kwargs)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,182 @@
+"""Tests for keyset pagination."""
+
+import datetime
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import paginate
+
+
+@pytest.mark.parametrize(
+    "order_by, expected_ordering",
+    [
+        pytest.param(None, [], id="none"),
+        pytest.param("name", [("name", False)], id="string"),
+        pytest.param("-name", [("name", True)], id="string descending"),
+        pytest.param(["name", "-id"], [("name", False), ("id", True)], id="multiple"),
+    ],
+)
+@pytest.mark.utility_base
+def test_parse_order_by(order_by, expected_ordering):
+    """
+    GIVEN order_by
+    WHEN parse_order_by is called with the order_by
+    THEN the expected ordering is returned.
+    """
+    returned_ordering = paginate.parse_order_by(order_by)
+
+    assert returned_ordering == expected_ordering
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        pytest.param("-", id="empty"),
+        pytest.param(["name", "-name"], id="repeated"),
+    ],
+)
+@pytest.mark.utility_base
+def test_parse_order_by_invalid(order_by):
+    """
+    GIVEN invalid order_by
+    WHEN parse_order_by is called with the order_by
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        paginate.parse_order_by(order_by)
+
+
+PROPERTIES = {
+    "id": {"type": "integer"},
+    "name": {"type": "string"},
+    "division": {"type": "string"},
+    "joined": {"type": "string", "format": "date"},
+    "address": {"type": "string"},
+    "data": {"type": "object", "x-json": True},
+}
+NULLABLE = {
+    "id": False,
+    "name": False,
+    "division": False,
+    "joined": False,
+    "address": True,
+    "data": False,
+}
+KEYS = [
+    (("id",), True),
+    (("name",), True),
+    (("division", "joined"), False),
+    (("address",), False),
+    (("data",), False),
+]
+
+
+@pytest.mark.parametrize(
+    "requested, expected_ordering",
+    [
+        pytest.param([], [("id", False)], id="default"),
+        pytest.param([("id", True)], [("id", True)], id="primary key"),
+        pytest.param([("name", False)], [("name", False)], id="unique"),
+        pytest.param(
+            [("division", False)],
+            [("division", False), ("id", False)],
+            id="index prefix",
+        ),
+        pytest.param(
+            [("division", False), ("joined", True)],
+            [("division", False), ("joined", True), ("id", True)],
+            id="index",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_ordering(requested, expected_ordering):
+    """
+    GIVEN requested ordering
+    WHEN calculate_ordering is called with the ordering
+    THEN the expected ordering is returned.
+    """
+    returned_ordering = paginate.calculate_ordering(
+        requested=requested, keys=KEYS, properties=PROPERTIES, nullable=NULLABLE
+    )
+
+    assert returned_ordering == expected_ordering
+
+
+@pytest.mark.parametrize(
+    "requested, keys",
+    [
+        pytest.param([], [], id="no primary key"),
+        pytest.param([("joined", False)], KEYS, id="not index prefix"),
+        pytest.param([("address", False)], KEYS, id="nullable"),
+        pytest.param([("data", False)], KEYS, id="json"),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_ordering_invalid(requested, keys):
+    """
+    GIVEN requested ordering that is not supported
+    WHEN calculate_ordering is called with the ordering
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        paginate.calculate_ordering(
+            requested=requested, keys=keys, properties=PROPERTIES, nullable=NULLABLE
+        )
+
+
+class _Instance:
+    """Instance with the values of the ordering properties."""
+
+    joined = datetime.date(2000, 1, 2)
+    id = 1
+
+
+ORDERING = [("joined", True), ("id", True)]
+
+
+@pytest.mark.utility_base
+def test_cursor_round_trip():
+    """
+    GIVEN instance and ordering
+    WHEN encode_cursor is called and the cursor is decoded
+    THEN a URL safe cursor is returned that decodes to the values of the instance.
+    """
+    cursor = paginate.encode_cursor(
+        _Instance(), ordering=ORDERING, properties=PROPERTIES
+    )
+
+    assert cursor.replace("-", "").replace("_", "").isalnum()
+    assert paginate.decode_cursor(cursor, ordering=ORDERING, properties=PROPERTIES) == [
+        datetime.date(2000, 1, 2),
+        1,
+    ]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("not a cursor", id="not base64"),
+        pytest.param("bm90IGpzb24", id="not json"),
+        pytest.param(
+            paginate.encode_cursor(
+                _Instance(), ordering=[("id", True)], properties=PROPERTIES
+            ),
+            id="different ordering",
+        ),
+        pytest.param(
+            "eyJvIjpbWyJqb2luZWQiLHRydWVdLFsiaWQiLHRydWVdXSwidiI6WzEsMV19",
+            id="invalid value",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_decode_cursor_invalid(cursor):
+    """
+    GIVEN invalid cursor
+    WHEN decode_cursor is called with the cursor
+    THEN InvalidArgumentError is raised.
+    """
+    with pytest.raises(exceptions.InvalidArgumentError):
+        paginate.decode_cursor(cursor, ordering=ORDERING, properties=PROPERTIES)
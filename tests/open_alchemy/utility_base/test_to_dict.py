@@ -1,10 +1,12 @@
 """Tests for UtilityBase."""
 
+import datetime
 from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import json_codec
 from open_alchemy import utility_base
 
 
@@ -143,31 +145,71 @@ def test_to_dict_error(__init__):
 
 
 @pytest.mark.utility_base
-def test_to_dict_inheritance_call(mocked_facades_models, __init__):
+def test_to_dict_inheritance(mocked_facades_models, __init__):
     """
-    GIVEN class that derives from UtilityBase with a schema that inherits
-    WHEN to_dict is called
-    THEN the dictionary based on the parent and child properties is returned.
+    GIVEN class that derives from UtilityBase with a schema that inherits from a
+        parent that overrides a property of the grandparent
+    WHEN to_dict is called twice
+    THEN the dictionary based on the properties of all the models in the order of the
+        root model first is returned and the parents are only looked up once.
     """
+    grandparent = type(
+        "Grandparent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "shared": {"type": "integer"},
+                    "grandparent_key": {"type": "string"},
+                }
+            },
+            "__init__": __init__,
+        },
+    )
+    parent = type(
+        "Parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "parent_key": {"type": "string"},
+                    "shared": {"type": "string"},
+                },
+                "x-inherits": "Grandparent",
+            },
+            "__init__": __init__,
+        },
+    )
+    mocked_facades_models.get_model.side_effect = lambda name: {
+        "Grandparent": grandparent,
+        "Parent": parent,
+    }[name]
     schema = {
         "type": "object",
         "properties": {"key": {"type": "string"}},
         "x-inherits": "Parent",
     }
-    mocked_facades_models.get_model.return_value.instance_to_dict.return_value = {
-        "parent_key": "parent value"
-    }
     model = type(
         "model", (utility_base.UtilityBase,), {"_schema": schema, "__init__": __init__}
     )
-    instance = model(**{"key": "value", "parent_key": "parent value"})
+    instance = model(
+        key="value",
+        parent_key="parent value",
+        grandparent_key="grandparent value",
+        shared="shared value",
+    )
 
+    instance.to_dict()
     returned_dict = instance.to_dict()
 
-    assert returned_dict == {"key": "value", "parent_key": "parent value"}
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
-    check_func = mocked_facades_models.get_model.return_value.instance_to_dict
-    check_func.assert_called_once_with(instance)
+    assert returned_dict == {
+        "shared": "shared value",
+        "grandparent_key": "grandparent value",
+        "parent_key": "parent value",
+        "key": "value",
+    }
+    assert list(returned_dict) == ["shared", "grandparent_key", "parent_key", "key"]
+    assert mocked_facades_models.get_model.call_count == 2
 
 
 @pytest.mark.utility_base
@@ -192,3 +234,52 @@ def test_to_str(__init__):
     assert returned_str == '{"key_1": 1}'
     assert str(instance) == '{"key_1": 1}'
     assert repr(instance) == "open_alchemy.models.Model(key_1=1)"
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        pytest.param(json_codec.StdlibCodec(), id="stdlib"),
+        pytest.param("orjson", id="orjson"),
+    ],
+)
+@pytest.mark.utility_base
+def test_to_str_from_str_codec(__init__, codec):
+    """
+    GIVEN model with date, date-time and binary properties and a JSON codec
+    WHEN to_str is called and the output is passed to from_str
+    THEN the values are serialized by the codec and the instance is reconstructed.
+    """
+    if codec == "orjson":
+        pytest.importorskip("orjson")
+        codec = json_codec.OrjsonCodec()
+    model = type(
+        "Model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "date": {"type": "string", "format": "date"},
+                    "date_time": {"type": "string", "format": "date-time"},
+                    "binary": {"type": "string", "format": "binary"},
+                }
+            },
+            "__init__": __init__,
+        },
+    )
+    model.set_json_codec(codec)
+    instance = model(
+        date=datetime.date(2000, 1, 1),
+        date_time=datetime.datetime(2000, 1, 1, 1, 1, 1),
+        binary=b"value 1",
+    )
+
+    returned_str = instance.to_str()
+    returned_instance = model.from_str(returned_str)
+
+    assert codec.loads(returned_str) == {
+        "date": "2000-01-01",
+        "date_time": "2000-01-01T01:01:01",
+        "binary": "value 1",
+    }
+    assert returned_instance.to_dict() == instance.to_dict()